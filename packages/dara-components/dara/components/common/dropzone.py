@@ -16,7 +16,7 @@ limitations under the License.
 """
 
 from collections.abc import Callable
-from uuid import uuid4
+from typing import BinaryIO
 
 from pandas import DataFrame
 from pydantic import ConfigDict
@@ -25,7 +25,7 @@ from dara.core.base_definitions import Action, UploadResolverDef
 from dara.core.definitions import StyledComponentInstance
 from dara.core.interactivity import ServerVariable
 
-DropzoneResolver = Callable[[bytes, str], DataFrame] | Callable[[bytes, str], None]
+DropzoneResolver = Callable[[bytes, str], DataFrame | None] | Callable[[BinaryIO, str], DataFrame | None]
 
 
 class UploadDropzone(StyledComponentInstance):
@@ -57,6 +57,8 @@ class UploadDropzone(StyledComponentInstance):
     :param resolver: optional resolver accepting `bytes` and filename as a string
         - if a target is specified, can be used to customise how the `bytes` received are turned into a `DataFrame`
         - if a target is not specified, can be treated as a side effect function to run on the `bytes` received (to i.e. store on disk)
+        - if its first argument is annotated as a file-like object, e.g. `BinaryIO`, it receives the uploaded file instead of `bytes`,
+          so large files don't have to be held in memory
     :param on_drop: optional action triggered when a file is successfully uploaded
     :param enable_paste: determines if the component should listen for and handle paste events (e.g., CTRL+V or right-click and paste). When set to True, the component allows text to be pasted directly, creating a file from the pasted content. This feature is disabled by default to accommodate scenarios where pasting text is not intended or could interfere with the component's primary functionality.
     """
@@ -81,10 +83,11 @@ class UploadDropzone(StyledComponentInstance):
         **kwargs,
     ):
         from dara.core.interactivity.any_data_variable import upload
+        from dara.core.internal.cross_process import generate_uid
         from dara.core.internal.registries import upload_resolver_registry
 
         # Register the resolver function if provided
-        uid = str(uuid4())
+        uid = generate_uid('upload_resolver')
         upload_resolver_registry.register(uid, UploadResolverDef(resolver=resolver, upload=upload))
 
         super().__init__(target=target, on_drop=on_drop, accept=accept, enable_paste=enable_paste, **kwargs)
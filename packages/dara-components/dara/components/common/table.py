@@ -15,13 +15,25 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import hashlib
+import json
+import time
 from collections.abc import Sequence
 from enum import Enum
-from typing import Any, ClassVar, Literal
+from typing import Any, ClassVar, Literal, cast
 
 from fastapi.encoders import jsonable_encoder
 from pandas import DataFrame
-from pydantic import ConfigDict, Field, SerializerFunctionWrapHandler, ValidationInfo, field_serializer, field_validator
+from pandas.util import hash_pandas_object
+from pydantic import (
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 from dara.components.common.base_component import ContentComponent
 from dara.core.base_definitions import Action
@@ -29,8 +41,12 @@ from dara.core.base_definitions import DaraBaseModel as BaseModel
 from dara.core.interactivity import (
     AnyVariable,
     ClientVariable,
+    ServerVariable,
     Variable,
 )
+from dara.core.interactivity.filtering import FilterQuery, Pagination
+from dara.core.interactivity.server_variable import MemoryBackend
+from dara.core.internal.cross_process import has_started, is_multi_process
 from dara.core.logging import dev_logger
 
 
@@ -507,6 +523,141 @@ class Column(BaseModel):
         return filter
 
 
+# Inline DataFrames with more rows than this are served through the paginated tabular endpoint rather than embedded
+MAX_INLINE_ROWS = 1_000
+
+# Number of seconds an inline DataFrame served while handling requests stays registered after it was last rendered or
+# read by a client, e.g. to load another page of the table
+SERVED_TABLE_TTL = 60 * 60
+
+# DataFrames served while the app is loading are referenced by pages compiled once, so they are never unregistered
+_pinned_tables: dict[str, ServerVariable] = {}
+
+_served_tables: dict[str, ServerVariable] = {}
+
+
+class _ServedTableBackend(MemoryBackend):
+    """
+    Memory backend of a DataFrame served while handling requests, tracking when it was last used
+    """
+
+    last_access: float = Field(default_factory=time.monotonic)
+
+    def touch(self):
+        self.last_access = time.monotonic()
+
+    async def read(self, key: str) -> Any:
+        self.touch()
+        return await super().read(key)
+
+    async def read_filtered(
+        self, key: str, filters: FilterQuery | dict | None = None, pagination: Pagination | None = None
+    ) -> tuple[DataFrame | None, int]:
+        self.touch()
+        return await super().read_filtered(key, filters, pagination)
+
+
+def _evict_expired_tables():
+    """
+    Unregister the DataFrames served while handling requests which have not been used for `SERVED_TABLE_TTL` seconds
+    """
+    from dara.core.internal.registries import server_variable_registry
+
+    expired_before = time.monotonic() - SERVED_TABLE_TTL
+    for uid, variable in list(_served_tables.items()):
+        if cast(_ServedTableBackend, variable.backend).last_access < expired_before:
+            del _served_tables[uid]
+            if server_variable_registry.has(uid):
+                server_variable_registry.remove(uid)
+
+
+def _get_dataframe_uid(data: DataFrame) -> str | None:
+    """
+    Get a uid derived from the contents of a DataFrame, or None if its values cannot be hashed.
+
+    :param data: the DataFrame to get the uid of
+    """
+    try:
+        hashed = hash_pandas_object(data, index=True).to_numpy()
+    except TypeError:
+        return None
+
+    digest = hashlib.sha256(hashed.tobytes())
+    digest.update(repr((list(data.columns), [str(dtype) for dtype in data.dtypes], list(data.index.names))).encode())
+    return f'table_data_{digest.hexdigest()}'
+
+
+def _serve_dataframe(data: DataFrame) -> ServerVariable | None:
+    """
+    Serve an inline DataFrame through the paginated tabular endpoint, by storing it in a ServerVariable.
+
+    The variable's uid is derived from the DataFrame's contents so rendering a table with the same data again, e.g. in
+    a `py_component`, reuses its variable rather than registering a new copy. Variables registered while handling
+    requests are unregistered once neither rendered nor read by a client for `SERVED_TABLE_TTL` seconds.
+
+    :param data: the DataFrame to serve
+    :returns: the variable serving the DataFrame, or None if it has to be embedded instead
+    """
+    from dara.core.internal.registries import server_variable_registry
+
+    # A variable registered while handling a request would only be known to the worker process handling it
+    if has_started() and is_multi_process():
+        return None
+
+    uid = _get_dataframe_uid(data)
+    if uid is not None:
+        if uid in _pinned_tables and server_variable_registry.has(uid):
+            return _pinned_tables[uid]
+        if uid in _served_tables and server_variable_registry.has(uid):
+            cast(_ServedTableBackend, _served_tables[uid].backend).touch()
+            return _served_tables[uid]
+
+    if not has_started():
+        backend = MemoryBackend(scope='global')
+    else:
+        _evict_expired_tables()
+        backend = _ServedTableBackend(scope='global')
+
+    # Written directly rather than through ServerVariable's default so the data is available as soon as it is registered
+    backend.data['global'] = data
+    variable = ServerVariable(backend=backend, uid=uid)
+
+    if isinstance(backend, _ServedTableBackend):
+        _served_tables[str(variable.uid)] = variable
+    else:
+        _pinned_tables[str(variable.uid)] = variable
+
+    return variable
+
+
+def _dataframe_to_records(data: DataFrame) -> list[dict[str, Any]]:
+    """
+    Convert a DataFrame to JSON-compatible records.
+
+    The DataFrame is written to JSON column by column by pandas' vectorized writer, rather than materializing a Python
+    object per cell and walking them with `jsonable_encoder`. Only values the writer does not support natively fall
+    back to the registered encoders.
+
+    :param data: the DataFrame to convert
+    """
+    from dara.core.internal.encoder_registry import get_jsonable_encoder
+
+    encoders = get_jsonable_encoder()
+
+    def _default(value: Any) -> Any:
+        encoder = encoders.get(type(value))
+        if encoder is not None:
+            return encoder(value)
+        return jsonable_encoder(value, custom_encoder=encoders)
+
+    # Durations are sent as seconds rather than ISO 8601 durations
+    timedeltas = data.select_dtypes('timedelta')
+    if len(timedeltas.columns) > 0:
+        data = data.assign(**{str(col): data[col].dt.total_seconds() for col in timedeltas.columns})
+
+    return json.loads(data.to_json(orient='records', date_format='iso', date_unit='us', default_handler=_default))
+
+
 class TableAction(BaseModel):
     icon_name: str
     label: str
@@ -567,6 +718,9 @@ class Table(ContentComponent):
     Table(data=data)
     ```
 
+    DataFrames with more than 1000 rows are not embedded in the page, they are automatically stored in a ServerVariable and
+    served through the same paginated endpoint as below.
+
     When working with larger datasets, it is recommended to use a ServerVariable or DerivedVariable to avoid sending the entire dataset to the client.
     They have built-in server-side filtering and pagination which is utilized by the Table component and integrated into its UI. They both support customization
     of the filtering and pagination behavior, respectively via a custom `ServerVariable.backend` or a custom `DerivedVariable.filter_resolver`.
@@ -935,6 +1089,17 @@ class Table(ContentComponent):
             return data
         raise ValueError(f'Invalid data passed to Table: {type(data)}, expected a DataFrame or a variable')
 
+    @model_validator(mode='after')
+    def serve_large_data(self):
+        if isinstance(self.data, DataFrame) and len(self.data) > MAX_INLINE_ROWS:
+            served = _serve_dataframe(self.data)
+            if served is not None:
+                self.data = served
+                # Embedded records do not include the index, keep large tables consistent with small ones
+                if 'include_index' not in self.model_fields_set:
+                    self.include_index = False
+        return self
+
     @field_serializer('data', mode='wrap')
     def serialize_field(self, value: Any, nxt: SerializerFunctionWrapHandler):
         if isinstance(value, AnyVariable):
@@ -944,7 +1109,7 @@ class Table(ContentComponent):
 
         try:
             if isinstance(value, DataFrame):
-                value = value.to_dict(orient='records')
+                return _dataframe_to_records(value)
             return jsonable_encoder(value, custom_encoder=get_jsonable_encoder())
         except Exception as e:
             dev_logger.error(
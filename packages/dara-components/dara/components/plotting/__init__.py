@@ -18,5 +18,6 @@ limitations under the License.
 
 import dara.components.plotting.palettes as PALETTES
 from dara.components.plotting.bokeh import *
+from dara.components.plotting.downsampling import *
 from dara.components.plotting.matplotlib import *
 from dara.components.plotting.plotly import *
@@ -15,19 +15,27 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from json import dumps
 from typing import Any
 
+import numpy
 from bokeh.document import Document
+from bokeh.models import ColumnDataSource, GlyphRenderer
 from bokeh.themes import Theme
 from pydantic import ConfigDict
 
 from dara.components.plotting.bokeh.themes import light_theme
+from dara.components.plotting.downsampling import Downsample, downsample_indices, take_points
 from dara.core.base_definitions import Action
 from dara.core.definitions import StyledComponentInstance
 
 SETTINGS = {'THEME': light_theme}
 
+# Numeric columns with at least this many values are sent as base64 encoded typed arrays rather than JSON lists
+BINARY_ARRAY_MIN_SIZE = 1_000
+
 
 def _get_theme(theme_input: dict | None):
     if theme_input is not None:
@@ -36,6 +44,79 @@ def _get_theme(theme_input: dict | None):
         return Theme(json=SETTINGS['THEME'])
 
 
+@contextmanager
+def _binary_array_columns(document: Document) -> Iterator[None]:
+    """
+    Temporarily replace the numeric list columns of the document's data sources with numpy arrays.
+
+    Bokeh serializes numpy arrays as base64 encoded buffers, which BokehJS decodes into typed arrays, whereas lists are
+    spelled out value by value. The original columns are restored on exit so the figure's data is left untouched.
+
+    :param document: the document to replace the columns of
+    """
+    replaced: list[tuple[ColumnDataSource, str, Any]] = []
+    for model in document.models:
+        if not isinstance(model, ColumnDataSource):
+            continue
+        for name, column in list(model.data.items()):
+            if not isinstance(column, list) or len(column) < BINARY_ARRAY_MIN_SIZE:
+                continue
+            array = numpy.asarray(column)
+            if array.ndim == 1 and array.dtype.kind in 'iuf':
+                replaced.append((model, name, column))
+                model.data[name] = array
+    try:
+        yield
+    finally:
+        for model, name, column in replaced:
+            model.data[name] = column
+
+
+@contextmanager
+def _downsampled_sources(document: Document, downsample: Downsample) -> Iterator[None]:
+    """
+    Temporarily replace the data of the document's data sources with their downsampled points.
+
+    The points kept for a source are the union of the points selected for the x and y columns of each glyph drawn from
+    it. Sources drawn by a glyph without x and y columns are left untouched. The original data is restored on exit.
+
+    :param document: the document to downsample the sources of
+    :param downsample: the downsampling settings
+    """
+    selected: dict[ColumnDataSource, list[numpy.ndarray] | None] = {}
+    for model in document.models:
+        if not isinstance(model, GlyphRenderer) or not isinstance(model.data_source, ColumnDataSource):
+            continue
+        source = model.data_source
+        if source in selected and selected[source] is None:
+            continue
+
+        x, y = getattr(model.glyph, 'x', None), getattr(model.glyph, 'y', None)
+        indices = None
+        if isinstance(x, str) and isinstance(y, str) and x in source.data and y in source.data:
+            indices = downsample_indices(
+                source.data[x], source.data[y], downsample.points, downsample.method, downsample.x_range
+            )
+        if indices is None:
+            selected[source] = None
+        else:
+            selected.setdefault(source, []).append(indices)  # type: ignore
+
+    replaced: list[tuple[ColumnDataSource, dict]] = []
+    for source, indices in selected.items():
+        if indices is None:
+            continue
+        original = dict(source.data)
+        length = len(next(iter(original.values())))
+        source.data = take_points(original, numpy.unique(numpy.concatenate(indices)), length)
+        replaced.append((source, original))
+    try:
+        yield
+    finally:
+        for source, original in replaced:
+            source.data = original
+
+
 class Bokeh(StyledComponentInstance):
     """
     A Bokeh Component allows for a bokeh figure to be added to your document. The component takes a single argument
@@ -47,6 +128,12 @@ class Bokeh(StyledComponentInstance):
 
     By default the component has a minimum height and width of 350px, this can be overwritten by passing the min_height and
     min_width props to the component.
+
+    Large numeric columns of the figure's data sources are sent to the browser as base64 encoded typed arrays, including
+    columns given as Python lists, rather than JSON lists. This can be disabled by passing `binary_arrays=False`.
+
+    Glyphs with millions of points can also be downsampled before being sent, by passing the number of points to keep
+    or the `Downsample` settings as `downsample`.
     """
 
     js_module = '@darajs/components'
@@ -62,11 +149,15 @@ class Bokeh(StyledComponentInstance):
         document: Any = None,
         theme: dict | None = None,
         events: list[tuple[str, Action]] | None = None,
+        binary_arrays: bool = True,
+        downsample: Downsample | int | None = None,
         **kwargs,
     ):
         """
         :param figure: the figure to display
         :param document: the document to display
+        :param binary_arrays: whether to encode large numeric list columns as binary typed arrays
+        :param downsample: the number of points to downsample glyphs to, or the `Downsample` settings
         """
         if figure is not None:
             doc = Document()
@@ -77,7 +168,13 @@ class Bokeh(StyledComponentInstance):
         if not isinstance(document, Document):
             raise ValueError(f'Bokeh component requires a Document instance, but got {type(document)}:\n{document}')
 
-        document_dict = dumps(document.to_json(deferred=False))
+        downsample = Downsample.from_arg(downsample)
+        with ExitStack() as stack:
+            if downsample is not None:
+                stack.enter_context(_downsampled_sources(document, downsample))
+            if binary_arrays:
+                stack.enter_context(_binary_array_columns(document))
+            document_dict = dumps(document.to_json(deferred=False))
 
         super().__init__(document=document_dict, events=events, **kwargs)
 
@@ -0,0 +1,283 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+import warnings
+from typing import Any, Literal
+
+import numpy
+import pandas
+
+from dara.core.base_definitions import DaraBaseModel as BaseModel
+
+__all__ = ['Downsample', 'DownsampleMethod', 'downsample_indices', 'relayout_range']
+
+DownsampleMethod = Literal['lttb', 'minmax']
+
+# Above this many points per output point, LTTB runs on min-max preselected candidates rather than on all points
+LTTB_PRESELECT_RATIO = 4
+
+
+class Downsample(BaseModel):
+    """
+    Downsampling settings for the plotting components.
+
+    Line and scatter traces with more than `points` points are reduced to roughly `points` points before being sent to
+    the browser, as a screen can only show so many of them.
+
+    - `'lttb'`, Largest Triangle Three Buckets, keeps the points which best preserve the visual shape of the series
+    - `'minmax'` keeps the lowest and highest point of equally sized buckets of points, which preserves every peak
+
+    Passing `x_range` restricts the data to a window of x values first, e.g. the visible range of a zoomed in plot, so
+    zooming in reveals more detail. Either bound can be None to leave that side open.
+
+    :param points: The maximum number of points to keep per trace
+    :param method: The downsampling method
+    :param x_range: The range of x values to keep
+    """
+
+    points: int = 2000
+    method: DownsampleMethod = 'lttb'
+    x_range: tuple[Any, Any] | None = None
+
+    @classmethod
+    def from_arg(cls, arg: 'Downsample | int | None') -> 'Downsample | None':
+        """
+        Get the downsampling settings from an argument, which can be the settings or a number of points.
+
+        :param arg: the argument to get the settings from
+        """
+        if arg is None or isinstance(arg, Downsample):
+            return arg
+        if isinstance(arg, int):
+            return cls(points=arg)
+        raise ValueError(f'Invalid downsample argument: {arg}, expected a Downsample instance or a number of points')
+
+
+def _to_numeric(values: Any) -> tuple[numpy.ndarray, bool] | None:
+    """
+    Convert values to float64 for downsampling, returning whether they were datetimes, or None if they are not numeric.
+
+    :param values: the values to convert
+    """
+    array = numpy.asarray(values)
+    if array.ndim != 1:
+        return None
+    if array.dtype.kind in 'iuf':
+        return array.astype(numpy.float64, copy=False), False
+    if array.dtype.kind == 'O':
+        # e.g. numbers with missing values given as None
+        try:
+            return array.astype(numpy.float64), False
+        except (ValueError, TypeError):
+            pass
+    if array.dtype.kind in 'OUM':
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                datetimes = pandas.to_datetime(array)
+        except (ValueError, TypeError):
+            return None
+        return numpy.where(datetimes.isna(), numpy.nan, datetimes.asi8), True
+    return None
+
+
+def _to_bound(value: Any, is_datetime: bool) -> float | None:
+    if value is None:
+        return None
+    if is_datetime:
+        return float(pandas.Timestamp(value).value)
+    return float(value)
+
+
+def _window_mask(x: numpy.ndarray, x_range: tuple[float | None, float | None]) -> numpy.ndarray:
+    """
+    Get a mask of the points within a range of x values, plus their direct neighbours so lines reach the edges.
+
+    :param x: the x values
+    :param x_range: the range of x values
+    """
+    start, end = x_range
+    inside = numpy.ones(len(x), dtype=bool)
+    if start is not None:
+        inside &= x >= start
+    if end is not None:
+        inside &= x <= end
+
+    mask = inside.copy()
+    mask[:-1] |= inside[1:]
+    mask[1:] |= inside[:-1]
+    return mask
+
+
+def minmax_indices(y: numpy.ndarray, points: int) -> numpy.ndarray:
+    """
+    Get the indices of the lowest and highest value in each of `points // 2` equally sized buckets, along with the
+    first and last index.
+
+    :param y: the values to downsample
+    :param points: the number of points to keep
+    """
+    length = len(y)
+    if points >= length:
+        return numpy.arange(length)
+
+    buckets = max((points - 2) // 2, 1)
+    size = math.ceil(length / buckets)
+    padding = buckets * size - length
+    missing = numpy.isnan(y)
+
+    lows = numpy.pad(numpy.where(missing, numpy.inf, y), (0, padding), constant_values=numpy.inf)
+    highs = numpy.pad(numpy.where(missing, -numpy.inf, y), (0, padding), constant_values=-numpy.inf)
+    starts = numpy.arange(buckets) * size
+
+    indices = numpy.concatenate(
+        [
+            [0, length - 1],
+            starts + lows.reshape(buckets, size).argmin(axis=1),
+            starts + highs.reshape(buckets, size).argmax(axis=1),
+        ]
+    )
+    return numpy.unique(indices[indices < length])
+
+
+def lttb_indices(x: numpy.ndarray, y: numpy.ndarray, points: int) -> numpy.ndarray:
+    """
+    Get the indices of the points selected by the Largest Triangle Three Buckets algorithm.
+
+    The points between the first and the last are split into `points - 2` buckets, and the point of each bucket forming
+    the largest triangle with the previously selected point and the average of the next bucket is kept.
+
+    :param x: the x values, sorted
+    :param y: the y values
+    :param points: the number of points to keep
+    """
+    length = len(x)
+    if points >= length or points < 3:
+        return numpy.arange(length)
+
+    edges = numpy.linspace(1, length - 1, points - 1).astype(numpy.int64)
+    # Averages of every bucket, ignoring missing values
+    present = ~numpy.isnan(y)
+    counts = numpy.maximum(numpy.add.reduceat(present.astype(numpy.int64), edges[:-1]), 1)
+    averages_x = numpy.add.reduceat(x, edges[:-1]) / (edges[1:] - edges[:-1])
+    averages_y = numpy.add.reduceat(numpy.where(present, y, 0), edges[:-1]) / counts
+    # The last bucket is compared against the last point
+    averages_x = numpy.append(averages_x[1:], x[-1])
+    averages_y = numpy.append(averages_y[1:], y[-1])
+
+    selected = numpy.empty(points, dtype=numpy.int64)
+    selected[0], selected[-1] = 0, length - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        px, py = x[previous], y[previous]
+        areas = numpy.abs(
+            (px - averages_x[bucket]) * (y[start:end] - py) - (px - x[start:end]) * (averages_y[bucket] - py)
+        )
+        previous = start + numpy.argmax(numpy.where(numpy.isnan(areas), -1, areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def downsample_indices(
+    x: Any,
+    y: Any,
+    points: int,
+    method: DownsampleMethod = 'lttb',
+    x_range: tuple[Any, Any] | None = None,
+) -> numpy.ndarray | None:
+    """
+    Get the indices of the points to keep when downsampling a series.
+
+    Returns None if all points should be kept, i.e. the series is small enough or its values are not numeric.
+
+    :param x: the x values, or None to use the position of each point
+    :param y: the y values
+    :param points: the number of points to keep
+    :param method: the downsampling method
+    :param x_range: the range of x values to keep
+    """
+    numeric_y = _to_numeric(y)
+    if numeric_y is None:
+        return None
+    y_values = numeric_y[0]
+
+    if x is None:
+        x_values, is_datetime = numpy.arange(len(y_values), dtype=numpy.float64), False
+    else:
+        numeric_x = _to_numeric(x)
+        if numeric_x is None or len(numeric_x[0]) != len(y_values):
+            return None
+        x_values, is_datetime = numeric_x
+
+    indices = numpy.arange(len(y_values))
+    if x_range is not None:
+        bounds = (_to_bound(x_range[0], is_datetime), _to_bound(x_range[1], is_datetime))
+        indices = numpy.flatnonzero(_window_mask(x_values, bounds))
+
+    if len(indices) > points:
+        if method == 'minmax':
+            indices = indices[minmax_indices(y_values[indices], points)]
+        else:
+            if len(indices) > points * LTTB_PRESELECT_RATIO:
+                indices = indices[minmax_indices(y_values[indices], points * LTTB_PRESELECT_RATIO)]
+            indices = indices[lttb_indices(x_values[indices], y_values[indices], points)]
+
+    if len(indices) == len(y_values):
+        return None
+    return indices
+
+
+def take_points(value: Any, indices: numpy.ndarray, length: int) -> Any:
+    """
+    Select the downsampled points of every per-point array nested in a value, e.g. a trace's coordinates, text
+    and marker colors.
+
+    :param value: the value to select the points of
+    :param indices: the indices of the points to keep
+    :param length: the number of points in the series, arrays of a different length are left untouched
+    """
+    if isinstance(value, dict):
+        return {key: take_points(item, indices, length) for key, item in value.items()}
+    if isinstance(value, numpy.ndarray) and value.ndim == 1 and len(value) == length:
+        return value[indices]
+    if isinstance(value, (list, tuple)) and len(value) == length:
+        return [value[index] for index in indices]
+    return value
+
+
+def relayout_range(event: dict | None, axis: str = 'xaxis') -> tuple[Any, Any] | None:
+    """
+    Get the new range of an axis from the data of a Plotly relayout event.
+
+    Returns `(None, None)` if the axis was reset to its full range, e.g. by double clicking the plot, and None if the
+    event did not change the axis, e.g. when only another axis was zoomed.
+
+    :param event: the relayout event data
+    :param axis: the name of the axis in the layout, e.g. 'xaxis' or 'xaxis2'
+    """
+    if not event:
+        return None
+    if event.get(f'{axis}.autorange'):
+        return (None, None)
+    if f'{axis}.range[0]' in event and f'{axis}.range[1]' in event:
+        return (event[f'{axis}.range[0]'], event[f'{axis}.range[1]'])
+    axis_range = event.get(f'{axis}.range')
+    if isinstance(axis_range, (list, tuple)) and len(axis_range) == 2:
+        return (axis_range[0], axis_range[1])
+    return None
@@ -17,42 +17,88 @@ limitations under the License.
 
 from base64 import b64encode
 from io import BytesIO
+from typing import Literal
 
 from matplotlib.figure import Figure
 
 from dara.core.definitions import StyledComponentInstance
 
+MatplotlibFormat = Literal['svg', 'png', 'webp']
+
+# Number of plotted points above which figures are rasterized rather than rendered as SVG
+RASTERIZE_THRESHOLD = 10_000
+
+
+def _count_points(figure: Figure) -> int:
+    """
+    Count the points drawn on a figure, i.e. the number of SVG elements it would render to.
+
+    :param figure: the figure to count the points of
+    """
+    count = 0
+    for ax in figure.get_axes():
+        for collection in ax.collections:
+            count += max(len(collection.get_offsets()), len(collection.get_paths()))
+        for line in ax.get_lines():
+            count += len(line.get_xydata())
+        count += len(ax.patches)
+    return count
+
 
 class Matplotlib(StyledComponentInstance):
     """
     A Matplotlib Component allows for a matplotlib figure to be added to your app.
-    This component converts the figure to a base64 encoded string and passes it to
-    the frontend where it is displayed as an image.
+    This component converts the figure to a base64 encoded image and passes it to
+    the frontend where it is displayed.
+
+    By default figures are rendered as SVG, unless they draw more than `rasterize_threshold` points in which case they
+    are rasterized to PNG, as the SVG of e.g. a large scatter plot is much larger and slower to display than an image.
+    The format can be set explicitly with the `format` argument:
+
+    ```python
+    from matplotlib.figure import Figure
+    from dara.components import Matplotlib
+
+    fig = Figure()
+    fig.add_subplot().scatter(x, y)
+
+    Matplotlib(fig, format='webp', dpi=150)
+    ```
 
     Although matplotlib plots can usually be made with pyplot, this is not
     thread-safe and so should not be used. Instead, use the matplotlib figure object.
 
     :param figure: A matplotlib figure
+    :param format: The image format to render the figure to, by default SVG or PNG depending on the number of points
+    :param rasterize_threshold: The number of points above which the figure is rasterized if no format is set
+    :param dpi: The resolution of rasterized figures, defaults to the figure's dpi
     """
 
     js_module = '@darajs/components'
 
     figure: str
+    format: MatplotlibFormat = 'svg'
 
     def __init__(
         self,
         figure: Figure,
+        format: MatplotlibFormat | None = None,
+        rasterize_threshold: int = RASTERIZE_THRESHOLD,
+        dpi: float | None = None,
         **kwargs,
     ):
         # Check if the figure is a matplotlib figure, they shouldn't be allowed to pass pyplot as that is not thread-safe
         if not isinstance(figure, Figure):
             raise TypeError('figure must be of type matplotlib figure')
 
+        if format is None:
+            format = 'png' if _count_points(figure) > rasterize_threshold else 'svg'
+
         buffer = BytesIO()
-        figure.savefig(buffer, format='svg')
+        figure.savefig(buffer, format=format, dpi=dpi if dpi is not None else 'figure')
         # Reset the buffer's position to the start
         buffer.seek(0)
 
         image_base64 = b64encode(buffer.read()).decode('utf-8')
 
-        super().__init__(figure=image_base64, **kwargs)
+        super().__init__(figure=image_base64, format=format, **kwargs)
@@ -15,13 +15,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from base64 import b64encode
+from collections.abc import Callable
 from enum import Enum
 from typing import Any, ClassVar
 
+import numpy
 import plotly.graph_objects as go
 import plotly.io as pio
 from pydantic import ConfigDict
 
+from dara.components.plotting.downsampling import Downsample, downsample_indices, take_points
 from dara.components.plotting.plotly.themes import light_theme
 from dara.core.base_definitions import Action
 from dara.core.base_definitions import DaraBaseModel as BaseModel
@@ -37,6 +41,142 @@ dara_template = go.layout.Template(layout=dara_theme)
 pio.templates['dara_theme'] = dara_template
 pio.templates.default = 'dara_theme'
 
+# Numeric arrays with at least this many values are sent as base64 encoded typed arrays rather than JSON lists
+BINARY_ARRAY_MIN_SIZE = 1_000
+
+# Typed array dtypes supported by plotly.js
+TYPED_ARRAY_DTYPES = {
+    'int8': 'i1',
+    'uint8': 'u1',
+    'int16': 'i2',
+    'uint16': 'u2',
+    'int32': 'i4',
+    'uint32': 'u4',
+    'float32': 'f4',
+    'float64': 'f8',
+}
+
+
+def _to_typed_array_dtype(array: numpy.ndarray) -> numpy.ndarray | None:
+    """
+    Cast an array to a dtype plotly.js has a typed array for, or return None if it has none.
+
+    64-bit integers are not supported by plotly.js, so they are downcast when all of their values fit.
+
+    :param array: the array to cast
+    """
+    if array.dtype.name in TYPED_ARRAY_DTYPES:
+        return array
+    if array.dtype.kind not in 'iu' or array.size == 0:
+        return None
+
+    low, high = array.min(), array.max()
+    if low >= -(2**31) and high < 2**31:
+        return array.astype(numpy.int32)
+    if low >= 0 and high < 2**32:
+        return array.astype(numpy.uint32)
+    if low >= -(2**53) and high <= 2**53:
+        return array.astype(numpy.float64)
+    return None
+
+
+def _encode_typed_array(array: numpy.ndarray) -> dict | None:
+    """
+    Encode a numeric array as a plotly.js typed array spec, i.e. its little-endian buffer as a base64 string.
+
+    :param array: the array to encode
+    """
+    if array.size < BINARY_ARRAY_MIN_SIZE or array.ndim > 2:
+        return None
+
+    typed_array = _to_typed_array_dtype(array)
+    if typed_array is None:
+        return None
+
+    dtype = typed_array.dtype.newbyteorder('<')
+    spec = {
+        'dtype': TYPED_ARRAY_DTYPES[dtype.name],
+        'bdata': b64encode(numpy.ascontiguousarray(typed_array, dtype=dtype).tobytes()).decode('ascii'),
+    }
+    if typed_array.ndim > 1:
+        spec['shape'] = ','.join(str(size) for size in typed_array.shape)
+    return spec
+
+
+def _encode_arrays(value: Any) -> Any:
+    """
+    Replace the numeric arrays nested in a trace with typed array specs.
+
+    :param value: the trace, or a value nested within it
+    """
+    if isinstance(value, dict):
+        return {key: _encode_arrays(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_arrays(item) for item in value]
+    if isinstance(value, numpy.ndarray):
+        spec = _encode_typed_array(value)
+        return spec if spec is not None else value
+    return value
+
+
+# Trace types made of a series of points which can be downsampled
+DOWNSAMPLED_TRACE_TYPES = ('scatter', 'scattergl')
+
+
+def _downsample_trace(trace: dict, downsample: Downsample) -> dict:
+    """
+    Downsample the points of a line or scatter trace.
+
+    :param trace: the trace to downsample
+    :param downsample: the downsampling settings
+    """
+    y = trace.get('y')
+    if trace.get('type', 'scatter') not in DOWNSAMPLED_TRACE_TYPES or y is None or len(y) <= downsample.points:
+        return trace
+
+    x = trace.get('x')
+    if x is None:
+        # Points are positioned by x0 and dx, which no longer holds once points are dropped
+        x = trace.get('x0', 0) + trace.get('dx', 1) * numpy.arange(len(y))
+        trace = {key: value for key, value in trace.items() if key not in ('x0', 'dx')}
+        trace['x'] = x
+
+    indices = downsample_indices(x, y, downsample.points, downsample.method, downsample.x_range)
+    if indices is None:
+        return trace
+    return take_points(trace, indices, len(y))
+
+
+def _transform_traces(figure_dict: dict, transform: Callable[[dict], dict]) -> dict:
+    figure_dict['data'] = [transform(trace) for trace in figure_dict.get('data', [])]
+    if 'frames' in figure_dict:
+        figure_dict['frames'] = [
+            {**frame, 'data': [transform(trace) for trace in frame.get('data', [])]} for frame in figure_dict['frames']
+        ]
+    return figure_dict
+
+
+def figure_to_json(figure: Any, binary_arrays: bool = True, downsample: Downsample | None = None) -> str:
+    """
+    Serialize a plotly figure to JSON.
+
+    With `binary_arrays`, large numeric arrays in the figure's traces are encoded as base64 typed arrays which plotly.js
+    decodes natively, rather than spelling out every value as JSON text.
+
+    :param figure: the figure to serialize
+    :param binary_arrays: whether to encode numeric arrays as typed arrays
+    :param downsample: the settings to downsample line and scatter traces with
+    """
+    if not binary_arrays and downsample is None:
+        return figure.to_json()
+
+    figure_dict = figure.to_plotly_json()
+    if downsample is not None:
+        figure_dict = _transform_traces(figure_dict, lambda trace: _downsample_trace(trace, downsample))
+    if binary_arrays:
+        figure_dict = _transform_traces(figure_dict, _encode_arrays)
+    return pio.to_json(figure_dict, validate=False)
+
 
 class PlotlyEventName(str, Enum):
     """
@@ -105,8 +245,44 @@ class Plotly(StyledComponentInstance):
     config.router.add_page(path='my-plot', content=Plotly(figure=fig, min_height=100))
     ```
 
+    Large numeric arrays, e.g. the coordinates of a scatter plot with many points, are sent to the browser as base64
+    encoded typed arrays rather than JSON lists, which is smaller and faster to parse. This can be disabled by passing
+    `binary_arrays=False`.
+
+    Line and scatter traces with millions of points can also be downsampled before being sent, by passing the number of
+    points to keep or the `Downsample` settings. To show more detail when zooming in, render the plot in a `py_component`
+    depending on the range from relayout events, so the visible window of the original data is resampled:
+
+    ```python
+    from dara.components import Downsample, Plotly, relayout_range
+    from dara.core import Variable, action, py_component
+
+    x_range = Variable(None)
+
+
+    @action
+    async def on_zoom(ctx: action.Ctx):
+        new_range = relayout_range(ctx.input)
+        if new_range is not None:
+            await ctx.update(x_range, new_range)
+
+
+    @py_component
+    def plot(x_range):
+        return Plotly(
+            build_figure(),
+            downsample=Downsample(points=2000, x_range=x_range),
+            events=[Plotly.Event(event_name=Plotly.EventName.RELAYOUT, actions=[on_zoom()])],
+        )
+
+
+    plot(x_range)
+    ```
+
     :param figure: A plotly figure
     :param events: An array of plotly events
+    :param binary_arrays: Whether to encode large numeric arrays as binary typed arrays
+    :param downsample: The number of points to downsample line and scatter traces to, or the `Downsample` settings
     """
 
     js_module = '@darajs/components'
@@ -127,12 +303,16 @@ class Plotly(StyledComponentInstance):
         figure: Any = None,
         theme: dict | None = None,
         events: list[PlotlyEvent] | None = None,
+        binary_arrays: bool = True,
+        downsample: Downsample | int | None = None,
         **kwargs,
     ):
         if theme is None and figure is not None:
             figure.update_layout(template=theme if theme is not None else SETTINGS['THEME'])
 
-        figure_dict = figure.to_json() if figure is not None else None
+        figure_dict = (
+            figure_to_json(figure, binary_arrays, Downsample.from_arg(downsample)) if figure is not None else None
+        )
 
         super().__init__(figure=figure_dict, events=events, **kwargs)
 
@@ -16,7 +16,11 @@ limitations under the License.
 """
 
 import re
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime, timezone
+from threading import Lock
 from typing import Any, Optional, cast
 
 import numpy
@@ -36,6 +40,54 @@ class ColumnDefinition(TypedDict):
     type: ColumnType
 
 
+class FrameCache:
+    """
+    LRU cache of values computed for a column of a DataFrame, keyed by the DataFrame instance, column and kind of value.
+
+    DataFrames are held through weak references, so an entry is only reused for the same DataFrame instance,
+    e.g. the cached value of a DerivedVariable, and never keeps a DataFrame alive.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        :param max_entries: maximum number of entries to keep
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, str, str], tuple[weakref.ref, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compute(self, data: DataFrame, col: str, kind: str, compute: Callable[[], Any]) -> Any:
+        """
+        Get the value computed for a column of a DataFrame, computing it if it is not cached yet.
+
+        :param data: DataFrame the column belongs to
+        :param col: column name
+        :param kind: kind of value
+        :param compute: function computing the value
+        """
+        key = (id(data), col, kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            # A different DataFrame might have been allocated at the same address
+            if entry is not None and entry[0]() is data:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (weakref.ref(data), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 def infer_column_type(data: DataFrame, col: str) -> ColumnType:
     """
     Get ColumnType for a given column of a dataframe.
@@ -200,49 +252,79 @@ def apply_date_filter(from_date: str, to_date: str, column: 'Series') -> Optiona
     return final_date_filter
 
 
-def apply_filters(variable_filters: list[FilterInstance], data: DataFrame) -> DataFrame:
+def get_filter_mask(variable_filters: list[FilterInstance], data: DataFrame) -> numpy.ndarray | None:
     """
-    Apply filters on data
+    Get a boolean mask of the rows matching all filters.
+
+    The filters defined for a given column are ORed together, and the filters of each column are ANDed into a single
+    mask without materializing any intermediate frames. Returns None if no filters are defined.
 
     :param variable_filters: list of filters to apply
     :param data: data to filter
     """
-    output = data.copy()
+    mask: numpy.ndarray | None = None
+    column_types: dict[str, ColumnType] = {}
 
     for fil in variable_filters:
         var = fil['column']
 
-        values_filter: Series | None = None
-        range_filter: Series | None = None
-        date_filter: Series | None = None
-
         if var is None or var.strip() == '':
             continue
 
-        column_type = infer_column_type(data, var)
+        if var not in column_types:
+            column_types[var] = infer_column_type(data, var)
+        column_type = column_types[var]
+        column = cast(Series, data[var])
+
+        filter_series: list[Series | None] = []
 
         # Range filter
         if fil['range'] != '' and 'range' in ALLOWED_FILTERS[column_type]:
-            range_filter = apply_range_filter(fil['range'], cast(Series, data[var]))
+            filter_series.append(apply_range_filter(fil['range'], column))
 
         # Values filter
         if fil['values'] != '' and 'values' in ALLOWED_FILTERS[column_type]:
-            values_filter = apply_values_filter(fil['values'], cast(Series, data[var]), column_type)
+            filter_series.append(apply_values_filter(fil['values'], column, column_type))
 
         if (fil['from_date'] != '' or fil['to_date'] != '') and ('from_date' in ALLOWED_FILTERS[column_type]):
-            date_filter = apply_date_filter(fil['from_date'], fil['to_date'], cast(Series, data[var]))
+            filter_series.append(apply_date_filter(fil['from_date'], fil['to_date'], column))
 
         # OR all of the defined filters together
-        final_filter = None
-        for filter_series in [values_filter, range_filter, date_filter]:
-            if filter_series is not None:
-                final_filter = final_filter | filter_series if final_filter is not None else filter_series
+        final_filter: numpy.ndarray | None = None
+        for series in filter_series:
+            if series is None:
+                continue
+            # The filter series are fresh results of comparisons, so their values can be combined in place
+            values = series.to_numpy(dtype=bool, na_value=False)
+            if final_filter is None:
+                final_filter = values
+            else:
+                numpy.logical_or(final_filter, values, out=final_filter)
 
         # if any filters were defined
         if final_filter is not None:
-            output = output[final_filter]
+            if mask is None:
+                mask = final_filter
+            else:
+                numpy.logical_and(mask, final_filter, out=mask)
+
+    return mask
+
+
+def apply_filters(variable_filters: list[FilterInstance], data: DataFrame) -> DataFrame:
+    """
+    Apply filters on data.
+    The data is returned as is if no filters are defined, otherwise the matching rows are selected once.
+
+    :param variable_filters: list of filters to apply
+    :param data: data to filter
+    """
+    mask = get_filter_mask(variable_filters, data)
+
+    if mask is None:
+        return data
 
-    return cast(DataFrame, output)
+    return cast(DataFrame, data[mask])
 
 
 def get_filter_stats(input_data: DataFrame, output_data: DataFrame, filters: list[FilterInstance]) -> FilterStats:
@@ -15,17 +15,121 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from pandas import DataFrame
+from typing import Any
+
+import numpy
+from pandas import DataFrame, Series, Timestamp, isna
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype, is_scalar
 
 from dara.components.common.table import Column, TableFormatterType
 from dara.components.smart.data_slicer.extension.data_slicer_filter import ColumnType
-from dara.components.smart.data_slicer.utils.core import ColumnDefinition
+from dara.components.smart.data_slicer.utils.core import ColumnDefinition, FrameCache
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+APPROXIMATE_QUANTILES_ROWS = 1_000_000
+"""Number of values above which the quantiles of a column are estimated from a sample"""
+
+QUANTILE_SAMPLE_SIZE = 100_000
+"""Number of values sampled to estimate the quantiles of large columns"""
+
+STATS_ORDER = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+column_stats_cache = FrameCache(max_entries=512)
+"""Statistics computed per column of the (filtered) datasets"""
+
+
+def _quantiles(values: numpy.ndarray) -> numpy.ndarray:
+    """
+    Compute the quartiles of an array of non-missing values, estimated from a sample for large arrays.
+
+    :param values: non-missing values
+    """
+    if len(values) > APPROXIMATE_QUANTILES_ROWS:
+        # Fixed seed so the statistics of a given dataset are stable
+        indices = numpy.random.default_rng(0).integers(0, len(values), QUANTILE_SAMPLE_SIZE)
+        values = values[indices]
+    return numpy.quantile(values, QUANTILES)
+
+
+def _numerical_stats(values: numpy.ndarray) -> dict[str, Any]:
+    count = len(values)
+    if count == 0:
+        return {'count': 0}
+
+    quantiles = _quantiles(values)
+    return {
+        'count': count,
+        'mean': values.mean(),
+        'std': values.std(ddof=1) if count > 1 else numpy.nan,
+        'min': values.min(),
+        '25%': quantiles[0],
+        '50%': quantiles[1],
+        '75%': quantiles[2],
+        'max': values.max(),
+    }
+
+
+def _datetime_stats(column: Series) -> dict[str, Any]:
+    # Computed on the underlying integers, missing values are stored as the minimum int64
+    values = column.array.asi8  # type: ignore
+    values = values[values != numpy.iinfo(numpy.int64).min]
+    stats = _numerical_stats(values)
+    stats.pop('std', None)
+
+    def _to_timestamp(value: Any):
+        return Timestamp(int(value), unit=column.dt.unit, tz=column.dt.tz)
+
+    return {key: value if key == 'count' else _to_timestamp(value) for key, value in stats.items()}
+
+
+def _categorical_stats(column: Series) -> dict[str, Any]:
+    counts = column.value_counts(dropna=True)
+    stats: dict[str, Any] = {'count': int(counts.sum()), 'unique': len(counts)}
+    if len(counts) > 0:
+        stats['top'] = counts.index[0]
+        stats['freq'] = counts.iloc[0]
+    return stats
+
+
+def get_column_stats(df: DataFrame, col: str) -> dict[str, Any]:
+    """
+    Compute the statistics of a column, matching `DataFrame.describe`.
+
+    Numerical and datetime columns get their count, mean, std, min, quartiles and max, computed from the non-missing
+    values in a single vectorized pass per statistic. Quartiles of columns with more than `APPROXIMATE_QUANTILES_ROWS`
+    values are estimated from a sample of `QUANTILE_SAMPLE_SIZE` values. Other columns get their count, number of
+    unique values, most frequent value and its frequency.
+    The statistics are cached per DataFrame instance and column.
+
+    :param df: DataFrame the column belongs to
+    :param col: column name
+    """
+
+    def _compute():
+        column = df[col]
+        if is_datetime64_any_dtype(column.dtype):
+            return _datetime_stats(column)
+        # Booleans are described like categories, as in `DataFrame.describe`
+        if is_numeric_dtype(column.dtype) and not is_bool_dtype(column.dtype):
+            values = column.to_numpy(dtype=float, na_value=numpy.nan)
+            return _numerical_stats(values[~numpy.isnan(values)])
+        return _categorical_stats(column)
+
+    return column_stats_cache.get_or_compute(df, col, 'stats', _compute)
 
 
 def get_describe_data(df: DataFrame) -> DataFrame:
     # Exclude the internal __index__ col from stats
-    cols = set(df.columns) - {'__index__'}
-    describe_df = df[list(cols)].describe(include='all').fillna('NaN').reset_index()
+    stats = {col: get_column_stats(df, col) for col in df.columns if col != '__index__'}
+    present = {key for col_stats in stats.values() for key in col_stats}
+    index = [key for key in STATS_ORDER if key in present]
+    # Statistics which are missing or do not apply to a column are shown as 'NaN'
+    data = {
+        col: ['NaN' if is_scalar(value) and isna(value) else value for value in (col_stats.get(key) for key in index)]
+        for col, col_stats in stats.items()
+    }
+    describe_df = DataFrame(data, index=index, dtype=object).reset_index()
     return describe_df
 
 
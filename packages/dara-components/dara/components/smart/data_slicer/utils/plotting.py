@@ -15,28 +15,86 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import cast
+from typing import Any, cast
 
 import numpy
 from bokeh.plotting import figure
 from pandas import DataFrame, Series
-from scipy.stats import gaussian_kde
+from scipy.ndimage import gaussian_filter1d
 
 from dara.components.common import Stack, Text
 from dara.components.plotting import Bokeh
 from dara.components.smart.data_slicer.extension.data_slicer_filter import ColumnType
-from dara.components.smart.data_slicer.utils.core import infer_column_type
+from dara.components.smart.data_slicer.utils.core import FrameCache, infer_column_type
 from dara.core.definitions import discover
 
 BLUE = '#3F9BF6'
 BOKEH_STYLES = {'height': '200px'}
 
+KDE_BINS = 2048
+"""Number of histogram bins the density estimate of numerical columns is computed from"""
+
+KDE_POINTS = 500
+"""Number of points the density estimate is plotted at"""
+
+PLOT_CACHE_SIZE = 32
+"""Maximum number of (dataset, column) plot data entries kept in memory"""
+
+plot_data_cache = FrameCache(max_entries=PLOT_CACHE_SIZE)
+
+
+def _binned_kde(column: Series, bins: int = KDE_BINS, points: int = KDE_POINTS) -> tuple[Any, Any] | None:
+    """
+    Estimate the density of a numerical column with a binned Gaussian KDE.
+
+    The values are binned once and the bin counts smoothed with a Gaussian kernel using Scott's rule for the bandwidth,
+    so the cost is linear in the number of rows rather than proportional to rows times evaluation points.
+    Returns None if the column has less than two distinct finite values.
+
+    :param column: numerical column
+    :param bins: number of histogram bins
+    :param points: number of points to evaluate the density at
+    """
+    values = column.to_numpy(dtype=float, na_value=numpy.nan)
+    values = values[numpy.isfinite(values)]
+    if len(values) < 2:
+        return None
+
+    low, high = values.min(), values.max()
+    std = values.std(ddof=1)
+    if low == high or std == 0:
+        return None
+
+    counts, edges = numpy.histogram(values, bins=bins, range=(low, high))
+    bin_width = edges[1] - edges[0]
+    bandwidth = std * len(values) ** (-1 / 5)
+    density = gaussian_filter1d(counts.astype(float), sigma=bandwidth / bin_width, mode='constant')
+    density /= len(values) * bin_width
+
+    centers = (edges[:-1] + edges[1:]) / 2
+    lin = numpy.linspace(low, high, points)
+    return lin, numpy.interp(lin, centers, density)
+
+
+def _category_counts(column: Series) -> Series:
+    """
+    Count the occurrences of each category of a column, labelled by their string representation.
+
+    :param column: categorical column
+    """
+    # Count first so only the distinct values are converted to strings
+    counts = column.value_counts(dropna=True)
+    counts.index = counts.index.astype(str)
+    # Distinct values can share a string representation, e.g. 1 and '1'
+    return counts.groupby(level=0, sort=True).sum()
+
 
 def _plot_x_numerical(dataset: DataFrame, x: str, **kwargs):
     color = BLUE
-    df = dataset.copy()
-    df = df[[x]].dropna()
-    lin = numpy.linspace(df[x].min(), df[x].max(), 500)
+    kde = plot_data_cache.get_or_compute(dataset, x, 'kde', lambda: _binned_kde(cast(Series, dataset[x])))
+    if kde is None:
+        return None
+    lin, y = kde
 
     p = figure(
         title=f'Distribution - {x}',
@@ -47,8 +105,6 @@ def _plot_x_numerical(dataset: DataFrame, x: str, **kwargs):
     )
     p.toolbar.logo = None  # type: ignore
 
-    pdf = gaussian_kde(cast(DataFrame, df[x]).dropna())
-    y = pdf(lin)
     p.line(
         lin,
         y,
@@ -61,14 +117,12 @@ def _plot_x_numerical(dataset: DataFrame, x: str, **kwargs):
 
 
 def _plot_x_categorical(dataset: DataFrame, x: str, **kwargs):
-    # clean infinities
-    df = dataset.copy()
-    df = df[[x]].dropna().astype(str)
-
-    values_counts = cast(Series, df[x]).value_counts()
+    values_counts = plot_data_cache.get_or_compute(
+        dataset, x, 'counts', lambda: _category_counts(cast(Series, dataset[x]))
+    )
 
     p = figure(
-        x_range=sorted(list(cast(Series, df[x]).unique())),
+        x_range=values_counts.index.tolist(),
         title=f'Histogram - {x}',
         toolbar_location=None,
         tools='',
@@ -2,8 +2,15 @@ import { type StyledComponentProps, injectCss, useComponentStyles } from '@daraj
 
 interface MatplotlibProps extends StyledComponentProps {
     figure: string;
+    format?: 'svg' | 'png' | 'webp';
 }
 
+const MIME_TYPES = {
+    png: 'image/png',
+    svg: 'image/svg+xml',
+    webp: 'image/webp',
+} as const;
+
 const StyledImg = injectCss('img');
 
 /**
@@ -18,7 +25,7 @@ function Matplotlib(props: MatplotlibProps): JSX.Element {
             id={props.id_}
             $rawCss={css}
             alt="Matplotlib graph"
-            src={`data:image/svg+xml;base64,${props.figure}`}
+            src={`data:${MIME_TYPES[props.format ?? 'svg']};base64,${props.figure}`}
             style={style}
         />
     );
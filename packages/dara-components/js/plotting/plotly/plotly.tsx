@@ -295,7 +295,8 @@ function handleEvent<T extends PlotlyEventName>(
     eventActions?.forEach((eventAction) => {
         if (eventAction?.handler) {
             const filteredData = filterEventData(figure, eventData, eventType);
-            void eventAction.handler(filteredData.points);
+            // point events pass the points interacted with, relayout and restyle events pass the updated properties
+            void eventAction.handler(filteredData?.points ?? filteredData);
         }
         if (eventAction?.custom_js) {
             const newFigure = executeCustomJs(eventAction.custom_js, eventData, figure);
@@ -13,8 +13,9 @@ test_uid = uuid.uuid4()
 class TestModalComponent(unittest.TestCase):
     """Test the Modal component"""
 
+    @patch('dara.core.internal.cross_process.uuid.uuid5', return_value=test_uid)
     @patch('dara.core.definitions.uuid.uuid4', return_value=test_uid)
-    def test_serialization(self, _uid):
+    def test_serialization(self, _uid, _stable_uid):
         """Test the component serializes to a dict"""
 
         @action
@@ -1,11 +1,18 @@
+import asyncio
+import time
 import unittest
 from unittest.mock import patch
 
+import numpy
+import pandas
 from fastapi.encoders import jsonable_encoder
 
 from dara.components.common import Table
+from dara.components.common import table as table_module
 from dara.components.common.table import TableFormatterType
-from dara.core import DataVariable
+from dara.core import DataVariable, ServerVariable
+from dara.core.interactivity.filtering import Pagination
+from dara.core.internal.registries import server_variable_registry
 
 
 class TestTableComponent(unittest.TestCase):
@@ -104,3 +111,94 @@ class TestTableComponent(unittest.TestCase):
             'uid': 'uid',
         }
         self.assertDictEqual(jsonable_encoder(cmp, exclude_none=True), expected_dict)
+
+    def test_inline_dataframe_serialization(self):
+        """Test inline DataFrames are serialized to JSON-compatible records"""
+        data = pandas.DataFrame(
+            {
+                'int': [1, 2],
+                'float': [1.5, numpy.nan],
+                'datetime': pandas.to_datetime(['2024-01-01 00:00:00.0', '2024-01-02 10:00:00.5']),
+                'str': ['a', None],
+                'duration': pandas.to_timedelta([1, 90], unit='s'),
+                'nullable': pandas.array([1, None], dtype='Int64'),
+            }
+        )
+
+        records = Table(data=data).model_dump()['props']['data']
+
+        self.assertEqual(
+            records,
+            [
+                {
+                    'int': 1,
+                    'float': 1.5,
+                    'datetime': '2024-01-01T00:00:00.000000',
+                    'str': 'a',
+                    'duration': 1.0,
+                    'nullable': 1,
+                },
+                {
+                    'int': 2,
+                    'float': None,
+                    'datetime': '2024-01-02T10:00:00.500000',
+                    'str': None,
+                    'duration': 90.0,
+                    'nullable': None,
+                },
+            ],
+        )
+
+    def test_large_dataframe_is_served(self):
+        """Test DataFrames over the inline row limit are served through a ServerVariable"""
+        data = pandas.DataFrame({'a': range(table_module.MAX_INLINE_ROWS + 1)})
+
+        cmp = Table(data=data)
+        self.assertIsInstance(cmp.data, ServerVariable)
+        self.assertFalse(cmp.include_index)
+        self.assertIs(server_variable_registry.get(str(cmp.data.uid)).backend.data['global'], data)
+
+        # The same data reuses the same variable
+        self.assertIs(Table(data=data.copy(), include_index=True).data, cmp.data)
+        self.assertTrue(Table(data=data, include_index=True).include_index)
+
+        # Small DataFrames are still embedded
+        self.assertIsInstance(Table(data=data.head(10)).data, pandas.DataFrame)
+
+    @patch.object(table_module, 'is_multi_process', return_value=False)
+    @patch.object(table_module, 'has_started')
+    def test_unused_served_dataframes_are_evicted(self, has_started, _is_multi_process):
+        """Test DataFrames served while handling requests are unregistered once unused, unless served while loading"""
+        has_started.return_value = False
+        pinned = Table(data=pandas.DataFrame({'pinned': range(table_module.MAX_INLINE_ROWS + 1)}))
+
+        has_started.return_value = True
+        unused, read = (
+            Table(data=pandas.DataFrame({name: range(table_module.MAX_INLINE_ROWS + 1)})).data
+            for name in ('unused', 'read')
+        )
+
+        expired = time.monotonic() - table_module.SERVED_TABLE_TTL - 1
+        unused.backend.last_access = expired
+        read.backend.last_access = expired
+
+        # A client loading a page of the table keeps it registered
+        entry = server_variable_registry.get(str(read.uid))
+        asyncio.run(ServerVariable.get_tabular_data(entry, pagination=Pagination(offset=0, limit=10)))
+
+        Table(data=pandas.DataFrame({'new': range(table_module.MAX_INLINE_ROWS + 1)}))
+
+        self.assertFalse(server_variable_registry.has(str(unused.uid)))
+        self.assertTrue(server_variable_registry.has(str(read.uid)))
+        # Tables of pages compiled when the app loaded stay registered
+        self.assertTrue(server_variable_registry.has(str(pinned.data.uid)))
+
+    @patch.object(table_module, 'is_multi_process', return_value=True)
+    @patch.object(table_module, 'has_started', return_value=True)
+    def test_large_dataframe_is_embedded_while_serving_multiple_workers(self, _has_started, _is_multi_process):
+        """Test DataFrames rendered while serving requests with several workers are embedded rather than served"""
+        data = pandas.DataFrame({'a': range(table_module.MAX_INLINE_ROWS + 1)})
+
+        cmp = Table(data=data)
+        self.assertIsInstance(cmp.data, pandas.DataFrame)
+        self.assertEqual(len(cmp.model_dump()['props']['data']), len(data))
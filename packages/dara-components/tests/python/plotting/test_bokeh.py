@@ -1,3 +1,4 @@
+import json
 import unittest
 import uuid
 from unittest.mock import patch
@@ -34,3 +35,37 @@ class TestBokehComponent(unittest.TestCase):
             'uid': str(test_uid),
         }
         self.assertEqual(cmp.model_dump(exclude_none=True), expected_dict)
+
+    def test_binary_arrays(self):
+        """Test large numeric list columns are encoded as binary arrays without modifying the figure"""
+        x = list(range(2000))
+        y = [i / 3 for i in x]
+        fig = figure()
+        fig.line(x, y)
+
+        cmp = Bokeh(fig)
+        self.assertEqual(cmp.document.count('"type": "ndarray"'), 2)
+        self.assertIs(fig.renderers[0].data_source.data['x'], x)
+
+        fig = figure()
+        fig.line(x, y)
+        self.assertNotIn('"type": "ndarray"', Bokeh(fig, binary_arrays=False).document)
+
+    def test_downsample(self):
+        """Test glyph data sources are downsampled without modifying the figure"""
+        x = list(range(10_000))
+        y = [(i % 100) / 3 for i in x]
+        fig = figure()
+        renderer = fig.line(x, y)
+        fig.scatter('x', 'y', source=renderer.data_source)
+
+        document = json.loads(Bokeh(fig, downsample=500, binary_arrays=False).document)
+        source = next(
+            model
+            for model in document['roots'][0]['attributes']['renderers'][0]['attributes'].values()
+            if isinstance(model, dict) and model.get('name') == 'ColumnDataSource'
+        )
+        columns = dict(source['attributes']['data']['entries'])
+        self.assertLessEqual(len(columns['x']), 500)
+        self.assertEqual(len(columns['x']), len(columns['y']))
+        self.assertEqual(len(renderer.data_source.data['x']), 10_000)
@@ -0,0 +1,88 @@
+import numpy
+import pandas
+import pytest
+
+from dara.components.plotting.downsampling import (
+    Downsample,
+    downsample_indices,
+    lttb_indices,
+    minmax_indices,
+    relayout_range,
+)
+
+
+def test_lttb_keeps_peaks_and_endpoints():
+    x = numpy.arange(10_000, dtype=numpy.float64)
+    y = numpy.zeros(10_000)
+    y[1234] = 100
+    y[8765] = -100
+
+    indices = lttb_indices(x, y, 100)
+
+    assert len(indices) == 100
+    assert (numpy.diff(indices) > 0).all()
+    assert indices[0] == 0
+    assert indices[-1] == 9_999
+    assert 1234 in indices
+    assert 8765 in indices
+
+
+def test_minmax_keeps_bucket_extremes():
+    y = numpy.sin(numpy.linspace(0, 20, 10_000))
+    y[500] = numpy.nan
+    y[5000] = 10
+
+    indices = minmax_indices(y, 100)
+
+    assert len(indices) <= 100
+    assert (numpy.diff(indices) > 0).all()
+    assert 5000 in indices
+    assert 500 not in indices
+    assert y[indices].max() == 10
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_downsample_indices(method):
+    y = numpy.random.default_rng(0).standard_normal(100_000).cumsum()
+
+    indices = downsample_indices(None, y, 1000, method)
+    assert indices is not None
+    assert len(indices) <= 1000
+    assert indices[0] == 0
+    assert indices[-1] == 99_999
+
+    # Small series and non-numeric values are left untouched
+    assert downsample_indices(None, y[:500], 1000, method) is None
+    assert downsample_indices(['a', 'b'] * 1000, y[:2000], 100, method) is None
+
+
+def test_downsample_indices_window():
+    x = pandas.date_range('2024-01-01', periods=10_000, freq='min').to_pydatetime()
+    y = numpy.arange(10_000)
+
+    indices = downsample_indices(x, y, 100, x_range=('2024-01-01 01:00', '2024-01-01 02:00'))
+    # The window plus the neighbouring points so lines reach the edges of the plot
+    assert indices.tolist() == list(range(59, 122))  # type: ignore
+
+    indices = downsample_indices(x, y, 100, x_range=('2024-01-02', None))
+    assert indices is not None
+    assert len(indices) == 100
+    assert indices[0] == 1439
+    assert indices[-1] == 9_999
+
+
+def test_relayout_range():
+    assert relayout_range({'xaxis.range[0]': 1, 'xaxis.range[1]': 2}) == (1, 2)
+    assert relayout_range({'xaxis2.range': [1, 2]}, axis='xaxis2') == (1, 2)
+    assert relayout_range({'xaxis.autorange': True}) == (None, None)
+    assert relayout_range({'yaxis.range[0]': 1, 'yaxis.range[1]': 2}) is None
+    assert relayout_range(None) is None
+
+
+def test_downsample_from_arg():
+    assert Downsample.from_arg(None) is None
+    assert Downsample.from_arg(500) == Downsample(points=500)
+    settings = Downsample(method='minmax')
+    assert Downsample.from_arg(settings) is settings
+    with pytest.raises(ValueError):
+        Downsample.from_arg('500')  # type: ignore
@@ -0,0 +1,38 @@
+import unittest
+from base64 import b64decode
+
+import numpy
+from matplotlib.figure import Figure
+
+from dara.components import Matplotlib
+
+
+class TestMatplotlibComponent(unittest.TestCase):
+    """Test the Matplotlib component"""
+
+    def _scatter(self, points: int) -> Figure:
+        fig = Figure()
+        fig.add_subplot().scatter(numpy.arange(points), numpy.arange(points))
+        return fig
+
+    def test_svg_by_default(self):
+        """Test figures with few points are rendered as SVG"""
+        cmp = Matplotlib(self._scatter(100))
+        self.assertEqual(cmp.format, 'svg')
+        self.assertIn(b'<svg', b64decode(cmp.figure))
+
+    def test_rasterized_above_threshold(self):
+        """Test figures with many points are rasterized to PNG"""
+        cmp = Matplotlib(self._scatter(200), rasterize_threshold=100)
+        self.assertEqual(cmp.format, 'png')
+        self.assertTrue(b64decode(cmp.figure).startswith(b'\x89PNG'))
+
+    def test_explicit_format(self):
+        """Test the format can be set explicitly"""
+        cmp = Matplotlib(self._scatter(10), format='webp', dpi=50)
+        self.assertEqual(cmp.format, 'webp')
+        self.assertEqual(b64decode(cmp.figure)[8:12], b'WEBP')
+
+    def test_requires_figure(self):
+        with self.assertRaises(TypeError):
+            Matplotlib('not a figure')  # type: ignore
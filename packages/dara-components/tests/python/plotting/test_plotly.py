@@ -0,0 +1,53 @@
+import json
+import unittest
+from base64 import b64decode
+
+import numpy
+import plotly.graph_objects as go
+
+from dara.components import Plotly
+
+
+class TestPlotlyComponent(unittest.TestCase):
+    """Test the Plotly component"""
+
+    def test_binary_arrays(self):
+        """Test large numeric arrays are encoded as typed arrays"""
+        x = numpy.arange(2000, dtype=numpy.int64)
+        y = numpy.linspace(0, 1, 2000)
+        z = numpy.arange(3000, dtype=numpy.float32).reshape(1000, 3)
+        fig = go.Figure([go.Scatter(x=x, y=y, text=['a'] * 2000), go.Heatmap(z=z)])
+
+        data = json.loads(Plotly(fig).figure)['data']
+
+        self.assertEqual(data[0]['x']['dtype'], 'i4')
+        numpy.testing.assert_array_equal(numpy.frombuffer(b64decode(data[0]['x']['bdata']), dtype='<i4'), x)
+        self.assertEqual(data[0]['y']['dtype'], 'f8')
+        numpy.testing.assert_array_equal(numpy.frombuffer(b64decode(data[0]['y']['bdata']), dtype='<f8'), y)
+        self.assertEqual(data[1]['z']['dtype'], 'f4')
+        self.assertEqual(data[1]['z']['shape'], '1000,3')
+        # Non-numeric arrays are left as lists
+        self.assertEqual(data[0]['text'], ['a'] * 2000)
+
+    def test_small_and_disabled_binary_arrays(self):
+        """Test small arrays, and all arrays with binary_arrays disabled, are sent as lists"""
+        fig = go.Figure(go.Scatter(x=numpy.arange(10), y=numpy.arange(10)))
+        self.assertEqual(json.loads(Plotly(fig).figure)['data'][0]['x'], list(range(10)))
+
+        fig = go.Figure(go.Scatter(x=numpy.arange(2000), y=numpy.arange(2000)))
+        self.assertEqual(json.loads(Plotly(fig, binary_arrays=False).figure)['data'][0]['x'], list(range(2000)))
+
+    def test_downsample(self):
+        """Test line and scatter traces are downsampled along with their per-point properties"""
+        y = numpy.random.default_rng(0).standard_normal(10_000).cumsum()
+        text = [str(i) for i in range(10_000)]
+        fig = go.Figure([go.Scatter(y=y, x0=10, dx=2, text=text), go.Bar(y=y)])
+
+        data = json.loads(Plotly(fig, downsample=500, binary_arrays=False).figure)['data']
+
+        self.assertEqual(len(data[0]['x']), 500)
+        self.assertEqual(len(data[0]['y']), 500)
+        self.assertEqual(data[0]['text'], [str((x - 10) // 2) for x in data[0]['x']])
+        self.assertNotIn('x0', data[0])
+        # Other trace types are left untouched
+        self.assertEqual(len(data[1]['y']), 10_000)
@@ -0,0 +1,91 @@
+import warnings
+from os import path
+from pathlib import Path
+
+import numpy
+import pandas
+
+from dara.components.smart.data_slicer.utils import data_preview
+from dara.components.smart.data_slicer.utils.core import FrameCache
+from dara.components.smart.data_slicer.utils.data_preview import get_column_stats, get_describe_data
+
+
+def get_test_data() -> pandas.DataFrame:
+    data = pandas.read_csv(path.join(Path(__file__).parent.parent.absolute(), 'data/churn_data_clean.csv'))
+    data['Renewal Date'] = pandas.to_datetime(data['Renewal Date'])
+    data['__index__'] = data.index
+    return data
+
+
+def test_describe_data_matches_pandas_describe():
+    data = get_test_data()
+
+    describe_df = get_describe_data(data).set_index('index')
+    expected = data.drop(columns='__index__').describe(include='all').fillna('NaN').reindex(describe_df.index)
+
+    assert describe_df.columns.tolist() == expected.columns.tolist()
+    for col in describe_df.columns:
+        for stat in describe_df.index:
+            value, expected_value = describe_df.at[stat, col], expected.at[stat, col]
+            if isinstance(expected_value, float):
+                assert numpy.isclose(value, expected_value), (col, stat)
+            else:
+                assert value == expected_value, (col, stat)
+
+
+def test_approximate_quantiles(monkeypatch):
+    monkeypatch.setattr(data_preview, 'APPROXIMATE_QUANTILES_ROWS', 1000)
+    monkeypatch.setattr(data_preview, 'QUANTILE_SAMPLE_SIZE', 5000)
+
+    data = pandas.DataFrame({'a': numpy.random.default_rng(1).uniform(0, 1, 50_000)})
+    stats = get_column_stats(data, 'a')
+
+    assert stats['count'] == 50_000
+    assert stats['min'] == data['a'].min() and stats['max'] == data['a'].max()
+    for key, quantile in (('25%', 0.25), ('50%', 0.5), ('75%', 0.75)):
+        assert abs(stats[key] - quantile) < 0.02
+
+
+def test_column_stats_cached_per_column(monkeypatch):
+    monkeypatch.setattr(data_preview, 'column_stats_cache', FrameCache(max_entries=8))
+    calls = []
+    numerical_stats = data_preview._numerical_stats
+
+    def _counting_stats(values):
+        calls.append(len(values))
+        return numerical_stats(values)
+
+    monkeypatch.setattr(data_preview, '_numerical_stats', _counting_stats)
+
+    data = pandas.DataFrame({'a': [1.0, 2.0, None], 'b': [1, 2, 3]})
+    first = get_describe_data(data)
+    assert calls == [2, 3]
+
+    pandas.testing.assert_frame_equal(get_describe_data(data), first)
+    assert get_column_stats(data, 'a')['count'] == 2
+    assert calls == [2, 3]
+
+
+def test_describe_data_handles_nullable_and_boolean_columns():
+    data = pandas.DataFrame(
+        {
+            'ints': pandas.array([1, None, 3], dtype='Int64'),
+            'floats': pandas.array([1.5, 2.5, None], dtype='Float64'),
+            'flags': [True, False, True],
+            'single': [1.0, None, None],
+        }
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        describe_df = get_describe_data(data).set_index('index')
+
+    assert describe_df.at['count', 'ints'] == 2
+    assert describe_df.at['mean', 'ints'] == 2.0
+    assert describe_df.at['max', 'floats'] == 2.5
+    # Booleans are described as categories, like pandas does
+    assert describe_df.at['top', 'flags']
+    assert describe_df.at['freq', 'flags'] == 2
+    assert describe_df.at['mean', 'flags'] == 'NaN'
+    # The standard deviation of a single value is missing
+    assert describe_df.at['std', 'single'] == 'NaN'
@@ -0,0 +1,57 @@
+import numpy
+import pandas
+from scipy.stats import gaussian_kde
+
+from dara.components.smart.data_slicer.utils import plotting
+from dara.components.smart.data_slicer.utils.core import FrameCache
+from dara.components.smart.data_slicer.utils.plotting import (
+    _binned_kde,
+    _category_counts,
+    render_input_plot,
+)
+
+
+def test_binned_kde_matches_gaussian_kde():
+    rng = numpy.random.default_rng(0)
+    column = pandas.Series(
+        numpy.concatenate([rng.normal(0, 1, 5000), rng.normal(5, 0.5, 2500), [numpy.nan, numpy.inf]])
+    )
+
+    lin, density = _binned_kde(column)
+    finite = column[numpy.isfinite(column)]
+    expected = gaussian_kde(finite)(lin)
+
+    assert len(lin) == plotting.KDE_POINTS
+    assert lin[0] == finite.min() and lin[-1] == finite.max()
+    numpy.testing.assert_allclose(density, expected, atol=expected.max() * 0.01)
+
+    # Nothing to estimate for constant columns
+    assert _binned_kde(pandas.Series([1.0, 1.0, numpy.nan])) is None
+
+
+def test_category_counts():
+    column = pandas.Series(['b', 'a', None, 'b', 1, '1'], dtype=object)
+    counts = _category_counts(column)
+    assert counts.index.tolist() == ['1', 'a', 'b']
+    assert counts.tolist() == [2, 1, 2]
+
+
+def test_plot_data_cached_per_dataset_and_column(monkeypatch):
+    calls = []
+
+    def _counting_kde(column):
+        calls.append(column.name)
+        return _binned_kde(column)
+
+    monkeypatch.setattr(plotting, 'plot_data_cache', FrameCache(max_entries=2))
+    monkeypatch.setattr(plotting, '_binned_kde', _counting_kde)
+
+    df = pandas.DataFrame({'a': numpy.arange(100.0), 'b': numpy.arange(100.0) ** 2})
+    render_input_plot(df, 'a')
+    render_input_plot(df, 'a')
+    render_input_plot(df, 'b')
+    assert calls == ['a', 'b']
+
+    # A different dataset is computed separately, even with the same content
+    render_input_plot(df.copy(), 'a')
+    assert calls == ['a', 'b', 'a']
@@ -6,7 +6,7 @@ import numpy
 import pandas
 
 from dara.components.smart.data_slicer.extension.data_slicer_filter import FilterInstance
-from dara.components.smart.data_slicer.utils.core import apply_filters
+from dara.components.smart.data_slicer.utils.core import apply_filters, get_filter_mask
 
 
 def get_test_data() -> pandas.DataFrame:
@@ -180,3 +180,32 @@ def test_date_between_filter():
         filtered_data['ID'].values.tolist()
         == DATA[(DATA['Renewal Date'] > date_from_numpy) & (DATA['Renewal Date'] < date_to_numpy)]['ID'].values.tolist()
     )
+
+
+def test_filters_combined():
+    """
+    Filters of different columns are ANDed, while the filters defined for one column are ORed
+    """
+    filters = [
+        FilterInstance(column='ID', range='[0, 100]', values='500', from_date='', to_date=''),
+        FilterInstance(column='Gender', range='', values='Male', from_date='', to_date=''),
+    ]
+
+    filtered_data = apply_filters(filters, DATA)
+
+    expected = DATA[(DATA['ID'].between(0, 100) | (DATA['ID'] == 500)) & (DATA['Gender'] == 'Male')]
+    assert filtered_data['ID'].values.tolist() == expected['ID'].values.tolist()
+    assert get_filter_mask(filters, DATA).tolist() == DATA['ID'].isin(expected['ID']).tolist()
+
+
+def test_no_filters_does_not_copy():
+    assert apply_filters([], DATA) is DATA
+    assert get_filter_mask([], DATA) is None
+
+
+def test_filters_with_missing_values():
+    data = pandas.DataFrame({'a': [1, None, 3, 4]})
+    filtered_data = apply_filters(
+        [FilterInstance(column='a', range='[2, :]', values='', from_date='', to_date='')], data
+    )
+    assert filtered_data['a'].tolist() == [3.0, 4.0]
@@ -52,6 +52,7 @@ from dara.core.auth.session import (
     refresh_auth_session,
     remove_auth_session,
     resolve_raw_auth_token,
+    verified_session_cache,
     verify_auth_token,
     verify_raw_auth_token,
 )
@@ -186,6 +187,9 @@ async def _clear_cached_session_auth_token(token: str):
     """
     from dara.core.internal.registries import session_auth_token_registry
 
+    # The token may be a raw bearer token rather than a session handle
+    verified_session_cache.remove(token)
+
     stored_session = await remove_auth_session(token)
     if stored_session is not None and session_auth_token_registry.has(stored_session.token_data.session_id):
         session_auth_token_registry.remove(stored_session.token_data.session_id)
@@ -362,20 +366,21 @@ async def verify_session(
 
         auth_config: BaseAuthConfig = auth_registry.get('auth_config')
 
-        if (
-            dara_session_token is not None
-            and token == dara_session_token
-            and await get_stored_auth_session(token) is None
-        ):
-            raise HTTPException(status_code=401, detail=INVALID_TOKEN_ERROR)
+        # Session cookies must resolve to a stored session, resolve it once and reuse it for verification
+        stored_session = None
+        if dara_session_token is not None and token == dara_session_token:
+            stored_session = await get_stored_auth_session(token)
+            if stored_session is None:
+                raise HTTPException(status_code=401, detail=INVALID_TOKEN_ERROR)
 
         try:
-            await verify_auth_token(auth_config, token)
+            await verify_auth_token(auth_config, token, stored_session=stored_session)
         except AuthError as auth_error:
             if not _should_attempt_session_refresh(auth_error):
                 raise
 
-            stored_session = await get_stored_auth_session(token)
+            if stored_session is None:
+                stored_session = await get_stored_auth_session(token)
             if stored_session is None or stored_session.refresh_token is None:
                 raise
 
@@ -15,16 +15,34 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from hashlib import sha256
 from inspect import isawaitable
 
 import jwt
 from fastapi import HTTPException
 
 from dara.core.auth.base import BaseAuthConfig
-from dara.core.auth.definitions import BAD_REQUEST_ERROR, INVALID_TOKEN_ERROR, AuthError, TokenData
-from dara.core.auth.session_store import StoredAuthSession, get_auth_session_backend, get_auth_session_expiration
+from dara.core.auth.definitions import (
+    BAD_REQUEST_ERROR,
+    ID_TOKEN,
+    INVALID_TOKEN_ERROR,
+    SESSION_ID,
+    USER,
+    AuthError,
+    TokenData,
+    UserData,
+)
+from dara.core.auth.session_store import (
+    StoredAuthSession,
+    _to_timestamp,
+    get_auth_session_backend,
+    get_auth_session_expiration,
+)
 from dara.core.auth.utils import cached_refresh_token
+from dara.core.internal.settings import get_settings
 from dara.core.telemetry import annotate_auth_observation, observe_auth
 
 
@@ -37,6 +55,129 @@ class _StoredRefreshSubject:
     refresh_token: str
 
 
+@dataclass(frozen=True)
+class _VerifiedSession:
+    """Result of verifying a token, along with the auth context set while verifying it."""
+
+    auth_config: BaseAuthConfig
+    token_data: TokenData
+    session_id: str | None
+    user: UserData | None
+    id_token: str | None
+    expires_at: float
+
+
+class VerifiedSessionCache:
+    """
+    Bounded in-process cache of verified auth tokens, so requests sent with the same token only verify it once.
+
+    Entries are keyed by a hash of the raw auth token, never of an opaque session handle. Session handles are
+    resolved through the session backend on every request, so a session revoked or refreshed in the backend,
+    by any process, stops resolving to the cached token right away. Entries are valid for at most `ttl` seconds,
+    and never past the expiry of the token. The entry of a raw token is also removed straight away when it is
+    revoked or refreshed in this process.
+    """
+
+    def __init__(self, max_size: int | None = None, ttl: float | None = None):
+        """
+        :param max_size: Maximum number of tokens to keep, defaults to the `AUTH_VERIFIED_SESSION_CACHE_SIZE` setting.
+            Set to 0 to disable caching.
+        :param ttl: Maximum number of seconds to keep a verification for, defaults to the
+            `AUTH_VERIFIED_SESSION_CACHE_TTL_SECONDS` setting
+        """
+        if max_size is not None and max_size < 0:
+            raise ValueError('max_size must be greater than or equal to 0')
+        if ttl is not None and ttl < 0:
+            raise ValueError('ttl must be greater than or equal to 0')
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, _VerifiedSession] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size if self._max_size is not None else get_settings().auth_verified_session_cache_size
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else get_settings().auth_verified_session_cache_ttl_seconds
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return sha256(token.encode()).hexdigest()
+
+    def _get_entry(self, auth_config: BaseAuthConfig, token: str) -> _VerifiedSession | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.auth_config is not auth_config or entry.expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, auth_config: BaseAuthConfig, token: str) -> TokenData | None:
+        """
+        Return the verified token data for a token and restore the auth context set while verifying it.
+
+        :param auth_config: the auth config verifying the token
+        :param token: the token to look up
+        """
+        entry = self._get_entry(auth_config, token)
+        if entry is None:
+            return None
+
+        SESSION_ID.set(entry.session_id)
+        USER.set(entry.user)
+        ID_TOKEN.set(entry.id_token)
+        return entry.token_data.model_copy(deep=True)
+
+    def set(self, auth_config: BaseAuthConfig, token: str, token_data: TokenData):
+        """
+        Store the verified token data for a raw auth token along with the current auth context.
+
+        :param auth_config: the auth config which verified the token
+        :param token: the verified raw auth token
+        :param token_data: the verified token data
+        """
+        max_size = self.max_size
+        ttl = self.ttl
+        if max_size == 0 or ttl == 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = _VerifiedSession(
+            auth_config=auth_config,
+            token_data=token_data.model_copy(deep=True),
+            session_id=SESSION_ID.get(),
+            user=USER.get(),
+            id_token=ID_TOKEN.get(),
+            expires_at=min(_to_timestamp(token_data.exp), time.time() + ttl),
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > max_size:
+            self._entries.popitem(last=False)
+
+    def remove(self, token: str):
+        """
+        Invalidate the cached verification of a raw auth token.
+
+        :param token: the raw auth token to invalidate
+        """
+        self._entries.pop(self._key(token), None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+verified_session_cache = VerifiedSessionCache()
+"""Process-wide cache of verified auth tokens"""
+
+
 async def get_stored_auth_session(token: str) -> StoredAuthSession | None:
     """
     Return a stored auth session for an opaque browser session handle.
@@ -70,6 +211,8 @@ async def remove_auth_session(token: str) -> StoredAuthSession | None:
             observation,
             attributes={'dara.auth.session_store.result': 'removed' if session is not None else 'miss'},
         )
+        if session is not None:
+            verified_session_cache.remove(session.auth_token)
         return session
 
 
@@ -92,19 +235,33 @@ async def verify_raw_auth_token(auth_config: BaseAuthConfig, token: str) -> Toke
             raise
 
 
-async def verify_auth_token(auth_config: BaseAuthConfig, token: str) -> TokenData:
+async def verify_auth_token(
+    auth_config: BaseAuthConfig, token: str, stored_session: StoredAuthSession | None = None
+) -> TokenData:
     """
     Verify an auth token transported by the browser or an external bearer client.
 
     Opaque browser session handles are resolved first. If the handle is not present
     in the server-side store, fall back to verifying the token directly so existing
     raw bearer token integrations keep working.
+
+    Verifications of raw tokens are cached briefly, see `VerifiedSessionCache`.
+
+    :param auth_config: the auth config verifying the token
+    :param token: the session handle or raw auth token to verify
+    :param stored_session: the stored session of the handle, if already resolved by the caller
     """
-    stored_session = await get_stored_auth_session(token)
     if stored_session is None:
-        return await verify_raw_auth_token(auth_config, token)
+        stored_session = await get_stored_auth_session(token)
+    raw_token = token if stored_session is None else stored_session.auth_token
 
-    return await verify_raw_auth_token(auth_config, stored_session.auth_token)
+    cached_token_data = verified_session_cache.get(auth_config, raw_token)
+    if cached_token_data is not None:
+        return cached_token_data
+
+    token_data = await verify_raw_auth_token(auth_config, raw_token)
+    verified_session_cache.set(auth_config, raw_token, token_data)
+    return token_data
 
 
 async def resolve_raw_auth_token(auth_config: BaseAuthConfig, token: str) -> str:
@@ -193,4 +350,7 @@ async def refresh_auth_session(
         if not updated:
             raise AuthError(INVALID_TOKEN_ERROR, 401)
 
+        # The previous token is no longer the one the session resolves to
+        verified_session_cache.remove(refresh_subject.session.auth_token)
+
         return session_token, new_token_data, new_refresh_token
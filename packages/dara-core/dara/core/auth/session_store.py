@@ -15,6 +15,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import heapq
 import json
 import os
 import re
@@ -48,6 +49,7 @@ AUTH_SESSION_BACKEND_REGISTRY_KEY = 'AuthSessionBackend'
 AUTH_SESSION_FILE_ENV_VAR = 'DARA_AUTH_SESSION_FILE_PATH'
 AUTH_SESSION_FILE_NAME_PATTERN = re.compile(r'^[0-9a-f]{64}\.json$')
 MAX_AUTH_SESSION_FILE_BYTES = 1024 * 1024
+AUTH_SESSION_CLEANUP_BATCH_SIZE = 100
 
 
 def generate_auth_session_token() -> str:
@@ -295,7 +297,7 @@ class FileAuthSessionBackend:
     from the opaque session handle hash and never contain the raw handle.
     """
 
-    def __init__(self, path: str | Path | None = None, cache_size: int = 1024):
+    def __init__(self, path: str | Path | None = None, cache_size: int = 1024, index_rebuild_interval: float = 3600):
         """
         Create a file-backed auth session store.
 
@@ -304,13 +306,21 @@ class FileAuthSessionBackend:
             app-scoped directory under the platform temp directory is created.
         :param cache_size: Maximum number of sessions to keep in the in-process
             read-through cache. Set to 0 to disable caching.
+        :param index_rebuild_interval: Seconds after which `clear_expired` rescans
+            the directory to index sessions written by other processes.
         """
         if cache_size < 0:
             raise ValueError('cache_size must be greater than or equal to 0')
 
         self.root = self._resolve_root(path)
         self.cache_size = cache_size
+        self.index_rebuild_interval = index_rebuild_interval
         self._cache: OrderedDict[str, _SessionEntry] = OrderedDict()
+        # Expiry index of session files, a heap of (retention expiry, file name) and the latest
+        # expiry of each file; heap items not matching the latest expiry are stale and skipped
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._expiries: dict[str, float] = {}
+        self._index_scanned_at: float | None = None
         # Serialize public operations within this backend instance so a
         # refresh-time set cannot recreate a session removed by logout/revoke.
         self._lock = anyio.Lock()
@@ -406,6 +416,65 @@ class FileAuthSessionBackend:
         while len(self._cache) > self.cache_size:
             self._cache.popitem(last=False)
 
+    def _index_expiry(self, file_name: str, retention_expires_at: float):
+        """
+        Record the retention expiry of a session file in the expiry index.
+
+        :param file_name: Session file name.
+        :param retention_expires_at: Timestamp after which the session can be removed.
+        """
+        if self._expiries.get(file_name) == retention_expires_at:
+            return
+
+        self._expiries[file_name] = retention_expires_at
+        heapq.heappush(self._expiry_heap, (retention_expires_at, file_name))
+
+    def _pop_expired_from_index(self, now: float) -> list[str]:
+        """
+        Remove and return the names of indexed session files whose retention has expired.
+
+        :param now: Current timestamp used for expiration checks.
+        """
+        expired: list[str] = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            retention_expires_at, file_name = heapq.heappop(self._expiry_heap)
+            if self._expiries.get(file_name) == retention_expires_at:
+                del self._expiries[file_name]
+                expired.append(file_name)
+        return expired
+
+    async def _scan_expiry_index(self):
+        """
+        Index the session files in the root, including ones written by other processes.
+
+        Session files carry their retention expiry as their modification time, so
+        the scan only stats files. It runs in batches without holding the backend lock.
+        """
+
+        def scan_batch(iterator) -> list[tuple[str, float]] | None:
+            batch: list[tuple[str, float]] = []
+            for dir_entry in iterator:
+                if AUTH_SESSION_FILE_NAME_PATTERN.fullmatch(dir_entry.name):
+                    with suppress(OSError):
+                        if dir_entry.is_file(follow_symlinks=False):
+                            batch.append((dir_entry.name, dir_entry.stat(follow_symlinks=False).st_mtime))
+                if len(batch) >= AUTH_SESSION_CLEANUP_BATCH_SIZE:
+                    return batch
+            return batch or None
+
+        try:
+            iterator = await to_thread.run_sync(os.scandir, self.root)
+        except OSError as e:
+            raise RuntimeError(f'Failed to list auth session file backend root: {self.root}') from e
+
+        with iterator:
+            while (batch := await to_thread.run_sync(scan_batch, iterator)) is not None:
+                for file_name, modified_at in batch:
+                    # Expiries indexed by this process are exact, the modification time is a hint
+                    # confirmed by reading the file before removing it
+                    if file_name not in self._expiries:
+                        self._index_expiry(file_name, modified_at)
+
     @staticmethod
     def _is_session_file(path: anyio.Path) -> bool:
         """
@@ -526,12 +595,17 @@ class FileAuthSessionBackend:
                 await file.flush()
                 await to_thread.run_sync(os.fsync, file.wrapped.fileno())
 
+            # Store the retention expiry as the modification time, so the expiry index can be
+            # rebuilt from a directory scan without reading every file
+            await to_thread.run_sync(os.utime, tmp_path, (entry.retention_expires_at, entry.retention_expires_at))
+
             # Readers should observe either the old complete file or the new
             # complete file, never an in-place rewrite.
             await tmp_path.replace(path)
             # fsync the directory so the rename itself is durable on filesystems
             # that require directory metadata to be flushed separately.
             await self._fsync_root()
+            self._index_expiry(path.name, entry.retention_expires_at)
         except Exception:
             with suppress(OSError):
                 await tmp_path.unlink(missing_ok=True)
@@ -603,6 +677,7 @@ class FileAuthSessionBackend:
             await self._remove_file(path)
             return None
 
+        self._index_expiry(path.name, entry.retention_expires_at)
         self._cache_entry(session_token, entry)
         return entry
 
@@ -716,24 +791,47 @@ class FileAuthSessionBackend:
                     continue
                 await self._remove_file(path)
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._expiries.clear()
 
     async def clear_expired(self):
         """
         Remove valid session files whose retention window has expired.
+
+        Only sessions due according to the expiry index are read, in small batches,
+        and the backend lock is only held while a batch is removed. The directory is
+        rescanned to index sessions written by other processes at most once every
+        `index_rebuild_interval` seconds.
         """
         now = time.time()
+        if self._index_scanned_at is None or now - self._index_scanned_at >= self.index_rebuild_interval:
+            await self._scan_expiry_index()
+            self._index_scanned_at = now
+
         async with self._lock:
             expired_cache_tokens = [
                 session_token for session_token, entry in self._cache.items() if entry.retention_expires_at <= now
             ]
+            # Cached sessions are indexed too, their files are removed below once confirmed expired
             for session_token in expired_cache_tokens:
                 self._cache.pop(session_token, None)
-                await self._remove_file(self._session_file_path(session_token))
 
-            async for path in self._valid_session_files():
-                entry = await self._read_entry_file(path)
-                if entry is not None and entry.retention_expires_at <= now:
-                    await self._remove_file(path)
+        expired_files = self._pop_expired_from_index(now)
+        for start in range(0, len(expired_files), AUTH_SESSION_CLEANUP_BATCH_SIZE):
+            async with self._lock:
+                for file_name in expired_files[start : start + AUTH_SESSION_CLEANUP_BATCH_SIZE]:
+                    # Re-read under the lock, the session may have been refreshed since it was indexed
+                    path = anyio.Path(self.root / file_name)
+                    entry = await self._read_entry_file(path)
+                    if entry is None:
+                        continue
+                    if entry.retention_expires_at <= now:
+                        await self._remove_file(path)
+                    else:
+                        self._index_expiry(file_name, entry.retention_expires_at)
+
+            # Let other requests acquire the lock between batches
+            await anyio.sleep(0)
 
 
 def _should_use_file_auth_sessions_by_default() -> bool:
@@ -263,10 +263,13 @@ class TTLCachePolicy(BaseCachePolicy):
     Evicts items from the cache after the specified time-to-live.
 
     :param ttl: time-to-live in seconds
+    :param max_stale: optional stale-while-revalidate window in seconds. If set, an expired entry keeps being
+        served for up to `max_stale` seconds past its TTL while a single background recomputation refreshes it
     """
 
     policy: str = Field(default='ttl', frozen=True)
     ttl: int
+    max_stale: int | None = None
 
 
 class Cache:
@@ -338,6 +341,9 @@ class CachedRegistryEntry(BaseModel):
     cache: BaseCachePolicy | None = None
     uid: str
 
+    shared: ClassVar[bool] = False
+    """Whether values are written through to the shared cache backend, if configured, so other processes can reuse them"""
+
     def to_store_key(self):
         """
         Returns a unique store key for this entry.
@@ -71,6 +71,7 @@ def cli():
 @click.option('--reload-dir', multiple=True, help='Directories to watch for reload')
 @click.option('--skip-jsbuild', is_flag=True, help='Whether to skip building the JS assets')
 @click.option('--dev-port', type=click.IntRange(1, 65535), help='The port used by the Vite development server')
+@click.option('--workers', default=1, type=click.IntRange(1), help='The number of worker processes to run')
 @click.option(
     '--base-url',
     default=lambda: os.environ.get('DARA_BASE_URL', None),
@@ -93,11 +94,19 @@ def start(
     reload_dir: list[str] | None,
     skip_jsbuild: bool,
     dev_port: int | None,
+    workers: int,
     base_url: str | None,
 ):
     if dev_port is not None and not enable_hmr:
         raise UsageError('--dev-port requires --enable-hmr')
 
+    if workers > 1:
+        if reload:
+            raise UsageError('--workers cannot be used with --reload')
+        if not disable_metrics:
+            # Each worker would try to bind its own Prometheus endpoint to the same port
+            raise UsageError('--workers requires --disable-metrics, export metrics over OTLP instead')
+
     config = _resolve_config_path(config)
 
     # Set the config path env var so main can pick it up
@@ -145,6 +154,9 @@ def start(
     if reload:
         os.environ['DARA_LIVE_RELOAD'] = 'TRUE'
 
+    # Let the app know how many processes serve it so it can warn about process-local state
+    os.environ['DARA_WORKERS'] = str(workers)
+
     # Skip rebuild js assets
     if skip_jsbuild:
         os.environ['SKIP_JSBUILD'] = 'TRUE'
@@ -200,6 +212,7 @@ def start(
         port=port,
         reload=reload,
         reload_dirs=dirs_to_watch,
+        workers=workers,
         log_config=logging_config,
         limit_max_requests=limit_max_requests,
         lifespan='on',
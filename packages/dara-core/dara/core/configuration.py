@@ -50,6 +50,7 @@ from dara.core.definitions import (
 from dara.core.interactivity.actions import ActionImpl, ResetVariables
 from dara.core.interactivity.any_variable import AnyVariable
 from dara.core.interactivity.client_variable import ClientVariable
+from dara.core.interactivity.server_variable import MemoryBackend, ServerVariable
 from dara.core.internal.encoder_registry import Encoder
 from dara.core.internal.import_discovery import (
     create_action_definition,
@@ -57,9 +58,11 @@ from dara.core.internal.import_discovery import (
     run_discovery,
 )
 from dara.core.internal.registry_lookup import CustomRegistryLookup
-from dara.core.internal.scheduler import ScheduledJob, ScheduledJobFactory
+from dara.core.internal.scheduler import ScheduledJob, ScheduledJobFactory, with_result_target
 from dara.core.logging import dev_logger
+from dara.core.persistence import BackendStore, InMemoryBackend
 from dara.core.router import Router
+from dara.core.shared_state import MessageBusConfig, SharedCacheBackendConfig, SingleFlightConfig
 from dara.core.visual.components import RawString
 from dara.core.visual.themes import BaseTheme, ThemeDef
 
@@ -77,11 +80,14 @@ class Configuration(BaseModel):
     enable_devtools: bool
     module_dependencies: dict[str, str]
     live_reload: bool
+    message_bus: MessageBusConfig | None = None
     powered_by_causalens: bool
     router: Router
     pages: dict[str, Page]
     routes: set[ApiRoute]
     scheduled_jobs: list[tuple[ScheduledJob | ScheduledJobFactory, Callable, list[Any] | None]] = []
+    shared_cache_backend: SharedCacheBackendConfig | None = None
+    single_flight: SingleFlightConfig | None = None
     startup_functions: list[Callable]
     static_folders: list[str]
     static_files_dir: str
@@ -126,6 +132,17 @@ class Configuration(BaseModel):
         return packages
 
 
+def _is_process_local(target: ServerVariable | BackendStore) -> bool:
+    """
+    Check whether a scheduled job target keeps its value in the memory of the current process.
+
+    :param target: the target of a scheduled job
+    """
+    if isinstance(target, ServerVariable):
+        return isinstance(target.backend, MemoryBackend)
+    return isinstance(target.backend, InMemoryBackend)
+
+
 class ConfigurationBuilder:
     """
     The ConfigurationBuilder class lets you build a Configuration object up piece by piece using helper methods that
@@ -140,6 +157,9 @@ class ConfigurationBuilder:
 
     auth_config: BaseAuthConfig
     _auth_session_backend: AuthSessionBackendConfig
+    _shared_cache_backend: SharedCacheBackendConfig | None
+    _message_bus: MessageBusConfig | None
+    _single_flight: SingleFlightConfig | None
     registry_lookup: CustomRegistryLookup
     _actions: list[ActionDef]
     _components: list[ComponentTypeAnnotation]
@@ -170,6 +190,9 @@ class ConfigurationBuilder:
     def __init__(self):
         self.auth_config = DefaultAuthConfig()
         self._auth_session_backend = auto_auth_session_backend
+        self._shared_cache_backend = None
+        self._message_bus = None
+        self._single_flight = None
         self.registry_lookup = {}
         self._actions = []
         self._components = []
@@ -233,6 +256,46 @@ class ConfigurationBuilder:
     def auth_session_backend(self, backend: AuthSessionBackendConfig):
         self._auth_session_backend = backend
 
+    @property
+    def shared_cache_backend(self) -> SharedCacheBackendConfig | None:
+        """
+        Backend or factory used to share cached values between app processes.
+        Defaults to None, meaning cached values are kept in-process only.
+        """
+
+        return self._shared_cache_backend
+
+    @shared_cache_backend.setter
+    def shared_cache_backend(self, backend: SharedCacheBackendConfig | None):
+        self._shared_cache_backend = backend
+
+    @property
+    def message_bus(self) -> MessageBusConfig | None:
+        """
+        Bus or factory used to forward websocket messages to channels owned by other app processes.
+        Defaults to None, meaning messages only reach clients connected to the current process.
+        """
+
+        return self._message_bus
+
+    @message_bus.setter
+    def message_bus(self, bus: MessageBusConfig | None):
+        self._message_bus = bus
+
+    @property
+    def single_flight(self) -> SingleFlightConfig | None:
+        """
+        Single-flight or factory used so only one app process computes a missing DerivedVariable value,
+        the others reuse its result from the shared cache backend. Requires `shared_cache_backend` to be set.
+        Defaults to None, meaning each process computes missing values independently.
+        """
+
+        return self._single_flight
+
+    @single_flight.setter
+    def single_flight(self, single_flight: SingleFlightConfig | None):
+        self._single_flight = single_flight
+
     def add_action(self, action: type[ActionImpl], local: bool = False):
         """
         Register an Action with the application.
@@ -579,12 +642,49 @@ class ConfigurationBuilder:
         self.startup_functions.append(startup_function)
         return startup_function
 
-    def scheduler(self, job: ScheduledJob, args: None | list[Any] = None):
+    def scheduler(
+        self,
+        job: ScheduledJob | ScheduledJobFactory,
+        args: None | list[Any] = None,
+        target: ServerVariable | BackendStore | None = None,
+    ):
+        """
+        Register a function to run on a schedule. Used as a decorator::
+
+            from dara.core.internal import scheduler
+
+            prices = ServerVariable(scope='global')
+
+            @config.scheduler(scheduler.every(5).minutes(), target=prices)
+            async def refresh_prices():
+                return await fetch_prices()
+
+        When a target is passed, the job runs in the app process and its return value is written to the target
+        on every run, which notifies all connected clients. Targets must be globally scoped, as scheduled jobs
+        run outside of any user session. When running multiple workers, jobs writing to a target whose backend
+        is shared between processes run in a single worker, other in-process jobs run in every worker.
+
+        :param job: The schedule to run the function on
+        :param args: List of arguments to pass to the function
+        :param target: A ServerVariable or BackendStore to write the result of each run to
+        """
         if args is None:
             args = []
 
+        if target is not None:
+            if target.scope != 'global':
+                raise ValueError('Scheduled jobs can only write to a target with a global scope')
+            # Copy the job so the schedule passed in, which may be shared, is left untouched
+            job = job.model_copy()
+            if not job.run_in_process:
+                job.in_process()
+            # Values kept in the memory of each process have to be written by every worker
+            job.single_runner = not _is_process_local(target)
+
         def _wrapper_func(func: Callable):
-            self.scheduled_jobs.append((job, func, args))
+            job_func = with_result_target(func, target) if target is not None else func
+            self.scheduled_jobs.append((job, job_func, args))
+            return func
 
         return _wrapper_func
 
@@ -629,6 +729,7 @@ class ConfigurationBuilder:
             enable_devtools=self.enable_devtools,
             module_dependencies=self._module_dependencies,
             live_reload=self.live_reload,
+            message_bus=self._message_bus,
             pages=self._pages,
             powered_by_causalens=self.powered_by_causalens,
             package_tag_processors=self._package_tags_processors,
@@ -636,6 +737,8 @@ class ConfigurationBuilder:
             router=self.router,
             static_files_dir=self.static_files_dir,
             scheduled_jobs=self.scheduled_jobs,
+            shared_cache_backend=self._shared_cache_backend,
+            single_flight=self._single_flight,
             startup_functions=all_startup_functions,
             static_folders=self._static_folders,
             task_module=self.task_module,
@@ -17,8 +17,13 @@ limitations under the License.
 
 import io
 import os
+from collections import OrderedDict
+from collections.abc import Sequence
+from threading import Lock
+from typing import Any
 
-import pandas
+import numpy
+import pyarrow.parquet
 from pandas import DataFrame
 
 from dara.core.base_definitions import CacheType
@@ -26,9 +31,9 @@ from dara.core.base_definitions import DaraBaseModel as BaseModel
 from dara.core.interactivity import (
     ClientVariable,
     DerivedVariable,
-    DownloadContent,
     SideEffect,
     Variable,
+    action,
 )
 from dara.core.internal.utils import get_cache_scope
 
@@ -141,6 +146,132 @@ class FileStore(BaseModel):
         os.remove(os.path.join(scope_path, name))
 
 
+DatasetFilters = Sequence[Sequence[Any]]
+"""
+Row filters in the `pyarrow`/`pandas.read_parquet` format, e.g. `[('col', '>', 5), ('other', 'in', ['a', 'b'])]`.
+A list of such lists is combined with OR.
+"""
+
+
+class DatasetCache:
+    """
+    Process-wide cache of datasets read from parquet files.
+
+    Entries are keyed by the file path, its modification time and size, and the projected columns, so a dataset
+    changed on disk is read again. Cached DataFrames are shared between all callers, so their values are made
+    read-only and writing to them in place raises an error.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        """
+        :param max_entries: maximum number of DataFrames to keep, least recently used ones are evicted first
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, DataFrame] = OrderedDict()
+        self._lock = Lock()
+        self._key_locks: dict[tuple, Lock] = {}
+
+    def read(
+        self, path: str, columns: Sequence[str] | None = None, filters: DatasetFilters | None = None
+    ) -> DataFrame | None:
+        """
+        Read a parquet file through a memory map, serving unfiltered reads from the cache.
+
+        Filtered reads skip the row groups whose statistics do not match the filters and are not cached.
+
+        :param path: path to the parquet file
+        :param columns: optional columns to read, defaults to all columns
+        :param filters: optional row filters pushed down to the parquet reader
+        :returns: the dataset or None if the file does not exist
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        column_key = tuple(columns) if columns is not None else None
+        if filters is not None and len(filters) > 0:
+            return self._load(path, column_key, filters)
+
+        key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size, column_key)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        # Only one thread loads a given dataset, the others wait and reuse its result
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    return self._entries[key]
+
+            try:
+                df = self._load(path, column_key, None)
+                _make_read_only(df)
+
+                with self._lock:
+                    # Drop entries for previous versions of the file
+                    for stale_key in [k for k in self._entries if k[0] == key[0] and k[1:3] != key[1:3]]:
+                        del self._entries[stale_key]
+                    self._entries[key] = df
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+        return df
+
+    def invalidate(self, path: str):
+        """
+        Remove all cached entries for a given file.
+
+        :param path: path to the parquet file
+        """
+        real_path = os.path.realpath(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == real_path]:
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _load(path: str, columns: tuple[str, ...] | None, filters: DatasetFilters | None) -> DataFrame:
+        table = pyarrow.parquet.read_table(
+            path,
+            columns=list(columns) if columns is not None else None,
+            filters=filters,
+            memory_map=True,
+            use_pandas_metadata=True,
+        )
+        return table.to_pandas()
+
+
+def _make_read_only(df: DataFrame):
+    """
+    Mark the arrays holding the values of a DataFrame as read-only, including the ones backing extension arrays
+    such as categoricals or nullable integers, so in-place writes fail instead of changing them for every holder.
+
+    :param df: the DataFrame to make read-only
+    """
+    for values in df._mgr.arrays:
+        for array in (values, getattr(values, '_ndarray', None), getattr(values, '_data', None)):
+            if isinstance(array, numpy.ndarray):
+                array.flags.writeable = False
+        mask = getattr(values, '_mask', None)
+        if isinstance(mask, numpy.ndarray):
+            mask.flags.writeable = False
+
+
+dataset_cache = DatasetCache()
+"""Dataset cache shared by all DataFactory instances in the process"""
+
+
 class DataFactory(BaseModel):
     """
     Acts as a factory of variables, actions and methods to interact with data stored locally.
@@ -251,6 +382,7 @@ class DataFactory(BaseModel):
         writer = self.file_store.write_file(cache, name)
         dataset.to_parquet(writer)
         writer.close()
+        dataset_cache.invalidate(self.get_dataset_path(name, cache))
 
     def get_dataset_path(self, name: str, cache: CacheType = CacheType.GLOBAL) -> str:
         """
@@ -262,12 +394,25 @@ class DataFactory(BaseModel):
         """
         return os.path.join(self.file_store.get_scoped_path(cache), name)
 
-    def read_dataset(self, name: str, cache: CacheType = CacheType.GLOBAL) -> DataFrame | None:
+    def read_dataset(
+        self,
+        name: str,
+        cache: CacheType = CacheType.GLOBAL,
+        columns: Sequence[str] | None = None,
+        filters: DatasetFilters | None = None,
+    ) -> DataFrame | None:
         """
         Read a dataset from disk to a DataFrame.
 
+        Datasets are read through a memory map and cached process-wide, so repeated reads, e.g. from many sessions,
+        share one copy of the data. Each call returns a shallow copy of the cached DataFrame, so adding, removing or
+        replacing columns does not affect other callers. Its values are read-only, modifying them in place, e.g.
+        `df.loc[0, 'col'] = 1` or `df['col'] += 1`, raises an error; copy the DataFrame first to do so.
+
         :param name: name of the dataset
         :param cache: cache type to get dataset for
+        :param columns: optional list of columns to read, defaults to all columns
+        :param filters: optional row filters, e.g. `[('col', '>', 5)]`; only row groups which can match them are read
         :returns: DataFrame or None if the dataset does not exist
         """
         if name is None:
@@ -277,20 +422,16 @@ class DataFactory(BaseModel):
         name_clean, _ext = os.path.splitext(name)
         name = name_clean + '.parquet'
 
-        reader = self.file_store.get_file(cache, name)
-
-        if reader is None:
-            return None
-
-        df = pandas.read_parquet(reader)
-        reader.close()
-        return df
+        df = dataset_cache.read(self.get_dataset_path(name, cache), columns, filters)
+        return df.copy(deep=False) if df is not None else None
 
     def read_dataset_var(
         self,
         name: str | ClientVariable,
         cache: CacheType | ClientVariable = CacheType.GLOBAL,
         polling_interval: int | ClientVariable | None = None,
+        columns: list[str] | ClientVariable | None = None,
+        filters: DatasetFilters | ClientVariable | None = None,
     ) -> DerivedVariable:
         """
         Create a DerivedVariable which reads a specific dataset from disk
@@ -299,13 +440,17 @@ class DataFactory(BaseModel):
         :param cache: cache to get the dataset for
         :param polling_interval: optional polling interval in seconds for the derived variable. Can be either a fixed
             integer or a ClientVariable for dynamic polling/disable behavior
+        :param columns: optional list of columns to read, or a ClientVariable holding it
+        :param filters: optional row filters, or a ClientVariable holding them, see `read_dataset`
         """
         name_var = name if isinstance(name, ClientVariable) else Variable(name)
         cache_var = cache if isinstance(cache, ClientVariable) else Variable(cache)
+        columns_var = columns if isinstance(columns, ClientVariable) else Variable(columns)
+        filters_var = filters if isinstance(filters, ClientVariable) else Variable(filters)
 
         return DerivedVariable(
             self.read_dataset,
-            variables=[name_var, cache_var],
+            variables=[name_var, cache_var, columns_var, filters_var],
             cache=CacheType.SESSION,
             polling_interval=polling_interval,
         )
@@ -318,6 +463,7 @@ class DataFactory(BaseModel):
         :param cache: cache to remove the dataset for
         """
         self.file_store.delete_file(cache, name)
+        dataset_cache.invalidate(self.get_dataset_path(name, cache))
 
     def delete_dataset_action(self, name: str | ClientVariable, cache: CacheType | ClientVariable = CacheType.GLOBAL):
         """
@@ -333,7 +479,7 @@ class DataFactory(BaseModel):
 
     def download_dataset_action(self, name: str | ClientVariable, cache: CacheType | ClientVariable = CacheType.GLOBAL):
         """
-        Get a DownloadContent action which downloads a dataset with a given name as a .csv
+        Get an action which downloads a dataset with a given name as a .csv
 
         :param name: name of the dataset to download
         :param cache: cache to download dataset for
@@ -341,8 +487,7 @@ class DataFactory(BaseModel):
         name_var = name if isinstance(name, ClientVariable) else Variable(name)
         cache_var = cache if isinstance(cache, ClientVariable) else Variable(cache)
 
-        def _resolver(ctx: DownloadContent.Ctx):  # type: ignore
-            ds_name, sel_cache = ctx.extras  # type: ignore
+        async def _download(ctx: action.Ctx, ds_name: str, sel_cache: CacheType):
             df = self.read_dataset(ds_name, sel_cache)
 
             if df is None:
@@ -350,9 +495,7 @@ class DataFactory(BaseModel):
 
             clean_name, _ext = os.path.splitext(ds_name)
 
-            # Write the dataset as a .csv temporarily, will be cleaned up after download
-            csv_path = os.path.join(self.file_store.get_scoped_path(sel_cache), clean_name + '.csv')
-            df.to_csv(csv_path)
-            return csv_path
+            # Streamed as .csv chunk by chunk rather than written to a temporary file
+            await ctx.download_content(df, clean_name + '.csv')
 
-        return DownloadContent(resolver=_resolver, extras=[name_var, cache_var], cleanup_file=True)
+        return action(_download)(name_var, cache_var)
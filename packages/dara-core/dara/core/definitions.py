@@ -42,7 +42,7 @@ from pydantic import (
     model_serializer,
 )
 
-from dara.core.base_definitions import Action, ComponentType
+from dara.core.base_definitions import Action, BaseCachePolicy, ComponentType
 from dara.core.base_definitions import DaraBaseModel as BaseModel
 from dara.core.css import CSSProperties
 from dara.core.interactivity import AnyVariable
@@ -462,6 +462,8 @@ class PyComponentDef(BaseModel):
     polling_interval: int | ClientVariable | None = None
     render_component: Callable[..., Awaitable[Any]]
     """Handler to render the component. Defaults to dara.core.visual.dynamic_component.render_component"""
+    cache: BaseCachePolicy | None = None
+    """Optional cache policy for the rendered results, keyed by the resolved arguments"""
 
     type: Literal[ComponentType.PY] = ComponentType.PY
 
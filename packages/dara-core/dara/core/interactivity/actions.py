@@ -20,7 +20,6 @@ from __future__ import annotations
 import contextlib
 import inspect
 import math
-import uuid
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 from enum import Enum
@@ -54,7 +53,14 @@ from dara.core.base_definitions import (
 from dara.core.base_definitions import DaraBaseModel as BaseModel
 from dara.core.interactivity.server_variable import ServerVariable
 from dara.core.interactivity.state_variable import StateVariable
-from dara.core.internal.download import generate_download_code
+from dara.core.internal.cross_process import generate_uid
+from dara.core.internal.download import (
+    DataFrameDownloadFormat,
+    StreamingContent,
+    encode_dataframe,
+    generate_download_code,
+    get_dataframe_format,
+)
 from dara.core.internal.registry_lookup import RegistryLookup
 from dara.core.internal.utils import run_user_handler
 
@@ -618,14 +624,17 @@ DownloadContentDef = ActionDef(name='DownloadContent', js_module='@darajs/core',
 
 @deprecated('Use @action instead')
 def DownloadContent(
-    resolver: Callable[[ComponentActionContext], str],
+    resolver: Callable[[ComponentActionContext], str | StreamingContent | DataFrame],
     extras: list[AnyVariable] | None = None,
     cleanup_file: bool = False,
+    file_name: str | None = None,
 ):
     """
     @deprecated This action is deprecated, use `ctx.download_file` in an `@action` instead.
 
-    Download action, downloads a given file
+    Download action, downloads a given file.
+    The resolver can also return an iterable or async iterable of bytes, or a DataFrame, which is then streamed to the
+    client as `file_name` without writing it to a file first.
 
     ```python
 
@@ -670,7 +679,12 @@ def DownloadContent(
         extras = [kwargs[f'kwarg_{idx}'] for idx in range(len(kwargs))]
         old_ctx = ComponentActionContext(inputs=ComponentActionInputs(value=ctx.input), extras=extras)
         result = await run_user_handler(resolver, args=(old_ctx,))
-        await ctx.download_file(result, cleanup_file)
+        if isinstance(result, str):
+            await ctx.download_file(result, cleanup_file)
+        else:
+            await ctx.download_content(
+                result, file_name or ('download.csv' if isinstance(result, DataFrame) else 'download')
+            )
 
     # Update the signature of _download to match so @action decorator works
     params = [
@@ -1254,6 +1268,60 @@ class ActionCtx:
         code = await generate_download_code(path, cleanup)
         return await NavigateToImpl(url=f'/api/core/download?code={code}', new_tab=True).execute(self)
 
+    async def download_content(
+        self,
+        content: StreamingContent | DataFrame,
+        file_name: str,
+        format: DataFrameDownloadFormat | None = None,
+    ):
+        """
+        Download content streamed from the server chunk by chunk, without writing it to a file first.
+
+        ```python
+
+        from dara.core import action, ConfigurationBuilder, ServerVariable
+        from dara.components.components import Button, Stack
+
+        df = pandas.DataFrame(data={'x': [1, 2, 3], 'y':[4, 5, 6]})
+        my_var = ServerVariable(df)
+
+        config = ConfigurationBuilder()
+
+        @action
+        async def download_parquet(ctx: action.Ctx, my_var_value: DataFrame):
+            # The DataFrame is encoded as the file is downloaded, one row group at a time
+            await ctx.download_content(my_var_value, file_name='data.parquet')
+
+        @action
+        async def download_report(ctx: action.Ctx):
+            async def generate_lines():
+                for idx in range(1000):
+                    yield f'line {idx}\\n'.encode()
+
+            await ctx.download_content(generate_lines(), file_name='report.txt')
+
+
+        def test_page():
+            return Stack(
+                Button('Download Data', onclick=download_parquet(my_var)),
+                Button('Download Report', onclick=download_report()),
+            )
+
+
+        config.router.add_page(path='download-content', content=test_page)
+
+        ```
+
+        :param content: iterable or async iterable of bytes, or a DataFrame to encode chunk by chunk
+        :param file_name: name of the downloaded file
+        :param format: format to encode a DataFrame in, inferred from the extension of `file_name` by default
+        """
+        if isinstance(content, DataFrame):
+            content = encode_dataframe(content, format or get_dataframe_format(file_name))
+
+        code = await generate_download_code(file_name, cleanup_file=False, content=content)
+        return await NavigateToImpl(url=f'/api/core/download?code={code}', new_tab=True).execute(self)
+
     async def download_variable(
         self, variable: AnyVariable, file_name: str | None = None, type: Literal['csv', 'xlsx', 'json'] = 'csv'
     ):
@@ -1299,6 +1367,7 @@ class ActionCtx:
         args: list[Any] | None = None,
         kwargs: dict[str, Any] | None = None,
         on_progress: Callable[[TaskProgressUpdate], None | Awaitable[None]] | None = None,
+        progress_interval: float | None = None,
     ):
         """
         Run a calculation as a task in a separate process. Recommended for CPU intensive tasks.
@@ -1339,13 +1408,15 @@ class ActionCtx:
         :param args: the arguments to pass to the function
         :param kwargs: the keyword arguments to pass to the function
         :param on_progress: a callback to receive progress updates
+        :param progress_interval: minimum number of seconds between progress updates, updates sent in between are
+            coalesced with the latest one winning; defaults to the global `DARA_TASK_PROGRESS_INTERVAL_SECONDS` setting
         """
         from dara.core.internal.registries import utils_registry
         from dara.core.internal.tasks import Task, TaskManager
 
         task_mgr: TaskManager = utils_registry.get('TaskManager')
 
-        task = Task(func=func, args=args, kwargs=kwargs, on_progress=on_progress)
+        task = Task(func=func, args=args, kwargs=kwargs, on_progress=on_progress, progress_interval=progress_interval)
         task_mgr.register_task(task)
         pending_task = await task_mgr.run_task(task)
         return await pending_task.value()
@@ -1487,7 +1558,7 @@ class action:
             )
 
         self.func = func
-        self.definition_uid = str(uuid.uuid4())
+        self.definition_uid = generate_uid('action')
 
         # Register the definition
         act_def = ActionResolverDef(resolver=func, uid=self.definition_uid, execute_action=execute_action)
@@ -1559,7 +1630,7 @@ class action:
                 'When calling an @action-decorated function outside an @action, the ActionCtx must not be passed in explicitly as it will be injected by Dara runtime'
             )
 
-        instance_uid = str(uuid.uuid4())
+        instance_uid = generate_uid('action_instance')
 
         all_args = [*args]
         bound_arg = None
@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import abc
 import inspect
-import uuid
 from collections.abc import Callable
 from contextlib import contextmanager
 from contextvars import ContextVar
@@ -35,6 +34,7 @@ from dara.core.base_definitions import BaseTask, PendingTask
 from dara.core.base_definitions import DaraBaseModel as BaseModel
 from dara.core.interactivity.condition import Condition, Operator
 from dara.core.internal.cache_store import CacheStore
+from dara.core.internal.cross_process import generate_uid
 from dara.core.internal.tasks import TaskManager
 from dara.core.internal.websocket import WS_CHANNEL, DaraServerMessage, WebsocketManager
 from dara.core.logging import dev_logger
@@ -344,7 +344,7 @@ class AnyVariable(BaseModel, abc.ABC):  # noqa: PLW1641 # we override equals to
     def __init__(self, uid: str | None = None, **kwargs) -> None:
         new_uid = uid
         if new_uid is None:
-            new_uid = str(uuid.uuid4())
+            new_uid = generate_uid('variable')
 
         super().__init__(uid=new_uid, **kwargs)
 
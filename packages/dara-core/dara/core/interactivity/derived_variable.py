@@ -19,11 +19,12 @@ from __future__ import annotations
 
 import json
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from inspect import Parameter, signature
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     Protocol,
     cast,
@@ -51,6 +52,7 @@ else:
     # At runtime, use Any to avoid forward reference issues with Pydantic
     NestedKey = Any
 
+from dara.core.auth.definitions import SESSION_ID, USER
 from dara.core.base_definitions import (
     BaseCachePolicy,
     BaseTask,
@@ -70,12 +72,14 @@ from dara.core.internal.multi_resource_lock import MultiResourceLock
 from dara.core.internal.pandas_utils import DataResponse, append_index, build_data_response
 from dara.core.internal.tasks import MetaTask, Task, TaskManager
 from dara.core.internal.utils import get_cache_scope, run_user_handler
+from dara.core.internal.websocket import DaraServerMessage
 from dara.core.logging import dev_logger, eng_logger
 from dara.core.telemetry import (
     _OperationObservation,
     observe_derived_variable,
     observe_derived_variable_filter,
     observe_derived_variable_phase,
+    observe_internal_operation,
     record_derived_variable_cache_access,
 )
 
@@ -95,6 +99,10 @@ VALUE_MISSING = object()
 Sentinel value to indicate that a value is missing from the cache
 """
 
+# Stale values currently being revalidated in the background, keyed by their namespaced cache key
+# Served in place of the pending task while a task-backed recomputation runs
+_revalidating: dict[str, Any] = {}
+
 
 class DerivedVariableResult(TypedDict):
     cache_key: str
@@ -307,6 +315,120 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
         assert_no_context('ctx.trigger')
         return TriggerVariable(variable=self, force=force)
 
+    async def warm(self, args: Iterable[Sequence[Any]], max_concurrency: int = 4):
+        """
+        Pre-compute and cache the values of this DerivedVariable for known-hot combinations of arguments,
+        so the first users requesting them are served from the cache.
+
+        Values are computed through the same path as client requests, including running the variable as a task.
+        Must be called within the running app, e.g. from a function registered with `config.on_startup`,
+        in which case the app waits for warming to complete before serving requests.
+        Failures are logged and do not prevent the remaining combinations from being computed.
+
+        ```python
+        from dara.core import Cache, ConfigurationBuilder, DerivedVariable, Variable
+
+        region = Variable('EU')
+        report = DerivedVariable(build_report, variables=[region], cache=Cache.Policy.TTL(ttl=3600))
+
+        config = ConfigurationBuilder()
+
+        @config.on_startup
+        async def warm_reports():
+            await report.warm([('EU',), ('US',), ('APAC',)])
+        ```
+
+        :param args: list of argument combinations, each holding the values of the variable's `variables` in order
+        :param max_concurrency: maximum number of values computed at the same time
+        """
+        with observe_internal_operation('cache', 'warm', name=str(self.uid)):
+            await self._compute_values('warm', args, max_concurrency, force=False)
+
+    async def refresh(self, args: Iterable[Sequence[Any]], max_concurrency: int = 4):
+        """
+        Recompute and re-cache the values of this DerivedVariable for the given combinations of arguments,
+        ignoring cached values, then notify connected clients so they fetch the fresh values.
+
+        Use it to refresh a DerivedVariable from the server once for all clients, e.g. from an in-process
+        scheduled job, instead of polling from every client with `polling_interval`.
+
+        ```python
+        from dara.core import Cache, ConfigurationBuilder, DerivedVariable, Variable
+        from dara.core.internal import scheduler
+
+        region = Variable('EU')
+        report = DerivedVariable(build_report, variables=[region], cache=Cache.Policy.KeepAll())
+
+        config = ConfigurationBuilder()
+
+        @config.scheduler(scheduler.every(10).minutes().in_process())
+        async def refresh_reports():
+            await report.refresh([('EU',), ('US',), ('APAC',)])
+        ```
+
+        :param args: list of argument combinations, each holding the values of the variable's `variables` in order
+        :param max_concurrency: maximum number of values computed at the same time
+        """
+        with observe_internal_operation('cache', 'refresh', name=str(self.uid)):
+            var_entry, task_mgr = await self._compute_values('refresh', args, max_concurrency, force=True)
+            await DerivedVariable._notify_refreshed(var_entry, task_mgr)
+
+    async def _compute_values(
+        self, operation: str, args: Iterable[Sequence[Any]], max_concurrency: int, force: bool
+    ) -> tuple[DerivedVariableRegistryEntry, TaskManager]:
+        """
+        Compute and cache the values of this DerivedVariable for the given combinations of arguments.
+
+        :param operation: name of the public operation, used in error messages
+        :param args: list of argument combinations, each holding the values of the variable's `variables` in order
+        :param max_concurrency: maximum number of values computed at the same time
+        :param force: whether to ignore cached values
+        """
+        from dara.core.internal.registries import derived_variable_registry, utils_registry
+
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+
+        var_entry = derived_variable_registry.get(str(self.uid))
+
+        if var_entry.cache is None or var_entry.cache.cache_type != Cache.Type.GLOBAL:
+            raise ValueError(f'Only DerivedVariables with a global cache policy can be {operation}ed')
+
+        if not utils_registry.has('TaskManager'):
+            raise RuntimeError(
+                f'DerivedVariable.{operation} must be called within the running app, '
+                'e.g. from a config.on_startup function or an in-process scheduled job'
+            )
+
+        store: CacheStore = utils_registry.get('Store')
+        task_mgr: TaskManager = utils_registry.get('TaskManager')
+        limiter = anyio.CapacityLimiter(max_concurrency)
+
+        async def _compute(values: Sequence[Any]):
+            async with limiter:
+                # Compute as an anonymous request so values are stored under the global scope
+                USER.set(None)
+                SESSION_ID.set(None)
+
+                try:
+                    force_key = f'{operation}_{uuid.uuid4()}' if force else None
+                    result = await DerivedVariable.get_value(var_entry, store, task_mgr, list(values), force_key)
+                    value = result['value']
+
+                    if isinstance(value, PendingTask):
+                        await value.run()
+                    elif isinstance(value, BaseTask):
+                        pending_task = await task_mgr.run_task(value)
+                        await pending_task.run()
+                except Exception as e:
+                    dev_logger.error(f'Failed to {operation} DerivedVariable {var_entry.uid} for {values}', error=e)
+
+        async with anyio.create_task_group() as tg:
+            for values in args:
+                tg.start_soon(_compute, values)
+
+        return var_entry, task_mgr
+
     @property
     def is_loading(self):
         """
@@ -513,11 +635,28 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
         # Compute cache key first, before any other work
         cache_key = DerivedVariable._get_cache_key(*args, uid=var_entry.uid, deps=var_entry.deps)
 
+        # A stale value being revalidated keeps being served until the fresh value is cached. This is checked before
+        # taking the lock below, as the revalidation holds it for the whole recomputation.
+        if force_key is None and not any(is_forced(arg) for arg in args):
+            revalidating_key = store.shared_key(var_entry, cache_key)
+            if revalidating_key in _revalidating:
+                record_derived_variable_cache_access('hit')
+                await DerivedVariable.add_latest_value(store, var_entry, cache_key)
+                eng_logger.info(
+                    f'DerivedVariable {_uid_short} returning stale value while revalidating',
+                    {'uid': var_entry.uid},
+                )
+                return {'cache_key': cache_key, 'value': _revalidating[revalidating_key]}
+
         # Lock on this specific cache key for the entire computation. Enter the
         # async context manually so the wait span ends as soon as the lock is held.
         lock = DV_LOCK.acquire(cache_key)
         with observe_derived_variable_phase('lock_wait', _resolver_name):
             await lock.__aenter__()
+
+        # Key of the cross-process flight held while computing, if any, and whether its release was handed to a task
+        flight_key: str | None = None
+        flight_handed_off = False
         try:
             # Extract and process nested derived variables
             values: list[Any] = [None] * len(args)
@@ -629,8 +768,17 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
             else:
                 record_derived_variable_cache_access('bypass')
 
+            # On a miss, coordinate with other app processes so only one of them computes the value
+            if not ignore_cache and value is VALUE_MISSING:
+                flight_key, value = await DerivedVariable._join_flight(store, var_entry, cache_key, _resolver_name)
+
             # If it's a PendingTask then return that task so it can be awaited later by a MetaTask
             if isinstance(value, PendingTask):
+                # Revalidation by a task may have started while waiting for the lock, keep serving the stale value
+                revalidating_key = store.shared_key(var_entry, cache_key)
+                if revalidating_key in _revalidating:
+                    return {'cache_key': cache_key, 'value': _revalidating[revalidating_key]}
+
                 eng_logger.info(
                     f'DerivedVariable {_uid_short} waiting for pending task',
                     {'uid': var_entry.uid, 'pending_task': value.task_id},
@@ -639,6 +787,9 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
 
             # We retrieved an actual value from the cache, return it
             if not ignore_cache and value is not VALUE_MISSING:
+                if task_mgr is not None and store.is_stale(var_entry, cache_key):
+                    DerivedVariable._revalidate(var_entry, store, task_mgr, args, cache_key, value)
+
                 eng_logger.info(
                     f'DerivedVariable {_uid_short} returning cached value directly',
                     {'uid': var_entry.uid, 'cached_value': value},
@@ -678,6 +829,9 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
                     pending_task = task_mgr.register_task(meta_task)
                     with observe_derived_variable_phase('cache_write', _resolver_name):
                         await store.set(var_entry, key=cache_key, value=pending_task, pin=_pin_result)
+                    flight_handed_off = DerivedVariable._release_flight_on_completion(
+                        store, task_mgr, flight_key, pending_task
+                    )
 
                     return {'cache_key': cache_key, 'value': meta_task}
 
@@ -704,6 +858,9 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
                 pending_task = task_mgr.register_task(task)
                 with observe_derived_variable_phase('cache_write', _resolver_name):
                     await store.set(var_entry, key=cache_key, value=pending_task, pin=_pin_result)
+                flight_handed_off = DerivedVariable._release_flight_on_completion(
+                    store, task_mgr, flight_key, pending_task
+                )
 
                 return {'cache_key': cache_key, 'value': task}
 
@@ -730,7 +887,10 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
                 if _observation is not None:
                     _observation.set_outcome('scheduled')
 
-                task_mgr.register_task(result)
+                pending_task = task_mgr.register_task(result)
+                flight_handed_off = DerivedVariable._release_flight_on_completion(
+                    store, task_mgr, flight_key, pending_task
+                )
 
                 return {'cache_key': cache_key, 'value': result}
 
@@ -745,8 +905,162 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
             )
             return {'cache_key': cache_key, 'value': result}
         finally:
+            if flight_key is not None and not flight_handed_off and store.single_flight is not None:
+                with anyio.CancelScope(shield=True):
+                    await store.single_flight.release(flight_key)
             await lock.__aexit__(None, None, None)
 
+    @staticmethod
+    def _revalidate(
+        var_entry: DerivedVariableRegistryEntry,
+        store: CacheStore,
+        task_mgr: TaskManager,
+        args: list[Any],
+        cache_key: str,
+        stale_value: Any,
+    ):
+        """
+        Recompute a stale cached value in the background, at most once at a time per value, and notify clients
+        once the fresh value is cached. The stale value keeps being served in the meantime.
+
+        :param var_entry: the registry entry for the derived variable
+        :param store: the store instance holding the stale value
+        :param task_mgr: task manager instance, running the recomputation
+        :param args: the arguments the stale value was computed with
+        :param cache_key: the cache key of the value
+        :param stale_value: the stale value to keep serving
+        """
+        revalidating_key = store.shared_key(var_entry, cache_key)
+        if revalidating_key in _revalidating:
+            return
+
+        _revalidating[revalidating_key] = stale_value
+
+        async def _refresh():
+            try:
+                result = await DerivedVariable.get_value(
+                    var_entry, store, task_mgr, args, force_key=f'revalidate_{uuid.uuid4()}'
+                )
+
+                if isinstance(result['value'], BaseTask):
+                    pending_task = await task_mgr.run_task(result['value'])
+                    await pending_task.run()
+
+                await DerivedVariable._notify_refreshed(var_entry, task_mgr)
+            except Exception as e:
+                dev_logger.error(f'Failed to revalidate stale value of DerivedVariable {var_entry.uid}', error=e)
+            finally:
+                _revalidating.pop(revalidating_key, None)
+
+        task_mgr.task_group.start_soon(_refresh)
+
+    @staticmethod
+    async def _notify_refreshed(var_entry: DerivedVariableRegistryEntry, task_mgr: TaskManager):
+        """
+        Notify the clients sharing a derived variable's cache scope that a fresh value is available.
+
+        :param var_entry: the registry entry for the derived variable
+        :param task_mgr: task manager instance, holding the websocket manager
+        """
+        from dara.core.internal.registries import websocket_registry
+
+        message = DaraServerMessage.create('DerivedVariableRefreshMessage', {'uid': var_entry.uid})
+        ws_mgr = task_mgr.ws_manager
+        cache_type = var_entry.cache.cache_type if var_entry.cache is not None else Cache.Type.GLOBAL
+
+        if cache_type == Cache.Type.GLOBAL:
+            await ws_mgr.broadcast(message)
+        elif cache_type == Cache.Type.USER:
+            user = USER.get()
+            if user is not None:
+                await ws_mgr.send_message_to_user(user.identity_id, message)
+        else:
+            session_id = SESSION_ID.get()
+            if session_id is not None and websocket_registry.has(session_id):
+                for channel in websocket_registry.get(session_id):
+                    await ws_mgr.send_message(channel, message)
+
+    @staticmethod
+    async def _join_flight(
+        store: CacheStore,
+        var_entry: DerivedVariableRegistryEntry,
+        cache_key: str,
+        resolver_name: str,
+    ) -> tuple[str | None, Any]:
+        """
+        Acquire the cross-process flight for a missing cache entry, if single-flight is configured.
+
+        Once acquired the store is checked again, as the previous holder has likely written the value to
+        the shared backend in the meantime. The flight is released straight away if so.
+
+        :param store: the store instance to check for cached values
+        :param var_entry: the registry entry for the derived variable
+        :param cache_key: the cache key of the value
+        :param resolver_name: stable registered resolver name for telemetry
+        :return: the key of the held flight, or None if not held, and the cached value or VALUE_MISSING
+        """
+        single_flight = store.single_flight
+        if single_flight is None or store.shared_backend is None:
+            return None, VALUE_MISSING
+
+        flight_key = store.shared_key(var_entry, cache_key)
+
+        try:
+            with observe_derived_variable_phase('flight_wait', resolver_name):
+                acquired = await single_flight.acquire(flight_key)
+        except Exception as e:
+            dev_logger.warning('Failed to acquire single-flight, computing uncoordinated', {'error': str(e)})
+            return None, VALUE_MISSING
+
+        if not acquired:
+            dev_logger.warning(
+                'Timed out waiting for another process to compute a DerivedVariable, computing uncoordinated',
+                {'uid': var_entry.uid},
+            )
+            return None, VALUE_MISSING
+
+        try:
+            value = await store.get(var_entry, key=cache_key, raise_for_missing=True)
+        except KeyError:
+            return flight_key, VALUE_MISSING
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await single_flight.release(flight_key)
+            raise
+
+        await single_flight.release(flight_key)
+        return None, value
+
+    @staticmethod
+    def _release_flight_on_completion(
+        store: CacheStore,
+        task_mgr: TaskManager,
+        flight_key: str | None,
+        pending_task: PendingTask,
+    ) -> bool:
+        """
+        Keep a held flight until a task computing the value completes, so other processes wait for its result.
+
+        :param store: the store instance holding the single-flight
+        :param task_mgr: task manager running the task
+        :param flight_key: key of the held flight, if any
+        :param pending_task: pending task computing the value
+        :return: whether the release has been handed off to the task
+        """
+        single_flight = store.single_flight
+        if flight_key is None or single_flight is None:
+            return False
+
+        async def _release():
+            try:
+                await pending_task.event.wait()
+            finally:
+                with anyio.CancelScope(shield=True):
+                    await single_flight.release(flight_key)
+
+        task_mgr.task_group.start_soon(_release)
+        return True
+
     @classmethod
     async def _filter_data(
         cls,
@@ -832,6 +1146,8 @@ class DerivedVariable(ClientVariable, Generic[VariableType]):
 
 
 class DerivedVariableRegistryEntry(CachedRegistryEntry):
+    shared: ClassVar[bool] = True
+
     deps: list[int] | None
     func: Callable[..., Any] | None
     filter_resolver: FilterResolver | None
@@ -17,9 +17,13 @@ limitations under the License.
 
 import io
 import os
-from typing import Literal, TypedDict, cast
+from collections.abc import Callable
+from inspect import isclass, signature
+from tempfile import SpooledTemporaryFile
+from typing import IO, BinaryIO, Literal, TypedDict, get_origin, get_type_hints
 
 import pandas
+from anyio import to_thread
 from fastapi import UploadFile
 
 from dara.core.base_definitions import UploadResolverDef
@@ -38,6 +42,53 @@ class DataFrameSchema(TypedDict):
     primaryKey: list[str]
 
 
+def _accepts_file_object(resolver: Callable) -> bool:
+    """
+    Check whether an upload resolver expects a file-like object rather than bytes,
+    i.e. its first parameter is annotated with e.g. `BinaryIO` or `IO[bytes]`.
+
+    :param resolver: the upload resolver
+    """
+    parameters = list(signature(resolver).parameters)
+    if len(parameters) == 0:
+        return False
+
+    try:
+        annotation = get_type_hints(resolver).get(parameters[0])
+    except Exception:
+        return False
+
+    annotation = get_origin(annotation) or annotation
+    return isclass(annotation) and issubclass(annotation, (IO, io.IOBase, SpooledTemporaryFile))
+
+
+def _read_upload(file: BinaryIO, file_type: str) -> pandas.DataFrame:
+    """
+    Parse an uploaded file into a DataFrame. Blocking, should be run in a worker thread.
+
+    Files are read directly from the file object so the upload is never held in memory as bytes or text.
+
+    :param file: the uploaded file
+    :param file_type: extension of the uploaded file, CSV is assumed for unknown extensions
+    """
+    file.seek(0)
+
+    if file_type in ('.parquet', '.pq'):
+        return pandas.read_parquet(file)
+    if file_type in ('.feather', '.arrow'):
+        return pandas.read_feather(file)
+
+    if file_type == '.xlsx':
+        content = pandas.read_excel(file, index_col=None)
+        content.columns = content.columns.str.replace('Unnamed: *', 'column_', regex=True)  # type: ignore
+        return content
+
+    # Default to csv, the C parser reads the file in buffered chunks
+    content = pandas.read_csv(file, index_col=0)
+    content.columns = content.columns.str.replace('Unnamed: *', 'column_', regex=True)  # type: ignore
+    return content
+
+
 async def upload(data: UploadFile, data_uid: str | None = None, resolver_id: str | None = None):
     """
     Resolve an upload with one complete telemetry lifecycle.
@@ -57,7 +108,8 @@ async def _upload(data: UploadFile, data_uid: str | None = None, resolver_id: st
 
     :param data: the file to upload
     :param data_uid: optional uid of the data variable to upload to
-    :param resolver_id: optional id of the upload resolver to use, falls back to default handlers for csv/xlsx
+    :param resolver_id: optional id of the upload resolver to use, falls back to default handlers for
+        csv/xlsx/parquet/feather
     """
     from dara.core.interactivity.server_variable import ServerVariable
     from dara.core.internal.registries import (
@@ -81,8 +133,6 @@ async def _upload(data: UploadFile, data_uid: str | None = None, resolver_id: st
         except KeyError as e:
             raise ValueError(f'Data Variable {data_uid} does not exist') from e
 
-    content = cast(bytes, await data.read())
-
     resolver = None
 
     # If Id is provided, lookup the definition from registry
@@ -91,17 +141,14 @@ async def _upload(data: UploadFile, data_uid: str | None = None, resolver_id: st
         resolver = resolver_def.resolver
 
     if resolver:
-        content = await run_user_handler(handler=resolver, args=(content, data.filename))
-    # If resolver is not provided, follow roughly the cl_dataset_parser logic
-    elif file_type == '.xlsx':
-        file_object_xlsx = io.BytesIO(content)
-        content = pandas.read_excel(file_object_xlsx, index_col=None)
-        content.columns = content.columns.str.replace('Unnamed: *', 'column_', regex=True)  # type: ignore
+        if _accepts_file_object(resolver):
+            await data.seek(0)
+            content = await run_user_handler(handler=resolver, args=(data.file, data.filename))
+        else:
+            content = await run_user_handler(handler=resolver, args=(await data.read(), data.filename))
     else:
-        # default to csv
-        file_object_csv = io.StringIO(content.decode('utf-8'))
-        content = pandas.read_csv(file_object_csv, index_col=0)
-        content.columns = content.columns.str.replace('Unnamed: *', 'column_', regex=True)  # type: ignore
+        # The upload is already spooled to a temporary file, parse it from there off the event loop
+        content = await to_thread.run_sync(_read_upload, data.file, file_type.lower())
 
     # If a server variable is provided, update it with the new content
     if variable_entry:
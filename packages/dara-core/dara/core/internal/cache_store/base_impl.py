@@ -28,6 +28,15 @@ class CacheStoreImpl(abc.ABC, Generic[PolicyT]):
         :param raise_for_missing: If true, an exception will be raised if the entry is not found
         """
 
+    def is_stale(self, key: str) -> bool:
+        """
+        Check whether an entry is held past its freshness, i.e. should be served while being recomputed.
+        Only policies supporting stale-while-revalidate hold stale entries.
+
+        :param key: The key of the entry to check.
+        """
+        return False
+
     @abc.abstractmethod
     async def set(self, key: str, value: Any, pin: bool = False):
         """
@@ -1,4 +1,4 @@
-from typing import Any, Generic, cast
+from typing import TYPE_CHECKING, Any, Generic, cast
 
 from dara.core.base_definitions import (
     CachedRegistryEntry,
@@ -12,10 +12,15 @@ from dara.core.internal.cache_store.base_impl import CacheStoreImpl, PolicyT
 from dara.core.internal.cache_store.keep_all import KeepAllCache
 from dara.core.internal.cache_store.lru import LRUCache
 from dara.core.internal.cache_store.ttl import TTLCache
-from dara.core.internal.utils import CacheScope, get_cache_scope
+from dara.core.internal.settings import get_settings
+from dara.core.internal.utils import CacheScope, get_cache_scope, get_code_fingerprint
+from dara.core.logging import dev_logger
 from dara.core.metrics import total_size
 from dara.core.telemetry import observe_internal_operation, record_cache_store_metrics
 
+if TYPE_CHECKING:
+    from dara.core.shared_state import SharedCacheBackend, SingleFlight
+
 
 def cache_impl_for_policy(policy: PolicyT) -> CacheStoreImpl[PolicyT]:
     """
@@ -81,6 +86,15 @@ class CacheScopeStore(Generic[PolicyT]):
 
         return await cache.get(key, unpin=unpin, raise_for_missing=raise_for_missing)
 
+    def is_stale(self, key: str) -> bool:
+        """
+        Check whether an entry in the current cache scope is stale, i.e. should be served while being recomputed.
+
+        :param key: The key of the entry to check.
+        """
+        cache = self.caches.get(get_cache_scope(self.policy.cache_type))
+        return cache is not None and cache.is_stale(key)
+
     async def set(self, key: str, value: Any, pin: bool = False):
         """
         Add an entry to the cache. Depending on the implementation might evict other entries.
@@ -123,8 +137,20 @@ class CacheStore:
     Key-value store class which stores a separate CacheScopeStore per registry entry.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        shared_backend: 'SharedCacheBackend | None' = None,
+        single_flight: 'SingleFlight | None' = None,
+    ):
         self.registry_stores: dict[str, CacheScopeStore] = {}
+        self.shared_backend = shared_backend
+        """
+        Optional cross-process backend. Local misses fall back to it and resolved values are written through.
+        """
+        self.single_flight = single_flight
+        """
+        Optional cross-process coordination for filling missing entries, only used alongside a shared backend.
+        """
         # The size is not totally accurate as we only add/subtract values stored, without accounting for keys
         # or extra memory due to hash collisions, internal cache implementation; its a 'good enough' approximation
         # of just the values stored
@@ -140,6 +166,100 @@ class CacheStore:
         entries = sum(len(registry_store) for registry_store in self.registry_stores.values())
         record_cache_store_metrics(self._size, entries)
 
+    @staticmethod
+    def shared_key(registry_entry: CachedRegistryEntry, key: str) -> str:
+        """
+        Get the key for an entry in the shared backend, namespaced by registry entry, current cache scope
+        and, for entries with a resolver, the fingerprint of its code.
+
+        :param registry_entry: The registry entry the value belongs to.
+        :param key: The cache key of the entry.
+        """
+        cache_type = registry_entry.cache.cache_type if registry_entry.cache is not None else None
+        shared_key = f'{registry_entry.to_store_key()}:{get_cache_scope(cache_type)}'
+
+        # Results of entries with a resolver are only valid for the version of the code which computed them
+        func = getattr(registry_entry, 'func', None)
+        if callable(func):
+            shared_key = f'{shared_key}:{get_code_fingerprint(func)}'
+
+        return f'{shared_key}:{key}'
+
+    async def _get_shared(self, registry_entry: CachedRegistryEntry, key: str) -> Any:
+        """
+        Retrieve an entry from the shared backend and populate the local store with it.
+
+        :param registry_entry: The registry entry to retrieve the value for.
+        :param key: The key of the entry to retrieve.
+        :raises KeyError: if the shared backend is not configured, the entry is not shared or it does not hold the entry
+        """
+        if self.shared_backend is None or registry_entry.cache is None or not registry_entry.shared:
+            raise KeyError(key)
+
+        try:
+            with observe_internal_operation('cache', 'shared.get'):
+                value = await self.shared_backend.get(self.shared_key(registry_entry, key))
+        except KeyError:
+            raise
+        except Exception as e:
+            dev_logger.warning('Failed to read from shared cache backend', {'error_type': type(e).__name__})
+            raise KeyError(key) from e
+
+        registry_store = self._get_or_create_registry_store(registry_entry)
+        await registry_store.set(key, value)
+        return value
+
+    async def _set_shared(self, registry_entry: CachedRegistryEntry, key: str, value: Any):
+        """
+        Write a resolved value through to the shared backend, only for registry entries which opt into it.
+        Pending tasks are process-local and never shared.
+
+        Values of policies without a TTL, e.g. LRU, are only bounded by their local store, which does not evict them
+        from the shared backend. They expire after the `DARA_SHARED_CACHE_DEFAULT_TTL_SECONDS` setting instead.
+
+        :param registry_entry: The registry entry to store the value for.
+        :param key: The key of the entry to set.
+        :param value: The value of the entry to set.
+        """
+        if (
+            self.shared_backend is None
+            or registry_entry.cache is None
+            or not registry_entry.shared
+            or isinstance(value, PendingTask)
+        ):
+            return
+
+        if isinstance(registry_entry.cache, TTLCachePolicy):
+            ttl = registry_entry.cache.ttl + (registry_entry.cache.max_stale or 0)
+        else:
+            ttl = get_settings().dara_shared_cache_default_ttl_seconds or None
+        try:
+            with observe_internal_operation('cache', 'shared.set'):
+                await self.shared_backend.set(self.shared_key(registry_entry, key), value, ttl=ttl)
+        except Exception as e:
+            # Unpicklable values or an unavailable backend must not fail the local write, but other processes
+            # will not be able to reuse the value
+            dev_logger.warning(
+                'Failed to write to shared cache backend',
+                {'uid': registry_entry.uid, 'error_type': type(e).__name__},
+            )
+
+    def _get_or_create_registry_store(self, registry_entry: CachedRegistryEntry) -> CacheScopeStore:
+        """
+        Get the CacheScopeStore for a registry entry, creating it if it does not exist yet.
+
+        :param registry_entry: The registry entry to get the store for.
+        """
+        assert registry_entry.cache is not None, 'Registry entry must have a cache policy to be used in a CacheStore'
+
+        registry_store = self.registry_stores.get(registry_entry.to_store_key())
+
+        if registry_store is None:
+            registry_store = CacheScopeStore(registry_entry.cache)
+            self.registry_stores[registry_entry.to_store_key()] = registry_store
+
+        return registry_store
+
     async def delete(self, registry_entry: CachedRegistryEntry, key: str) -> Any:
         """
         Delete an entry from the cache for the given registry entry and cache key.
@@ -147,6 +267,12 @@ class CacheStore:
         :param registry_entry: The registry entry to delete the value for.
         :param key: The key of the entry to delete.
         """
+        if self.shared_backend is not None and registry_entry.cache is not None and registry_entry.shared:
+            try:
+                await self.shared_backend.delete(self.shared_key(registry_entry, key))
+            except Exception as e:
+                dev_logger.warning('Failed to delete from shared cache backend', {'error_type': type(e).__name__})
+
         registry_store = self.registry_stores.get(registry_entry.to_store_key())
 
         # No store for this entry yet
@@ -176,16 +302,35 @@ class CacheStore:
         """
         registry_store = self.registry_stores.get(registry_entry.to_store_key())
 
-        # No store for this entry yet
-        if registry_store is None:
-            if raise_for_missing:
+        try:
+            # No store for this entry yet
+            if registry_store is None:
                 raise KeyError(f'No cache store found for {registry_entry.to_store_key()}')
-            return None
 
-        value = await registry_store.get(key, unpin=unpin, raise_for_missing=raise_for_missing)
-        self._update_metrics()
+            value = await registry_store.get(key, unpin=unpin, raise_for_missing=True)
+        except KeyError:
+            # Fall back to the shared backend, if configured, before reporting a miss
+            try:
+                value = await self._get_shared(registry_entry, key)
+            except KeyError:
+                if raise_for_missing:
+                    raise
+                value = None
+        finally:
+            self._update_metrics()
+
         return value
 
+    def is_stale(self, registry_entry: CachedRegistryEntry, key: str) -> bool:
+        """
+        Check whether an entry is held past its TTL within the stale-while-revalidate window of its policy.
+
+        :param registry_entry: The registry entry to check the value for.
+        :param key: The key of the entry to check.
+        """
+        registry_store = self.registry_stores.get(registry_entry.to_store_key())
+        return registry_store is not None and registry_store.is_stale(key)
+
     async def get_or_wait(self, registry_entry: CachedRegistryEntry, key: str):
         """
         Retrieve an entry from the cache for the given registry entry and cache key.
@@ -219,32 +364,31 @@ class CacheStore:
         :param error: If set, the value is a PendingValue that will resolve to this error.
         :param pin: If true, the entry will not be evicted until read.
         """
-        assert registry_entry.cache is not None, 'Registry entry must have a cache policy to be used in a CacheStore'
+        registry_store = self._get_or_create_registry_store(registry_entry)
 
-        registry_store = self.registry_stores.get(registry_entry.to_store_key())
+        prev_value = await registry_store.get(key)
 
-        # No store for this entry yet, create new
-        if registry_store is None:
-            registry_store = CacheScopeStore(registry_entry.cache)
-            self.registry_stores[registry_entry.to_store_key()] = registry_store
+        await registry_store.set(key, value, pin=pin)
+        self._update_metrics()
 
-        prev_value = await registry_store.get(key)
+        await self._set_shared(registry_entry, key, value)
 
         # If the previous value was a PendingTask, resolve it with the new value
         # This handles cache-coordinated tasks (e.g., DerivedVariables) where PendingTasks
-        # are stored in cache to coordinate multiple callers with the same cache key
+        # are stored in cache to coordinate multiple callers with the same cache key.
+        # This is done after the shared write, as resolving releases the cross-process flight held by the task
         if isinstance(prev_value, PendingTask):
             prev_value.resolve(value)
 
-        await registry_store.set(key, value, pin=pin)
-        self._update_metrics()
-
         return value
 
     async def clear(self):
         """
-        Empty all stores.
+        Empty all stores, including the shared backend if configured.
         """
+        if self.shared_backend is not None:
+            await self.shared_backend.clear()
+
         for registry_store in self.registry_stores.values():
             await registry_store.clear()
         self.registry_stores = {}
@@ -13,17 +13,19 @@ class Node:
     A node to hold the value, expiration time, and pin status of each cache entry.
     """
 
-    def __init__(self, value: Any, expiration_time: float, pin: bool = False):
+    def __init__(self, value: Any, expiration_time: float, pin: bool = False, fresh_until: float | None = None):
         """
         Initialize a new node.
 
         :param value: The value to be stored.
         :param expiration_time: The time at which the value expires.
         :param pin: Whether the entry should be preserved even if its TTL has expired.
+        :param fresh_until: The time at which the value becomes stale, defaults to the expiration time.
         """
         self.value = value
         self.expiration_time = expiration_time
         self.pin = pin
+        self.fresh_until = fresh_until if fresh_until is not None else expiration_time
 
 
 class TTLCache(CacheStoreImpl[TTLCachePolicy]):
@@ -34,6 +36,9 @@ class TTLCache(CacheStoreImpl[TTLCachePolicy]):
     The heap ensures that the soonest-to-expire entry is always at the top, enabling quick eviction of expired entries.
     On each set or get operation, the cache checks and evicts expired entries based on the TTL policy.
     Pinned entries are not evicted until they are unpinned, regardless of their TTL.
+
+    If the policy sets `max_stale`, entries are only evicted `max_stale` seconds after their TTL has elapsed
+    and are reported as stale in the meantime, so they can be served while being recomputed.
     """
 
     def __init__(self, policy: TTLCachePolicy):
@@ -91,8 +96,9 @@ class TTLCache(CacheStoreImpl[TTLCachePolicy]):
         async with self.lock:
             await self._cleanup()
 
-            expiration_time = time.time() + self.policy.ttl
-            node = Node(value, expiration_time, pin)
+            fresh_until = time.time() + self.policy.ttl
+            expiration_time = fresh_until + (self.policy.max_stale or 0)
+            node = Node(value, expiration_time, pin, fresh_until=fresh_until)
             if pin:
                 self.pinned_cache[key] = node
                 self.unpinned_cache.pop(key, None)  # Ensure the key is removed from unpinned cache if it exists
@@ -101,6 +107,18 @@ class TTLCache(CacheStoreImpl[TTLCachePolicy]):
                 heapq.heappush(self.expiration_heap, (expiration_time, key))
                 self.pinned_cache.pop(key, None)  # Ensure the key is removed from pinned cache if it exists
 
+    def is_stale(self, key: str) -> bool:
+        """
+        Check whether an entry has outlived its TTL but is still held within the `max_stale` window.
+
+        :param key: The key of the entry to check.
+        """
+        if self.policy.max_stale is None:
+            return False
+
+        node = self.pinned_cache.get(key) or self.unpinned_cache.get(key)
+        return node is not None and time.time() >= node.fresh_until
+
     async def delete(self, key: str) -> None:
         """
         Delete a key-value pair from the cache, if it exists.
@@ -0,0 +1,213 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from dara.core.logging import dev_logger
+
+# Frames of these modules are skipped when looking for the module defining an object
+_INTERNAL_MODULES = ('dara.core.', 'pydantic', 'functools', 'typing', 'abc')
+_UID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, 'dara.core')
+
+_uid_counters: defaultdict[str, int] = defaultdict(int)
+_uid_lock = threading.Lock()
+_started = False
+
+# Writes of entries shared while running within `sharing_runtime_entries`
+_pending_writes: ContextVar[list[asyncio.Task] | None] = ContextVar('_pending_writes', default=None)
+# Strong references to writes started outside of it, so they are not garbage collected before completing
+_background_writes: set[asyncio.Task] = set()
+
+
+def is_multi_process() -> bool:
+    """
+    Whether the app is served by several worker processes
+    """
+    return int(os.environ.get('DARA_WORKERS', '1')) > 1
+
+
+def has_started() -> bool:
+    """
+    Whether the application has finished loading, i.e. objects created from now on are created while serving requests
+    """
+    return _started
+
+
+def mark_started(started: bool = True):
+    """
+    Mark the application as loaded, called once the router has been compiled.
+
+    :param started: whether the application has started
+    """
+    global _started
+    _started = started
+
+
+def _defining_module() -> str:
+    """
+    Get the name of the first module outside of Dara internals in the current call stack
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if not module.startswith(_INTERNAL_MODULES):
+            return module
+        frame = frame.f_back
+    return '__main__'
+
+
+def generate_uid(kind: str) -> str:
+    """
+    Generate a uid for an object which is registered in one of the registries.
+
+    Every worker process imports the app and compiles its router in the same order, so while the app is loading
+    the uid is derived from the module creating the object and the number of objects of the same kind it created
+    before. This makes the uid identical in every process. Objects created while serving requests get a random uid.
+
+    :param kind: kind of the object, e.g. 'variable' or 'action'
+    """
+    if _started:
+        return str(uuid.uuid4())
+
+    key = f'{kind}:{_defining_module()}'
+    with _uid_lock:
+        index = _uid_counters[key]
+        _uid_counters[key] += 1
+
+    return str(uuid.uuid5(_UID_NAMESPACE, f'{key}:{index}'))
+
+
+def check_runtime_registration(registry_name: str, key: str):
+    """
+    Refuse registering a new entry once the app has started when running several processes.
+    The entry would only exist in the process serving the current request, so requests for it served by other
+    processes would fail.
+
+    :param registry_name: name of the registry
+    :param key: key of the entry being registered
+    """
+    if _started and is_multi_process():
+        raise RuntimeError(
+            f'Cannot register {key} in the {registry_name} registry while serving requests when running multiple '
+            'workers, as other workers would not be able to find it. Create it when the app is loaded, '
+            'i.e. at module level or in the page content, instead.'
+        )
+
+
+def _shared_entry_key(registry_name: str, key: str) -> str:
+    return f'registry:{registry_name}:{key}'
+
+
+def share_runtime_entry(registry_name: str, key: str, value: Any):
+    """
+    Write an entry registered while serving requests through to the shared cache backend when running
+    several processes, so other processes can find it.
+
+    Registering from a worker thread blocks until the entry is written. Registering on the event loop cannot block,
+    so the write is awaited when leaving the enclosing `sharing_runtime_entries` block instead.
+
+    :param registry_name: name of the registry
+    :param key: key of the entry being registered
+    :param value: the registered value
+    """
+    if not (_started and is_multi_process()):
+        return
+
+    from dara.core.internal.registries import utils_registry
+    from dara.core.internal.utils import call_async
+
+    shared_backend = utils_registry.get('Store').shared_backend
+    if shared_backend is None:
+        raise RuntimeError(
+            f'Cannot register {key} in the {registry_name} registry while serving requests when running multiple '
+            'workers without config.shared_cache_backend, as other workers would not be able to find it.'
+        )
+
+    async def _write():
+        try:
+            await shared_backend.set(_shared_entry_key(registry_name, key), value)
+        except Exception as e:
+            dev_logger.warning(
+                f'Failed to share {key} of the {registry_name} registry with other workers, requests for it served '
+                'by other workers will fail',
+                {'error_type': type(e).__name__},
+            )
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        call_async(_write)
+        return
+
+    write = asyncio.create_task(_write())
+    pending_writes = _pending_writes.get()
+    if pending_writes is not None:
+        pending_writes.append(write)
+    else:
+        _background_writes.add(write)
+        write.add_done_callback(_background_writes.discard)
+
+
+@asynccontextmanager
+async def sharing_runtime_entries() -> AsyncIterator[None]:
+    """
+    Wait for the writes of entries shared within the block to complete when leaving it, e.g. so a rendered
+    component is only returned once the other processes can find the actions and components it references.
+    """
+    pending_writes: list[asyncio.Task] = []
+    token = _pending_writes.set(pending_writes)
+    try:
+        yield
+    finally:
+        _pending_writes.reset(token)
+        if len(pending_writes) > 0:
+            await asyncio.gather(*pending_writes)
+
+
+async def get_shared_entry(registry_name: str, key: str) -> Any:
+    """
+    Read an entry registered by another process from the shared cache backend.
+
+    :param registry_name: name of the registry
+    :param key: key of the entry
+    :raises KeyError: if not running several processes, no shared backend is configured or it does not hold the entry
+    """
+    if not is_multi_process():
+        raise KeyError(key)
+
+    from dara.core.internal.registries import utils_registry
+
+    shared_backend = utils_registry.get('Store').shared_backend
+    if shared_backend is None:
+        raise KeyError(key)
+
+    try:
+        return await shared_backend.get(_shared_entry_key(registry_name, key))
+    except KeyError:
+        raise
+    except Exception as e:
+        dev_logger.warning('Failed to read from shared cache backend', {'error_type': type(e).__name__})
+        raise KeyError(key) from e
@@ -17,12 +17,23 @@ limitations under the License.
 
 from __future__ import annotations
 
+import asyncio
+import io
+import mimetypes
 import os
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Iterator
 from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeAlias
 from uuid import uuid4
 
 import anyio
+import pyarrow
+import pyarrow.parquet
+from pandas import DataFrame, RangeIndex
+from starlette.responses import FileResponse, StreamingResponse
+from starlette.types import Message, Receive, Scope, Send
 
 from dara.core.auth.definitions import USER
 from dara.core.base_definitions import Cache, CachedRegistryEntry
@@ -36,8 +47,11 @@ class DownloadDataEntry(BaseModel):
 
     uid: str
     file_path: str
+    """Path to the file to download, or the file name for streamed content"""
     cleanup_file: bool
     identity_name: str | None = None
+    content: Any = None
+    """Iterable or async iterable of bytes streamed instead of reading a file"""
     download: Callable[[DownloadDataEntry], Awaitable[tuple[anyio.AsyncFile, Callable[..., Awaitable]]]]
     """Handler for getting the file from the entry"""
 
@@ -49,7 +63,10 @@ DownloadRegistryEntry = CachedRegistryEntry(
 
 async def download(data_entry: DownloadDataEntry) -> tuple[anyio.AsyncFile, Callable[..., Awaitable]]:
     """
-    Get the loaded filename and path from a code
+    Get the loaded filename and path from a code.
+
+    Custom `download` handlers are streamed from the file they return, entries using this default handler are served
+    with a `DownloadFileResponse` instead.
 
     :param code: one-time download code
     :return: tuple of (async file, cleanup function)
@@ -73,6 +90,280 @@ async def download(data_entry: DownloadDataEntry) -> tuple[anyio.AsyncFile, Call
     return (async_file, cleanup)
 
 
+RESUMABLE_DOWNLOAD_WINDOW = 60 * 10
+"""Seconds during which an interrupted download can be resumed with a Range request"""
+
+
+@dataclass
+class _ResumableDownload:
+    """
+    Download which has been started but not sent in full.
+    """
+
+    data_entry: DownloadDataEntry
+    size: int
+    sent: list[tuple[int, int]] = field(default_factory=list)
+    """Byte ranges sent in full, as sorted and non-overlapping [start, end) intervals"""
+    expires_at: float = 0
+    timer: asyncio.TimerHandle | None = None
+
+    def add_sent_range(self, start: int, end: int) -> bool:
+        """
+        Record a byte range as sent, and return whether the whole file has now been sent.
+
+        :param start: first byte of the range
+        :param end: byte after the last byte of the range
+        """
+        ranges: list[tuple[int, int]] = []
+        for range_start, range_end in sorted([*self.sent, (start, end)]):
+            if ranges and range_start <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], range_end))
+            else:
+                ranges.append((range_start, range_end))
+        self.sent = ranges
+        return ranges == [(0, self.size)]
+
+    def keep_alive(self, code: str):
+        """
+        Keep the download resumable for another `RESUMABLE_DOWNLOAD_WINDOW` seconds, then clean it up.
+
+        :param code: download code of the download
+        """
+        self.expires_at = time.time() + RESUMABLE_DOWNLOAD_WINDOW
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = asyncio.get_running_loop().call_later(RESUMABLE_DOWNLOAD_WINDOW, _expire_download, code)
+
+    def close(self):
+        """
+        Stop tracking the download and remove its file if `cleanup_file` is set.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.data_entry.cleanup_file and os.path.exists(self.data_entry.file_path):
+            os.remove(self.data_entry.file_path)
+
+
+_resumable_downloads: dict[str, _ResumableDownload] = {}
+"""Downloads which have been started but not sent in full, keyed by their code"""
+
+
+def _expire_download(code: str):
+    resumable = _resumable_downloads.pop(code, None)
+    if resumable is not None:
+        resumable.close()
+
+
+def get_resumable_download(code: str) -> DownloadDataEntry | None:
+    """
+    Get an interrupted download which can be resumed by the current user.
+
+    :param code: download code used for the interrupted download
+    """
+    resumable = _resumable_downloads.get(code)
+    if resumable is None or resumable.expires_at <= time.time():
+        return None
+
+    data_entry = resumable.data_entry
+    user = USER.get()
+    if data_entry.identity_name is not None and (user is None or user.identity_name != data_entry.identity_name):
+        return None
+
+    return data_entry
+
+
+def _get_sent_range(message: Message, size: int) -> tuple[int, int] | None:
+    """
+    Get the byte range of the file a response sends, from its start message.
+
+    :param message: the http.response.start message
+    :param size: size of the file
+    :returns: the [start, end) range sent, or None if unknown, i.e. for multiple ranges sent as a multipart body
+    """
+    if message['status'] == 200:
+        return (0, size)
+    if message['status'] != 206:
+        return None
+
+    headers = {key.lower(): value for key, value in message.get('headers', [])}
+    content_range = headers.get(b'content-range', b'').decode('latin-1')
+    # Single ranges are sent as 'bytes start-end/size', multiple ranges as a multipart body instead
+    range_spec, _, _size = content_range.removeprefix('bytes ').partition('/')
+    start, _, end = range_spec.partition('-')
+    if not (start.isdigit() and end.isdigit()):
+        return None
+    return (int(start), int(end) + 1)
+
+
+class DownloadFileResponse(FileResponse):
+    """
+    Response serving the file of a download code.
+
+    Uses the server's sendfile support where available, and supports Range requests. Once every byte of the file
+    has been sent, across one or several requests, the download is complete and the file is removed if
+    `cleanup_file` is set. An interrupted download can be resumed with a Range request using the same code for
+    `RESUMABLE_DOWNLOAD_WINDOW` seconds after the last request, after which it is cleaned up.
+    """
+
+    def __init__(self, code: str, data_entry: DownloadDataEntry):
+        """
+        :param code: download code the file is served for
+        :param data_entry: entry of the download code
+        """
+        # Raises upfront if the file does not exist
+        stat_result = os.stat(data_entry.file_path)
+        super().__init__(
+            data_entry.file_path,
+            headers={'Content-Disposition': f'attachment; filename={os.path.basename(data_entry.file_path)}'},
+            stat_result=stat_result,
+        )
+        self.code = code
+        self.data_entry = data_entry
+        self.size = stat_result.st_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        resumable = _resumable_downloads.get(self.code)
+        if resumable is None:
+            resumable = _ResumableDownload(self.data_entry, self.size)
+            _resumable_downloads[self.code] = resumable
+        resumable.keep_alive(self.code)
+
+        sent_range = None
+
+        async def _send(message: Message):
+            nonlocal sent_range
+            # HEAD requests do not send the file
+            if message['type'] == 'http.response.start' and scope['method'].upper() != 'HEAD':
+                sent_range = _get_sent_range(message, resumable.size)
+            await send(message)
+
+        # Raises if the client disconnects, keeping the download resumable
+        await super().__call__(scope, receive, _send)
+
+        if sent_range is not None and resumable.add_sent_range(*sent_range):
+            _resumable_downloads.pop(self.code, None)
+            resumable.close()
+
+
+StreamingContent: TypeAlias = Iterable[bytes] | AsyncIterable[bytes]
+
+DataFrameDownloadFormat: TypeAlias = Literal['csv', 'parquet']
+
+DOWNLOAD_CHUNK_ROWS = 10_000
+"""Number of rows encoded per chunk when streaming a DataFrame"""
+
+
+def get_dataframe_format(file_name: str) -> DataFrameDownloadFormat:
+    """
+    Get the format to encode a DataFrame in for a given file name, based on its extension.
+
+    :param file_name: name of the downloaded file
+    """
+    _name, ext = os.path.splitext(file_name)
+    return 'parquet' if ext.lower() in ('.parquet', '.pq') else 'csv'
+
+
+def csv_chunks(df: DataFrame, chunk_rows: int = DOWNLOAD_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Encode a DataFrame as CSV, yielding the header and then `chunk_rows` rows at a time.
+
+    :param df: DataFrame to encode
+    :param chunk_rows: number of rows per chunk
+    """
+    yield df.iloc[:0].to_csv().encode()
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start : start + chunk_rows].to_csv(header=False).encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Writable file collecting the bytes written to it until they are drained.
+    Keeps track of the total position, as the Parquet writer uses it for the offsets in the file footer.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):  # type: ignore
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self):
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def parquet_chunks(df: DataFrame, chunk_rows: int = DOWNLOAD_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Encode a DataFrame as Parquet, writing and yielding a row group of `chunk_rows` rows at a time.
+
+    :param df: DataFrame to encode
+    :param chunk_rows: number of rows per row group
+    """
+    # A default index is restored on read without storing it, as it would otherwise be restored from the first chunk
+    index = df.index
+    preserve_index = not (isinstance(index, RangeIndex) and index.start == 0 and index.step == 1 and index.name is None)
+
+    # Inferred from the whole DataFrame so that every row group is written with the same types
+    schema = pyarrow.Schema.from_pandas(df, preserve_index=preserve_index)
+
+    sink = _ChunkSink()
+    with pyarrow.parquet.ParquetWriter(sink, schema) as writer:
+        for start in range(0, len(df), chunk_rows):
+            writer.write_table(
+                pyarrow.Table.from_pandas(
+                    df.iloc[start : start + chunk_rows], schema=schema, preserve_index=preserve_index
+                )
+            )
+            yield sink.drain()
+    # The footer is written when the writer is closed
+    yield sink.drain()
+
+
+def encode_dataframe(
+    df: DataFrame, format: DataFrameDownloadFormat = 'csv', chunk_rows: int = DOWNLOAD_CHUNK_ROWS
+) -> Iterator[bytes]:
+    """
+    Encode a DataFrame in a given format, chunk by chunk.
+
+    :param df: DataFrame to encode
+    :param format: format to encode the DataFrame in
+    :param chunk_rows: number of rows encoded per chunk
+    """
+    if format == 'parquet':
+        return parquet_chunks(df, chunk_rows)
+    if format == 'csv':
+        return csv_chunks(df, chunk_rows)
+    raise ValueError(f'Unsupported DataFrame download format: {format}')
+
+
+def stream_download(data_entry: DownloadDataEntry) -> StreamingResponse:
+    """
+    Response streaming the content of a download code, chunk by chunk.
+
+    :param data_entry: entry of the download code
+    """
+    file_name = os.path.basename(data_entry.file_path)
+    media_type, _encoding = mimetypes.guess_type(file_name)
+    return StreamingResponse(
+        content=data_entry.content,
+        headers={'Content-Disposition': f'attachment; filename={file_name}'},
+        media_type=media_type or 'application/octet-stream',
+    )
+
+
 GENERATE_CODE_OVERRIDE = ContextVar[Callable[[str], str] | None]('GENERATE_CODE_OVERRIDE', default=None)
 """
 Optional context variable which can be used to override the default behaviour of code generation.
@@ -80,12 +371,13 @@ Invoked with the file path to generate a download code for.
 """
 
 
-async def generate_download_code(file_path: str, cleanup_file: bool) -> str:
+async def generate_download_code(file_path: str, cleanup_file: bool, content: StreamingContent | None = None) -> str:
     """
     Generate a one-time download code for a given dataset.
 
-    :param file_path: path to file
+    :param file_path: path to file, or the name of the downloaded file if `content` is passed
     :cleanup_file: bool with whether to erase the file after user downloads it
+    :param content: optional iterable or async iterable of bytes to stream instead of the file
     """
     from dara.core.internal.cache_store import CacheStore
     from dara.core.internal.registries import utils_registry
@@ -106,6 +398,7 @@ async def generate_download_code(file_path: str, cleanup_file: bool) -> str:
             file_path=file_path,
             cleanup_file=cleanup_file,
             identity_name=user.identity_name if user is not None else None,
+            content=content,
             download=download,
         ),
     )
@@ -28,6 +28,20 @@ from dara.core.internal.pool.utils import SharedMemoryPointer, SubprocessExcepti
 
 WORKER_NAME = 'task_pool_worker'
 
+FAKE_PROGRESS_PREFIX = 'FAKE_PROGRESS__'
+"""Prefix of progress messages starting a fake progress animation on the client"""
+
+
+def is_coalescable_progress(progress: float, message: str) -> bool:
+    """
+    Whether a progress update can be dropped in favour of a later one. Fake progress updates start an animation
+    on the client and the final update marks the end of the progress, so they are always delivered.
+
+    :param progress: progress of the update, 0-100
+    :param message: message of the update
+    """
+    return progress < 100 and not message.startswith(FAKE_PROGRESS_PREFIX)
+
 
 class WorkerParameters(TypedDict):
     task_module: str
@@ -67,6 +81,8 @@ class TaskPayload(TypedDict):
     args: tuple
     kwargs: dict
     telemetry_context: NotRequired[dict[str, str] | None]
+    progress_interval: NotRequired[float]
+    """Minimum number of seconds between progress updates sent by the worker"""
 
 
 class TaskDefinition:
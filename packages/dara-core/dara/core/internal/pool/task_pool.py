@@ -135,7 +135,12 @@ class TaskPool:
             raise RuntimeError('Pool already started')
 
     def submit(
-        self, task_uid: str, function_name: str, args: tuple | None = None, kwargs: dict | None = None
+        self,
+        task_uid: str,
+        function_name: str,
+        args: tuple | None = None,
+        kwargs: dict | None = None,
+        progress_interval: float = 0,
     ) -> TaskDefinition:
         """
         Submit a new task to the pool
@@ -144,6 +149,8 @@ class TaskPool:
         :param function_name: name of the function within configured task module to run
         :param args: list of arguments to pass to the function
         :param kwargs: dict of kwargs to pass to the function
+        :param progress_interval: minimum number of seconds between progress updates sent by the worker,
+            updates sent in between are coalesced with the latest one winning
         """
         if args is None:
             args = ()
@@ -159,6 +166,7 @@ class TaskPool:
                 args=args,
                 kwargs=kwargs,
                 telemetry_context=capture_telemetry_carrier(),
+                progress_interval=progress_interval,
             ),
             telemetry_context=capture_telemetry_context(),
         )
@@ -18,16 +18,18 @@ limitations under the License.
 from __future__ import annotations
 
 import logging
+import math
 import os
 import signal
 import sys
+import threading
 from collections.abc import Callable
 from datetime import datetime
 from importlib import import_module
 from inspect import iscoroutinefunction
 from multiprocessing import get_context
 from multiprocessing.context import SpawnProcess
-from time import sleep
+from time import monotonic, sleep
 
 import anyio
 
@@ -36,6 +38,7 @@ from dara.core.internal.pool.definitions import (
     WORKER_NAME,
     WorkerParameters,
     WorkerStatus,
+    is_coalescable_progress,
 )
 from dara.core.internal.pool.utils import (
     SubprocessException,
@@ -93,9 +96,63 @@ def execute_function(func: Callable, args: tuple, kwargs: dict):
         return SubprocessException(e)
 
 
-def _create_send_update(task_uid: str, channel: Channel):
-    """Create a __send_update method to inject into the @track_progress-wrapped function"""
-    return lambda *args: channel.worker_api.send_progress(task_uid, *args)
+class ProgressSender:
+    """
+    The __send_update method injected into the @track_progress-wrapped function.
+
+    Coalesces progress updates so at most one is sent to the pool every `interval` seconds. Updates sent in between
+    are held back and only the latest one is sent once the interval elapses. Fake progress and final updates are
+    never held back.
+    """
+
+    def __init__(self, task_uid: str, channel: Channel, interval: float = 0):
+        self.task_uid = task_uid
+        self.channel = channel
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last_sent = -math.inf
+        self._pending: tuple[float, str] | None = None
+        self._timer: threading.Timer | None = None
+
+    def __call__(self, progress: float, message: str):
+        if not is_coalescable_progress(progress, message):
+            # Send any held back update first to keep the order of updates
+            self.flush()
+            with self._lock:
+                self._send(progress, message, monotonic())
+            return
+
+        with self._lock:
+            now = monotonic()
+            remaining = self._last_sent + self.interval - now
+
+            if remaining <= 0 and self._timer is None:
+                self._send(progress, message, now)
+                return
+
+            # Within the interval, keep the latest update and send it once the interval elapses
+            self._pending = (progress, message)
+            if self._timer is None:
+                self._timer = threading.Timer(max(remaining, 0), self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _send(self, progress: float, message: str, now: float):
+        self._last_sent = now
+        self.channel.worker_api.send_progress(self.task_uid, progress, message)
+
+    def flush(self):
+        """
+        Send the pending update immediately, if there is one
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if self._pending is not None:
+                self._send(*self._pending, monotonic())
+                self._pending = None
 
 
 def _setup_logger() -> logging.Logger:
@@ -186,12 +243,18 @@ def worker_loop(worker_params: WorkerParameters, channel: Channel):
                     kwargs = payload['kwargs']
 
                     # If func is decorated with @track_progress, inject updater method
+                    progress_sender = None
                     wrapped_by = getattr(func, '__wrapped_by__', None)
                     if wrapped_by is not None and wrapped_by.__name__ == 'track_progress':
-                        kwargs = {**kwargs, '__send_update': _create_send_update(task_uid, channel)}
+                        progress_sender = ProgressSender(task_uid, channel, payload.get('progress_interval', 0))
+                        kwargs = {**kwargs, '__send_update': progress_sender}
 
                 with observe_task_phase('execute', task_name):
                     result = execute_function(func, payload['args'], kwargs)
+
+                # Deliver the latest progress update before the result
+                if progress_sender is not None:
+                    progress_sender.flush()
                 if isinstance(result, SubprocessException):
                     observation.record_exception(result.unwrap())
 
@@ -34,27 +34,33 @@ from dara.core.interactivity.derived_variable import (
 from dara.core.interactivity.server_variable import ServerVariableRegistryEntry
 from dara.core.interactivity.stream_variable import StreamVariableRegistryEntry
 from dara.core.internal.download import DownloadDataEntry
-from dara.core.internal.registry import Registry, RegistryType
+from dara.core.internal.registry import CrossProcessMode, Registry, RegistryType
 from dara.core.internal.websocket import CustomClientMessagePayload
 from dara.core.persistence import BackendStoreEntry
 
 action_def_registry = Registry[ActionDef](RegistryType.ACTION_DEF, CORE_ACTIONS)  # all registered actions
-action_registry = Registry[ActionResolverDef](RegistryType.ACTION)  # functions for actions requiring backend calls
+action_registry = Registry[ActionResolverDef](
+    RegistryType.ACTION, cross_process=CrossProcessMode.STABLE
+)  # functions for actions requiring backend calls
 upload_resolver_registry = Registry[UploadResolverDef](
-    RegistryType.UPLOAD_RESOLVER
+    RegistryType.UPLOAD_RESOLVER, cross_process=CrossProcessMode.STABLE
 )  # functions for upload resolvers requiring backend calls
-component_registry = Registry[ComponentTypeAnnotation](RegistryType.COMPONENTS, CORE_COMPONENTS)
+component_registry = Registry[ComponentTypeAnnotation](
+    RegistryType.COMPONENTS, CORE_COMPONENTS, cross_process=CrossProcessMode.STABLE
+)
 config_registry = Registry[EndpointConfiguration](RegistryType.ENDPOINT_CONFIG)
-server_variable_registry = Registry[ServerVariableRegistryEntry](RegistryType.SERVER_VARIABLE, allow_duplicates=False)
+server_variable_registry = Registry[ServerVariableRegistryEntry](
+    RegistryType.SERVER_VARIABLE, allow_duplicates=False, cross_process=CrossProcessMode.STABLE
+)
 """map of server variable uid -> server variable entry"""
 derived_variable_registry = Registry[DerivedVariableRegistryEntry](
-    RegistryType.DERIVED_VARIABLE, allow_duplicates=False
+    RegistryType.DERIVED_VARIABLE, allow_duplicates=False, cross_process=CrossProcessMode.STABLE
 )
 latest_value_registry = Registry[LatestValueRegistryEntry](RegistryType.LAST_VALUE, allow_duplicates=False)
 template_registry = Registry[Template](RegistryType.TEMPLATE)
 auth_registry = Registry[BaseAuthConfig](RegistryType.AUTH_CONFIG)
 utils_registry = Registry[Any](RegistryType.UTILS, INITIAL_CORE_INTERNALS)
-static_kwargs_registry = Registry[Mapping[str, Any]](RegistryType.STATIC_KWARGS)
+static_kwargs_registry = Registry[Mapping[str, Any]](RegistryType.STATIC_KWARGS, cross_process=CrossProcessMode.SHARED)
 
 websocket_registry = Registry[set[str]](RegistryType.WEBSOCKET_CHANNELS)
 """maps session_id -> WS channel"""
@@ -71,11 +77,15 @@ custom_ws_handlers_registry = Registry[Callable[[str, CustomClientMessagePayload
 """map of custom kind name -> handler function(channel: str, message: CustomClientMessagePayload)"""
 
 
-backend_store_registry = Registry[BackendStoreEntry](RegistryType.BACKEND_STORE, allow_duplicates=False)
+backend_store_registry = Registry[BackendStoreEntry](
+    RegistryType.BACKEND_STORE, allow_duplicates=False, cross_process=CrossProcessMode.STABLE
+)
 """map of store uid -> store instance"""
 
 download_code_registry = Registry[DownloadDataEntry](RegistryType.DOWNLOAD_CODE, allow_duplicates=False)
 """map of download codes -> download data entry, used only to allow overriding download code behaviour via RegistryLookup"""
 
-stream_variable_registry = Registry[StreamVariableRegistryEntry](RegistryType.STREAM_VARIABLE, allow_duplicates=False)
+stream_variable_registry = Registry[StreamVariableRegistryEntry](
+    RegistryType.STREAM_VARIABLE, allow_duplicates=False, cross_process=CrossProcessMode.STABLE
+)
 """map of stream variable uid -> stream variable registry entry"""
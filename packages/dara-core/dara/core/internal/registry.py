@@ -20,6 +20,7 @@ from collections.abc import MutableMapping
 from enum import Enum
 from typing import Generic, TypeVar
 
+from dara.core.internal.cross_process import check_runtime_registration, share_runtime_entry
 from dara.core.metrics import total_size
 from dara.core.telemetry import record_registry_cache_metrics
 
@@ -49,6 +50,18 @@ class RegistryType(str, Enum):
     STREAM_VARIABLE = 'StreamVariable'
 
 
+class CrossProcessMode(str, Enum):
+    """
+    How the entries of a registry are kept consistent between worker processes when running several of them
+    """
+
+    STABLE = 'stable'
+    """Entries are registered while the app loads under uids identical in every process, new entries are refused afterwards"""
+
+    SHARED = 'shared'
+    """Entries registered while serving requests are written through to the shared cache backend"""
+
+
 class Registry(Generic[T]):
     """
     A generic registry class that allows for new registries to be quickly added and expose a common interface
@@ -61,14 +74,17 @@ class Registry(Generic[T]):
         name: RegistryType | str,
         initial_registry: MutableMapping[str, T] | None = None,
         allow_duplicates: bool | None = True,
+        cross_process: CrossProcessMode | None = None,
     ):
         """
         :param name: human readable name of the registry; used for metrics
         :param initial_registry: an optional initial set of elements for the registry
         :param allow_duplicates: an optional boolean which determines whether this registry should allow for duplicate uids entries
+        :param cross_process: how entries are kept consistent between worker processes; None if the registry is process-local
         """
         self.name = name
         self.allow_duplicates = allow_duplicates
+        self.cross_process = cross_process
         self._registry = {}
         if initial_registry is not None:
             self._registry = copy.deepcopy(initial_registry)
@@ -81,6 +97,12 @@ class Registry(Generic[T]):
         if not self.allow_duplicates and key in self._registry:
             raise ValueError(f'Invalid uid value: {key}, is already taken')
 
+        if key not in self._registry:
+            if self.cross_process == CrossProcessMode.STABLE:
+                check_runtime_registration(self._name_value, key)
+            elif self.cross_process == CrossProcessMode.SHARED:
+                share_runtime_entry(self._name_value, key, value)
+
         self._registry[key] = value
         self._size = total_size(self._registry)
         self._update_metrics()
@@ -103,12 +125,15 @@ class Registry(Generic[T]):
         """Fetch all the items currently registered"""
         return self._registry
 
+    @property
+    def _name_value(self) -> str:
+        return self.name.value if isinstance(self.name, RegistryType) else self.name
+
     def _update_metrics(self):
         """
         Notify the cache metrics tracker.
         """
-        name = self.name.value if isinstance(self.name, RegistryType) else self.name
-        record_registry_cache_metrics(name, self._size, len(self._registry))
+        record_registry_cache_metrics(self._name_value, self._size, len(self._registry))
 
     def remove(self, key: str):
         """
@@ -18,7 +18,8 @@ limitations under the License.
 from collections.abc import Callable, Coroutine
 from typing import Literal, TypeVar
 
-from dara.core.internal.registry import Registry, RegistryType
+from dara.core.internal.cross_process import get_shared_entry
+from dara.core.internal.registry import CrossProcessMode, Registry, RegistryType
 from dara.core.internal.utils import async_dedupe
 from dara.core.telemetry import observe_internal_operation
 
@@ -67,8 +68,17 @@ class RegistryLookup:
                     # If something else registered the entry while we were waiting, return that
                     if registry.has(uid):
                         return registry.get(uid)
-                    registry.register(uid, entry)
+                    registry.set(uid, entry)
                     return entry
+                if registry.cross_process == CrossProcessMode.SHARED:
+                    # The entry might have been registered by another worker process
+                    try:
+                        entry = await get_shared_entry(registry_name, uid)
+                    except KeyError:
+                        pass
+                    else:
+                        registry.set(uid, entry)
+                        return entry
                 raise ValueError(
                     f'Could not find uid {uid} in {registry.name} registry, did you register it before the app was initialized?'
                 ) from e
@@ -64,7 +64,13 @@ from dara.core.interactivity.stream_utils import track_stream
 from dara.core.interactivity.stream_variable import run_stream
 from dara.core.internal.cache_store import CacheStore
 from dara.core.internal.devtools import print_stacktrace
-from dara.core.internal.download import DownloadRegistryEntry
+from dara.core.internal.download import (
+    DownloadFileResponse,
+    DownloadRegistryEntry,
+    download,
+    get_resumable_download,
+    stream_download,
+)
 from dara.core.internal.execute_action import CURRENT_ACTION_ID, execute_action_sync
 from dara.core.internal.normalization import NormalizedPayload, denormalize, normalize
 from dara.core.internal.pandas_utils import data_response_to_json, df_to_json, is_data_response
@@ -185,10 +191,17 @@ async def get_action(uid: str, body: ActionRequestBody):
 
 
 @core_api_router.get('/download', dependencies=[Depends(verify_session)])
-async def get_download(code: str):
+async def get_download(code: str, request: Request):
     store: CacheStore = utils_registry.get('Store')
 
     try:
+        # A started download can only be resumed with a Range request, the code is otherwise used up
+        data_entry = get_resumable_download(code)
+        if data_entry is not None:
+            if 'range' not in request.headers:
+                raise ValueError('Download code already used')
+            return DownloadFileResponse(code, data_entry)
+
         data_entry = await store.get(DownloadRegistryEntry, key=code)
 
         # If not found directly in the store, use the override registry
@@ -201,6 +214,16 @@ async def get_download(code: str):
             # remove it from the registry immediately because it's one time use
             download_code_registry.remove(code)
 
+        if data_entry.content is not None:
+            # Streamed content can only be consumed once, so it cannot be resumed
+            await store.delete(DownloadRegistryEntry, key=data_entry.uid)
+            return stream_download(data_entry)
+
+        if data_entry.download is download:
+            # Remove the entry from the store explicitly, the response keeps it resumable until it's complete
+            await store.delete(DownloadRegistryEntry, key=data_entry.uid)
+            return DownloadFileResponse(code, data_entry)
+
         async_file, cleanup = await data_entry.download(data_entry)
 
         file_name = os.path.basename(data_entry.file_path)
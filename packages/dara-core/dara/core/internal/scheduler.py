@@ -15,18 +15,30 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import heapq
+import itertools
 import time
 from collections.abc import Callable
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import partial, wraps
+from inspect import iscoroutinefunction
 from multiprocessing import get_context
 from multiprocessing.process import BaseProcess
 from pickle import PicklingError
 from typing import Any, cast
 from weakref import WeakKeyDictionary
 
+import anyio
+from anyio import to_thread
+from anyio.abc import TaskGroup
 from croniter import croniter
 from pydantic import BaseModel, field_validator
+from typing_extensions import Self
 
+from dara.core.logging import dev_logger
+from dara.core.shared_state import SingleFlight
 from dara.core.telemetry import (
     capture_telemetry_carrier,
     initialize_process_telemetry,
@@ -42,11 +54,51 @@ def _callable_name(func: Callable) -> str:
     return f'{getattr(func, "__module__", "unknown")}.{getattr(func, "__qualname__", type(func).__name__)}'
 
 
+class MissedRunPolicy(str, Enum):
+    """
+    What an in-process scheduled job does with runs it missed, e.g. because the event loop was blocked,
+    the host was suspended or the previous run was still in progress.
+    """
+
+    SKIP = 'skip'
+    """Drop missed runs, only runs starting within the grace time of their due time are executed"""
+
+    RUN_ONCE = 'run_once'
+    """Coalesce all missed runs into a single run"""
+
+    RUN_ALL = 'run_all'
+    """Execute every missed run, one after another"""
+
+
+def with_result_target(func: Callable, target: Any) -> Callable:
+    """
+    Wrap a scheduled function so its return value is written to a target, e.g. a ServerVariable or a BackendStore,
+    which notifies the connected clients of the new value.
+
+    :param func: The scheduled function
+    :param target: The object to write the result to, must define an async `write(value)` method
+    """
+
+    @wraps(func)
+    async def _run_and_write(*args):
+        if iscoroutinefunction(func):
+            result = await func(*args)
+        else:
+            result = await to_thread.run_sync(partial(func, *args))
+        await target.write(result)
+
+    return _run_and_write
+
+
 class ScheduledJob(BaseModel):
     interval: int | list[int]
     continue_running: bool = True
     first_execution: bool = True
     run_once: bool
+    run_in_process: bool = False
+    allow_overlap: bool = False
+    missed_runs: MissedRunPolicy = MissedRunPolicy.RUN_ONCE
+    single_runner: bool = False
 
     def __init__(self, interval: int | list, run_once=False, **kwargs):
         """
@@ -57,6 +109,45 @@ class ScheduledJob(BaseModel):
         """
         super().__init__(interval=interval, run_once=run_once, **kwargs)
 
+    def in_process(
+        self, allow_overlap: bool = False, missed_runs: MissedRunPolicy | str = MissedRunPolicy.RUN_ONCE
+    ) -> Self:
+        """
+        Run the job within the application process instead of a dedicated process.
+
+        In-process jobs share a single timer in the app's event loop. Coroutine functions run on the
+        event loop, other functions in the shared worker thread pool, so they should not be CPU heavy.
+
+        :param allow_overlap: Whether a run can start while the previous run of the job is still in progress
+        :param missed_runs: What to do with runs which were missed, see :class:`MissedRunPolicy`
+        """
+        self.run_in_process = True
+        self.allow_overlap = allow_overlap
+        self.missed_runs = MissedRunPolicy(missed_runs)
+        return self
+
+    def _repeat_interval(self) -> int:
+        interval = self.interval[1] if isinstance(self.interval, list) else self.interval
+        if interval <= 0:
+            raise ValueError('The interval of a repeating scheduled job must be greater than 0')
+        return interval
+
+    def next_run_time(self, now: float, last_run: float | None = None) -> float | None:
+        """
+        Compute when the job is next due for the in-process scheduler.
+
+        :param now: The current timestamp
+        :param last_run: The timestamp the job was last due at, None if it has not been due yet
+        :return: The timestamp the job is next due at, None if it should not run again
+        """
+        if not self.continue_running:
+            return None
+        if last_run is None:
+            return now + (self.interval[0] if isinstance(self.interval, list) else self.interval)
+        if self.run_once:
+            return None
+        return last_run + self._repeat_interval()
+
     def do(self, func, args=None, *, _telemetry_name: str | None = None) -> BaseProcess:
         """
         Starts the scheduled job process and returns it to the caller. Process is daemonized,
@@ -154,6 +245,19 @@ class CronScheduledJob(ScheduledJob):
             raise ValueError('Must provide a valid cron schedule expression.')
         super().__init__(interval=0, run_once=False, crondef=crondef)
 
+    def next_run_time(self, now: float, last_run: float | None = None) -> float | None:
+        """
+        Compute when the job is next due for the in-process scheduler.
+
+        :param now: The current timestamp
+        :param last_run: The timestamp the job was last due at, None if it has not been due yet
+        :return: The timestamp the job is next due at, None if it should not run again
+        """
+        if not self.continue_running:
+            return None
+        start = datetime.fromtimestamp(now if last_run is None else last_run, tz=timezone.utc)
+        return croniter(self.crondef, start).get_next(float)
+
     def do(self, func, args=None, *, _telemetry_name: str | None = None) -> BaseProcess:
         """
         Starts the scheduled job process and returns it to the caller. Process is daemonized,
@@ -189,15 +293,45 @@ class CronScheduledJob(ScheduledJob):
 
 class TimeScheduledJob(ScheduledJob):
     job_time: datetime
+    weekday: int | None = None
 
-    def __init__(self, interval: int | list, job_time: str, run_once=False):
+    def __init__(self, interval: int | list, job_time: str, run_once=False, weekday: int | None = None):
         """
         Creates a TimeScheduledJob object
 
         :param interval: The interval between job executions, in seconds
         :param job_time: A string containing the time at which to execute this job. Must be formatted %H:%M
+        :param run_once: Whether to run the job only once
+        :param weekday: The day of the week to execute the job on, 0 being Sunday
+        """
+        super().__init__(
+            interval=interval, run_once=run_once, job_time=datetime.strptime(job_time, '%H:%M'), weekday=weekday
+        )
+
+    def next_run_time(self, now: float, last_run: float | None = None) -> float | None:
+        """
+        Compute when the job is next due for the in-process scheduler.
+
+        The first run happens at the next occurrence of the job time (UTC), on the given weekday if set,
+        later runs follow it by the job's interval.
+
+        :param now: The current timestamp
+        :param last_run: The timestamp the job was last due at, None if it has not been due yet
+        :return: The timestamp the job is next due at, None if it should not run again
         """
-        super().__init__(interval=interval, job_time=datetime.strptime(job_time, '%H:%M'))
+        if not self.continue_running:
+            return None
+        if last_run is not None:
+            return None if self.run_once else last_run + self._repeat_interval()
+
+        current_time = datetime.fromtimestamp(now, tz=timezone.utc)
+        next_run = current_time.replace(hour=self.job_time.hour, minute=self.job_time.minute, second=0, microsecond=0)
+        if self.weekday is not None:
+            # datetime counts weekdays from Monday, cron style weekdays from Sunday
+            next_run += timedelta(days=((self.weekday - 1) % 7 - next_run.weekday()) % 7)
+        if next_run <= current_time:
+            next_run += timedelta(days=1 if self.weekday is None else 7)
+        return next_run.timestamp()
 
     def do(self, func, args=None, *, _telemetry_name: str | None = None) -> BaseProcess:
         """
@@ -243,7 +377,12 @@ class ScheduledJobFactory(BaseModel):
     interval: int | list
     continue_running: bool = True
     weekday: datetime | None = None
+    weekday_number: int | None = None
     run_once: bool
+    run_in_process: bool = False
+    allow_overlap: bool = False
+    missed_runs: MissedRunPolicy = MissedRunPolicy.RUN_ONCE
+    single_runner: bool = False
 
     @field_validator('weekday', mode='before')
     @classmethod
@@ -254,6 +393,40 @@ class ScheduledJobFactory(BaseModel):
             return datetime.strptime(weekday, '%w')
         raise ValueError(f'Invalid weekday {weekday} passed to ScheduledJobFactory')
 
+    def in_process(
+        self, allow_overlap: bool = False, missed_runs: MissedRunPolicy | str = MissedRunPolicy.RUN_ONCE
+    ) -> Self:
+        """
+        Run the job within the application process instead of a dedicated process, see :meth:`ScheduledJob.in_process`.
+
+        :param allow_overlap: Whether a run can start while the previous run of the job is still in progress
+        :param missed_runs: What to do with runs which were missed, see :class:`MissedRunPolicy`
+        """
+        self.run_in_process = True
+        self.allow_overlap = allow_overlap
+        self.missed_runs = MissedRunPolicy(missed_runs)
+        return self
+
+    def _apply_job_options(self, job: ScheduledJob):
+        job.continue_running = self.continue_running
+        job.run_in_process = self.run_in_process
+        job.allow_overlap = self.allow_overlap
+        job.missed_runs = self.missed_runs
+        job.single_runner = self.single_runner
+
+    def to_job(self) -> ScheduledJob:
+        """
+        Create the ScheduledJob running at the factory's interval.
+        """
+        if self.weekday is not None:
+            # Set 2 intervals, where the first interval is the time from now until the first execution
+            interval: list | int = [(self.weekday - datetime.utcnow()).seconds, self.interval]
+        else:
+            interval = self.interval
+        job = ScheduledJob(interval, run_once=self.run_once)
+        self._apply_job_options(job)
+        return job
+
     def at(self, job_time: str) -> TimeScheduledJob:
         """
         If the job must execute at a specific time of day, this function returns a
@@ -268,8 +441,8 @@ class ScheduledJobFactory(BaseModel):
             interval: list | int = [(self.weekday - datetime.utcnow()).seconds, self.interval]
         else:
             interval = self.interval
-        job = TimeScheduledJob(interval, job_time, run_once=self.run_once)
-        job.continue_running = self.continue_running
+        job = TimeScheduledJob(interval, job_time, run_once=self.run_once, weekday=self.weekday_number)
+        self._apply_job_options(job)
         return job
 
     def do(self, func, args=None) -> BaseProcess:
@@ -280,14 +453,217 @@ class ScheduledJobFactory(BaseModel):
         :param func: The function to be pickled and passed to the subprocess to execute
         :param args: Any arguments to be passed to the picked function
         """
-        if self.weekday is not None:
-            # Set 2 intervals, where the first interval is the time from now until the first execution
-            interval: list | int = [(self.weekday - datetime.utcnow()).seconds, self.interval]
-        else:
-            interval = self.interval
-        job = ScheduledJob(interval, run_once=self.run_once)
-        job.continue_running = self.continue_running
-        return job.do(func, args)
+        return self.to_job().do(func, args)
+
+
+@dataclass(eq=False)
+class _InProcessJob:
+    """State of a job registered with the InProcessScheduler"""
+
+    job: ScheduledJob
+    func: Callable
+    args: list
+    name: str
+    telemetry_context: dict[str, str] | None
+    running: bool = False
+    pending_runs: int = 0
+
+
+class InProcessScheduler:
+    """
+    Runs in-process scheduled jobs on the application's event loop, from a single timer heap.
+
+    Coroutine functions are awaited on the event loop, other functions run in the shared worker thread pool.
+    A run which is late by more than `misfire_grace_time` seconds is considered missed and handled
+    according to the job's :class:`MissedRunPolicy`.
+    """
+
+    def __init__(self, misfire_grace_time: float = 1):
+        """
+        :param misfire_grace_time: Seconds a run can be late by before it is considered missed
+        """
+        self.misfire_grace_time = misfire_grace_time
+        self.jobs: list[_InProcessJob] = []
+        self._heap: list[tuple[float, int, _InProcessJob]] = []
+        self._counter = itertools.count()
+        self._wakeup: anyio.Event | None = None
+        self._task_group: TaskGroup | None = None
+        self._stopped = False
+
+    def add(
+        self,
+        job: ScheduledJob | ScheduledJobFactory,
+        func: Callable,
+        args: list | None = None,
+        name: str | None = None,
+    ):
+        """
+        Register a job to run on the scheduler.
+
+        :param job: The job defining when to run the function
+        :param func: The function to run
+        :param args: List of arguments to pass to the function
+        :param name: Name of the job used for telemetry, defaults to the function name
+        """
+        if isinstance(job, ScheduledJobFactory):
+            job = job.to_job()
+        entry = _InProcessJob(
+            job=job,
+            func=func,
+            args=args or [],
+            name=name or _callable_name(func),
+            telemetry_context=capture_telemetry_carrier(),
+        )
+        next_run = job.next_run_time(time.time())
+        if next_run is not None:
+            # Validate the repeat interval upfront rather than failing in the scheduler loop
+            job.next_run_time(next_run, next_run)
+        self.jobs.append(entry)
+        self._schedule(entry, next_run)
+
+    def _schedule(self, entry: _InProcessJob, next_run: float | None):
+        if next_run is None:
+            return
+        heapq.heappush(self._heap, (next_run, next(self._counter), entry))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _collect_runs(self, entry: _InProcessJob, due: float, now: float) -> int:
+        """
+        Reschedule a job which fell due and return how many runs to execute for it.
+
+        :param entry: The job which fell due
+        :param due: The timestamp the job was due at
+        :param now: The current timestamp
+        """
+        due_runs = 1
+        latest_due = due
+        next_run = entry.job.next_run_time(now, latest_due)
+        # Further runs may have fallen due while the loop was busy, e.g. blocked or suspended
+        while next_run is not None and next_run <= now:
+            due_runs += 1
+            latest_due = next_run
+            next_run = entry.job.next_run_time(now, latest_due)
+        self._schedule(entry, next_run)
+
+        if entry.job.missed_runs == MissedRunPolicy.RUN_ALL:
+            return due_runs
+        if entry.job.missed_runs == MissedRunPolicy.RUN_ONCE:
+            return 1
+        return 1 if now - latest_due <= self.misfire_grace_time else 0
+
+    def _queue_runs(self, entry: _InProcessJob, runs: int) -> bool:
+        """
+        Queue runs of a job which does not allow overlapping runs.
+
+        :param entry: The job to queue runs of
+        :param runs: The number of runs to queue
+        :return: Whether a runner has to be started for the job
+        """
+        if entry.running:
+            # The runs are missed as the previous run is still in progress
+            if entry.job.missed_runs == MissedRunPolicy.RUN_ALL:
+                entry.pending_runs += runs
+            elif entry.job.missed_runs == MissedRunPolicy.RUN_ONCE:
+                entry.pending_runs = max(entry.pending_runs, 1)
+            else:
+                dev_logger.debug(
+                    'Skipping scheduled job run as the previous run is still in progress', {'job': entry.name}
+                )
+            return False
+
+        entry.pending_runs += runs
+        entry.running = entry.pending_runs > 0
+        return entry.running
+
+    async def _execute(self, entry: _InProcessJob):
+        try:
+            with observe_scheduled_job(entry.name, entry.telemetry_context):
+                if iscoroutinefunction(entry.func):
+                    await entry.func(*entry.args)
+                else:
+                    await to_thread.run_sync(partial(entry.func, *entry.args))
+        except Exception as e:
+            dev_logger.error(f'Error running scheduled job {entry.name}', error=e)
+
+    async def _drain(self, entry: _InProcessJob):
+        try:
+            while entry.pending_runs > 0:
+                entry.pending_runs -= 1
+                await self._execute(entry)
+        finally:
+            entry.running = False
+            entry.pending_runs = 0
+
+    def _start_runs(self, task_group: TaskGroup, entry: _InProcessJob, runs: int):
+        if entry.job.allow_overlap:
+            for _ in range(runs):
+                task_group.start_soon(self._execute, entry)
+        elif self._queue_runs(entry, runs):
+            task_group.start_soon(self._drain, entry)
+
+    async def run(self):
+        """
+        Run the registered jobs until the scheduler is stopped.
+        """
+        if self._stopped:
+            return
+
+        async with anyio.create_task_group() as task_group:
+            self._task_group = task_group
+            self._wakeup = anyio.Event()
+            try:
+                while True:
+                    if len(self._heap) == 0:
+                        await self._wakeup.wait()
+                        self._wakeup = anyio.Event()
+                        continue
+
+                    due, _, entry = self._heap[0]
+                    delay = due - time.time()
+                    if delay > 0:
+                        # Wake up early if a job is added in the meantime
+                        with anyio.move_on_after(delay):
+                            await self._wakeup.wait()
+                            self._wakeup = anyio.Event()
+                        continue
+
+                    heapq.heappop(self._heap)
+                    self._start_runs(task_group, entry, self._collect_runs(entry, due, time.time()))
+            finally:
+                self._task_group = None
+                self._wakeup = None
+
+    async def run_elected(self, flight: SingleFlight, key: str, poll_interval: float = 1):
+        """
+        Run the registered jobs in a single process of the app, the one holding the flight for a key.
+
+        The other processes keep trying to acquire the flight and take over once it is released, e.g. when
+        the running process exits, until the scheduler is stopped.
+
+        :param flight: single flight shared by the app's processes, which does not wait for a held flight
+        :param key: key of the flight to hold while running the jobs
+        :param poll_interval: seconds between attempts to acquire the flight
+        """
+        while not await flight.acquire(key):
+            if self._stopped:
+                return
+            await anyio.sleep(poll_interval)
+
+        try:
+            await self.run()
+        finally:
+            await flight.release(key)
+
+    def stop(self):
+        """
+        Stop the scheduler, cancelling runs in progress.
+
+        Functions running in worker threads cannot be interrupted, the scheduler stops once they return.
+        """
+        self._stopped = True
+        if self._task_group is not None:
+            self._task_group.cancel_scope.cancel()
 
 
 class Scheduler:
@@ -357,6 +733,7 @@ class Scheduler:
             interval=self.interval * 604800,
             run_once=self._run_once,
             weekday=str(weekday),  # type: ignore
+            weekday_number=weekday,
         )
 
     def monday(self) -> ScheduledJobFactory:
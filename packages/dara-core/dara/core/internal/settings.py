@@ -34,6 +34,8 @@ class Settings(BaseSettings):
     dara_base_url: str = ''
     dara_template_extra_js: str = ''
     auth_session_max_age_seconds: int = 7 * 24 * 60 * 60
+    auth_verified_session_cache_size: Annotated[int, Field(ge=0)] = 1024
+    auth_verified_session_cache_ttl_seconds: Annotated[FiniteFloat, Field(ge=0)] = 30
 
     # Feature flags
     cgroup_memory_limit_enabled: bool = False
@@ -44,10 +46,16 @@ class Settings(BaseSettings):
     otel_semconv_stability_opt_in: str = 'http'
     otel_metrics_exporter: str = 'otlp'
     dara_otel_shutdown_timeout_millis: PositiveInt = 5000
+    # Fraction of operations observed per telemetry category, e.g. {"cache": 0.1}; unlisted categories are always observed
+    dara_otel_sample_rates: dict[str, Annotated[FiniteFloat, Field(ge=0, le=1)]] = {}
 
     dara_metrics_port: int = 10000
     dara_disable_metrics: bool = False
     dara_stream_keepalive_interval_seconds: Annotated[FiniteFloat, Field(ge=1, le=30)] = 15
+    dara_task_progress_interval_seconds: Annotated[FiniteFloat, Field(ge=0)] = 0
+    # Time-to-live of shared cache entries whose cache policy has none, 0 keeps them until evicted by the backend
+    dara_shared_cache_default_ttl_seconds: Annotated[FiniteFloat, Field(ge=0)] = 24 * 60 * 60
+    dara_shared_cache_purge_interval_seconds: Annotated[FiniteFloat, Field(gt=0)] = 5 * 60
 
     model_config = SettingsConfigDict(env_file='.env', extra='allow')
 
@@ -18,7 +18,8 @@ limitations under the License.
 import contextlib
 import inspect
 import math
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Iterator
 from typing import Any, cast, overload
 
 from anyio import (
@@ -29,6 +30,7 @@ from anyio import (
     create_task_group,
     get_cancelled_exc_class,
     move_on_after,
+    sleep,
 )
 from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectSendStream
@@ -50,6 +52,8 @@ from dara.core.internal.cache_store import CacheStore
 from dara.core.internal.devtools import get_error_for_channel
 from dara.core.internal.pandas_utils import remove_index
 from dara.core.internal.pool import TaskPool
+from dara.core.internal.pool.definitions import is_coalescable_progress
+from dara.core.internal.settings import get_settings
 from dara.core.internal.utils import exception_group_contains, run_user_handler
 from dara.core.internal.websocket import DaraServerMessage, TaskNotificationMessagePayload, WebsocketManager
 from dara.core.logging import dev_logger, eng_logger
@@ -94,6 +98,7 @@ class Task(BaseTask):
         on_progress: Callable[[TaskProgressUpdate], None | Awaitable[None]] | None = None,
         telemetry_origin_kind: str | None = None,
         telemetry_origin_name: str | None = None,
+        progress_interval: float | None = None,
     ):
         """
         :param func: The function to execute within the process
@@ -106,6 +111,8 @@ class Task(BaseTask):
         :param task_id: Optional task_id to set for the task - otherwise the task generates its id automatically
         :param telemetry_origin_kind: bounded subsystem that scheduled the task
         :param telemetry_origin_name: stable callable name that scheduled the task
+        :param progress_interval: Optional minimum number of seconds between progress updates delivered for the task,
+                                  defaults to the interval set with @track_progress or the global setting
         """
         self._func_name = self._verify_function(func)
         self._args = args if args is not None else []
@@ -116,6 +123,9 @@ class Task(BaseTask):
         self.on_progress = on_progress
         self.telemetry_origin_kind = telemetry_origin_kind
         self.telemetry_origin_name = telemetry_origin_name
+        self.progress_interval = (
+            progress_interval if progress_interval is not None else getattr(func, '__progress_interval__', None)
+        )
 
         super().__init__(task_id)
 
@@ -181,7 +191,13 @@ class Task(BaseTask):
 
         with pool.on_progress(self.task_id, on_progress):
             with observe_task_operation('dispatch', 'process'):
-                pool_task_def = pool.submit(self.task_id, self._func_name, args=tuple(self._args), kwargs=self._kwargs)
+                pool_task_def = pool.submit(
+                    self.task_id,
+                    self._func_name,
+                    args=tuple(self._args),
+                    kwargs=self._kwargs,
+                    progress_interval=_get_progress_interval(self),
+                )
 
             try:
                 with observe_task_operation('wait', 'process'):
@@ -384,6 +400,97 @@ class MetaTask(BaseTask):
             self.cancel_scope.cancel()
 
 
+def _iter_task_hierarchy(task: BaseTask) -> Iterator[BaseTask]:
+    """
+    Iterate over a task and all the tasks nested in it
+
+    :param task: The root task of the hierarchy
+    """
+    yield task
+
+    if isinstance(task, MetaTask):
+        for arg in [*task.args, *task.kwargs.values()]:
+            if isinstance(arg, BaseTask):
+                yield from _iter_task_hierarchy(arg)
+
+
+def _get_progress_interval(task: BaseTask) -> float:
+    """
+    Get the minimum number of seconds between progress updates delivered for a task
+
+    :param task: The task to get the interval for
+    """
+    interval = getattr(task, 'progress_interval', None)
+    return interval if interval is not None else get_settings().dara_task_progress_interval_seconds
+
+
+class _ProgressCoalescer:
+    """
+    Delivers task progress updates at most once every interval per task. Updates received within the interval are held
+    back and only the latest one is delivered once the interval elapses. Fake progress and final updates are never
+    held back.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[TaskProgressUpdate], Awaitable[None]],
+        task_group: TaskGroup,
+        intervals: dict[str, float],
+    ):
+        """
+        :param deliver: handler delivering an update
+        :param task_group: task group to run the delayed deliveries in
+        :param intervals: the interval of each task id, tasks not included use the global setting
+        """
+        self._deliver = deliver
+        self._task_group = task_group
+        self._intervals = intervals
+        self._last_delivered: dict[str, float] = {}
+        self._pending: dict[str, TaskProgressUpdate] = {}
+
+    async def submit(self, update: TaskProgressUpdate):
+        """
+        Deliver an update, or hold it back until the interval of its task elapses
+        """
+        if not is_coalescable_progress(update.progress, update.message):
+            # Deliver any held back update first to keep the order of updates
+            await self.flush(update.task_id)
+            self._last_delivered[update.task_id] = time.monotonic()
+            await self._deliver(update)
+            return
+
+        interval = self._intervals.get(update.task_id)
+        if interval is None:
+            interval = get_settings().dara_task_progress_interval_seconds
+
+        now = time.monotonic()
+        remaining = self._last_delivered.get(update.task_id, -math.inf) + interval - now
+
+        if remaining <= 0 and update.task_id not in self._pending:
+            self._last_delivered[update.task_id] = now
+            await self._deliver(update)
+            return
+
+        if update.task_id not in self._pending:
+            self._task_group.start_soon(self._flush_after, update.task_id, max(remaining, 0))
+        self._pending[update.task_id] = update
+
+    async def _flush_after(self, task_id: str, delay: float):
+        await sleep(delay)
+        await self.flush(task_id)
+
+    async def flush(self, task_id: str):
+        """
+        Deliver the pending update of a task immediately, if there is one
+
+        :param task_id: the id of the task
+        """
+        update = self._pending.pop(task_id, None)
+        if update is not None:
+            self._last_delivered[task_id] = time.monotonic()
+            await self._deliver(update)
+
+
 class TaskManagerError(ValueError):
     pass
 
@@ -433,6 +540,10 @@ class TaskManager:
 
     def __init__(self, task_group: TaskGroup, ws_manager: WebsocketManager, store: CacheStore):
         self.tasks: dict[str, PendingTask] = {}
+        # Reverse index of the task hierarchies of registered tasks, mapping the id of every task in a hierarchy
+        # to the ids of the registered tasks containing it, so notifications only visit the affected tasks
+        self._ancestors: dict[str, set[str]] = {}
+        self._hierarchies: dict[str, set[str]] = {}
         self.task_group = task_group
         self.ws_manager = ws_manager
         self.store = store
@@ -443,9 +554,32 @@ class TaskManager:
         Register a task. This will ensure the task it tracked and notifications are routed correctly.
         """
         pending_task = PendingTask(task.task_id, task)
+        self._unregister_task(task.task_id)
         self.tasks[task.task_id] = pending_task
+
+        hierarchy = self._collect_all_task_ids_in_hierarchy(task)
+        self._hierarchies[task.task_id] = hierarchy
+        for task_id in hierarchy:
+            self._ancestors.setdefault(task_id, set()).add(task.task_id)
+
         return pending_task
 
+    def _unregister_task(self, task_id: str) -> PendingTask | None:
+        """
+        Stop tracking a registered task, removing it from the tasks dict and the hierarchy index.
+
+        :param task_id: the id of the task to remove
+        :return: the removed PendingTask, if it was registered
+        """
+        for child_id in self._hierarchies.pop(task_id, ()):
+            ancestors = self._ancestors.get(child_id)
+            if ancestors is not None:
+                ancestors.discard(task_id)
+                if not ancestors:
+                    del self._ancestors[child_id]
+
+        return self.tasks.pop(task_id, None)
+
     @overload
     async def run_task(self, task: PendingTask, ws_channel: str | None = None) -> Any: ...
 
@@ -530,7 +664,7 @@ class TaskManager:
                             )
 
                     # Remove from running tasks
-                    self.tasks.pop(task_id_to_cancel, None)
+                    self._unregister_task(task_id_to_cancel)
 
                     dev_logger.info('Task cancelled', {'task_id': task_id_to_cancel})
 
@@ -615,20 +749,7 @@ class TaskManager:
         :param task: The root task to start collecting from
         :return: Set of all task IDs in the hierarchy
         """
-        task_ids = {task.task_id}
-
-        if isinstance(task, MetaTask):
-            # Collect from args
-            for arg in task.args:
-                if isinstance(arg, BaseTask):
-                    task_ids.update(self._collect_all_task_ids_in_hierarchy(arg))
-
-            # Collect from kwargs
-            for value in task.kwargs.values():
-                if isinstance(value, BaseTask):
-                    task_ids.update(self._collect_all_task_ids_in_hierarchy(value))
-
-        return task_ids
+        return {child.task_id for child in _iter_task_hierarchy(task)}
 
     async def _multicast_notification(
         self,
@@ -646,14 +767,9 @@ class TaskManager:
         """
         # prevent cancellation, we need the notifications to be sent
         with CancelScope(shield=True):
-            # Find all PendingTasks that have the message_task_id in their hierarchy
-            tasks_to_notify = set()
-
-            for pending_task in self.tasks.values():
-                # Check if the message_task_id is in this PendingTask's hierarchy
-                task_ids_in_hierarchy = self._collect_all_task_ids_in_hierarchy(pending_task.task_def)
-                if task_id in task_ids_in_hierarchy:
-                    tasks_to_notify.add(pending_task.task_id)
+            # Find all PendingTasks that have the message_task_id in their hierarchy,
+            # copied as the index can change while notifications are sent
+            tasks_to_notify = set(self._ancestors.get(task_id, ()))
 
             # Send notifications for all affected PendingTasks in parallel
             if tasks_to_notify:
@@ -744,28 +860,36 @@ class TaskManager:
             # Create a memory object stream to capture messages from the tasks
             send_stream, receive_stream = create_memory_object_stream[TaskMessage](math.inf)
 
-            async def handle_messages():
+            async def deliver_progress(message: TaskProgressUpdate):
+                # Send progress notifications to related tasks
+                await self._multicast_notification(
+                    task_id=message.task_id,
+                    messages=[
+                        _task_notification_message(
+                            {
+                                # Will be updated per task ID in multicast
+                                'task_id': message.task_id,
+                                'status': 'PROGRESS',
+                                'progress': message.progress,
+                                'message': message.message,
+                            }
+                        )
+                    ],
+                )
+                if isinstance(task, Task) and task.on_progress:
+                    await run_user_handler(task.on_progress, args=(message,))
+
+            async def handle_messages(progress: _ProgressCoalescer):
                 async with receive_stream:
                     async for message in receive_stream:
                         if isinstance(message, TaskProgressUpdate):
-                            # Send progress notifications to related tasks
-                            await self._multicast_notification(
-                                task_id=message.task_id,
-                                messages=[
-                                    _task_notification_message(
-                                        {
-                                            # Will be updated per task ID in multicast
-                                            'task_id': message.task_id,
-                                            'status': 'PROGRESS',
-                                            'progress': message.progress,
-                                            'message': message.message,
-                                        }
-                                    )
-                                ],
-                            )
-                            if isinstance(task, Task) and task.on_progress:
-                                await run_user_handler(task.on_progress, args=(message,))
-                        elif isinstance(message, TaskResult):
+                            await progress.submit(message)
+                            continue
+
+                        # Deliver the latest progress of the task before its result or error
+                        await progress.flush(message.task_id)
+
+                        if isinstance(message, TaskResult):
                             # 1. Cache-coordinated tasks: resolve via cache store (CacheStore.set handles PendingTask resolution)
                             if (
                                 message.cache_key is not None
@@ -803,7 +927,7 @@ class TaskManager:
                                 self.tasks[message.task_id].resolve(message.result)
 
                             # Remove the task from the registered tasks - it finished running
-                            self.tasks.pop(message.task_id, None)
+                            self._unregister_task(message.task_id)
                         elif isinstance(message, TaskError):
                             observation.record_exception(message.error)
 
@@ -837,7 +961,7 @@ class TaskManager:
                             )
 
                             # Remove the task from the registered tasks - it finished running
-                            self.tasks.pop(message.task_id, None)
+                            self._unregister_task(message.task_id)
 
             task_error: ExceptionGroup | None = None
 
@@ -850,8 +974,13 @@ class TaskManager:
             try:
                 with catch({BaseException: handle_exception}):  # type: ignore
                     async with create_task_group() as tg:
-                        # Handle incoming messages in parallel
-                        tg.start_soon(handle_messages)
+                        # Handle incoming messages in parallel, coalescing progress updates of each task
+                        progress = _ProgressCoalescer(
+                            deliver_progress,
+                            tg,
+                            {child.task_id: _get_progress_interval(child) for child in _iter_task_hierarchy(task)},
+                        )
+                        tg.start_soon(handle_messages, progress)
 
                         # Handle tasks that return other tasks
                         async with send_stream:
@@ -930,7 +1059,7 @@ class TaskManager:
                             )
 
                     # Remove the task from the running tasks
-                    self.tasks.pop(task.task_id, None)
+                    self._unregister_task(task.task_id)
 
                 # Make sure streams are closed
                 with move_on_after(3, shield=True):
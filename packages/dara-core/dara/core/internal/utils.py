@@ -18,10 +18,12 @@ limitations under the License.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
 import os
 from collections.abc import Awaitable, Callable, Coroutine, Sequence
-from functools import wraps
+from contextlib import suppress
+from functools import cache, wraps
 from importlib import import_module
 from importlib.util import find_spec
 from types import ModuleType
@@ -74,6 +76,38 @@ def get_cache_scope(cache_type: CacheType | None) -> CacheScope:
     return 'global'
 
 
+@cache
+def get_code_fingerprint(func: Callable) -> str:
+    """
+    Get a short fingerprint of a function's code, which changes whenever the function or the module defining it
+    is modified.
+
+    Used to namespace cached results persisted beyond the current process, so results computed by a previous
+    version of the function, or of helpers defined next to it, are not reused. Changes to code in other modules
+    called by the function are not detected.
+
+    :param func: the function to fingerprint
+    """
+    func = inspect.unwrap(func)
+
+    try:
+        source: bytes = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        # Source is unavailable, e.g. for functions defined in a REPL, fall back to the bytecode
+        code = getattr(func, '__code__', None)
+        source = code.co_code if code is not None else getattr(func, '__qualname__', repr(func)).encode()
+
+    fingerprint = hashlib.sha256(source)
+
+    module = inspect.getmodule(func)
+    # The source of the module is unavailable e.g. for a REPL session, the function's own code is all there is then
+    if module is not None:
+        with suppress(OSError, TypeError):
+            fingerprint.update(inspect.getsource(module).encode())
+
+    return fingerprint.hexdigest()[:16]
+
+
 async def run_user_handler(handler: Callable, args: Sequence | None = None, kwargs: dict | None = None):
     """
     Run a user-defined handler function. Runs sync functions in a threadpool.
@@ -23,7 +23,7 @@ from collections.abc import Mapping
 from contextvars import ContextVar
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from uuid import uuid4
 
 import anyio
@@ -58,6 +58,9 @@ from dara.core.telemetry import (
     use_telemetry_context,
 )
 
+if TYPE_CHECKING:
+    from dara.core.shared_state import MessageBus
+
 
 # Client message types
 class DaraClientMessage(BaseModel):
@@ -110,6 +113,7 @@ ServerMessageTypename = Literal[
     'ActionMessage',
     'BackendStoreMessage',
     'BackendStorePatchMessage',
+    'DerivedVariableRefreshMessage',
     'ServerErrorMessage',
     'ServerVariableMessage',
     'TaskNotificationMessage',
@@ -173,6 +177,12 @@ class BackendStorePatchMessagePayload(ServerMessagePayload):
     sequence_number: int
 
 
+class DerivedVariableRefreshMessagePayload(ServerMessagePayload):
+    """Payload notifying clients that a fresh value of a derived variable has been cached."""
+
+    uid: str
+
+
 class ServerErrorMessagePayload(ServerMessagePayload):
     """Payload for a server error notification."""
 
@@ -219,6 +229,7 @@ _SERVER_MESSAGE_PAYLOAD_TYPES: dict[ServerMessageTypename, type[ServerMessagePay
     'ActionMessage': ActionMessagePayload,
     'BackendStoreMessage': BackendStoreMessagePayload,
     'BackendStorePatchMessage': BackendStorePatchMessagePayload,
+    'DerivedVariableRefreshMessage': DerivedVariableRefreshMessagePayload,
     'ServerErrorMessage': ServerErrorMessagePayload,
     'ServerVariableMessage': ServerVariableMessagePayload,
     'TaskNotificationMessage': TaskNotificationMessagePayload,
@@ -557,12 +568,19 @@ class WebsocketManager:
     Manages WebSocket connections to clients and communication with them.
     """
 
-    def __init__(self):
+    def __init__(self, bus: 'MessageBus | None' = None):
         self.handlers: dict[str, WebSocketHandler] = {}
         """
         A mapping of channel IDs to WebSocketHandler instances.
         """
 
+        self.bus = bus
+        """
+        Optional message bus used to reach channels owned by other app processes.
+        """
+
+        self._bus_scope = anyio.CancelScope()
+
     def _construct_message(self, payload: ServerMessageInput, custom: bool) -> ServerMessage:
         """
         Construct a message to send to the client.
@@ -608,6 +626,17 @@ class WebsocketManager:
         """
         Send a message to all connected clients.
 
+        :param message: The message to send
+        :param custom: Whether the message is a custom message
+        :param ignore_channel: A channel ID to ignore when broadcasting
+        """
+        await self._broadcast_local(message, custom, ignore_channel)
+        await self._publish('broadcast', message, custom, ignore_channel=ignore_channel)
+
+    async def _broadcast_local(self, message: ServerMessageInput, custom: bool, ignore_channel: str | None = None):
+        """
+        Send a message to all clients connected to this process.
+
         :param message: The message to send
         :param custom: Whether the message is a custom message
         :param ignore_channel: A channel ID to ignore when broadcasting
@@ -624,6 +653,21 @@ class WebsocketManager:
         """
         Send a message to all connected channels associated with the given user.
 
+        :param user_id: The user ID to send the message to
+        :param message: The message payload to send
+        :param custom: Whether the message is a custom message
+        :param ignore_channel: A channel ID to ignore when sending
+        """
+        await self._send_local_message_to_user(user_id, message, custom, ignore_channel)
+        # Session registries are process-local, so let each process resolve its own channels for the user
+        await self._publish('user', message, custom, user_id=user_id, ignore_channel=ignore_channel)
+
+    async def _send_local_message_to_user(
+        self, user_id: str, message: ServerMessageInput, custom: bool, ignore_channel: str | None = None
+    ):
+        """
+        Send a message to the channels associated with the given user connected to this process.
+
         :param user_id: The user ID to send the message to
         :param message: The message payload to send
         :param custom: Whether the message is a custom message
@@ -638,7 +682,9 @@ class WebsocketManager:
             for channel in channels:
                 if ignore_channel is not None and channel == ignore_channel:
                     continue
-                tg.start_soon(self.send_message, channel, message, custom)
+                handler = self.handlers.get(channel)
+                if handler:
+                    tg.start_soon(handler.send_message, self._construct_message(message, custom))
 
     async def send_message(self, channel_id: str, message: ServerMessageInput, custom=False):
         """
@@ -651,6 +697,9 @@ class WebsocketManager:
         handler = self.handlers.get(channel_id)
         if handler:
             await handler.send_message(self._construct_message(message, custom))
+        else:
+            # The channel may be owned by another process
+            await self._publish('send', message, custom, channel_id=channel_id)
 
     async def send_and_wait(self, channel_id: str, message: ServerMessageInput, custom=False):
         """
@@ -673,6 +722,71 @@ class WebsocketManager:
         if channel_id in self.handlers:
             del self.handlers[channel_id]
 
+    async def _publish(
+        self, kind: Literal['broadcast', 'send', 'user'], message: ServerMessageInput, custom: bool, **target
+    ):
+        """
+        Forward a message to other processes over the message bus, if one is configured.
+
+        Typed messages are serialized as envelopes which `_construct_message` parses back on the receiving side.
+
+        :param kind: how the receiving processes should route the message
+        :param message: The message payload to send
+        :param custom: Whether the message is a custom message
+        :param target: routing parameters for the given kind
+        """
+        if self.bus is None:
+            return
+
+        try:
+            constructed = self._construct_message(message, custom)
+            # Untyped application messages have no discriminator to parse the envelope back, forward the payload only
+            if isinstance(constructed, DaraServerMessage) and constructed.typename is None:
+                serialized = jsonable_encoder(constructed.message)
+            else:
+                serialized = jsonable_encoder(constructed)
+            await self.bus.publish({'kind': kind, 'custom': custom, 'message': serialized, **target})
+        except Exception as e:
+            eng_logger.error('Failed to publish message to the message bus', error=e)
+
+    async def _on_bus_message(self, bus_message: dict[str, Any]):
+        """
+        Deliver a message forwarded by another process to the matching local channels.
+
+        :param bus_message: message received from the bus
+        """
+        kind = bus_message.get('kind')
+        message = bus_message['message']
+        custom = bool(bus_message.get('custom', False))
+
+        if kind == 'broadcast':
+            await self._broadcast_local(message, custom, bus_message.get('ignore_channel'))
+        elif kind == 'user':
+            await self._send_local_message_to_user(
+                bus_message['user_id'], message, custom, bus_message.get('ignore_channel')
+            )
+        elif kind == 'send':
+            handler = self.handlers.get(bus_message['channel_id'])
+            if handler:
+                await handler.send_message(self._construct_message(message, custom))
+
+    async def run_bus_listener(self):
+        """
+        Listen for messages forwarded by other processes until `stop_bus_listener` is called.
+        Returns immediately if no message bus is configured.
+        """
+        if self.bus is None:
+            return
+
+        with self._bus_scope:
+            await self.bus.subscribe(self._on_bus_message)
+
+    def stop_bus_listener(self):
+        """
+        Stop listening for messages from the message bus.
+        """
+        self._bus_scope.cancel()
+
 
 async def ws_handler(websocket: WebSocket):
     """
@@ -19,6 +19,7 @@ import asyncio
 import json
 import os
 import sys
+import time
 import traceback
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
@@ -28,7 +29,7 @@ from inspect import iscoroutine
 from multiprocessing.process import BaseProcess
 from pathlib import Path
 
-from anyio import create_task_group
+from anyio import CancelScope, create_task_group
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.encoders import ENCODERS_BY_TYPE, jsonable_encoder
 from fastapi.staticfiles import StaticFiles
@@ -50,6 +51,7 @@ from dara.core.definitions import JsComponentDef
 from dara.core.interactivity.stream_utils import setup_signal_handlers
 from dara.core.internal.cache_store import CacheStore
 from dara.core.internal.cgroup import get_cpu_count, set_memory_limit
+from dara.core.internal.cross_process import is_multi_process, mark_started
 from dara.core.internal.custom_response import CustomResponse
 from dara.core.internal.devtools import send_error_for_session
 from dara.core.internal.encoder_registry import encoder_registry
@@ -69,7 +71,7 @@ from dara.core.internal.registries import (
 from dara.core.internal.registry_lookup import RegistryLookup
 from dara.core.internal.routing import core_api_router, create_loader_route, error_decorator
 from dara.core.internal.runtime_env import is_backend_reload_enabled, is_docker_mode, is_hmr_enabled
-from dara.core.internal.scheduler import stop_scheduled_process
+from dara.core.internal.scheduler import InProcessScheduler, stop_scheduled_process
 from dara.core.internal.settings import get_settings
 from dara.core.internal.tasks import TaskManager
 from dara.core.internal.utils import enforce_sso, import_config
@@ -85,6 +87,13 @@ from dara.core.js_tooling.js_utils import (
 from dara.core.logging import LoggingMiddleware, dev_logger, eng_logger, http_logger
 from dara.core.metrics.registry import DARA_METRICS_REGISTRY
 from dara.core.router import convert_template_to_router
+from dara.core.shared_state import (
+    FileLockSingleFlight,
+    purge_expired_entries,
+    resolve_message_bus,
+    resolve_shared_cache_backend,
+    resolve_single_flight,
+)
 from dara.core.telemetry import (
     initialize_process_telemetry,
     instrument_fastapi_app,
@@ -92,6 +101,9 @@ from dara.core.telemetry import (
     shutdown_telemetry,
 )
 
+# Flight held by the worker running the single-runner scheduled jobs
+SCHEDULER_FLIGHT_KEY = 'dara-in-process-scheduler'
+
 
 def _callable_name(func: Callable) -> str:
     """Return a stable module-qualified callable name."""
@@ -163,6 +175,13 @@ def _start_application(config: Configuration):
     @asynccontextmanager
     async def application_lifespan(app: FastAPI):
         # Create a task group for the application so we can kick off tasks in the background
+        # The purge loop runs until cancelled, so it is stopped explicitly on shutdown
+        shared_cache_purge = CancelScope()
+
+        async def _purge_shared_cache(backend):
+            with shared_cache_purge:
+                await purge_expired_entries(backend, get_settings().dara_shared_cache_purge_interval_seconds)
+
         async with create_task_group() as task_group:
             # STARTUP
             with observe_internal_operation('application', 'startup'):
@@ -194,9 +213,36 @@ def _start_application(config: Configuration):
                 store: CacheStore = utils_registry.get('Store')
                 utils_registry.set('RegistryLookup', RegistryLookup(config.registry_lookup))
 
+                with observe_internal_operation('application', 'shared_state.initialize'):
+                    store.shared_backend = resolve_shared_cache_backend(config.shared_cache_backend, config)
+                    store.single_flight = resolve_single_flight(config.single_flight, config)
+                    message_bus = resolve_message_bus(config.message_bus, config)
+
+                    if store.single_flight is not None and store.shared_backend is None:
+                        dev_logger.warning(
+                            'config.single_flight is set without config.shared_cache_backend, it will not be used '
+                            'as processes cannot share computed values.'
+                        )
+
+                    if is_multi_process() and message_bus is None:
+                        dev_logger.warning(
+                            'Running multiple workers without a message bus, websocket messages will only reach '
+                            'clients connected to the worker sending them. Set config.message_bus to share them.'
+                        )
+
+                    if is_multi_process() and store.shared_backend is None:
+                        dev_logger.warning(
+                            'Running multiple workers without a shared cache backend, py_components and actions '
+                            'called while rendering other py_components cannot be served by other workers. '
+                            'Set config.shared_cache_backend to share them.'
+                        )
+
                 with observe_internal_operation('application', 'runtime.initialize'):
-                    ws_manager = WebsocketManager()
+                    ws_manager = WebsocketManager(bus=message_bus)
                     task_manager = TaskManager(task_group, ws_manager, store)
+                    task_group.start_soon(ws_manager.run_bus_listener)
+                    if store.shared_backend is not None:
+                        task_group.start_soon(_purge_shared_cache, store.shared_backend)
 
                     # Add other internals
                     utils_registry.set('TaskGroup', task_group)
@@ -262,11 +308,34 @@ def _start_application(config: Configuration):
                             cleanup_functions.append(res)
 
                 eng_logger.info(f'Starting {len(config.scheduled_jobs)} local scheduled jobs')
+                in_process_scheduler = InProcessScheduler()
+                # With multiple workers, jobs writing to shared targets run in the worker elected by a file lock
+                single_runner_scheduler = InProcessScheduler()
                 try:
                     for job, func, args in config.scheduled_jobs:
                         job_name = _callable_name(func)
                         with observe_internal_operation('application', 'scheduled_job.start', name=job_name):
-                            scheduled_processes.append((job.do(func, args), job_name))
+                            # Job objects without in-process support run in their own process
+                            if not getattr(job, 'run_in_process', False):
+                                scheduled_processes.append((job.do(func, args), job_name))
+                            elif is_multi_process() and getattr(job, 'single_runner', False):
+                                single_runner_scheduler.add(job, func, args, name=job_name)
+                            else:
+                                if is_multi_process():
+                                    dev_logger.warning(
+                                        f'Running multiple workers, in-process scheduled job {job_name} runs in '
+                                        'every worker. Only jobs writing to a target with a backend shared between '
+                                        'workers run in a single worker.'
+                                    )
+                                in_process_scheduler.add(job, func, args, name=job_name)
+                    if len(in_process_scheduler.jobs) > 0:
+                        task_group.start_soon(in_process_scheduler.run)
+                    if len(single_runner_scheduler.jobs) > 0:
+                        task_group.start_soon(
+                            single_runner_scheduler.run_elected,
+                            FileLockSingleFlight(timeout=0),
+                            SCHEDULER_FLIGHT_KEY,
+                        )
                 except BaseException:
                     for scheduled_process, job_name in scheduled_processes:
                         with observe_internal_operation('application', 'scheduled_job.rollback', name=job_name):
@@ -296,6 +365,9 @@ def _start_application(config: Configuration):
                                 cleanup_observation.record_exception(e)
                                 eng_logger.error('Error running cleanup function', e)
 
+                    ws_manager.stop_bus_listener()
+                    shared_cache_purge.cancel()
+
                     eng_logger.debug('App shutting down, attempting to cancel all tasks and shut down the task pool')
                     with observe_internal_operation('application', 'tasks.cancel'):
                         await task_manager.cancel_all_tasks()
@@ -310,6 +382,8 @@ def _start_application(config: Configuration):
                             await task_pool.join(5)
                             eng_logger.debug('Task pool shut down')
 
+                    in_process_scheduler.stop()
+                    single_runner_scheduler.stop()
                     for scheduled_process, job_name in scheduled_processes:
                         with observe_internal_operation('application', 'scheduled_job.stop', name=job_name):
                             await asyncio.to_thread(stop_scheduled_process, scheduled_process, 5)
@@ -503,9 +577,11 @@ def _start_application(config: Configuration):
         jinja_templates.env.globals['base_url'] = os.getenv('DARA_BASE_URL', '')
         jinja_templates.env.globals['entry'] = '_entry.tsx'
 
-        # Compile the router, executing all page functions etc
+        # Compile the router, executing all page functions and analyzing their dependencies
         try:
+            compile_start = time.perf_counter()
             config.router.compile()
+            eng_logger.info(f'Compiled router in {(time.perf_counter() - compile_start) * 1000:.1f}ms')
         except Exception as e:
             traceback.print_exc()
             dev_logger.error('Error compiling router', error=e)
@@ -590,6 +666,9 @@ def _start_application(config: Configuration):
         async def not_found(rest_of_path: str):
             raise HTTPException(status_code=404, detail='API endpoint not found')
 
+    # Objects created from now on are created while serving requests, so their uids differ between processes
+    mark_started()
+
     instrument_fastapi_app(app)
     return app
 
@@ -7,7 +7,6 @@ from typing import (
     Any,
     Literal,
 )
-from uuid import uuid4
 
 import aiorwlock
 import anyio
@@ -22,6 +21,7 @@ from pydantic import (
 )
 
 from dara.core.auth.definitions import USER
+from dara.core.internal.cross_process import generate_uid
 from dara.core.internal.utils import run_user_handler
 from dara.core.internal.websocket import DaraServerMessage, ServerMessageTypename
 from dara.core.logging import dev_logger
@@ -182,14 +182,14 @@ class BackendStore(PersistenceStore):
     """
     Persistence store implementation that uses a backend implementation to store data server-side
 
-    :param uid: unique identifier for this store; defaults to a random UUID
+    :param uid: unique identifier for this store; defaults to a uid derived from the module defining it
     :param backend: the backend to use for storing data; defaults to an in-memory backend
     :param scope: the scope for the store; if 'global' a single value is stored for all users,
         if 'user' a value is stored per user
     :param readonly: whether to use the backend in read-only mode, i.e. skip syncing values from client to backend and raise if write()/delete() is called
     """
 
-    uid: str = Field(default_factory=lambda: str(uuid4()))
+    uid: str = Field(default_factory=lambda: generate_uid('backend_store'))
     backend: PersistenceBackend = Field(default_factory=InMemoryBackend, exclude=True)
     scope: Literal['global', 'user'] = 'global'
     readonly: bool = False
@@ -211,7 +211,7 @@ class BackendStore(PersistenceStore):
         """
         Persistence store implementation that uses a backend implementation to store data server-side
 
-        :param uid: unique identifier for this store; defaults to a random UUID
+        :param uid: unique identifier for this store; defaults to a uid derived from the module defining it
         :param backend: the backend to use for storing data; defaults to an in-memory backend
         :param scope: the scope for the store; if 'global' a single value is stored for all users,
             if 'user' a value is stored per user
@@ -1,3 +1,5 @@
+from functools import cache
+
 from pydantic import BaseModel, Field, SerializeAsAny
 
 from dara.core.definitions import ComponentInstance
@@ -34,31 +36,54 @@ class DependencyGraph(BaseModel):
         Create a DependencyGraph from a ComponentInstance
         """
         graph = DependencyGraph()
-        _analyze_component_dependencies(component, graph)
+        _analyze_component_dependencies(component, graph, _get_table_component(), set())
         return graph
 
 
-def _analyze_component_dependencies(component: ComponentInstance, graph: DependencyGraph) -> None:
+@cache
+def _get_table_component() -> type[ComponentInstance] | None:
     """
-    Recursively analyze a component tree to build a dependency graph of DerivedVariables and PyComponentInstances.
-
-    Note: Control flow components (If, Match, For) are treated as boundaries - their conditional
-    child properties are not recursed into since only one branch will render at runtime.
+    Get the Table component class if dara.components is installed, resolved once rather than on each analysis
     """
     try:
         from dara.components import Table
     except ImportError:
-        Table = None
+        return None
+    return Table
+
 
+def _analyze_component_dependencies(
+    component: ComponentInstance,
+    graph: DependencyGraph,
+    table_component: type[ComponentInstance] | None,
+    visited: set[int],
+) -> None:
+    """
+    Recursively analyze a component tree to build a dependency graph of DerivedVariables and PyComponentInstances.
+
+    Note: Control flow components (If, Match, For) are treated as boundaries - their conditional
+    child properties are not recursed into since only one branch will render at runtime.
+
+    :param component: component to analyze
+    :param graph: graph to add the dependencies to
+    :param table_component: the Table component class, if available
+    :param visited: ids of the component instances already analyzed, so instances shared within the tree are only
+        analyzed once
+    """
     # The component itself is a PyComponentInstance
     if isinstance(component, PyComponentInstance):
         if component.uid not in graph.py_components:
             graph.py_components[component.uid] = component
         return
 
+    if id(component) in visited:
+        return
+    visited.add(id(component))
+
     # Get properties to skip for control flow components
     component_name = type(component).__name__
     skip_attrs = CONTROL_FLOW_SKIP_ATTRS.get(component_name, set())
+    is_table = table_component is not None and isinstance(component, table_component)
 
     # otherwise check each field
     for attr in component.model_fields_set:
@@ -70,7 +95,7 @@ def _analyze_component_dependencies(component: ComponentInstance, graph: Depende
         # Handle encountered variables and py_components
         if isinstance(value, DerivedVariable) and value.uid not in graph.derived_variables:
             # SPECIAL CASE: exclude Table.data since it's tabular and preloading it would be a waste
-            if Table and isinstance(component, Table) and attr == 'data':
+            if is_table and attr == 'data':
                 continue
             graph.derived_variables[value.uid] = value
         elif isinstance(value, PyComponentInstance) and value.uid not in graph.py_components:
@@ -78,9 +103,9 @@ def _analyze_component_dependencies(component: ComponentInstance, graph: Depende
         # Recursion cases:
         # component instances
         elif isinstance(value, ComponentInstance):
-            _analyze_component_dependencies(value, graph)
+            _analyze_component_dependencies(value, graph, table_component, visited)
         # component lists
         elif isinstance(value, list):
             for item in value:
                 if isinstance(item, ComponentInstance):
-                    _analyze_component_dependencies(item, graph)
+                    _analyze_component_dependencies(item, graph, table_component, visited)
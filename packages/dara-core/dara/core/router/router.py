@@ -20,6 +20,7 @@ from dara.core.base_definitions import Action
 from dara.core.definitions import ComponentInstance
 from dara.core.interactivity import Variable
 from dara.core.persistence import PersistenceStore  # noqa: F401
+from dara.core.telemetry import observe_internal_operation
 
 from .dependency_graph import DependencyGraph
 
@@ -563,8 +564,7 @@ class IndexRoute(BaseRoute):
         super().compile()
         content = _execute_route_func(self.content, self.full_path)
 
-        # Analyze component dependencies
-        dependency_graph = DependencyGraph.from_component(content)
+        dependency_graph = _analyze_route_dependencies(content, self.full_path)
 
         self.compiled_data = RouteData(
             content=content, on_load=self.on_load, definition=self, dependency_graph=dependency_graph
@@ -589,8 +589,7 @@ class PageRoute(BaseRoute, HasChildRoutes):
         super().compile()
         content = _execute_route_func(self.content, self.full_path)
 
-        # Analyze component dependencies
-        dependency_graph = DependencyGraph.from_component(content)
+        dependency_graph = _analyze_route_dependencies(content, self.full_path)
 
         self.compiled_data = RouteData(
             content=content, on_load=self.on_load, definition=self, dependency_graph=dependency_graph
@@ -639,7 +638,7 @@ class LayoutRoute(BaseRoute, HasChildRoutes):
         super().compile()
 
         content = _execute_route_func(self.content, self.full_path)
-        dependency_graph = DependencyGraph.from_component(content)
+        dependency_graph = _analyze_route_dependencies(content, self.full_path)
 
         self.compiled_data = RouteData(
             on_load=self.on_load, content=content, definition=self, dependency_graph=dependency_graph
@@ -773,9 +772,11 @@ class Router(HasChildRoutes):
         Compile the route tree into a data structure ready for matching:
         - executes all page functions
         - validates route paths
+        - analyzes the dependencies of each route's content, stored in its `RouteData`
         """
-        for child in self.children:
-            child.compile()
+        with observe_internal_operation('application', 'router.compile'):
+            for child in self.children:
+                child.compile()
 
     def to_route_map(self) -> dict[str, RouteData]:
         """
@@ -925,6 +926,15 @@ class Router(HasChildRoutes):
                 self._print_routes(route_children, next_prefix, line_handler)
 
 
+def _analyze_route_dependencies(content: ComponentInstance, path: str | None) -> DependencyGraph:
+    """
+    Analyze the dependencies of a route's content.
+    Done once when the route is compiled, the resulting graph is stored in the route's `RouteData`.
+    """
+    with observe_internal_operation('application', 'router.dependency_analysis', name=path):
+        return DependencyGraph.from_component(content)
+
+
 def _execute_route_func(
     content: Callable[..., ComponentInstance] | ComponentInstance, path: str | None
 ) -> ComponentInstance:
@@ -0,0 +1,51 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from dara.core.shared_state.base import (
+    BusMessageHandler,
+    MessageBus,
+    MessageBusConfig,
+    SharedCacheBackend,
+    SharedCacheBackendConfig,
+    SingleFlight,
+    SingleFlightConfig,
+    purge_expired_entries,
+    resolve_message_bus,
+    resolve_shared_cache_backend,
+    resolve_single_flight,
+)
+from dara.core.shared_state.disk import DiskCacheBackend
+from dara.core.shared_state.file_lock import FileLockSingleFlight
+from dara.core.shared_state.sqlite import SQLiteMessageBus, SQLiteSharedCacheBackend
+
+__all__ = [
+    'BusMessageHandler',
+    'DiskCacheBackend',
+    'FileLockSingleFlight',
+    'MessageBus',
+    'MessageBusConfig',
+    'SQLiteMessageBus',
+    'SQLiteSharedCacheBackend',
+    'SharedCacheBackend',
+    'SharedCacheBackendConfig',
+    'SingleFlight',
+    'SingleFlightConfig',
+    'purge_expired_entries',
+    'resolve_message_bus',
+    'resolve_shared_cache_backend',
+    'resolve_single_flight',
+]
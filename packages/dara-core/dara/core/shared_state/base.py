@@ -0,0 +1,215 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+import anyio
+
+from dara.core.logging import dev_logger
+
+if TYPE_CHECKING:
+    from dara.core.configuration import Configuration
+
+
+@runtime_checkable
+class SharedCacheBackend(Protocol):
+    """
+    Cross-process key-value storage sitting behind the in-memory `CacheStore`.
+
+    The in-memory stores remain the first level. For registry entries opting in, i.e. DerivedVariable results,
+    the `CacheStore` falls back to this backend on a local miss and writes resolved values through so other
+    processes can reuse them.
+    Values must be picklable; pending tasks are never written to a shared backend.
+
+    Backends which do not drop expired keys by themselves can implement an async `clear_expired` method,
+    which is called periodically by each app process, see `purge_expired_entries`.
+    """
+
+    async def get(self, key: str) -> Any:
+        """
+        Return the value stored under a key.
+
+        :param key: namespaced cache key
+        :raises KeyError: if the key is missing or expired
+        """
+        ...
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        """
+        Store a value under a key.
+
+        :param key: namespaced cache key
+        :param value: picklable value to store
+        :param ttl: optional time-to-live in seconds
+        """
+        ...
+
+    async def delete(self, key: str):
+        """Remove a key if it exists."""
+        ...
+
+    async def clear(self):
+        """Remove all stored keys."""
+        ...
+
+
+BusMessageHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@runtime_checkable
+class MessageBus(Protocol):
+    """
+    Pub/sub transport connecting the `WebsocketManager` instances of several app processes.
+
+    Messages are JSON-serializable dicts. A bus must not deliver a message back to the process
+    that published it.
+    """
+
+    async def publish(self, message: dict[str, Any]):
+        """
+        Publish a message to every other subscribed process.
+
+        :param message: JSON-serializable message
+        """
+        ...
+
+    async def subscribe(self, on_message: BusMessageHandler):
+        """
+        Deliver messages published by other processes until cancelled.
+
+        :param on_message: async callback invoked with each received message
+        """
+        ...
+
+
+@runtime_checkable
+class SingleFlight(Protocol):
+    """
+    Cross-process coordination ensuring only one process computes a given cache entry at a time.
+
+    Before computing a missing DerivedVariable value, a process acquires the flight for its cache key.
+    Processes acquiring a flight held by another process wait until it is released, then find the
+    result in the shared cache backend instead of computing it again.
+    """
+
+    async def acquire(self, key: str) -> bool:
+        """
+        Wait until the current process holds the flight for a key.
+
+        :param key: namespaced cache key
+        :return: True if the flight is held, False if waiting timed out and the caller should proceed uncoordinated
+        """
+        ...
+
+    async def release(self, key: str):
+        """Release a flight held by the current process, no-op if not held."""
+        ...
+
+
+SharedCacheBackendFactory = Callable[['Configuration'], SharedCacheBackend]
+SharedCacheBackendConfig = SharedCacheBackend | SharedCacheBackendFactory
+MessageBusFactory = Callable[['Configuration'], MessageBus]
+MessageBusConfig = MessageBus | MessageBusFactory
+SingleFlightFactory = Callable[['Configuration'], SingleFlight]
+SingleFlightConfig = SingleFlight | SingleFlightFactory
+
+
+def resolve_shared_cache_backend(
+    shared_cache_backend: SharedCacheBackendConfig | None,
+    config: 'Configuration',
+) -> SharedCacheBackend | None:
+    """
+    Resolve a configured shared cache backend object or factory into a concrete backend.
+
+    :param shared_cache_backend: backend, factory or None if not configured
+    :param config: the app configuration passed to factories
+    """
+    if shared_cache_backend is None:
+        return None
+
+    if isinstance(shared_cache_backend, SharedCacheBackend):
+        backend = shared_cache_backend
+    else:
+        backend = shared_cache_backend(config)
+
+    if not isinstance(backend, SharedCacheBackend):
+        raise TypeError('shared_cache_backend must be a SharedCacheBackend or a factory returning one')
+
+    dev_logger.info('Using shared cache backend', {'backend': backend.__class__.__name__})
+
+    return backend
+
+
+async def purge_expired_entries(backend: SharedCacheBackend, interval: float):
+    """
+    Periodically remove expired entries from a shared cache backend, until cancelled.
+    Backends without a `clear_expired` method are left alone.
+
+    :param backend: the shared cache backend to purge
+    :param interval: number of seconds between purges
+    """
+    clear_expired = getattr(backend, 'clear_expired', None)
+    if clear_expired is None:
+        return
+
+    while True:
+        await anyio.sleep(interval)
+        try:
+            await clear_expired()
+        except Exception as e:
+            dev_logger.warning('Failed to purge expired shared cache entries', {'error_type': type(e).__name__})
+
+
+def resolve_message_bus(message_bus: MessageBusConfig | None, config: 'Configuration') -> MessageBus | None:
+    """
+    Resolve a configured message bus object or factory into a concrete bus.
+
+    :param message_bus: bus, factory or None if not configured
+    :param config: the app configuration passed to factories
+    """
+    if message_bus is None:
+        return None
+
+    bus = message_bus if isinstance(message_bus, MessageBus) else message_bus(config)
+
+    if not isinstance(bus, MessageBus):
+        raise TypeError('message_bus must be a MessageBus or a factory returning one')
+
+    dev_logger.info('Using message bus', {'bus': bus.__class__.__name__})
+
+    return bus
+
+
+def resolve_single_flight(single_flight: SingleFlightConfig | None, config: 'Configuration') -> SingleFlight | None:
+    """
+    Resolve a configured single-flight object or factory into a concrete implementation.
+
+    :param single_flight: single-flight, factory or None if not configured
+    :param config: the app configuration passed to factories
+    """
+    if single_flight is None:
+        return None
+
+    flight = single_flight if isinstance(single_flight, SingleFlight) else single_flight(config)
+
+    if not isinstance(flight, SingleFlight):
+        raise TypeError('single_flight must be a SingleFlight or a factory returning one')
+
+    dev_logger.info('Using single-flight', {'single_flight': flight.__class__.__name__})
+
+    return flight
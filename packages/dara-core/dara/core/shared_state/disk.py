@@ -0,0 +1,226 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+import pyarrow
+from anyio import to_thread
+from pandas import DataFrame
+from platformdirs import user_cache_path
+from pyarrow import feather
+
+from dara.core.internal.app_scope import get_app_key
+from dara.core.logging import dev_logger
+from dara.core.shared_state.sqlite import _SQLiteConnection
+
+DISK_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+"""Default maximum size of the disk cache in bytes, 1GB"""
+
+EVICTION_BATCH_SIZE = 64
+"""Number of least recently used entries read at a time when evicting"""
+
+
+class DiskCacheBackend:
+    """
+    Persistent cache backend storing values on local disk, bounded in size with least-recently-used eviction.
+
+    DataFrames are stored as uncompressed Arrow IPC files, which are read through a memory map instead of being
+    unpickled; converting them back to pandas still copies the data into memory. Other values are pickled.
+    An SQLite index tracks sizes, expiry and access times, so the cache can be shared by the processes of one host
+    and survives restarts. Keys produced by the `CacheStore` include a fingerprint of the resolver code and of its
+    module, so results of a previous version of a DerivedVariable are not reused after a deploy.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_size: int = DISK_CACHE_MAX_SIZE):
+        """
+        :param directory: directory to store cached values in; defaults to an app-scoped directory
+            in the user cache directory
+        :param max_size: maximum total size of stored values in bytes
+        """
+        if max_size <= 0:
+            raise ValueError('max_size must be greater than 0')
+
+        self.directory = (
+            Path(directory) if directory is not None else user_cache_path('dara') / 'dv-cache' / get_app_key()
+        )
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._db = _SQLiteConnection(
+            self.directory / 'index.sqlite3',
+            'CREATE TABLE IF NOT EXISTS dara_disk_cache ('
+            'key TEXT PRIMARY KEY, filename TEXT NOT NULL, format TEXT NOT NULL, size INTEGER NOT NULL, '
+            'expires_at REAL, last_access REAL NOT NULL);'
+            'CREATE INDEX IF NOT EXISTS dara_disk_cache_last_access ON dara_disk_cache (last_access);'
+            'CREATE INDEX IF NOT EXISTS dara_disk_cache_expires_at ON dara_disk_cache (expires_at);'
+            # Running total of the stored sizes, kept up to date by triggers so every process sees the same total
+            'CREATE TABLE IF NOT EXISTS dara_disk_cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER);'
+            'INSERT OR IGNORE INTO dara_disk_cache_size (id, total) SELECT 0, COALESCE(SUM(size), 0) FROM dara_disk_cache;'
+            'CREATE TRIGGER IF NOT EXISTS dara_disk_cache_insert AFTER INSERT ON dara_disk_cache BEGIN '
+            'UPDATE dara_disk_cache_size SET total = total + NEW.size; END;'
+            'CREATE TRIGGER IF NOT EXISTS dara_disk_cache_update AFTER UPDATE OF size ON dara_disk_cache BEGIN '
+            'UPDATE dara_disk_cache_size SET total = total - OLD.size + NEW.size; END;'
+            'CREATE TRIGGER IF NOT EXISTS dara_disk_cache_delete AFTER DELETE ON dara_disk_cache BEGIN '
+            'UPDATE dara_disk_cache_size SET total = total - OLD.size; END;',
+        )
+
+    def _read(self, filename: str, fmt: str) -> Any:
+        path = self.directory / filename
+
+        if fmt == 'arrow':
+            # Split blocks so columns are not consolidated, which would copy them a second time
+            return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+        with open(path, 'rb') as f:
+            return pickle.load(f)  # nosec B301 # the cache directory is owned by the app
+
+    def _write(self, key: str, value: Any) -> tuple[str, str, int]:
+        """
+        Write a value to a new file, atomically replacing any previous file for the key.
+
+        :return: filename, storage format and size in bytes
+        """
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        fmt = 'pickle'
+        tmp_path = self.directory / f'{digest}.{os.getpid()}.tmp'
+
+        try:
+            if isinstance(value, DataFrame):
+                try:
+                    feather.write_feather(pyarrow.Table.from_pandas(value), tmp_path, compression='uncompressed')
+                    fmt = 'arrow'
+                except (pyarrow.ArrowException, TypeError, ValueError):
+                    # e.g. mixed-type object columns or non-string column names, store pickled instead
+                    dev_logger.debug('DataFrame cannot be stored as Arrow, pickling it instead', {'key': key})
+
+            if fmt == 'pickle':
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            filename = f'{digest}.{fmt}'
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, self.directory / filename)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return filename, fmt, size
+
+    def _remove_files(self, filenames: list[str]):
+        for filename in filenames:
+            (self.directory / filename).unlink(missing_ok=True)
+
+    def _get(self, key: str) -> Any:
+        now = time.time()
+        rows = self._db.execute(
+            'SELECT filename, format FROM dara_disk_cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+            (key, now),
+        )
+        if len(rows) == 0:
+            raise KeyError(key)
+
+        filename, fmt = rows[0]
+        try:
+            value = self._read(filename, fmt)
+        except FileNotFoundError as e:
+            # Evicted by another process in the meantime
+            raise KeyError(key) from e
+
+        self._db.execute('UPDATE dara_disk_cache SET last_access = ? WHERE key = ?', (now, key))
+        return value
+
+    def _set(self, key: str, value: Any, ttl: float | None):
+        filename, fmt, size = self._write(key, value)
+
+        if size > self.max_size:
+            self._db.execute('DELETE FROM dara_disk_cache WHERE key = ?', (key,))
+            self._remove_files([filename])
+            return
+
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        # Upsert rather than replace, as replacing a row does not fire the delete trigger keeping the total size
+        self._db.execute(
+            'INSERT INTO dara_disk_cache (key, filename, format, size, expires_at, last_access) '
+            'VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET filename = excluded.filename, '
+            'format = excluded.format, size = excluded.size, expires_at = excluded.expires_at, '
+            'last_access = excluded.last_access',
+            (key, filename, fmt, size, expires_at, now),
+        )
+        self._evict()
+
+    def _evict(self):
+        """
+        Drop expired entries, then least recently used ones until the total size fits within `max_size`.
+        """
+        now = time.time()
+        evicted = [
+            row[0] for row in self._db.execute('SELECT filename FROM dara_disk_cache WHERE expires_at <= ?', (now,))
+        ]
+        self._db.execute('DELETE FROM dara_disk_cache WHERE expires_at <= ?', (now,))
+
+        total_size = self.size()
+        while total_size > self.max_size:
+            rows = self._db.execute(
+                'SELECT key, filename, size FROM dara_disk_cache ORDER BY last_access LIMIT ?', (EVICTION_BATCH_SIZE,)
+            )
+            if len(rows) == 0:
+                break
+            for key, filename, size in rows:
+                if total_size <= self.max_size:
+                    break
+                self._db.execute('DELETE FROM dara_disk_cache WHERE key = ?', (key,))
+                evicted.append(filename)
+                total_size -= size
+
+        self._remove_files(evicted)
+
+    def _delete(self, key: str):
+        rows = self._db.execute('SELECT filename FROM dara_disk_cache WHERE key = ?', (key,))
+        self._db.execute('DELETE FROM dara_disk_cache WHERE key = ?', (key,))
+        self._remove_files([row[0] for row in rows])
+
+    def _clear(self):
+        rows = self._db.execute('SELECT filename FROM dara_disk_cache')
+        self._db.execute('DELETE FROM dara_disk_cache')
+        self._remove_files([row[0] for row in rows])
+
+    async def get(self, key: str) -> Any:
+        return await to_thread.run_sync(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        await to_thread.run_sync(self._set, key, value, ttl)
+
+    async def delete(self, key: str):
+        await to_thread.run_sync(self._delete, key)
+
+    async def clear(self):
+        await to_thread.run_sync(self._clear)
+
+    async def clear_expired(self):
+        """Remove entries whose TTL has elapsed."""
+        await to_thread.run_sync(self._evict)
+
+    def size(self) -> int:
+        """Get the total size of stored values in bytes."""
+        return self._db.execute('SELECT total FROM dara_disk_cache_size')[0][0]
+
+    def close(self):
+        self._db.close()
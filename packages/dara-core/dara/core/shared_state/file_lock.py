@@ -0,0 +1,124 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+import anyio
+
+from dara.core.shared_state.sqlite import default_shared_state_path
+
+if sys.platform == 'win32':
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLockSingleFlight:
+    """
+    Single-flight implementation using OS file locks, coordinating the processes of one host.
+
+    Each key maps to a lock file in a shared directory. Locks are released by the OS if the holding
+    process dies, so a crashed worker never blocks the others. Waiting processes poll the lock
+    rather than blocking a worker thread on it.
+    """
+
+    def __init__(self, directory: str | Path | None = None, poll_interval: float = 0.05, timeout: float | None = 300):
+        """
+        :param directory: directory to keep lock files in; defaults to a directory next to the default
+            shared state database
+        :param poll_interval: seconds between attempts to acquire a held lock
+        :param timeout: seconds to wait for another process before computing uncoordinated, None to wait indefinitely
+        """
+        if poll_interval <= 0:
+            raise ValueError('poll_interval must be greater than 0')
+
+        self.directory = Path(directory) if directory is not None else default_shared_state_path().with_suffix('.locks')
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._held: dict[str, int] = {}
+
+    def _lock_path(self, key: str) -> Path:
+        return self.directory / f'{hashlib.sha256(key.encode()).hexdigest()}.lock'
+
+    def _try_acquire(self, key: str) -> bool:
+        # File locks are per open file, another acquisition in this process has to wait for release() too
+        if key in self._held:
+            return False
+
+        fd = os.open(self._lock_path(key), os.O_RDWR | os.O_CREAT, 0o600)
+        if not _try_lock(fd):
+            os.close(fd)
+            return False
+
+        self._held[key] = fd
+        return True
+
+    async def acquire(self, key: str) -> bool:
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+        while not self._try_acquire(key):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await anyio.sleep(self.poll_interval)
+
+        return True
+
+    async def release(self, key: str):
+        fd = self._held.pop(key, None)
+        if fd is None:
+            return
+
+        # Lock files are left in place, unlinking them would race with processes about to lock them
+        try:
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+    def is_held(self, key: str) -> bool:
+        """
+        Check whether the current process holds the flight for a key.
+
+        :param key: namespaced cache key
+        """
+        return key in self._held
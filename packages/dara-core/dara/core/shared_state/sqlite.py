@@ -0,0 +1,218 @@
+"""
+Copyright 2023 Impulse Innovations Limited
+
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+import anyio
+from anyio import to_thread
+
+from dara.core.internal.app_scope import get_app_key
+from dara.core.logging import dev_logger
+from dara.core.shared_state.base import BusMessageHandler
+
+SHARED_STATE_PATH_ENV_VAR = 'DARA_SHARED_STATE_PATH'
+
+
+def default_shared_state_path() -> Path:
+    """
+    Return the default app-scoped SQLite database path shared by the processes of one app.
+
+    Uses `DARA_SHARED_STATE_PATH` if set, otherwise a Dara-owned file under the platform temp directory.
+    """
+    configured_path = os.environ.get(SHARED_STATE_PATH_ENV_VAR)
+    if configured_path is not None:
+        return Path(configured_path).expanduser().resolve()
+
+    root = Path(tempfile.gettempdir()) / 'dara-shared-state'
+    root.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return root / f'{get_app_key()}.sqlite3'
+
+
+class _SQLiteConnection:
+    """
+    Lazily opened SQLite connection shared by the worker threads of one process.
+
+    SQLite serializes writers across processes with file locks, WAL mode lets readers proceed
+    while another process writes. Within a process access is serialized by a thread lock.
+    """
+
+    def __init__(self, path: str | Path | None, schema: str):
+        self.path = Path(path) if path is not None else default_shared_state_path()
+        self._schema = schema
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(self._schema)
+            self._conn = conn
+        return self._conn
+
+    def execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """
+        Execute a statement and return all resulting rows. Blocking, run in a worker thread.
+
+        :param sql: SQL statement
+        :param params: statement parameters
+        """
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SQLiteSharedCacheBackend:
+    """
+    Shared cache backend storing pickled values in a local SQLite database.
+
+    Lets several app processes on one host (e.g. uvicorn workers in one pod) share DerivedVariable
+    results and task results without any external service.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        :param path: path of the SQLite database file; defaults to an app-scoped file in the temp directory,
+            overridable with `DARA_SHARED_STATE_PATH`
+        """
+        self._db = _SQLiteConnection(
+            path,
+            'CREATE TABLE IF NOT EXISTS dara_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)',
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._db.path
+
+    async def get(self, key: str) -> Any:
+        rows = await to_thread.run_sync(
+            self._db.execute,
+            'SELECT value FROM dara_cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)',
+            (key, time.time()),
+        )
+        if len(rows) == 0:
+            raise KeyError(key)
+        return pickle.loads(rows[0][0])  # nosec B301 # the database is owned by the app processes
+
+    async def set(self, key: str, value: Any, ttl: float | None = None):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        expires_at = time.time() + ttl if ttl is not None else None
+        await to_thread.run_sync(
+            self._db.execute,
+            'INSERT OR REPLACE INTO dara_cache (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, payload, expires_at),
+        )
+
+    async def delete(self, key: str):
+        await to_thread.run_sync(self._db.execute, 'DELETE FROM dara_cache WHERE key = ?', (key,))
+
+    async def clear(self):
+        await to_thread.run_sync(self._db.execute, 'DELETE FROM dara_cache')
+
+    async def clear_expired(self):
+        """Remove entries whose TTL has elapsed."""
+        await to_thread.run_sync(self._db.execute, 'DELETE FROM dara_cache WHERE expires_at <= ?', (time.time(),))
+
+    def close(self):
+        self._db.close()
+
+
+class SQLiteMessageBus:
+    """
+    Message bus implemented as an append-only SQLite table polled by every subscribed process.
+
+    Intended for running several app processes on one host without external services. Messages
+    older than `retention` seconds are pruned by the subscribers.
+    """
+
+    def __init__(self, path: str | Path | None = None, poll_interval: float = 0.05, retention: float = 60):
+        """
+        :param path: path of the SQLite database file; defaults to an app-scoped file in the temp directory,
+            overridable with `DARA_SHARED_STATE_PATH`
+        :param poll_interval: seconds between polls for new messages
+        :param retention: seconds to keep published messages for before pruning them
+        """
+        if poll_interval <= 0:
+            raise ValueError('poll_interval must be greater than 0')
+
+        self._db = _SQLiteConnection(
+            path,
+            'CREATE TABLE IF NOT EXISTS dara_bus ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, origin TEXT NOT NULL, created_at REAL NOT NULL, payload TEXT NOT NULL)',
+        )
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.origin = str(uuid.uuid4())
+
+    @property
+    def path(self) -> Path:
+        return self._db.path
+
+    async def publish(self, message: dict[str, Any]):
+        await to_thread.run_sync(
+            self._db.execute,
+            'INSERT INTO dara_bus (origin, created_at, payload) VALUES (?, ?, ?)',
+            (self.origin, time.time(), json.dumps(message)),
+        )
+
+    async def subscribe(self, on_message: BusMessageHandler):
+        # Only deliver messages published after subscribing
+        rows = await to_thread.run_sync(self._db.execute, 'SELECT COALESCE(MAX(id), 0) FROM dara_bus')
+        last_id: int = rows[0][0]
+        last_prune = time.time()
+
+        while True:
+            rows = await to_thread.run_sync(
+                self._db.execute,
+                'SELECT id, origin, payload FROM dara_bus WHERE id > ? ORDER BY id',
+                (last_id,),
+            )
+            for message_id, origin, payload in rows:
+                last_id = message_id
+                if origin == self.origin:
+                    continue
+                try:
+                    await on_message(json.loads(payload))
+                except Exception as e:
+                    dev_logger.error('Error handling message bus message', error=e)
+
+            now = time.time()
+            if now - last_prune > self.retention:
+                last_prune = now
+                await to_thread.run_sync(
+                    self._db.execute, 'DELETE FROM dara_bus WHERE created_at < ?', (now - self.retention,)
+                )
+
+            await anyio.sleep(self.poll_interval)
+
+    def close(self):
+        self._db.close()
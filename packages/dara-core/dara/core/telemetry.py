@@ -18,8 +18,10 @@ limitations under the License.
 import asyncio
 import logging
 import os
+import random
 from collections.abc import Iterator, Mapping
 from contextlib import AbstractContextManager, contextmanager, suppress
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from threading import Lock, Thread
 from time import perf_counter
@@ -595,6 +597,68 @@ class _OperationObservation:
         self.span.set_attribute('dara.outcome', self.outcome)
 
 
+class _UnobservedOperation(_OperationObservation):
+    """Shared observation for operations which are not observed, ignoring outcome updates."""
+
+    def set_outcome(self, outcome: str) -> None:
+        pass
+
+    def record_exception(self, error: BaseException) -> None:
+        pass
+
+
+class _UnobservedOperationContext(AbstractContextManager):
+    """Reusable no-op context manager returned instead of allocating one when an operation is not observed."""
+
+    observation = _UnobservedOperation()
+
+    def __enter__(self) -> _OperationObservation:
+        return self.observation
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+
+_UNOBSERVED = _UnobservedOperationContext()
+
+# Sampling decision of the root sampled operation the current code runs in, None outside of one
+_SAMPLED: ContextVar[bool | None] = ContextVar('dara_telemetry_sampled', default=None)
+
+
+def _is_sampled(category: str) -> bool:
+    """
+    Return whether to trace one operation of a category.
+
+    Operations nested in a sampled operation reuse the decision of the root operation, so traces are either kept
+    whole or dropped whole. Root operations decide based on the configured per-category sample rate.
+
+    :param category: bounded telemetry category such as ``cache`` or ``derived_variable``
+    """
+    sampled = _SAMPLED.get()
+    if sampled is not None:
+        return sampled
+    rate = _RUNTIME.sample_rates.get(category)
+    return rate is None or rate >= 1 or (rate > 0 and random.random() < rate)  # nosec B311 # not security related
+
+
+@contextmanager
+def _sampling_decision(sampled: bool | None) -> Iterator[None]:
+    """
+    Hold the sampling decision of a root operation for the operations nested in it.
+
+    :param sampled: the decision made for the operation, None for operations which are not sampled
+    """
+    if sampled is None or _SAMPLED.get() is not None:
+        yield
+        return
+
+    token = _SAMPLED.set(sampled)
+    try:
+        yield
+    finally:
+        _SAMPLED.reset(token)
+
+
 @contextmanager
 def _observe_operation(
     *,
@@ -607,7 +671,15 @@ def _observe_operation(
     span_kind: SpanKind = SpanKind.INTERNAL,
     context: Context | None = None,
     links: list[Link] | None = None,
+    sampled: bool | None = None,
 ) -> Iterator[_OperationObservation]:
+    """
+    Trace and measure one operation.
+
+    Metrics are always recorded, so their counts cover every operation. Spans are only recorded for sampled operations.
+
+    :param sampled: sampling decision for sampled operation categories, None for operations which are always traced
+    """
     if not _RUNTIME.configured:
         yield _OperationObservation()
         return
@@ -616,23 +688,32 @@ def _observe_operation(
     active.add(1, metric_attributes)
     observation = _OperationObservation()
     try:
-        with _TRACER.start_as_current_span(
-            span_name,
-            context=context,
-            kind=span_kind,
-            attributes=span_attributes,
-            links=links,
-            record_exception=False,
-            set_status_on_exception=False,
-        ) as span:
-            observation.span = span
-            try:
-                yield observation
-            except BaseException as error:
-                observation.record_exception(error)
-                raise
-            finally:
-                span.set_attribute('dara.outcome', observation.outcome)
+        with _sampling_decision(sampled):
+            if sampled is False:
+                try:
+                    yield observation
+                except BaseException as error:
+                    observation.record_exception(error)
+                    raise
+                return
+
+            with _TRACER.start_as_current_span(
+                span_name,
+                context=context,
+                kind=span_kind,
+                attributes=span_attributes,
+                links=links,
+                record_exception=False,
+                set_status_on_exception=False,
+            ) as span:
+                observation.span = span
+                try:
+                    yield observation
+                except BaseException as error:
+                    observation.record_exception(error)
+                    raise
+                finally:
+                    span.set_attribute('dara.outcome', observation.outcome)
     finally:
         outcome_attributes = {**metric_attributes, 'dara.outcome': observation.outcome}
         duration.record(perf_counter() - started, outcome_attributes)
@@ -884,14 +965,13 @@ def record_websocket_queue_wait(duration_seconds: float, message_type: str) -> N
         )
 
 
-@contextmanager
 def observe_derived_variable(
     resolver_name: str,
     execution: str,
     *,
     variable_id: str,
     function_name: str,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace and measure one complete derived-variable resolution.
 
@@ -900,6 +980,21 @@ def observe_derived_variable(
     :param variable_id: registered derived-variable identifier
     :param function_name: unqualified resolver function name
     """
+    if not _RUNTIME.configured:
+        return _UNOBSERVED
+    return _observe_derived_variable(
+        resolver_name, execution, variable_id, function_name, _is_sampled('derived_variable')
+    )
+
+
+@contextmanager
+def _observe_derived_variable(
+    resolver_name: str,
+    execution: str,
+    variable_id: str,
+    function_name: str,
+    sampled: bool,
+) -> Iterator[_OperationObservation]:
     metric_attributes = {
         'dara.derived_variable.resolver': resolver_name,
         'dara.derived_variable.execution': execution,
@@ -919,15 +1014,15 @@ def observe_derived_variable(
         active=_DERIVED_VARIABLE_ACTIVE,
         duration=_DERIVED_VARIABLE_DURATION,
         executions=_DERIVED_VARIABLE_EXECUTIONS,
+        sampled=sampled,
     ) as observation:
         yield observation
 
 
-@contextmanager
 def observe_derived_variable_phase(
     phase: str,
     resolver_name: str,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace one bounded phase within derived-variable resolution.
 
@@ -937,65 +1032,80 @@ def observe_derived_variable_phase(
     :param phase: bounded phase name
     :param resolver_name: stable registered resolver name
     """
-    if not _RUNTIME.configured:
-        yield _OperationObservation()
-        return
-
-    observation = _OperationObservation()
-    with _TRACER.start_as_current_span(
-        f'dara.derived_variable.{phase}',
-        attributes={
-            'dara.derived_variable.phase': phase,
-            'dara.derived_variable.resolver': resolver_name,
-        },
-        record_exception=False,
-        set_status_on_exception=False,
-    ) as span:
-        observation.span = span
-        try:
-            yield observation
-        except BaseException as error:
-            observation.record_exception(error)
-            raise
-        finally:
-            span.set_attribute('dara.outcome', observation.outcome)
+    if not _RUNTIME.configured or _SAMPLED.get() is False:
+        return _UNOBSERVED
+    return _observe_derived_variable_phase(phase, resolver_name, _is_sampled('derived_variable'))
 
 
 @contextmanager
+def _observe_derived_variable_phase(phase: str, resolver_name: str, sampled: bool) -> Iterator[_OperationObservation]:
+    with _sampling_decision(sampled):
+        if not sampled:
+            yield _UNOBSERVED.observation
+            return
+
+        observation = _OperationObservation()
+        with _TRACER.start_as_current_span(
+            f'dara.derived_variable.{phase}',
+            attributes={
+                'dara.derived_variable.phase': phase,
+                'dara.derived_variable.resolver': resolver_name,
+            },
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            observation.span = span
+            try:
+                yield observation
+            except BaseException as error:
+                observation.record_exception(error)
+                raise
+            finally:
+                span.set_attribute('dara.outcome', observation.outcome)
+
+
 def observe_derived_variable_filter(
     filter_name: str,
     *,
     custom: bool,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace one derived-variable tabular filtering callback.
 
     :param filter_name: stable callable identity for the selected filter resolver
     :param custom: whether the application supplied the filter resolver
     """
-    if not _RUNTIME.configured:
-        yield _OperationObservation()
-        return
+    if not _RUNTIME.configured or _SAMPLED.get() is False:
+        return _UNOBSERVED
+    return _observe_derived_variable_filter(filter_name, custom, _is_sampled('derived_variable'))
 
-    observation = _OperationObservation()
-    with _TRACER.start_as_current_span(
-        'dara.derived_variable.filter',
-        attributes={
-            'dara.derived_variable.phase': 'filter',
-            'dara.derived_variable.filter.name': filter_name,
-            'dara.derived_variable.filter.custom': custom,
-        },
-        record_exception=False,
-        set_status_on_exception=False,
-    ) as span:
-        observation.span = span
-        try:
-            yield observation
-        except BaseException as error:
-            observation.record_exception(error)
-            raise
-        finally:
-            span.set_attribute('dara.outcome', observation.outcome)
+
+@contextmanager
+def _observe_derived_variable_filter(filter_name: str, custom: bool, sampled: bool) -> Iterator[_OperationObservation]:
+    with _sampling_decision(sampled):
+        if not sampled:
+            yield _UNOBSERVED.observation
+            return
+
+        observation = _OperationObservation()
+        with _TRACER.start_as_current_span(
+            'dara.derived_variable.filter',
+            attributes={
+                'dara.derived_variable.phase': 'filter',
+                'dara.derived_variable.filter.name': filter_name,
+                'dara.derived_variable.filter.custom': custom,
+            },
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            observation.span = span
+            try:
+                yield observation
+            except BaseException as error:
+                observation.record_exception(error)
+                raise
+            finally:
+                span.set_attribute('dara.outcome', observation.outcome)
 
 
 def record_derived_variable_cache_access(result: str) -> None:
@@ -1008,14 +1118,13 @@ def record_derived_variable_cache_access(result: str) -> None:
         _DERIVED_VARIABLE_CACHE_ACCESSES.add(1, {'dara.cache.result': result})
 
 
-@contextmanager
 def observe_py_component(
     component_name: str,
     *,
     definition_id: str,
     instance_id: str | None,
     function_name: str,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace and measure one Python component render.
 
@@ -1024,6 +1133,19 @@ def observe_py_component(
     :param instance_id: rendered component instance identifier, when available
     :param function_name: unqualified renderer function name
     """
+    if not _RUNTIME.configured:
+        return _UNOBSERVED
+    return _observe_py_component(component_name, definition_id, instance_id, function_name, _is_sampled('py_component'))
+
+
+@contextmanager
+def _observe_py_component(
+    component_name: str,
+    definition_id: str,
+    instance_id: str | None,
+    function_name: str,
+    sampled: bool,
+) -> Iterator[_OperationObservation]:
     metric_attributes = {'dara.py_component.name': component_name}
     span_attributes = {
         **metric_attributes,
@@ -1041,6 +1163,7 @@ def observe_py_component(
         active=_PY_COMPONENT_ACTIVE,
         duration=_PY_COMPONENT_DURATION,
         executions=_PY_COMPONENT_EXECUTIONS,
+        sampled=sampled,
     ) as observation:
         yield observation
 
@@ -1119,11 +1242,10 @@ def observe_upload(resolver_kind: str) -> Iterator[_OperationObservation]:
         yield observation
 
 
-@contextmanager
 def observe_backend_store(
     operation: str,
     backend_name: str,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace and measure one backend-store operation.
 
@@ -1132,6 +1254,13 @@ def observe_backend_store(
     :param operation: bounded operation such as ``read``, ``write``, or ``delete``
     :param backend_name: backend implementation class name
     """
+    if not _RUNTIME.configured:
+        return _UNOBSERVED
+    return _observe_backend_store(operation, backend_name, _is_sampled('backend_store'))
+
+
+@contextmanager
+def _observe_backend_store(operation: str, backend_name: str, sampled: bool) -> Iterator[_OperationObservation]:
     attributes = {
         'dara.backend_store.operation': operation,
         'dara.backend_store.backend': backend_name,
@@ -1143,18 +1272,18 @@ def observe_backend_store(
         active=_BACKEND_STORE_ACTIVE,
         duration=_BACKEND_STORE_DURATION,
         executions=_BACKEND_STORE_EXECUTIONS,
+        sampled=sampled,
     ) as observation:
         yield observation
 
 
-@contextmanager
 def observe_auth(
     operation: str,
     *,
     system: str | None = None,
     attributes: Mapping[str, str | bool | int | float] | None = None,
     span_kind: SpanKind = SpanKind.INTERNAL,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace and measure one bounded authentication operation.
 
@@ -1167,6 +1296,19 @@ def observe_auth(
     :param attributes: additional safe span-only diagnostic attributes
     :param span_kind: OpenTelemetry span kind for the operation
     """
+    if not _RUNTIME.configured:
+        return _UNOBSERVED
+    return _observe_auth(operation, system, attributes, span_kind, _is_sampled('auth'))
+
+
+@contextmanager
+def _observe_auth(
+    operation: str,
+    system: str | None,
+    attributes: Mapping[str, str | bool | int | float] | None,
+    span_kind: SpanKind,
+    sampled: bool,
+) -> Iterator[_OperationObservation]:
     metric_attributes = {'dara.auth.operation': operation}
     span_attributes: dict[str, str | bool | int | float] = dict(metric_attributes)
     if system is not None:
@@ -1183,6 +1325,7 @@ def observe_auth(
         duration=_AUTH_DURATION,
         executions=_AUTH_EXECUTIONS,
         span_kind=span_kind,
+        sampled=sampled,
     ) as observation:
         try:
             yield observation
@@ -1220,23 +1363,31 @@ def annotate_auth_observation(
         observation.span.set_attribute(key, value)
 
 
-@contextmanager
 def observe_internal_operation(
     category: str,
     operation: str,
     *,
     name: str | None = None,
-) -> Iterator[_OperationObservation]:
+) -> AbstractContextManager[_OperationObservation]:
     """
     Trace and measure an important bounded internal operation.
 
     The optional implementation or registry name is span-only to prevent
     application-defined identifiers from becoming metric dimensions.
 
-    :param category: bounded subsystem such as ``server_variable`` or ``cache``
+    :param category: bounded subsystem such as ``server_variable`` or ``cache``, also used as the sampling category
     :param operation: bounded operation within the subsystem
     :param name: optional stable implementation or registry name
     """
+    if not _RUNTIME.configured:
+        return _UNOBSERVED
+    return _observe_internal_operation(category, operation, name, _is_sampled(category))
+
+
+@contextmanager
+def _observe_internal_operation(
+    category: str, operation: str, name: str | None, sampled: bool
+) -> Iterator[_OperationObservation]:
     metric_attributes = {
         'dara.internal.category': category,
         'dara.internal.operation': operation,
@@ -1251,6 +1402,7 @@ def observe_internal_operation(
         active=_INTERNAL_OPERATION_ACTIVE,
         duration=_INTERNAL_OPERATION_DURATION,
         executions=_INTERNAL_OPERATIONS,
+        sampled=sampled,
     ) as observation:
         yield observation
 
@@ -1578,6 +1730,7 @@ def use_telemetry_carrier(carrier: Mapping[str, str] | None) -> Iterator[None]:
 @dataclass
 class _TelemetryRuntime:
     configured: bool = False
+    sample_rates: dict[str, float] = field(default_factory=dict)
     logging_instrumented: bool = False
     logging_handler: LoggingHandler | None = None
     system_metrics_instrumented: bool = False
@@ -1595,6 +1748,8 @@ class _TelemetryRuntime:
         if not settings.dara_otel_enabled and not metrics_enabled:
             return False
 
+        self.sample_rates = dict(settings.dara_otel_sample_rates)
+
         # The stable HTTP duration histogram uses seconds and is the instrument
         # operators should query for latency percentiles.
         os.environ.setdefault('OTEL_SEMCONV_STABILITY_OPT_IN', settings.otel_semconv_stability_opt_in)
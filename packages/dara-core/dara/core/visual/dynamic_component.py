@@ -16,6 +16,10 @@ limitations under the License.
 """
 
 import contextlib
+import datetime
+import decimal
+import enum
+import hashlib
 import json
 import uuid
 from collections import OrderedDict
@@ -30,14 +34,19 @@ from typing import (
 )
 
 import anyio
+import numpy
 from fastapi.encoders import jsonable_encoder
+from pandas import DataFrame, Index, Series
+from pandas.util import hash_pandas_object
+from pydantic import BaseModel
 
-from dara.core.base_definitions import BaseTask
+from dara.core.base_definitions import BaseTask, Cache, CacheArgType, CachedRegistryEntry
 from dara.core.definitions import BaseFallback, ComponentInstance, PyComponentDef
 from dara.core.interactivity import AnyVariable
 from dara.core.interactivity.client_variable import ClientVariable
 from dara.core.interactivity.state_variable import StateVariable
 from dara.core.internal.cache_store import CacheStore
+from dara.core.internal.cross_process import generate_uid, sharing_runtime_entries
 from dara.core.internal.dependency_resolution import resolve_dependency
 from dara.core.internal.encoder_registry import deserialize
 from dara.core.internal.normalization import NormalizedPayload, normalize
@@ -71,6 +80,7 @@ def py_component(
     fallback: BaseFallback | ComponentInstance | None = None,
     track_progress: bool | None = False,
     polling_interval: int | ClientVariable | None = None,
+    cache: CacheArgType | None = None,
 ) -> Callable[[Callable], Callable[..., PyComponentInstance]]: ...
 
 
@@ -81,6 +91,7 @@ def py_component(
     fallback: BaseFallback | ComponentInstance | None = None,
     track_progress: bool | None = False,
     polling_interval: int | ClientVariable | None = None,
+    cache: CacheArgType | None = None,
 ) -> Callable[..., PyComponentInstance] | Callable[[Callable], Callable[..., PyComponentInstance]]:
     """
     A decorator that can be used to trigger a component function to be rerun whenever a give variable changes. It should be
@@ -92,8 +103,16 @@ def py_component(
     :param polling_interval: an optional polling interval in seconds for the component. This can be either a fixed
                              integer or a ClientVariable (e.g. SwitchVariable) for dynamic polling/disable behavior.
                              Setting this will cause the component to poll the backend and refresh itself every n seconds.
+    :param cache: an optional cache policy for the rendered component. If set, renders with the same resolved arguments
+                  reuse the previously rendered result instead of calling the function again. Results are cached per
+                  session unless the policy sets another `cache_type`. Renders depending on a task, or with arguments
+                  which cannot be hashed, are not cached.
     """
     fallback_component = None
+    cache_policy = Cache.Policy.from_arg(cache) if cache is not None else None
+    if cache_policy is not None and 'cache_type' not in cache_policy.model_fields_set:
+        # The function can depend on the current user, so results are only shared across users when requested
+        cache_policy = cache_policy.model_copy(update={'cache_type': Cache.Type.SESSION})
 
     if fallback:
         fallback_component = fallback
@@ -102,9 +121,27 @@ def py_component(
         fallback_component = placeholder
 
     def _py_component(func: Callable) -> Callable[..., PyComponentInstance]:
-        uid = uuid.uuid4()
+        uid = generate_uid('py_component')
         old_signature = signature(func)
 
+        # Register the component when it is defined, so every worker process knows about it even if it is only
+        # rendered within other py_components
+        from dara.core.internal.registries import component_registry
+
+        eng_logger.info(f'Registering py_component "{func.__name__}"')
+        component_registry.register(
+            uid,
+            PyComponentDef(
+                func=func,
+                name=uid,
+                dynamic_kwargs={},
+                fallback=fallback_component,
+                polling_interval=polling_interval,
+                render_component=render_component,
+                cache=cache_policy,
+            ),
+        )
+
         @wraps(func)
         def _inner_func(*args, **kwargs) -> PyComponentInstance:
             # Handle errors explicitly so they are clear for the end user
@@ -118,25 +155,7 @@ def py_component(
                     f'Expected {len(old_signature.parameters)} arguments, but received {len(args) + len(kwargs)}'
                 )
 
-            # Register the component here, if it hasn't already been, in case dynamic args are provided.
-            from dara.core.internal.registries import (
-                component_registry,
-                static_kwargs_registry,
-            )
-
-            try:
-                component_registry.get(str(uid))
-            except KeyError:
-                eng_logger.info(f'Registering py_component "{func.__name__}"')
-                py_comp = PyComponentDef(
-                    func=func,
-                    name=str(uid),
-                    dynamic_kwargs={},
-                    fallback=fallback_component,
-                    polling_interval=polling_interval,
-                    render_component=render_component,
-                )
-                component_registry.register(str(uid), py_comp)
+            from dara.core.internal.registries import static_kwargs_registry
 
             # Create kwargs for every argument based on the function signature and then split them into dynamic vs static
             all_kwargs = {**kwargs}
@@ -179,13 +198,13 @@ def py_component(
                 else:
                     static_kwargs[key] = kwarg
 
-            instance_uid = str(uuid.uuid4())
+            instance_uid = generate_uid('py_component_instance')
 
             # Store the static_kwargs in a registry
             static_kwargs_registry.register(instance_uid, static_kwargs)
 
             # Returning a PyComponentInstance with dynamic and static args
-            instance_cls = type(str(uid), (PyComponentInstance,), {})
+            instance_cls = type(uid, (PyComponentInstance,), {})
             return instance_cls(
                 func_name=func.__name__,
                 dynamic_kwargs=dynamic_kwargs,
@@ -283,10 +302,12 @@ async def _render_component(
 
     if values is not None:
         annotations = definition.func.__annotations__
+        resolved_values = {}
         resolved_dyn_kwargs = {}
 
         async def _resolve_kwarg(val: Any, key: str):
             val = await resolve_dependency(val, store, task_mgr)
+            resolved_values[key] = val
             typ = annotations.get(key)
             resolved_dyn_kwargs[key] = deserialize(val, typ)
 
@@ -337,9 +358,26 @@ async def _render_component(
 
             return task
 
+        cache_entry = None
+        cache_key = _get_cache_key({**resolved_values, **static_kwargs}) if definition.cache is not None else None
+        if cache_key is not None:
+            cache_entry = CachedRegistryEntry(uid=definition.name, cache=definition.cache)
+
+            # The normalized payload is cached, so a hit skips both rendering and serialization
+            cached_result = await store.get(cache_entry, key=cache_key)
+            if cached_result is not None:
+                eng_logger.info(
+                    f'PyComponent {definition.func.__name__} returning cached result',
+                    {'uid': definition.name, 'cache_key': cache_key},
+                )
+                return cached_result
+
         with observe_internal_operation('py_component', 'renderer', name=definition.name):
             result = await renderer(**resolved_kwargs)
 
+        if cache_entry is not None and cache_key is not None:
+            await store.set(cache_entry, key=cache_key, value=result)
+
         eng_logger.info(
             f'PyComponent {definition.func.__name__} returning result', {'uid': definition.name, 'result': result}
         )
@@ -349,6 +387,65 @@ async def _render_component(
     return await renderer()
 
 
+def _hash_pandas(value: DataFrame | Series | Index) -> str:
+    """
+    Hash a pandas object by its content, index, labels and dtypes, as its string representation is truncated.
+
+    :param value: pandas object to hash
+    """
+    digest = hashlib.sha256(hash_pandas_object(value, index=True).to_numpy().tobytes())
+    if isinstance(value, DataFrame):
+        labels = [repr(value.columns.tolist()), repr(value.dtypes.astype(str).tolist())]
+    else:
+        labels = [repr(value.name), str(value.dtype)]
+    index = value if isinstance(value, Index) else value.index
+    labels += [repr(index.names), str(index.dtype)]
+    digest.update(json.dumps(labels).encode())
+    return digest.hexdigest()
+
+
+def _hash_default(value: Any) -> Any:
+    """
+    Convert values which are not JSON serializable to a representation used for the cache key.
+    Representations are tagged with the type of the value, so they never match a plain JSON value.
+
+    :param value: value to convert
+    :raises TypeError: if the value cannot be represented faithfully, in which case the result is not cached
+    """
+    if isinstance(value, (DataFrame, Series, Index)):
+        return {'__dara_hash__': type(value).__name__, 'value': _hash_pandas(value)}
+    if isinstance(value, numpy.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError('Cannot hash numpy arrays of objects')
+        digest = hashlib.sha256(numpy.ascontiguousarray(value).tobytes())
+        return {'__dara_hash__': 'ndarray', 'value': [digest.hexdigest(), value.dtype.str, value.shape]}
+    if isinstance(value, numpy.generic):
+        return {'__dara_hash__': value.dtype.str, 'value': value.item()}
+    if isinstance(value, BaseModel):
+        return {'__dara_hash__': f'{type(value).__module__}.{type(value).__qualname__}', 'value': value.model_dump()}
+    if isinstance(value, enum.Enum):
+        return {'__dara_hash__': f'{type(value).__module__}.{type(value).__qualname__}', 'value': value.value}
+    if isinstance(value, (datetime.date, datetime.time)):
+        return {'__dara_hash__': type(value).__name__, 'value': value.isoformat()}
+    if isinstance(value, (datetime.timedelta, decimal.Decimal, uuid.UUID)):
+        return {'__dara_hash__': type(value).__name__, 'value': str(value)}
+    raise TypeError(f'Cannot hash values of type {type(value).__name__}')
+
+
+def _get_cache_key(kwargs: Mapping[str, Any]) -> str | None:
+    """
+    Get the cache key for the rendered result of a py_component, a hash of its resolved arguments.
+    Returns None if the arguments cannot be hashed faithfully, in which case the result is not cached.
+
+    :param kwargs: resolved arguments passed to the component function
+    """
+    try:
+        serialized = json.dumps(kwargs, sort_keys=True, default=_hash_default)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
 def _make_render_safe(handler: Callable):
     """
     Wrap the handler in a check to make sure a ComponentInstance is rendered
@@ -357,7 +454,9 @@ def _make_render_safe(handler: Callable):
     """
 
     async def _render_safe(**kwargs: dict[str, Any]) -> NormalizedPayload[ComponentInstance | None]:
-        result = await run_user_handler(handler, kwargs=kwargs)
+        # Components and actions created while rendering must be shared before the result referencing them is sent
+        async with sharing_runtime_entries():
+            result = await run_user_handler(handler, kwargs=kwargs)
         safe_result: ComponentInstance | None = None
 
         if result is None:
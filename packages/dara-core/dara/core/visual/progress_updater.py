@@ -18,9 +18,11 @@ limitations under the License.
 import inspect
 from collections import OrderedDict
 from collections.abc import Callable
-from functools import wraps
+from functools import partial, wraps
 from inspect import Signature, signature
 
+from dara.core.internal.pool.definitions import FAKE_PROGRESS_PREFIX
+
 
 class ProgressUpdater:
     """
@@ -52,14 +54,25 @@ class ProgressUpdater:
         :param estimated_time: optionally, provide an estimate on how long the operation should take (in milliseconds)
         :param message: message to show while the fake progress is running
         """
-        self.updater_method(progress_end, f'FAKE_PROGRESS__{estimated_time}__{message}')
+        self.updater_method(progress_end, f'{FAKE_PROGRESS_PREFIX}{estimated_time}__{message}')
 
 
-def track_progress(func=None):
+def track_progress(func=None, *, interval: float | None = None):
     """
     Task function decorator which injects a ProgressUpdater instance into a keyword argument with
     type annotation of ProgressUpdater.
 
+    Progress updates sent in quick succession are coalesced, at most one update is delivered every `interval`
+    seconds and the latest update wins. Fake progress and final updates are always delivered. The interval defaults
+    to the `DARA_TASK_PROGRESS_INTERVAL_SECONDS` setting (0, i.e. every update is delivered), and can be set per
+    task function:
+
+    ```python
+    @track_progress(interval=0.5)
+    def task_function(updater: ProgressUpdater):
+        ...
+    ```
+
     Example usage:
 
 
@@ -81,10 +94,18 @@ def track_progress(func=None):
 
     Intercepts `__send_update` keyword argument which is injected into kwargs by TaskManager when the task is
     ran and uses it to instantiate the ProgressUpdater object.
+
+    :param func: the task function to wrap
+    :param interval: minimum number of seconds between progress updates delivered for the task
     """
     if func is None:
+        if interval is not None:
+            return partial(track_progress, interval=interval)
         raise ValueError('No function provided for decorator @track_progress')
 
+    if interval is not None and interval < 0:
+        raise ValueError('Progress interval must be greater than or equal to 0')
+
     new_annotations = {}
     old_signature = signature(func)
     params = OrderedDict()
@@ -154,5 +175,6 @@ def track_progress(func=None):
     # Store metadata on the wrapped function - keep a reference to the function wrapped and the decorator itself
     _inner_func.__wrapped__ = func
     _inner_func.__wrapped_by__ = track_progress  # type: ignore
+    _inner_func.__progress_interval__ = interval  # type: ignore
 
     return _inner_func
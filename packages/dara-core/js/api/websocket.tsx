@@ -45,6 +45,7 @@ export enum ServerMessageTypename {
     ACTION = 'ActionMessage',
     BACKEND_STORE = 'BackendStoreMessage',
     BACKEND_STORE_PATCH = 'BackendStorePatchMessage',
+    DERIVED_VARIABLE_REFRESH = 'DerivedVariableRefreshMessage',
     SERVER_ERROR = 'ServerErrorMessage',
     SERVER_VARIABLE = 'ServerVariableMessage',
     TASK_NOTIFICATION = 'TaskNotificationMessage',
@@ -172,6 +173,15 @@ export const serverVariableMessageSchema = z.object({
 });
 export type ServerVariableMessage = z.infer<typeof serverVariableMessageSchema>;
 
+export const derivedVariableRefreshMessageSchema = z.object({
+    __typename: z.literal(ServerMessageTypename.DERIVED_VARIABLE_REFRESH),
+    message: z.object({
+        uid: z.string(),
+    }),
+    type: z.literal('message'),
+});
+export type DerivedVariableRefreshMessage = z.infer<typeof derivedVariableRefreshMessageSchema>;
+
 export const customMessageSchema = z.object({
     message: z.object({
         data: z.any(),
@@ -193,6 +203,7 @@ export const firstPartyServerMessageSchema = z.discriminatedUnion('__typename',
     backendStoreMessageSchema,
     backendStorePatchMessageSchema,
     serverVariableMessageSchema,
+    derivedVariableRefreshMessageSchema,
 ]);
 
 export const webSocketMessageSchema = z.union([
@@ -215,6 +226,10 @@ export function isServerVariableMessage(message: WebSocketMessage): message is S
     return message.type === 'message' && message.__typename === ServerMessageTypename.SERVER_VARIABLE;
 }
 
+export function isDerivedVariableRefreshMessage(message: WebSocketMessage): message is DerivedVariableRefreshMessage {
+    return message.type === 'message' && message.__typename === ServerMessageTypename.DERIVED_VARIABLE_REFRESH;
+}
+
 export function isServerErrorMessage(message: WebSocketMessage): message is ServerErrorMessage {
     return message.type === 'message' && message.__typename === ServerMessageTypename.SERVER_ERROR;
 }
@@ -249,6 +264,7 @@ export interface WebSocketClientInterface {
     backendStoreMessages$(): Observable<BackendStoreMessage['message']>;
     backendStorePatchMessages$(): Observable<BackendStorePatchMessage['message']>;
     serverVariableMessages$(): Observable<ServerVariableMessage['message']>;
+    derivedVariableRefreshMessages$(): Observable<DerivedVariableRefreshMessage['message']>;
     channel$: () => Observable<string>;
     customMessages$: () => Observable<CustomMessage>;
     getChannel: () => Promise<string>;
@@ -528,6 +544,13 @@ export class WebSocketClient implements WebSocketClientInterface {
         );
     }
 
+    derivedVariableRefreshMessages$(): Observable<DerivedVariableRefreshMessage['message']> {
+        return this.messages$.pipe(
+            filter(isDerivedVariableRefreshMessage),
+            map((msg) => msg.message)
+        );
+    }
+
     /**
      * Get the observable to receive the new channel when the socket reconnects
      */
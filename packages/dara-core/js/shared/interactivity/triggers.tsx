@@ -14,6 +14,11 @@ export interface TriggerInfo {
     variable: DerivedVariable;
 }
 
+/**
+ * Variable uid -> trigger keys registered for it, across nested and loop instances
+ */
+const triggerKeysByUid = new Map<string, Set<string>>();
+
 /**
  * Get a trigger index for a variable from the atom registry, registering it if not already registered
  *
@@ -22,6 +27,11 @@ export interface TriggerInfo {
 export function getOrRegisterTrigger(variable: DerivedVariable): RecoilState<TriggerIndexValue> {
     const triggerKey = getRegistryKey(variable, 'trigger');
 
+    if (!triggerKeysByUid.has(variable.uid)) {
+        triggerKeysByUid.set(variable.uid, new Set());
+    }
+    triggerKeysByUid.get(variable.uid)!.add(triggerKey);
+
     if (!atomRegistry.has(triggerKey)) {
         atomRegistry.set(
             triggerKey,
@@ -38,6 +48,17 @@ export function getOrRegisterTrigger(variable: DerivedVariable): RecoilState<Tri
     return atomRegistry.get(triggerKey)!;
 }
 
+/**
+ * Get the registered trigger indexes of all instances of a variable
+ *
+ * @param uid uid of the variable
+ */
+export function getTriggersForUid(uid: string): Array<RecoilState<TriggerIndexValue>> {
+    return [...(triggerKeysByUid.get(uid) ?? [])]
+        .filter((triggerKey) => atomRegistry.has(triggerKey))
+        .map((triggerKey) => atomRegistry.get(triggerKey)!);
+}
+
 /**
  * Resolve current trigger index value for a variable from the atom registry.
  * If the atom is not registered, returns default values.
@@ -1,18 +1,44 @@
 import { useEffect } from 'react';
+import { useRecoilCallback } from 'recoil';
 
 import { type WebSocketClientInterface } from '@/api';
 import { useVariableState } from '@/shared/interactivity';
+import { getTriggersForUid } from '@/shared/interactivity/triggers';
 
 interface VariableStateProviderProps {
     wsClient: WebSocketClientInterface;
 }
 
 /**
- * Responds to server variable value requests
+ * Responds to server variable value requests and derived variable refresh notifications
  */
 function VariableStateProvider(props: VariableStateProviderProps): React.ReactNode {
     const getVariableState = useVariableState();
 
+    const refreshVariable = useRecoilCallback(
+        ({ set }) =>
+            (uid: string) => {
+                // Not forced, the server already cached the fresh value so re-requesting it is enough
+                for (const trigger of getTriggersForUid(uid)) {
+                    set(trigger, (triggerIndexValue) => ({
+                        force_key: null,
+                        inc: triggerIndexValue.inc + 1,
+                    }));
+                }
+            },
+        []
+    );
+
+    useEffect(() => {
+        const sub = props.wsClient?.derivedVariableRefreshMessages$().subscribe((message) => {
+            refreshVariable(message.uid);
+        });
+
+        return () => {
+            sub?.unsubscribe();
+        };
+    }, [props.wsClient, refreshVariable]);
+
     useEffect(() => {
         const sub = props.wsClient?.variableRequests$().subscribe(async (req) => {
             // Catch any errors when fetching the variable value otherwise this takes down the stream and no further
@@ -7,6 +7,7 @@ import {
     type BackendStoreMessage,
     type BackendStorePatchMessage,
     type CustomMessage,
+    type DerivedVariableRefreshMessage,
     type ProgressNotificationMessage,
     type ServerErrorMessage,
     type ServerVariableMessage,
@@ -17,6 +18,7 @@ import {
     isBackendStoreMessage,
     isBackendStorePatchMessage,
     isCustomMessage,
+    isDerivedVariableRefreshMessage,
     isInitMessage,
     isServerErrorMessage,
     isServerVariableMessage,
@@ -65,6 +67,13 @@ export default class MockWebSocketClient implements MockWebSocketClientInterface
         );
     }
 
+    derivedVariableRefreshMessages$(): Observable<DerivedVariableRefreshMessage['message']> {
+        return this.messages$.pipe(
+            filter(isDerivedVariableRefreshMessage),
+            map((msg) => msg.message)
+        );
+    }
+
     /**
      * Get the observable to receive the new channel when the socket reconnects
      */
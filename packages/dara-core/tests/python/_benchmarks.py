@@ -0,0 +1,505 @@
+"""
+Benchmark suite for Dara's hot paths.
+
+Each scenario records per-operation latencies and reports throughput plus p50/p99 latency. Run it from the
+``dara-core`` package directory so the test helpers and tasks can be imported:
+
+    python -m tests.python._benchmarks --output results.json
+
+Passing ``--baseline`` compares the results against a previous output file and exits with a non-zero status when a
+scenario regressed by more than ``--max-regression`` percent, e.g. to catch performance regressions before a release:
+
+    python -m tests.python._benchmarks --baseline baseline.json --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from tests.python._telemetry_overhead_benchmark import _percentile
+
+# Regressions below this absolute latency delta are measurement noise and are never reported
+MIN_REGRESSION_DELTA_MS = 0.05
+DEFAULT_MAX_REGRESSION = 20.0
+BENCHMARK_CHANNEL = 'benchmark_channel'
+
+
+@dataclass
+class BenchmarkOptions:
+    """Sizes shared by the scenarios, configurable from the command line."""
+
+    iterations: int | None
+    warmup: int
+    rows: int
+    preloads: int
+    clients: int
+    payload_mb: float
+    tree_nodes: int
+    seed: int
+
+
+@dataclass
+class Measurement:
+    """Latencies of the measured operations of one scenario."""
+
+    latencies_ns: list[int]
+    elapsed_ns: int
+
+    def summary(self) -> dict[str, float]:
+        return {
+            'iterations': len(self.latencies_ns),
+            'mean_ms': statistics.fmean(self.latencies_ns) / 1_000_000,
+            'p50_ms': _percentile(self.latencies_ns, 0.50) / 1_000_000,
+            'p99_ms': _percentile(self.latencies_ns, 0.99) / 1_000_000,
+            'ops_per_second': len(self.latencies_ns) / (self.elapsed_ns / 1_000_000_000),
+        }
+
+
+Operation = Callable[[int], Awaitable[None]]
+
+
+async def _measure(operation: Operation, iterations: int, warmup: int) -> Measurement:
+    """
+    Run an operation sequentially, timing each call.
+
+    :param operation: async callable receiving the iteration index
+    :param iterations: number of measured calls
+    :param warmup: number of unmeasured calls made first
+    """
+    for index in range(warmup):
+        await operation(-index - 1)
+
+    latencies_ns: list[int] = []
+    batch_started = perf_counter_ns()
+    for index in range(iterations):
+        started = perf_counter_ns()
+        await operation(index)
+        latencies_ns.append(perf_counter_ns() - started)
+    return Measurement(latencies_ns, perf_counter_ns() - batch_started)
+
+
+def _check(response, name: str):
+    if response.status_code != 200:
+        raise RuntimeError(f'{name} request failed with {response.status_code}: {response.text}')
+
+
+@cache
+def _dataframe(rows: int, seed: int):
+    """Build a seeded frame with numeric and string columns."""
+    import numpy
+    import pandas
+
+    rng = numpy.random.default_rng(seed)
+    return pandas.DataFrame(
+        {
+            'int_col': rng.integers(0, 1_000_000, rows),
+            'float_col': rng.random(rows),
+            'str_col': rng.choice(['alpha', 'beta', 'gamma', 'delta'], rows),
+        }
+    )
+
+
+def _components():
+    """Minimal components to put variables on a page."""
+    from pydantic import SerializeAsAny
+
+    from dara.core.definitions import ComponentInstance
+    from dara.core.interactivity.any_variable import AnyVariable
+
+    class Stack(ComponentInstance):
+        children: list
+
+        def __init__(self, *children):
+            super().__init__(children=children)
+
+    class Text(ComponentInstance):
+        text: SerializeAsAny[str | AnyVariable]
+
+    return Stack, Text
+
+
+async def _run_app_scenario(builder, iterations: int, warmup: int, make_operation) -> Measurement:
+    """
+    Start an app from a configuration builder and measure an operation against it.
+
+    :param builder: configuration of the app
+    :param iterations: number of measured calls
+    :param warmup: number of unmeasured calls made first
+    :param make_operation: callable receiving the client and auth headers and returning the operation to measure
+    """
+    from async_asgi_testclient import TestClient
+
+    from dara.core.main import _start_application
+
+    from tests.python.utils import _get_auth_headers, create_app
+
+    app = _start_application(create_app(builder))
+    async with TestClient(app) as client:
+        headers = await _get_auth_headers()
+        operation = await make_operation(client, headers)
+        return await _measure(operation, iterations, warmup)
+
+
+def _derived_variable_builder():
+    from dara.core.configuration import ConfigurationBuilder
+    from dara.core.interactivity import DerivedVariable, Variable
+
+    _Stack, Text = _components()
+    builder = ConfigurationBuilder()
+    first, second = Variable(), Variable()
+    derived = DerivedVariable(lambda a, b: a + b, variables=[first, second])
+    builder.router.add_page(path='benchmark', content=Text(text=derived))
+    return builder, derived
+
+
+def _derived_variable_body(derived, values: list) -> dict:
+    from tests.python.utils import normalize_request
+
+    normalized_values, lookup = normalize_request(values, derived.variables)
+    return {'values': {'data': normalized_values, 'lookup': lookup}, 'ws_channel': BENCHMARK_CHANNEL, 'force_key': None}
+
+
+async def derived_variable_cache_hit(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Fetch a DerivedVariable with the same arguments, served from the cache."""
+    builder, derived = _derived_variable_builder()
+    body = _derived_variable_body(derived, [1, 2])
+
+    async def make_operation(client, headers):
+        async def operation(_index: int):
+            _check(await client.post(f'/api/core/derived-variable/{derived.uid}', json=body, headers=headers), 'DV')
+
+        # Populate the cache before measuring
+        await operation(0)
+        return operation
+
+    return await _run_app_scenario(builder, iterations, options.warmup, make_operation)
+
+
+async def derived_variable_cache_miss(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Fetch a DerivedVariable with new arguments each time, so the resolver runs."""
+    builder, derived = _derived_variable_builder()
+    bodies = {index: _derived_variable_body(derived, [index, 1]) for index in range(-options.warmup, iterations)}
+
+    async def make_operation(client, headers):
+        async def operation(index: int):
+            _check(
+                await client.post(f'/api/core/derived-variable/{derived.uid}', json=bodies[index], headers=headers),
+                'DV',
+            )
+
+        return operation
+
+    return await _run_app_scenario(builder, iterations, options.warmup, make_operation)
+
+
+def _tabular_builder(options: BenchmarkOptions):
+    from dara.core.configuration import ConfigurationBuilder
+    from dara.core.interactivity.server_variable import ServerVariable
+
+    _Stack, Text = _components()
+    builder = ConfigurationBuilder()
+    variable = ServerVariable(default=_dataframe(options.rows, options.seed))
+    builder.router.add_page(path='benchmark', content=Text(text=variable))
+    return builder, variable
+
+
+async def _run_tabular_scenario(options: BenchmarkOptions, iterations: int, sort: bool) -> Measurement:
+    builder, variable = _tabular_builder(options)
+    rng = random.Random(options.seed)  # nosec B311 # deterministic benchmark inputs
+    sort_keys = ['int_col', '-float_col', 'str_col', '-int_col']
+    query_strings = {}
+    for index in range(-options.warmup, iterations):
+        query_string: dict[str, Any] = {'offset': rng.randrange(max(options.rows - 100, 1)), 'limit': 100}
+        if sort:
+            query_string['order_by'] = sort_keys[index % len(sort_keys)]
+        query_strings[index] = query_string
+
+    async def make_operation(client, headers):
+        async def operation(index: int):
+            response = await client.post(
+                f'/api/core/tabular-variable/{variable.uid}',
+                json={'filters': None, 'ws_channel': BENCHMARK_CHANNEL},
+                headers=headers,
+                query_string=query_strings[index],
+            )
+            _check(response, 'Tabular')
+
+        return operation
+
+    return await _run_app_scenario(builder, iterations, options.warmup, make_operation)
+
+
+async def tabular_paging(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Fetch random pages of a large ServerVariable."""
+    return await _run_tabular_scenario(options, iterations, sort=False)
+
+
+async def tabular_sorting(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Fetch random pages of a large ServerVariable sorted by alternating columns."""
+    return await _run_tabular_scenario(options, iterations, sort=True)
+
+
+async def route_loader_preloads(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Load a route preloading N DerivedVariables, computed with new arguments each time."""
+    from dara.core.configuration import ConfigurationBuilder
+    from dara.core.interactivity import DerivedVariable, Variable
+    from dara.core.router import Router
+
+    from tests.python.utils import ndjson, normalize_request
+
+    Stack, Text = _components()
+    builder = ConfigurationBuilder()
+    variable = Variable(default=0)
+    derived_variables = [
+        DerivedVariable(lambda value, offset=offset: value + offset, variables=[variable])
+        for offset in range(options.preloads)
+    ]
+    router = Router()
+    route = router.add_page(path='benchmark', content=Stack(*[Text(text=dv) for dv in derived_variables]))
+    builder.router = router
+
+    def _body(index: int) -> dict:
+        normalized_values, lookup = normalize_request([index], [variable])
+        return {
+            'action_payloads': [],
+            'derived_variable_payloads': [
+                {'uid': dv.uid, 'values': {'data': normalized_values, 'lookup': lookup}} for dv in derived_variables
+            ],
+            'py_component_payloads': [],
+            'params': {},
+            'ws_channel': BENCHMARK_CHANNEL,
+        }
+
+    bodies = {index: _body(index) for index in range(-options.warmup, iterations)}
+
+    async def make_operation(client, headers):
+        async def operation(index: int):
+            response = await client.post(
+                f'/api/core/route/{route.get_identifier()}', json=bodies[index], headers=headers
+            )
+            _check(response, 'Route loader')
+            preloaded = [chunk async for chunk in ndjson(response) if chunk['type'] == 'derived_variable']
+            if len(preloaded) != options.preloads:
+                raise RuntimeError(f'Route loader returned {len(preloaded)} of {options.preloads} preloads')
+
+        return operation
+
+    return await _run_app_scenario(builder, iterations, options.warmup, make_operation)
+
+
+async def websocket_broadcast(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Broadcast a message to N websocket handlers and encode it for each client as the websocket endpoint does."""
+    from fastapi.encoders import jsonable_encoder
+
+    from dara.core.internal.websocket import DaraServerMessage, WebsocketManager
+
+    manager = WebsocketManager()
+    handlers = [manager.create_handler(f'client_{index}') for index in range(options.clients)]
+    payload = {'uid': 'benchmark', 'sequence_number': 0, 'value': {'rows': list(range(20))}}
+
+    async def operation(_index: int):
+        await manager.broadcast(DaraServerMessage.create('ServerVariableMessage', payload))
+        for handler in handlers:
+            jsonable_encoder(await handler.receive_stream.receive())
+
+    return await _measure(operation, iterations, options.warmup)
+
+
+async def task_pool_round_trip(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Submit a task with a large DataFrame payload to the TaskPool and wait for it to be returned."""
+    from anyio import create_task_group
+
+    from dara.core.internal.pool import TaskPool
+
+    rows = max(int(options.payload_mb * 1024 * 1024 / 24), 1)
+    payload = _dataframe(rows, options.seed)
+
+    async with (
+        create_task_group() as tg,
+        TaskPool(task_group=tg, max_workers=1, worker_parameters={'task_module': 'tests.python.tasks'}) as pool,
+    ):
+        # Wait for the worker to start before measuring
+        await pool.submit('benchmark_start', 'identity_task', (None,))
+
+        async def operation(index: int):
+            result = await pool.submit(f'benchmark_{index}', 'identity_task', (payload,))
+            if len(result) != rows:
+                raise RuntimeError('TaskPool returned an unexpected payload')
+
+        return await _measure(operation, iterations, options.warmup)
+
+
+def _tree(nodes: int) -> dict:
+    """Build a serialized component tree where every other node references a variable."""
+    from dara.core.interactivity import DerivedVariable, Variable
+
+    variables = [Variable(default=index, uid=f'var_{index}') for index in range(64)]
+    derived = [
+        DerivedVariable(lambda x: x, variables=[variable], uid=f'dv_{i}') for i, variable in enumerate(variables)
+    ]
+    serialized = [variable.model_dump() for variable in variables + derived]
+
+    children: list[dict] = []
+    for index in range(nodes):
+        props: dict[str, Any] = {'label': f'node {index}', 'style': {'width': index % 100, 'flex': 1}}
+        if index % 2 == 0:
+            props['value'] = serialized[index % len(serialized)]
+        children.append({'name': 'Node', 'uid': f'node_{index}', 'props': props})
+
+    # Nest the nodes in groups so the tree has some depth
+    groups = [{'name': 'Stack', 'props': {'children': children[start : start + 50]}} for start in range(0, nodes, 50)]
+    return {'name': 'Root', 'props': {'children': groups}}
+
+
+async def normalize_denormalize(options: BenchmarkOptions, iterations: int) -> Measurement:
+    """Normalize and denormalize a large component tree."""
+    from dara.core.internal.normalization import denormalize, normalize
+
+    tree = _tree(options.tree_nodes)
+
+    async def operation(_index: int):
+        normalized, lookup = normalize(tree)
+        denormalize(normalized, lookup)
+
+    return await _measure(operation, iterations, options.warmup)
+
+
+# Scenario name -> (benchmark, default number of measured iterations)
+SCENARIOS: dict[str, tuple[Callable[[BenchmarkOptions, int], Awaitable[Measurement]], int]] = {
+    'derived_variable_cache_hit': (derived_variable_cache_hit, 500),
+    'derived_variable_cache_miss': (derived_variable_cache_miss, 500),
+    'tabular_paging': (tabular_paging, 100),
+    'tabular_sorting': (tabular_sorting, 20),
+    'route_loader_preloads': (route_loader_preloads, 100),
+    'websocket_broadcast': (websocket_broadcast, 200),
+    'task_pool_round_trip': (task_pool_round_trip, 20),
+    'normalize_denormalize': (normalize_denormalize, 20),
+}
+
+
+async def _run_scenarios(scenarios: list[str], options: BenchmarkOptions) -> dict[str, dict[str, float]]:
+    """Run the selected scenarios sequentially and summarize each of them."""
+    results = {}
+    for scenario in scenarios:
+        benchmark, default_iterations = SCENARIOS[scenario]
+        summary = (await benchmark(options, options.iterations or default_iterations)).summary()
+        results[scenario] = summary
+        print(
+            f'scenario={scenario} p50={summary["p50_ms"]:.3f}ms p99={summary["p99_ms"]:.3f}ms '
+            f'ops/s={summary["ops_per_second"]:.1f}',
+            flush=True,
+        )
+    return results
+
+
+def _find_regressions(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], max_regression: float
+) -> list[str]:
+    """
+    Describe the scenarios which got slower than the baseline by more than the allowed percentage.
+
+    :param results: scenario summaries of the current run
+    :param baseline: scenario summaries of the baseline run
+    :param max_regression: maximum allowed increase in latency, or decrease in throughput, in percent
+    """
+    regressions = []
+    for scenario, summary in results.items():
+        previous = baseline.get(scenario)
+        if previous is None:
+            continue
+
+        for metric in ('p50_ms', 'p99_ms'):
+            delta = summary[metric] - previous[metric]
+            if delta > MIN_REGRESSION_DELTA_MS and delta / previous[metric] * 100 > max_regression:
+                regressions.append(
+                    f'{scenario}: {metric} {summary[metric]:.3f}ms is {delta / previous[metric] * 100:.1f}% '
+                    f'slower than the baseline {previous[metric]:.3f}ms'
+                )
+
+        throughput_change = (summary['ops_per_second'] / previous['ops_per_second'] - 1) * 100
+        if -throughput_change > max_regression:
+            regressions.append(
+                f'{scenario}: throughput {summary["ops_per_second"]:.1f} ops/s is {-throughput_change:.1f}% '
+                f'lower than the baseline {previous["ops_per_second"]:.1f} ops/s'
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark suite, optionally comparing it against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--scenario', action='append', choices=list(SCENARIOS), help='scenario to run, defaults to all of them'
+    )
+    parser.add_argument('--iterations', type=int, help="measured iterations, overrides every scenario's default")
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows of the tabular frame')
+    parser.add_argument('--preloads', type=int, default=50, help='DerivedVariables preloaded by the route loader')
+    parser.add_argument('--clients', type=int, default=100, help='websocket clients receiving a broadcast')
+    parser.add_argument('--payload-mb', type=float, default=50, help='size of the TaskPool payload')
+    parser.add_argument('--tree-nodes', type=int, default=20_000, help='nodes of the normalized tree')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help='file to write the JSON results to')
+    parser.add_argument('--baseline', type=Path, help='previous results to compare against')
+    parser.add_argument(
+        '--max-regression',
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        metavar='PERCENT',
+        help='maximum allowed regression against the baseline',
+    )
+    arguments = parser.parse_args()
+
+    # Use the test settings and measure Dara itself rather than its telemetry
+    os.environ.setdefault('DARA_TEST_FLAG', 'TRUE')
+    os.environ.setdefault('DARA_OTEL_ENABLED', 'FALSE')
+    os.environ.setdefault('DARA_DISABLE_METRICS', 'TRUE')
+
+    import anyio
+
+    options = BenchmarkOptions(
+        iterations=arguments.iterations,
+        warmup=arguments.warmup,
+        rows=arguments.rows,
+        preloads=arguments.preloads,
+        clients=arguments.clients,
+        payload_mb=arguments.payload_mb,
+        tree_nodes=arguments.tree_nodes,
+        seed=arguments.seed,
+    )
+    scenarios = arguments.scenario or list(SCENARIOS)
+    result: dict[str, Any] = {
+        'metadata': {
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'options': {key: value for key, value in vars(options).items()},
+        },
+        'scenarios': anyio.run(_run_scenarios, scenarios, options),
+    }
+
+    if arguments.baseline is not None:
+        baseline = json.loads(arguments.baseline.read_text())
+        result['regressions'] = _find_regressions(result['scenarios'], baseline['scenarios'], arguments.max_regression)
+
+    serialized = json.dumps(result, indent=2, sort_keys=True)
+    if arguments.output is not None:
+        arguments.output.write_text(serialized)
+    print(f'DARA_BENCHMARK={serialized}')
+
+    if len(result.get('regressions', [])) > 0:
+        sys.exit('Performance regressions:\n' + '\n'.join(result['regressions']))
+
+
+if __name__ == '__main__':
+    main()
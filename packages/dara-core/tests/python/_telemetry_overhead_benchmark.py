@@ -1,4 +1,9 @@
-"""Measure Dara request overhead for representative telemetry configurations."""
+"""
+Measure Dara request overhead for representative telemetry configurations.
+
+With ``--gate`` the script exits with a non-zero status when the p50 overhead of a scenario exceeds its threshold,
+so it can be used as a regression gate, e.g. ``python tests/python/_telemetry_overhead_benchmark.py --gate``.
+"""
 
 import argparse
 import asyncio
@@ -41,7 +46,28 @@ SCENARIOS = {
         'OTEL_LOGS_EXPORTER': 'none',
         'OTEL_METRICS_EXPORTER': 'none',
     },
+    'combined_sampled': {
+        'DARA_OTEL_ENABLED': 'TRUE',
+        'DARA_DISABLE_METRICS': 'FALSE',
+        'DARA_OTEL_SAMPLE_RATES': '{"auth": 0.1, "cache": 0.1, "derived_variable": 0.1}',
+        'OTEL_TRACES_EXPORTER': 'none',
+        'OTEL_LOGS_EXPORTER': 'none',
+        'OTEL_METRICS_EXPORTER': 'none',
+    },
+}
+
+# Maximum p50 latency overhead against the disabled scenario, in percent, checked in CI with --gate. The benchmark
+# endpoint does almost no work, so the relative overhead is large: medians measured over 5 rounds were 113% for
+# prometheus and combined, 86% for traces_logs and 85% for combined_sampled. The thresholds leave about 12 points of
+# headroom over those values, which covers the spread between rounds.
+OVERHEAD_THRESHOLDS = {
+    'prometheus': 125.0,
+    'traces_logs': 100.0,
+    'combined': 125.0,
+    'combined_sampled': 100.0,
 }
+# Overheads below this absolute p50 delta are measurement noise and never fail the gate
+MIN_GATED_DELTA_MS = 0.05
 
 
 def _percentile(values: list[int], percentile: float) -> float:
@@ -162,6 +188,32 @@ def _overhead(summary: dict[str, float], baseline: dict[str, float]) -> dict[str
     }
 
 
+def _find_regressions(scenarios: dict[str, dict[str, float]], thresholds: dict[str, float]) -> list[str]:
+    """Describe the scenarios whose p50 overhead exceeds their threshold."""
+    regressions = []
+    for scenario, threshold in thresholds.items():
+        summary = scenarios.get(scenario)
+        if summary is None or 'p50_delta_percent' not in summary:
+            continue
+        if summary['p50_delta_percent'] > threshold and summary['p50_delta_ms'] > MIN_GATED_DELTA_MS:
+            regressions.append(
+                f'{scenario}: p50 overhead {summary["p50_delta_percent"]:.1f}% '
+                f'({summary["p50_delta_ms"]:.3f}ms) exceeds {threshold:.1f}%'
+            )
+    return regressions
+
+
+def _parse_thresholds(values: list[str]) -> dict[str, float]:
+    """Parse ``scenario=percent`` threshold overrides on top of the defaults."""
+    thresholds = dict(OVERHEAD_THRESHOLDS)
+    for value in values:
+        scenario, _, percent = value.partition('=')
+        if scenario not in SCENARIOS or scenario == 'disabled':
+            raise ValueError(f'Unknown benchmark scenario {scenario!r}')
+        thresholds[scenario] = float(percent)
+    return thresholds
+
+
 def _run_controller(warmup: int, requests: int, rounds: int) -> dict[str, Any]:
     """Run scenarios in alternating order to reduce systematic thermal drift."""
     results: dict[str, list[dict[str, float]]] = {scenario: [] for scenario in SCENARIOS}
@@ -209,6 +261,14 @@ def main() -> None:
     parser.add_argument('--warmup', type=int, default=300)
     parser.add_argument('--requests', type=int, default=3000)
     parser.add_argument('--rounds', type=int, default=7)
+    parser.add_argument('--gate', action='store_true', help='fail when an overhead threshold is exceeded')
+    parser.add_argument(
+        '--threshold',
+        action='append',
+        default=[],
+        metavar='SCENARIO=PERCENT',
+        help='override the maximum p50 overhead of a scenario',
+    )
     arguments = parser.parse_args()
 
     if arguments.worker:
@@ -216,9 +276,14 @@ def main() -> None:
         print(f'DARA_TELEMETRY_BENCHMARK={json.dumps(result, sort_keys=True)}')
         return
 
+    thresholds = _parse_thresholds(arguments.threshold)
     result = _run_controller(arguments.warmup, arguments.requests, arguments.rounds)
+    result['regressions'] = _find_regressions(result['scenarios'], thresholds)
     print(f'DARA_TELEMETRY_BENCHMARK={json.dumps(result, indent=2, sort_keys=True)}')
 
+    if arguments.gate and len(result['regressions']) > 0:
+        sys.exit('Telemetry overhead regressions:\n' + '\n'.join(result['regressions']))
+
 
 if __name__ == '__main__':
     main()
@@ -103,6 +103,17 @@ def track_task(updater: ProgressUpdater):
     return 'result'
 
 
+# Define a mock function with @track_progress that sends updates in a tight loop
+@track_progress(interval=0.2)
+def tight_loop_track_task(updater: ProgressUpdater):
+    for i in range(1, 1001):
+        if i % 100 == 0:
+            time.sleep(0.05)
+        updater.send_update(i / 10, f'Step {i}')
+
+    return 'result'
+
+
 # Define a second mock function with @track_progress that will send updates
 @track_progress
 def track_task_2(updater: ProgressUpdater):
@@ -20,6 +20,7 @@ from dara.core.auth.definitions import (
     UNAUTHORIZED_ERROR,
     TokenData,
 )
+from dara.core.auth.session import verified_session_cache
 from dara.core.auth.session_store import (
     AuthSessionBackend,
     FileAuthSessionBackend,
@@ -42,6 +43,7 @@ async def clear_cache():
     set_auth_session_backend(InMemoryAuthSessionBackend())
     yield
     token_refresh_cache.clear()
+    verified_session_cache.clear()
     await get_auth_session_backend().clear()
 
 
@@ -323,6 +325,109 @@ async def test_verify_session_cookie():
         assert response.json() == {'test': 'test'}
 
 
+async def test_verify_session_caches_verified_token():
+    """Check that a session token is verified once and the cached verification is dropped on revoke"""
+
+    @get('test-ext/test')
+    def handle():
+        return {'session_id': SESSION_ID.get()}
+
+    builder = ConfigurationBuilder()
+    builder.add_endpoint(handle)
+    config = builder._to_configuration()
+    app = _start_application(config)
+
+    async with AsyncClient(app) as client:
+        _, session_token = await _store_auth_session(
+            TokenData(
+                identity_id='user',
+                identity_name='user',
+                session_id='token1',
+                exp=datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(days=1),
+            )
+        )
+
+        with mock.patch.object(
+            type(config.auth_config), 'verify_token', autospec=True, side_effect=type(config.auth_config).verify_token
+        ) as verify_token:
+            for _ in range(5):
+                response = await client.get('/api/test-ext/test', headers={'Authorization': f'Bearer {session_token}'})
+                assert response.status_code == 200
+                # The auth context is restored for cached verifications
+                assert response.json() == {'session_id': 'token1'}
+
+            assert verify_token.call_count == 1
+
+            response = await client.post(
+                '/api/auth/revoke-session', headers={'Authorization': f'Bearer {session_token}'}
+            )
+            assert response.status_code == 200
+
+            response = await client.get('/api/test-ext/test', headers={'Authorization': f'Bearer {session_token}'})
+            assert response.status_code == 401
+
+
+async def test_verify_session_drops_cached_raw_token_on_revoke():
+    """Check that revoking a raw bearer token drops its cached verification straight away"""
+
+    @get('test-ext/test')
+    def handle():
+        return {'test': 'test'}
+
+    builder = ConfigurationBuilder()
+    builder.add_endpoint(handle)
+    config = builder._to_configuration()
+    app = _start_application(config)
+
+    async with AsyncClient(app) as client:
+        headers = {'Authorization': f'Bearer {TEST_TOKEN}'}
+
+        with mock.patch.object(
+            type(config.auth_config), 'verify_token', autospec=True, side_effect=type(config.auth_config).verify_token
+        ) as verify_token:
+            for _ in range(3):
+                response = await client.get('/api/test-ext/test', headers=headers)
+                assert response.status_code == 200
+            assert verify_token.call_count == 1
+
+            response = await client.post('/api/auth/revoke-session', headers=headers)
+            assert response.status_code == 200
+            verify_count = verify_token.call_count
+
+            # The token is verified again rather than served from the cache
+            await client.get('/api/test-ext/test', headers=headers)
+            assert verify_token.call_count == verify_count + 1
+
+
+async def test_verify_session_cookie_resolves_session_once():
+    """Check that a session cookie is looked up in the session backend once per request"""
+
+    @get('test-ext/test')
+    def handle():
+        return {'test': 'test'}
+
+    builder = ConfigurationBuilder()
+    builder.add_endpoint(handle)
+
+    app = _start_application(builder._to_configuration())
+
+    async with AsyncClient(app) as client:
+        _, session_token = await _store_auth_session(
+            TokenData(
+                identity_id='user',
+                identity_name='user',
+                session_id='token1',
+                exp=datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(days=1),
+            )
+        )
+        backend = get_auth_session_backend()
+
+        with mock.patch.object(backend, 'get', side_effect=backend.get) as backend_get:
+            response = await client.get('/api/test-ext/test', cookies={SESSION_TOKEN_COOKIE_NAME: session_token})
+            assert response.status_code == 200
+            assert backend_get.call_count == 1
+
+
 async def test_verify_session_invalid_cookie_clears_auth_cookies_without_refresh_token(
     caplog: pytest.LogCaptureFixture,
 ):
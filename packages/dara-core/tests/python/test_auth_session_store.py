@@ -201,6 +201,51 @@ async def test_file_auth_session_backend_clear_expired_preserves_active_sessions
     assert session_file(tmp_path, active_session_token).exists()
 
 
+async def test_file_auth_session_backend_clear_expired_only_reads_expired_sessions(tmp_path):
+    backend = FileAuthSessionBackend(path=tmp_path)
+
+    with freeze_time(timestamp_datetime(99.0)) as frozen_time:
+        with mock.patch(
+            'dara.core.auth.session_store.generate_auth_session_token',
+            side_effect=[f'token-{i}' for i in range(5)],
+        ):
+            expired_session_token = await backend.create('auth-token', token_data(session_id='expired', exp=100.0))
+            active_session_tokens = [
+                await backend.create('auth-token', token_data(session_id=f'session-{i}', exp=300.0)) for i in range(4)
+            ]
+
+        frozen_time.move_to(timestamp_datetime(160.1))
+        with mock.patch.object(backend, '_read_entry_file', wraps=backend._read_entry_file) as read_entry_file:
+            await backend.clear_expired()
+
+    assert read_entry_file.call_count == 1
+    assert not session_file(tmp_path, expired_session_token).exists()
+    assert all(session_file(tmp_path, token).exists() for token in active_session_tokens)
+
+
+async def test_file_auth_session_backend_clear_expired_keeps_sessions_refreshed_by_other_processes(tmp_path):
+    backend = FileAuthSessionBackend(path=tmp_path, index_rebuild_interval=0)
+    other_backend = FileAuthSessionBackend(path=tmp_path)
+
+    with freeze_time(timestamp_datetime(99.0)) as frozen_time:
+        with mock.patch('dara.core.auth.session_store.generate_auth_session_token', side_effect=['token-1', 'token-2']):
+            refreshed_session_token = await backend.create(
+                'auth-token-1', token_data(session_id='session-1', exp=100.0)
+            )
+            # Written by another process, only discovered by scanning the directory
+            other_session_token = await other_backend.create(
+                'auth-token-2', token_data(session_id='session-2', exp=100.0)
+            )
+
+        await other_backend.set(refreshed_session_token, 'auth-token-3', token_data(session_id='session-1', exp=300.0))
+
+        frozen_time.move_to(timestamp_datetime(160.1))
+        await backend.clear_expired()
+
+    assert session_file(tmp_path, refreshed_session_token).exists()
+    assert not session_file(tmp_path, other_session_token).exists()
+
+
 async def test_file_auth_session_backend_reads_from_memory_cache_after_file_load(tmp_path):
     writer = FileAuthSessionBackend(path=tmp_path)
 
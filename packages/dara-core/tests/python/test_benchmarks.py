@@ -0,0 +1,42 @@
+import pytest
+
+from tests.python._benchmarks import BenchmarkOptions, _find_regressions, _run_scenarios
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_benchmark_scenarios_record_latencies():
+    options = BenchmarkOptions(
+        iterations=3, warmup=1, rows=100, preloads=2, clients=2, payload_mb=0.01, tree_nodes=100, seed=0
+    )
+
+    results = await _run_scenarios(['normalize_denormalize', 'websocket_broadcast'], options)
+
+    assert set(results) == {'normalize_denormalize', 'websocket_broadcast'}
+    for summary in results.values():
+        assert summary['iterations'] == 3
+        assert 0 < summary['p50_ms'] <= summary['p99_ms']
+        assert summary['ops_per_second'] > 0
+
+
+def test_benchmark_baseline_comparison_detects_regressions():
+    baseline = {
+        'slower': {'p50_ms': 1.0, 'p99_ms': 2.0, 'ops_per_second': 1000.0},
+        'noise': {'p50_ms': 0.01, 'p99_ms': 0.02, 'ops_per_second': 1000.0},
+        'unchanged': {'p50_ms': 1.0, 'p99_ms': 2.0, 'ops_per_second': 1000.0},
+    }
+    results = {
+        'slower': {'p50_ms': 1.5, 'p99_ms': 2.1, 'ops_per_second': 700.0},
+        # Large relative but tiny absolute latency changes are ignored
+        'noise': {'p50_ms': 0.03, 'p99_ms': 0.04, 'ops_per_second': 1000.0},
+        'unchanged': {'p50_ms': 1.05, 'p99_ms': 2.0, 'ops_per_second': 990.0},
+        # Scenarios missing from the baseline are not compared
+        'new': {'p50_ms': 1.0, 'p99_ms': 2.0, 'ops_per_second': 1000.0},
+    }
+
+    regressions = _find_regressions(results, baseline, max_regression=20)
+
+    assert len(regressions) == 2
+    assert all(regression.startswith('slower') for regression in regressions)
+    assert any('p50_ms' in regression for regression in regressions)
+    assert any('throughput' in regression for regression in regressions)
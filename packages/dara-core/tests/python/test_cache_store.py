@@ -169,6 +169,36 @@ async def test_ttl_cache():
         assert await ttl_cache.get('f') is None  # "f" should be evicted since it's no longer pinned
 
 
+async def test_ttl_cache_stale_while_revalidate():
+    ttl_cache = TTLCache(policy=Cache.Policy.TTL(ttl=2, max_stale=5))
+
+    with freeze_time('2023-01-01 12:00:00'):
+        await ttl_cache.set('a', 1)
+        assert not ttl_cache.is_stale('a')
+
+    # Past the TTL but within the max-staleness window, the value is still served but reported as stale
+    with freeze_time('2023-01-01 12:00:03'):
+        assert await ttl_cache.get('a') == 1
+        assert ttl_cache.is_stale('a')
+
+        # Refreshing the value makes it fresh again
+        await ttl_cache.set('a', 2)
+        assert not ttl_cache.is_stale('a')
+
+    # Past the TTL and the max-staleness window, the value is evicted
+    with freeze_time('2023-01-01 12:00:10'):
+        assert await ttl_cache.get('a') is None
+        assert not ttl_cache.is_stale('a')
+
+    # Without max_stale entries are never reported as stale
+    plain_cache = TTLCache(policy=Cache.Policy.TTL(ttl=2))
+    with freeze_time('2023-01-01 12:00:00'):
+        await plain_cache.set('a', 1, pin=True)
+    with freeze_time('2023-01-01 12:00:03'):
+        assert await plain_cache.get('a') == 1
+        assert not plain_cache.is_stale('a')
+
+
 async def test_cache_store_global_api():
     # Sample store, we're not testing cache eviction so just use keep-all here
     store = CacheStore()
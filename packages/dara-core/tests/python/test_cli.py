@@ -77,3 +77,27 @@ def test_start_rejects_development_port_outside_hmr():
 
     assert result.exit_code != 0
     assert '--dev-port requires --enable-hmr' in result.output
+
+
+def test_start_passes_workers_to_uvicorn():
+    """Multiple workers are forwarded to uvicorn and exposed to the app processes."""
+    with (
+        patch.dict(os.environ),
+        patch('dara.core.cli.uvicorn.run') as run,
+    ):
+        result = CliRunner().invoke(cli, ['start', '--workers', '4', '--skip-jsbuild', '--disable-metrics'])
+        assert os.environ['DARA_WORKERS'] == '4'
+
+    assert result.exception is None
+    assert run.call_args.kwargs['workers'] == 4
+
+
+def test_start_rejects_workers_with_reload_or_metrics():
+    """Reloading and the per-process metrics server only support a single worker."""
+    result = CliRunner().invoke(cli, ['start', '--workers', '2', '--reload', '--disable-metrics'])
+    assert result.exit_code != 0
+    assert '--workers cannot be used with --reload' in result.output
+
+    result = CliRunner().invoke(cli, ['start', '--workers', '2'])
+    assert result.exit_code != 0
+    assert '--workers requires --disable-metrics' in result.output
@@ -0,0 +1,140 @@
+import os
+
+import numpy
+import pandas
+import pytest
+from async_asgi_testclient import TestClient
+
+from dara.core.configuration import ConfigurationBuilder
+from dara.core.data_utils import DataFactory, DatasetCache, dataset_cache
+from dara.core.definitions import ComponentInstance
+from dara.core.interactivity import DerivedVariable, Variable
+from dara.core.main import _start_application
+
+from tests.python.utils import _get_derived_variable, create_app
+
+
+class MockComponent(ComponentInstance):
+    text: DerivedVariable
+
+
+@pytest.fixture(autouse=True)
+def clear_dataset_cache():
+    dataset_cache.clear()
+    yield
+    dataset_cache.clear()
+
+
+def test_read_dataset_is_shared_between_reads(tmp_path):
+    factory = DataFactory(str(tmp_path))
+    df = pandas.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    factory.write_dataset(df, 'data.csv')
+
+    first = factory.read_dataset('data.csv')
+    assert first is not None
+    pandas.testing.assert_frame_equal(first, df)
+    # Served from the process-wide cache, sharing the data but not the frame
+    for second in (factory.read_dataset('data'), DataFactory(str(tmp_path)).read_dataset('data.parquet')):
+        assert second is not None
+        assert second is not first
+        assert numpy.shares_memory(second['a'].to_numpy(), first['a'].to_numpy())
+
+    # Structural changes do not leak into other reads
+    first['c'] = 1
+    first.drop(columns=['b'], inplace=True)
+    pandas.testing.assert_frame_equal(factory.read_dataset('data'), df)  # type: ignore
+
+    # Shared values are read-only, so in-place writes fail rather than changing other reads
+    shared = factory.read_dataset('data')
+    assert shared is not None
+    with pytest.raises(ValueError):
+        shared.loc[0, 'a'] = 10
+    with pytest.raises(ValueError):
+        shared['a'] += 1
+    pandas.testing.assert_frame_equal(factory.read_dataset('data'), df)  # type: ignore
+
+    # A copy can be modified freely
+    copied = shared.copy()
+    copied.loc[0, 'a'] = 10
+    assert copied['a'].tolist() == [10, 2, 3]
+
+    assert factory.read_dataset('missing') is None
+
+
+def test_read_dataset_is_refreshed_on_write(tmp_path):
+    factory = DataFactory(str(tmp_path))
+    factory.write_dataset(pandas.DataFrame({'a': [1]}), 'data')
+    assert factory.read_dataset('data')['a'].tolist() == [1]  # type: ignore
+
+    factory.write_dataset(pandas.DataFrame({'a': [2]}), 'data')
+    assert factory.read_dataset('data')['a'].tolist() == [2]  # type: ignore
+
+    # Changes made outside of the factory are picked up from the file's modification time
+    path = factory.get_dataset_path('data.parquet')
+    pandas.DataFrame({'a': [3]}).to_parquet(path)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000_000))
+    assert factory.read_dataset('data')['a'].tolist() == [3]  # type: ignore
+
+    factory.delete_dataset('data.parquet')
+    assert factory.read_dataset('data') is None
+
+
+def test_read_dataset_projects_columns_and_filters_row_groups(tmp_path):
+    factory = DataFactory(str(tmp_path))
+    df = pandas.DataFrame({'a': range(100), 'b': [float(i) for i in range(100)], 'c': ['x'] * 100})
+    path = factory.get_dataset_path('data.parquet')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_parquet(path, row_group_size=10)
+
+    projected = factory.read_dataset('data', columns=['b'])
+    assert projected is not None
+    assert projected.columns.tolist() == ['b']
+    assert factory.read_dataset('data', columns=['b']).columns.tolist() == ['b']  # type: ignore
+
+    filtered = factory.read_dataset('data', columns=['a', 'c'], filters=[('a', '>=', 95)])
+    assert filtered is not None
+    assert filtered['a'].tolist() == [95, 96, 97, 98, 99]
+    assert filtered.columns.tolist() == ['a', 'c']
+
+    # Filters received from the client are lists rather than tuples
+    filtered = factory.read_dataset('data', filters=[['a', '<', 2], ['c', '==', 'x']])
+    assert filtered['a'].tolist() == [0, 1]  # type: ignore
+
+
+def test_dataset_cache_evicts_least_recently_used(tmp_path):
+    cache = DatasetCache(max_entries=2)
+    paths = []
+    for name in ('first', 'second', 'third'):
+        path = str(tmp_path / f'{name}.parquet')
+        pandas.DataFrame({'a': [1]}).to_parquet(path)
+        paths.append(path)
+
+    first = cache.read(paths[0])
+    cache.read(paths[1])
+    # Access the first dataset so the second becomes least recently used
+    assert cache.read(paths[0]) is first
+    cache.read(paths[2])
+
+    assert cache.read(paths[0]) is first
+    assert len(cache._entries) == 2
+    assert all(key[0] != os.path.realpath(paths[1]) for key in cache._entries)
+
+
+@pytest.mark.anyio
+async def test_read_dataset_var(tmp_path):
+    factory = DataFactory(str(tmp_path))
+    factory.write_dataset(pandas.DataFrame({'a': range(10), 'b': range(10)}), 'data')
+
+    filters = Variable()
+    dataset = factory.read_dataset_var('data', columns=['a'], filters=filters)
+    builder = ConfigurationBuilder()
+    builder.router.add_page(path='test', content=MockComponent(text=dataset))
+
+    app = _start_application(create_app(builder))
+    async with TestClient(app) as client:
+        response = await _get_derived_variable(
+            client,
+            dataset,
+            {'values': ['data', 'global', ['a'], [['a', '>', 7]]], 'ws_channel': 'test_channel', 'force_key': None},
+        )
+        assert response.json()['value'] == {'a': {'0': 8, '1': 9}}
@@ -253,3 +253,20 @@ class TestControlFlowBoundaries:
         # Only the regular DV should be collected, not the conditional one
         assert len(graph.derived_variables) == 1
         assert dv_regular.uid in graph.derived_variables
+
+    def test_shared_component_instances_analyzed_once(self):
+        walked = []
+
+        class CountingComponent(MockComponent):
+            @property
+            def model_fields_set(self) -> set[str]:
+                walked.append(self)
+                return super().model_fields_set
+
+        dv = DerivedVariable(lambda: None, variables=[Variable(1)])
+        shared = CountingComponent(value=dv)
+        comp = MockComponent(children=[shared, MockComponent(children=[shared]), shared])
+
+        graph = DependencyGraph.from_component(comp)
+        assert list(graph.derived_variables) == [dv.uid]
+        assert walked == [shared]
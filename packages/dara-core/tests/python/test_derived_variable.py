@@ -1,9 +1,11 @@
 import asyncio
 import datetime
+import time
 from contextvars import ContextVar
 from unittest.mock import Mock
 from uuid import uuid4
 
+import anyio
 import jwt
 import pytest
 from anyio import create_task_group
@@ -13,7 +15,7 @@ from pydantic import BaseModel
 from dara.core import DerivedVariable, Variable
 from dara.core.auth.basic import MultiBasicAuthConfig
 from dara.core.auth.definitions import JWT_ALGO
-from dara.core.base_definitions import CacheType
+from dara.core.base_definitions import Cache, CacheType
 from dara.core.configuration import ConfigurationBuilder
 from dara.core.definitions import ComponentInstance
 from dara.core.interactivity.switch_variable import SwitchVariable
@@ -104,6 +106,180 @@ async def test_fetching_derived_variable():
         assert mock_func.call_count == 2
 
 
+async def test_stale_while_revalidate():
+    """Test that a stale value is served while it is refreshed in the background, then clients are notified"""
+    builder = ConfigurationBuilder()
+
+    var1 = Variable()
+    results = iter([1, 2])
+
+    def calc(_a):
+        return next(results)
+
+    mock_func = Mock(wraps=calc)
+
+    derived = DerivedVariable(mock_func, variables=[var1], cache=Cache.Policy.TTL(ttl=1, max_stale=60))
+
+    builder.add_page('Test', content=MockComponent(text=derived))
+
+    config = create_app(builder)
+
+    app = _start_application(config)
+    async with AsyncClient(app) as client, _async_ws_connect(client) as websocket:
+        init = await websocket.receive_json()
+        body = {'values': [5], 'ws_channel': init['message']['channel'], 'force_key': None}
+
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 1
+
+        await anyio.sleep(1.1)
+
+        # The expired value is served immediately while a refresh is started
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 1
+
+        # Clients are notified once the fresh value is cached
+        message = await websocket.receive_json()
+        assert message['__typename'] == 'DerivedVariableRefreshMessage'
+        assert message['message'] == {'uid': str(derived.uid)}
+
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 2
+        assert mock_func.call_count == 2
+
+
+async def test_stale_value_served_during_revalidation():
+    """Test that requests made while a stale value is being recomputed get the stale value without waiting"""
+    builder = ConfigurationBuilder()
+
+    var1 = Variable()
+    results = iter([1, 2])
+
+    def calc(_a):
+        result = next(results)
+        if result == 2:
+            # Slow recomputation, concurrent requests should not wait for it
+            time.sleep(2)
+        return result
+
+    mock_func = Mock(wraps=calc)
+
+    derived = DerivedVariable(mock_func, variables=[var1], cache=Cache.Policy.TTL(ttl=1, max_stale=60))
+
+    builder.add_page('Test', content=MockComponent(text=derived))
+
+    config = create_app(builder)
+
+    app = _start_application(config)
+    async with AsyncClient(app) as client, _async_ws_connect(client) as websocket:
+        init = await websocket.receive_json()
+        body = {'values': [5], 'ws_channel': init['message']['channel'], 'force_key': None}
+
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 1
+
+        await anyio.sleep(1.1)
+
+        # Starts the revalidation
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 1
+
+        # Wait for the recomputation to start
+        await anyio.sleep(0.2)
+        assert mock_func.call_count == 2
+
+        # A concurrent request during the revalidation gets the stale value immediately
+        start = time.monotonic()
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 1
+        assert time.monotonic() - start < 1
+
+        message = await websocket.receive_json()
+        assert message['__typename'] == 'DerivedVariableRefreshMessage'
+
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 2
+        assert mock_func.call_count == 2
+
+
+async def test_warm_derived_variable():
+    """Test that values warmed on startup are served from the cache"""
+    builder = ConfigurationBuilder()
+
+    var1 = Variable()
+    var2 = Variable()
+
+    def calc(a, b):
+        return a + b
+
+    mock_func = Mock(wraps=calc)
+
+    derived = DerivedVariable(mock_func, variables=[var1, var2])
+    session_derived = DerivedVariable(mock_func, variables=[var1, var2], cache=CacheType.SESSION)
+
+    @builder.on_startup
+    async def warm():
+        await derived.warm([(1, 2), (3, 4), (5, 6)], max_concurrency=2)
+
+    builder.add_page('Test', content=MockComponent(text=derived))
+
+    config = create_app(builder)
+
+    app = _start_application(config)
+    async with AsyncClient(app) as client:
+        assert mock_func.call_count == 3
+
+        response = await _get_derived_variable(
+            client,
+            derived,
+            {'values': [3, 4], 'ws_channel': 'test_channel', 'force_key': None},
+        )
+        assert response.json()['value'] == 7
+        assert mock_func.call_count == 3
+
+        # Values cached per session or user cannot be warmed
+        with pytest.raises(ValueError):
+            await session_derived.warm([(1, 2)])
+
+
+async def test_refresh_derived_variable():
+    """Test that refreshing recomputes cached values and notifies clients"""
+    builder = ConfigurationBuilder()
+
+    var1 = Variable()
+    results = iter([1, 2])
+
+    def calc(_a):
+        return next(results)
+
+    mock_func = Mock(wraps=calc)
+
+    derived = DerivedVariable(mock_func, variables=[var1], cache=Cache.Policy.KeepAll())
+
+    builder.add_page('Test', content=MockComponent(text=derived))
+
+    config = create_app(builder)
+
+    app = _start_application(config)
+    async with AsyncClient(app) as client, _async_ws_connect(client) as websocket:
+        init = await websocket.receive_json()
+        body = {'values': [5], 'ws_channel': init['message']['channel'], 'force_key': None}
+
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 1
+
+        await derived.refresh([(5,)])
+
+        message = await websocket.receive_json()
+        assert message['__typename'] == 'DerivedVariableRefreshMessage'
+        assert message['message'] == {'uid': str(derived.uid)}
+
+        # The fresh value is served from the cache
+        response = await _get_derived_variable(client, derived, dict(body))
+        assert response.json()['value'] == 2
+        assert mock_func.call_count == 2
+
+
 async def test_fetching_async_derived_variable():
     """Test that an async DerivedVariable can be fetched from the backend by passing the current values"""
 
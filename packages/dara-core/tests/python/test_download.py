@@ -1,4 +1,5 @@
 import inspect
+import io
 import os
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
@@ -6,6 +7,7 @@ from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 import anyio
+import pandas
 import pytest
 from async_asgi_testclient import TestClient as AsyncClient
 from exceptiongroup import BaseExceptionGroup
@@ -21,14 +23,16 @@ from dara.core.internal.download import (
     GENERATE_CODE_OVERRIDE,
     DownloadDataEntry,
     DownloadRegistryEntry,
+    csv_chunks,
     download,
     generate_download_code,
+    parquet_chunks,
 )
 from dara.core.internal.registries import utils_registry
 from dara.core.internal.registry import RegistryType
 from dara.core.main import _start_application
 
-from tests.python.utils import _async_ws_connect, _call_action, _get_auth_headers, get_action_results
+from tests.python.utils import _async_ws_connect, _call_action, _get_auth_headers, get_action_results, wait_assert
 
 pytestmark = pytest.mark.anyio
 
@@ -86,7 +90,7 @@ async def test_download():
     assert not os.path.exists('test_download.txt')
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
+@patch('dara.core.interactivity.actions.generate_uid', return_value='uid')
 async def test_download_content_extras(_uid):
     """
     Test that extras are passed through to the resolver
@@ -143,7 +147,7 @@ async def test_download_content_extras(_uid):
         assert entry.cleanup_file is True
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
+@patch('dara.core.interactivity.actions.generate_uid', return_value='uid')
 async def test_file_not_found(_uid):
     """
     Test that when file not found that it raises an error
@@ -195,7 +199,7 @@ async def test_file_not_found(_uid):
         assert "No such file or directory: './test.txt'" in error_msg
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
+@patch('dara.core.interactivity.actions.generate_uid', return_value='uid')
 async def test_file_cleanup(_uid):
     """
     Test that file is correctly streamed and cleaned up when cleanup_file flag is set to true
@@ -252,7 +256,7 @@ async def test_file_cleanup(_uid):
         assert not os.path.exists('./test_download_content.txt')
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
+@patch('dara.core.interactivity.actions.generate_uid', return_value='uid')
 async def test_file_cleanup_false(_uid):
     """
     Test that file is not cleaned up if cleanup_file is False
@@ -372,3 +376,194 @@ async def test_download_code_override():
 
     code = await generate_download_code('test_download.txt', cleanup_file=True)
     assert code == 'test_download.txt_override'
+
+
+async def test_download_supports_resuming_with_range_requests(tmp_path):
+    """
+    Test that an interrupted download can be resumed with a Range request, and the file is cleaned up once complete
+    """
+    file_path = tmp_path / 'large.bin'
+    content = bytes(range(256)) * 4
+    file_path.write_bytes(content)
+
+    config = ConfigurationBuilder()._to_configuration()
+    app = _start_application(config)
+
+    async with AsyncClient(app) as client:
+        headers = await _get_auth_headers()
+        code = await generate_download_code(str(file_path), cleanup_file=True)
+
+        # The first request only receives part of the file, e.g. the connection dropped
+        response = await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=0-99'})
+        assert response.status_code == 206
+        assert response.content == content[:100]
+        assert response.headers['Content-Range'] == f'bytes 0-99/{len(content)}'
+        assert file_path.exists()
+
+        # The code can't be used to download the file again from the start
+        with pytest.raises((BaseExceptionGroup, ValueError)):
+            await client.get(f'/api/core/download?code={code}', headers=headers)
+
+        # Resume the download until the end of the file
+        response = await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=100-'})
+        assert response.status_code == 206
+        assert response.content == content[100:]
+        assert not file_path.exists()
+
+        # The download is complete, so the code is used up
+        with pytest.raises((BaseExceptionGroup, ValueError)):
+            await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=100-'})
+
+
+async def test_download_only_completes_once_every_byte_is_sent(tmp_path):
+    """
+    Test that a range reaching the end of the file does not complete the download until the rest has been sent
+    """
+    file_path = tmp_path / 'large.bin'
+    content = bytes(range(256)) * 4
+    file_path.write_bytes(content)
+
+    config = ConfigurationBuilder()._to_configuration()
+    app = _start_application(config)
+
+    async with AsyncClient(app) as client:
+        headers = await _get_auth_headers()
+        code = await generate_download_code(str(file_path), cleanup_file=True)
+
+        # The suffix of the file is fetched first, e.g. to read a parquet footer
+        response = await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=-100'})
+        assert response.status_code == 206
+        assert response.content == content[-100:]
+        assert file_path.exists()
+
+        response = await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=0-499'})
+        assert response.content == content[:500]
+        assert file_path.exists()
+
+        response = await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=400-923'})
+        assert response.content == content[400:924]
+        assert not file_path.exists()
+
+
+async def test_interrupted_download_is_cleaned_up_after_resume_window(tmp_path):
+    file_path = tmp_path / 'large.bin'
+    file_path.write_bytes(b'x' * 1000)
+
+    config = ConfigurationBuilder()._to_configuration()
+    app = _start_application(config)
+
+    with patch('dara.core.internal.download.RESUMABLE_DOWNLOAD_WINDOW', 0.1):
+        async with AsyncClient(app) as client:
+            headers = await _get_auth_headers()
+            code = await generate_download_code(str(file_path), cleanup_file=True)
+
+            response = await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=0-99'})
+            assert response.status_code == 206
+
+            # Cleaned up without waiting for another request
+            await wait_assert(lambda: not file_path.exists(), timeout=2)
+            with pytest.raises((BaseExceptionGroup, ValueError)):
+                await client.get(f'/api/core/download?code={code}', headers={**headers, 'Range': 'bytes=100-'})
+
+
+async def test_download_sets_content_length(tmp_path):
+    file_path = tmp_path / 'data.csv'
+    file_path.write_text('a,b\n1,2\n')
+
+    config = ConfigurationBuilder()._to_configuration()
+    app = _start_application(config)
+
+    async with AsyncClient(app) as client:
+        code = await generate_download_code(str(file_path), cleanup_file=False)
+        response = await client.get(f'/api/core/download?code={code}', headers=await _get_auth_headers())
+        assert response.status_code == 200
+        assert response.content == b'a,b\n1,2\n'
+        assert response.headers['Content-Length'] == str(len(b'a,b\n1,2\n'))
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert file_path.exists()
+
+
+async def test_download_streams_content():
+    """
+    Test that content passed to a download code is streamed chunk by chunk without a file
+    """
+    config = ConfigurationBuilder()._to_configuration()
+    app = _start_application(config)
+
+    async def generate_lines():
+        for idx in range(3):
+            yield f'line {idx}\n'.encode()
+
+    async with AsyncClient(app) as client:
+        headers = await _get_auth_headers()
+        code = await generate_download_code('report.txt', cleanup_file=False, content=generate_lines())
+
+        response = await client.get(f'/api/core/download?code={code}', headers=headers)
+        assert response.status_code == 200
+        assert response.content == b'line 0\nline 1\nline 2\n'
+        assert response.headers['Content-Disposition'] == 'attachment; filename=report.txt'
+        assert response.headers['Content-Type'].startswith('text/plain')
+
+        # Streamed content is consumed, so the code is used up
+        with pytest.raises((BaseExceptionGroup, ValueError)):
+            await client.get(f'/api/core/download?code={code}', headers=headers)
+
+
+def test_dataframe_chunk_encoders():
+    df = pandas.DataFrame(
+        {'a': range(25), 'b': [float(i) for i in range(25)], 'c': ['y'] * 10 + ['x'] * 15},
+        index=pandas.Index([f'row_{i}' for i in range(25)], name='key'),
+    )
+
+    chunks = list(csv_chunks(df, chunk_rows=10))
+    # Header followed by one chunk per 10 rows
+    assert len(chunks) == 4
+    assert chunks[0] == b'key,a,b,c\n'
+    pandas.testing.assert_frame_equal(pandas.read_csv(io.BytesIO(b''.join(chunks)), index_col=0), df)
+
+    chunks = list(parquet_chunks(df, chunk_rows=10))
+    # One row group per 10 rows, followed by the footer
+    assert len(chunks) == 4
+    pandas.testing.assert_frame_equal(pandas.read_parquet(io.BytesIO(b''.join(chunks))), df)
+
+    # Default index is not stored, and columns keep their type even if a row group only contains nulls
+    df = pandas.DataFrame({'c': [None] * 10 + ['x'] * 15})
+    pandas.testing.assert_frame_equal(pandas.read_parquet(io.BytesIO(b''.join(parquet_chunks(df, chunk_rows=10)))), df)
+
+
+@patch('dara.core.interactivity.actions.generate_uid', return_value='uid')
+async def test_download_content_streams_dataframe(_uid):
+    """
+    Test that a DataFrame returned by the resolver is streamed in the format of the file name
+    """
+    builder = ConfigurationBuilder()
+    df = pandas.DataFrame({'a': range(100), 'b': ['x'] * 100})
+
+    action = DownloadContent(lambda _ctx: df, file_name='data.parquet')
+    builder.router.add_page(path='test', content=MockComponent(text='test', action=action))
+
+    config = builder._to_configuration()
+    app = _start_application(config)
+
+    async with AsyncClient(app) as client, _async_ws_connect(client) as websocket:
+        init = await websocket.receive_json()
+        exec_uid = 'exec_uid'
+
+        await _call_action(
+            client,
+            action,
+            data={
+                'input': None,
+                'values': {},
+                'ws_channel': init.get('message', {}).get('channel'),
+                'execution_id': exec_uid,
+            },
+        )
+
+        action_results = await get_action_results(websocket, exec_uid)
+        url = action_results[0].get('url')
+
+        response = await client.get(url, headers=await _get_auth_headers())
+        assert response.status_code == 200
+        assert response.headers['Content-Disposition'] == 'attachment; filename=data.parquet'
+        pandas.testing.assert_frame_equal(pandas.read_parquet(io.BytesIO(response.content)), df)
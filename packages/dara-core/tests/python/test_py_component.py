@@ -2,6 +2,8 @@ import os
 from unittest.mock import Mock
 
 import anyio
+import numpy
+import pandas
 import pytest
 from async_asgi_testclient import TestClient as AsyncClient
 from pydantic import BaseModel
@@ -10,8 +12,10 @@ from dara.core import DerivedVariable, SwitchVariable, Variable, py_component
 from dara.core.base_definitions import Cache
 from dara.core.configuration import ConfigurationBuilder
 from dara.core.definitions import BaseFallback, ComponentInstance
+from dara.core.internal.registries import component_registry
 from dara.core.main import _start_application
 from dara.core.router import PageRoute, Router
+from dara.core.visual.dynamic_component import _get_cache_key
 
 from tests.python.tasks import (
     add,
@@ -1585,3 +1589,80 @@ async def test_nested_derived_variable_missing_path_in_py_component():
             },
         )
         assert data == {'name': 'MockComponent', 'props': {'text': 'None'}, 'uid': 'uid'}
+
+
+async def test_cached_py_component():
+    """Check that a py_component with a cache policy only renders once for the same resolved arguments"""
+    builder = ConfigurationBuilder()
+    calls = []
+
+    @py_component(cache=Cache.Policy.LRU(max_size=2))
+    def TestCachedComp(input_val: str, static_val: str):
+        calls.append(input_val)
+        return MockComponentTwo(text=input_val, text2=static_val)
+
+    var = Variable()
+    builder.router = Router()
+    builder.router.add_page(path='test', content=TestCachedComp(var, 'static'), id='test')
+
+    config = create_app(builder)
+
+    app = _start_application(config)
+    async with AsyncClient(app) as client:
+        response, status = await _get_template(client, page_id='test')
+        component = response['template']
+
+        async def _render(value: str):
+            return await _get_py_component(
+                client,
+                component.get('name'),
+                kwargs={'input_val': var},
+                data={'uid': component.get('uid'), 'values': {'input_val': value}, 'ws_channel': 'test_channel'},
+            )
+
+        expected = {'name': 'MockComponentTwo', 'props': {'text': 'first', 'text2': 'static'}, 'uid': 'uid'}
+        assert await _render('first') == expected
+        assert await _render('first') == expected
+        assert calls == ['first']
+
+        assert (await _render('second'))['props']['text'] == 'second'
+        assert await _render('first') == expected
+        assert calls == ['first', 'second']
+
+
+def test_py_component_cache_key():
+    df = pandas.DataFrame({'a': range(1000)})
+    changed = df.copy()
+    changed.loc[500, 'a'] = -1
+
+    assert _get_cache_key({'df': df, 'value': 1}) == _get_cache_key({'value': 1, 'df': df.copy()})
+    # Differences hidden from the truncated string representation still change the key
+    assert _get_cache_key({'df': df, 'value': 1}) != _get_cache_key({'df': changed, 'value': 1})
+    assert _get_cache_key({'df': df}) != _get_cache_key({'df': df.rename(columns={'a': 'b'})})
+    assert _get_cache_key({'df': df}) != _get_cache_key({'df': df.rename_axis('idx')})
+    assert _get_cache_key({'s': df['a']}) != _get_cache_key({'s': df['a'].rename('b')})
+
+    array = numpy.arange(6)
+    assert _get_cache_key({'array': array}) == _get_cache_key({'array': array.copy()})
+    assert _get_cache_key({'array': array}) != _get_cache_key({'array': array.reshape(2, 3)})
+    assert _get_cache_key({'array': array}) != _get_cache_key({'array': array.astype('int32')})
+
+    # Values are never confused with their string representation
+    assert _get_cache_key({'value': numpy.int64(1)}) != _get_cache_key({'value': '1'})
+
+    # Values which cannot be hashed faithfully are not cached
+    assert _get_cache_key({'value': object()}) is None
+    assert _get_cache_key({'array': numpy.array([object()])}) is None
+
+
+def test_py_component_cache_policy_defaults_to_session():
+    @py_component(cache=Cache.Policy.LRU(max_size=2))
+    def SessionComp():
+        return MockComponentTwo(text='a', text2='b')
+
+    @py_component(cache=Cache.Policy.LRU(max_size=2, cache_type=Cache.Type.GLOBAL))
+    def GlobalComp():
+        return MockComponentTwo(text='a', text2='b')
+
+    assert component_registry.get(type(SessionComp()).__name__).cache.cache_type == Cache.Type.SESSION
+    assert component_registry.get(type(GlobalComp()).__name__).cache.cache_type == Cache.Type.GLOBAL
@@ -3,6 +3,7 @@ import pytest
 from dara.core.configuration import ConfigurationBuilder
 from dara.core.defaults import default_template
 from dara.core.definitions import ComponentInstance
+from dara.core.interactivity.derived_variable import DerivedVariable
 from dara.core.interactivity.plain_variable import Variable
 from dara.core.router import IndexRoute, LayoutRoute, Outlet, PageRoute, PrefixRoute, Router, convert_template_to_router
 from dara.core.visual.components.router_content import RouterContent
@@ -630,3 +631,26 @@ class TestCompilation:
         content = router.children[0].compiled_data.content
 
         assert isinstance(content, Text)
+
+    def test_dependency_graphs_compiled_per_route(self):
+        """
+        Test that compiling the router stores the dependency graph of each route's content in its route data
+        """
+
+        class Text(ComponentInstance):
+            text: Variable[str] | DerivedVariable
+
+        layout_dv = DerivedVariable(lambda: 'layout', variables=[])
+        page_dv = DerivedVariable(lambda: 'page', variables=[])
+
+        router = Router()
+        layout = router.add_layout(content=Text(text=layout_dv))
+        layout.add_page(path='page', content=lambda: Text(text=page_dv))
+        router.add_prefix(path='prefix')
+        router.compile()
+
+        route_map = {data.definition.full_path: data for data in router.to_route_map().values()}  # type: ignore
+        assert list(route_map['/page'].dependency_graph.derived_variables) == [page_dv.uid]  # type: ignore
+        assert list(route_map['/'].dependency_graph.derived_variables) == [layout_dv.uid]  # type: ignore
+        # Prefix routes have no content to analyze
+        assert route_map['/prefix'].dependency_graph is None
@@ -1,9 +1,20 @@
 import datetime
+import time
 from unittest.mock import MagicMock
 
+import anyio
 import pytest
+from async_asgi_testclient import TestClient as AsyncClient
 
+from dara.core.configuration import ConfigurationBuilder
+from dara.core.interactivity.server_variable import ServerVariable
 from dara.core.internal import scheduler
+from dara.core.internal.scheduler import InProcessScheduler, MissedRunPolicy
+from dara.core.main import _start_application
+from dara.core.persistence import BackendStore, FileBackend
+from dara.core.shared_state import FileLockSingleFlight
+
+from tests.python.utils import create_app, wait_assert
 
 
 class PickledMock(MagicMock):
@@ -112,3 +123,187 @@ def test_run_once():
     scheduled_job_process.join()
     # If joining the test causes the process to hang, the test will exceed the timeout and fail
     scheduled_job_process.close()
+
+
+def test_in_process_next_run_times():
+    """Test that the in-process triggers compute the next run of interval, cron and time jobs"""
+    # Wednesday 2024-01-03 12:00 UTC
+    now = datetime.datetime(2024, 1, 3, 12, 0, tzinfo=datetime.timezone.utc).timestamp()
+
+    interval_job = scheduler.every(10).seconds()
+    assert interval_job.next_run_time(now) == now + 10
+    assert interval_job.next_run_time(now, now + 10) == now + 20
+    assert scheduler.on(10).seconds().next_run_time(now, now + 10) is None
+
+    assert scheduler.cron('0 0 * * *').next_run_time(now) == now + 12 * 3600
+
+    assert scheduler.every().day().at('15:15').next_run_time(now) == now + 3 * 3600 + 15 * 60
+    assert scheduler.every().day().at('10:00').next_run_time(now) == now + 22 * 3600
+    assert scheduler.every().day().at('10:00').next_run_time(now, now) == now + 86400
+    # Monday, 0 being Sunday
+    assert scheduler.every().monday().at('12:00').next_run_time(now) == now + 5 * 86400
+    assert scheduler.every().wednesday().at('12:00').next_run_time(now) == now + 7 * 86400
+
+
+def test_in_process_scheduler_rejects_zero_interval():
+    with pytest.raises(ValueError):
+        InProcessScheduler().add(scheduler.every(0).seconds().in_process(), lambda: None)
+
+
+@pytest.mark.parametrize(
+    'policy, expected_runs',
+    [(MissedRunPolicy.SKIP, 0), (MissedRunPolicy.RUN_ONCE, 1), (MissedRunPolicy.RUN_ALL, 6)],
+)
+def test_in_process_scheduler_missed_runs(policy, expected_runs):
+    """Test that runs missed while the scheduler was busy are handled according to the job's policy"""
+    engine = InProcessScheduler()
+    engine.add(scheduler.every(10).seconds().in_process(missed_runs=policy), lambda: None)
+    due, _, entry = engine._heap.pop()
+
+    # Woken up 55 seconds late, so 5 further runs fell due in the meantime
+    assert engine._collect_runs(entry, due, due + 55) == expected_runs
+    assert engine._heap[0][0] == due + 60
+
+    # Runs within the grace time are not missed
+    due, _, entry = engine._heap.pop()
+    assert engine._collect_runs(entry, due, due + 0.5) == 1
+
+
+@pytest.mark.parametrize(
+    'policy, expected_pending_runs',
+    [(MissedRunPolicy.SKIP, 0), (MissedRunPolicy.RUN_ONCE, 1), (MissedRunPolicy.RUN_ALL, 3)],
+)
+def test_in_process_scheduler_prevents_overlapping_runs(policy, expected_pending_runs):
+    engine = InProcessScheduler()
+    engine.add(scheduler.every(1).seconds().in_process(missed_runs=policy), lambda: None)
+    entry = engine.jobs[0]
+
+    assert engine._queue_runs(entry, 1)
+    entry.pending_runs = 0
+
+    # The previous run is still in progress, no new runner is started
+    assert not engine._queue_runs(entry, 1)
+    assert not engine._queue_runs(entry, 2)
+    assert entry.pending_runs == expected_pending_runs
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_in_process_scheduler_runs_jobs():
+    """Test that async and sync jobs run in the app process on a shared timer"""
+    async_runs = []
+    sync_runs = []
+
+    async def async_job(value):
+        async_runs.append(value)
+
+    def sync_job():
+        sync_runs.append(time.time())
+        raise ValueError('Errors are logged and do not stop the job')
+
+    engine = InProcessScheduler()
+    engine.add(scheduler.every(1).seconds().in_process(), async_job, ['value'])
+    engine.add(scheduler.on(1).second().in_process(), sync_job)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(engine.run)
+        await wait_assert(lambda: len(async_runs) >= 2, timeout=5)
+        engine.stop()
+
+    assert async_runs[:2] == ['value', 'value']
+    assert len(sync_runs) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_in_process_scheduler_runs_elected(tmp_path):
+    """Test that only the scheduler holding the flight runs its jobs, another one takes over once released"""
+    runs = {'first': 0, 'second': 0}
+
+    def _create_scheduler(name: str):
+        async def job():
+            runs[name] += 1
+
+        engine = InProcessScheduler()
+        engine.add(scheduler.every(1).seconds().in_process(), job)
+        return engine
+
+    first = _create_scheduler('first')
+    second = _create_scheduler('second')
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(first.run_elected, FileLockSingleFlight(tmp_path, timeout=0), 'scheduler', 0.05)
+        await wait_assert(lambda: runs['first'] >= 1, timeout=5)
+        tg.start_soon(second.run_elected, FileLockSingleFlight(tmp_path, timeout=0), 'scheduler', 0.05)
+        await anyio.sleep(1.5)
+        assert runs['second'] == 0
+
+        first.stop()
+        await wait_assert(lambda: runs['second'] >= 1, timeout=5)
+        second.stop()
+
+
+def test_scheduled_jobs_with_shared_targets_run_in_a_single_worker(tmp_path):
+    """Test that only jobs writing to targets shared between processes are marked to run in a single worker"""
+    builder = ConfigurationBuilder()
+
+    def refresh():
+        return 1
+
+    builder.scheduler(scheduler.every(1).seconds().in_process())(refresh)
+    builder.scheduler(scheduler.every(1).seconds(), target=ServerVariable(scope='global'))(refresh)
+    builder.scheduler(scheduler.every(1).seconds(), target=BackendStore())(refresh)
+    builder.scheduler(
+        scheduler.every(1).seconds(), target=BackendStore(backend=FileBackend(path=str(tmp_path / 'store.json')))
+    )(refresh)
+
+    assert [job.single_runner for job, _, _ in builder.scheduled_jobs] == [False, False, False, True]
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_in_process_scheduled_job_runs_with_app():
+    """Test that in-process jobs registered on the config run during the app lifespan without a process"""
+    builder = ConfigurationBuilder()
+    runs = []
+
+    @builder.scheduler(scheduler.every(1).seconds().in_process())
+    async def refresh():
+        runs.append(1)
+
+    app = _start_application(create_app(builder))
+
+    async with AsyncClient(app):
+        await wait_assert(lambda: len(runs) >= 1, timeout=5)
+
+
+@pytest.mark.anyio
+@pytest.mark.timeout(10)
+async def test_scheduled_job_writes_result_to_target():
+    """Test that the result of a job with a target is written to it, running the job in the app process"""
+    builder = ConfigurationBuilder()
+    prices = ServerVariable(scope='global')
+    results = iter(range(100))
+
+    job = scheduler.every(1).seconds()
+
+    @builder.scheduler(job, target=prices)
+    def refresh_prices():
+        return {'price': next(results)}
+
+    assert builder.scheduled_jobs[-1][0].run_in_process
+    # The job passed in is not modified
+    assert not job.run_in_process
+    # The decorated function is left unchanged
+    assert refresh_prices() == {'price': 0}
+
+    app = _start_application(create_app(builder))
+
+    async def refreshed():
+        return await prices.read() == {'price': 1}
+
+    async with AsyncClient(app):
+        await wait_assert(refreshed, timeout=5)
+
+    with pytest.raises(ValueError):
+        builder.scheduler(scheduler.every(1).seconds(), target=ServerVariable(scope='user'))
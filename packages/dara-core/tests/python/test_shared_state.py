@@ -0,0 +1,529 @@
+from contextlib import asynccontextmanager
+from typing import ClassVar
+from unittest.mock import patch
+
+import anyio
+import pandas
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from dara.core.base_definitions import Cache, CachedRegistryEntry, PendingTask
+from dara.core.configuration import ConfigurationBuilder
+from dara.core.interactivity import derived_variable
+from dara.core.interactivity.derived_variable import DerivedVariable, DerivedVariableRegistryEntry
+from dara.core.internal.cache_store import CacheStore
+from dara.core.internal.settings import get_settings
+from dara.core.internal.websocket import DaraServerMessage, WebsocketManager
+from dara.core.main import _start_application
+from dara.core.shared_state import (
+    DiskCacheBackend,
+    FileLockSingleFlight,
+    SQLiteMessageBus,
+    SQLiteSharedCacheBackend,
+    purge_expired_entries,
+    resolve_message_bus,
+    resolve_shared_cache_backend,
+    resolve_single_flight,
+)
+
+from tests.python.utils import wait_for
+
+pytestmark = pytest.mark.anyio
+
+
+class SharedEntry(CachedRegistryEntry):
+    shared: ClassVar[bool] = True
+
+
+async def test_sqlite_cache_backend(tmp_path):
+    backend = SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3')
+
+    with pytest.raises(KeyError):
+        await backend.get('missing')
+
+    await backend.set('a', {'value': 1})
+    await backend.set('none', None)
+    assert await backend.get('a') == {'value': 1}
+    # None is a valid stored value, distinct from a miss
+    assert await backend.get('none') is None
+
+    await backend.delete('a')
+    with pytest.raises(KeyError):
+        await backend.get('a')
+
+    await backend.clear()
+    with pytest.raises(KeyError):
+        await backend.get('none')
+
+
+async def test_sqlite_cache_backend_ttl(tmp_path):
+    backend = SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3')
+
+    await backend.set('a', 1, ttl=0.1)
+    assert await backend.get('a') == 1
+
+    await anyio.sleep(0.2)
+    with pytest.raises(KeyError):
+        await backend.get('a')
+
+    await backend.clear_expired()
+
+
+async def test_cache_store_shares_values_between_processes(tmp_path):
+    """Two stores backed by the same shared backend behave like two app processes"""
+    path = tmp_path / 'state.sqlite3'
+    first_store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+    second_store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+    entry = SharedEntry(uid='dv', cache=Cache.Policy.LRU(max_size=2))
+
+    await first_store.set(entry, 'key', 'value')
+    assert await second_store.get(entry, 'key') == 'value'
+
+    # The value is now held locally by the second store as well
+    assert 'value' in second_store.registry_stores[entry.to_store_key()].values()
+
+    await first_store.delete(entry, 'key')
+    assert await CacheStore(shared_backend=SQLiteSharedCacheBackend(path)).get(entry, 'key') is None
+
+    with pytest.raises(KeyError):
+        await CacheStore(shared_backend=SQLiteSharedCacheBackend(path)).get(entry, 'key', raise_for_missing=True)
+
+
+async def test_cache_store_expires_shared_entries_without_ttl(tmp_path, monkeypatch):
+    """Shared values of policies without a TTL expire after the default TTL, as local eviction does not reach them"""
+    monkeypatch.setenv('DARA_SHARED_CACHE_DEFAULT_TTL_SECONDS', '0.1')
+    get_settings.cache_clear()
+
+    try:
+        path = tmp_path / 'state.sqlite3'
+        store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+        entry = SharedEntry(uid='dv', cache=Cache.Policy.LRU(max_size=2))
+
+        await store.set(entry, 'key', 'value')
+        assert await CacheStore(shared_backend=SQLiteSharedCacheBackend(path)).get(entry, 'key') == 'value'
+
+        await anyio.sleep(0.2)
+        assert await CacheStore(shared_backend=SQLiteSharedCacheBackend(path)).get(entry, 'key') is None
+    finally:
+        get_settings.cache_clear()
+
+
+async def test_purge_expired_entries(tmp_path):
+    backend = SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3')
+    await backend.set('expired', 1, ttl=0.01)
+    await backend.set('kept', 2)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(purge_expired_entries, backend, 0.05)
+        await anyio.sleep(0.2)
+        tg.cancel_scope.cancel()
+
+    assert backend._db.execute('SELECT key FROM dara_cache') == [('kept',)]
+
+    class _NoPurgeBackend:
+        pass
+
+    # Backends without clear_expired return straight away
+    with anyio.fail_after(1):
+        await purge_expired_entries(_NoPurgeBackend(), 0.01)  # type: ignore
+
+
+async def test_app_shutdown_stops_purging_shared_cache(tmp_path):
+    builder = ConfigurationBuilder()
+    builder.shared_cache_backend = SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3')
+    app = _start_application(builder._to_configuration())
+
+    # The purge loop must not keep the app's task group open on shutdown
+    with anyio.fail_after(10):
+        async with app.router.lifespan_context(app):
+            pass
+
+
+async def test_cache_store_only_shares_opted_in_entries(tmp_path):
+    """Only values of entries opting in, e.g. DerivedVariable results, are written through"""
+    path = tmp_path / 'state.sqlite3'
+    first_store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+    second_store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+    entry = CachedRegistryEntry(uid='latest_value', cache=Cache.Policy.KeepAll())
+
+    await first_store.set(entry, 'key', 'value')
+    assert await first_store.get(entry, 'key') == 'value'
+    assert await second_store.get(entry, 'key') is None
+
+    assert DerivedVariableRegistryEntry.shared
+
+
+async def test_cache_store_does_not_share_pending_tasks(tmp_path):
+    path = tmp_path / 'state.sqlite3'
+    first_store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+    second_store = CacheStore(shared_backend=SQLiteSharedCacheBackend(path))
+    entry = SharedEntry(uid='dv', cache=Cache.Policy.KeepAll())
+
+    class _Task(PendingTask):
+        def __init__(self):
+            super().__init__('task', None)  # type: ignore
+
+    await first_store.set(entry, 'key', _Task())
+    assert await second_store.get(entry, 'key') is None
+
+
+async def test_cache_store_resolves_pending_task_after_shared_write(tmp_path):
+    """Waiters on a pending task, such as a held flight, are only released once other processes can read the value"""
+    entry = SharedEntry(uid='dv', cache=Cache.Policy.KeepAll())
+    written = []
+    written_on_resolve = []
+
+    class _Task(PendingTask):
+        def __init__(self):
+            super().__init__('task', None)  # type: ignore
+
+        def resolve(self, value):
+            written_on_resolve.extend(written)
+            super().resolve(value)
+
+    class _SlowBackend(SQLiteSharedCacheBackend):
+        async def set(self, key, value, ttl=None):
+            await anyio.sleep(0.1)
+            await super().set(key, value, ttl=ttl)
+            written.append(value)
+
+    store = CacheStore(shared_backend=_SlowBackend(tmp_path / 'state.sqlite3'))
+    task = _Task()
+    await store.set(entry, 'key', task)
+    await store.set(entry, 'key', 'value')
+
+    assert task.event.is_set()
+    assert written_on_resolve == ['value']
+
+
+async def test_cache_store_ignores_unpicklable_values(tmp_path):
+    store = CacheStore(shared_backend=SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3'))
+    entry = SharedEntry(uid='dv', cache=Cache.Policy.KeepAll())
+
+    value = lambda: None  # noqa: E731
+
+    # Local write succeeds even though the shared write fails
+    await store.set(entry, 'key', value)
+    assert await store.get(entry, 'key') is value
+
+
+async def test_sqlite_message_bus(tmp_path):
+    path = tmp_path / 'state.sqlite3'
+    publisher = SQLiteMessageBus(path, poll_interval=0.01)
+    subscriber = SQLiteMessageBus(path, poll_interval=0.01)
+    received_by_publisher = []
+    received_by_subscriber = []
+
+    async def on_publisher_message(message):
+        received_by_publisher.append(message)
+
+    async def on_subscriber_message(message):
+        received_by_subscriber.append(message)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(publisher.subscribe, on_publisher_message)
+        tg.start_soon(subscriber.subscribe, on_subscriber_message)
+        await anyio.sleep(0.1)
+
+        await publisher.publish({'value': 1})
+        await publisher.publish({'value': 2})
+
+        await wait_for(lambda: len(received_by_subscriber) == 2, timeout=2)
+        tg.cancel_scope.cancel()
+
+    assert received_by_subscriber == [{'value': 1}, {'value': 2}]
+    # A process never receives its own messages back
+    assert received_by_publisher == []
+
+
+async def test_websocket_manager_forwards_messages_over_bus(tmp_path):
+    path = tmp_path / 'state.sqlite3'
+    first_manager = WebsocketManager(bus=SQLiteMessageBus(path, poll_interval=0.01))
+    second_manager = WebsocketManager(bus=SQLiteMessageBus(path, poll_interval=0.01))
+    remote_handler = second_manager.create_handler('REMOTE')
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(first_manager.run_bus_listener)
+        tg.start_soon(second_manager.run_bus_listener)
+        await anyio.sleep(0.1)
+
+        # Channel is owned by the other process
+        await first_manager.send_message('REMOTE', {'application': 'payload'})
+        with anyio.fail_after(2):
+            message = await remote_handler.receive_stream.receive()
+        assert jsonable_encoder(message) == {'type': 'message', 'message': {'application': 'payload'}}
+
+        # Typed envelopes keep their protocol discriminator
+        await first_manager.broadcast(DaraServerMessage.create('ActionMessage', {'action': None, 'uid': 'action'}))
+        with anyio.fail_after(2):
+            message = await remote_handler.receive_stream.receive()
+        assert isinstance(message, DaraServerMessage)
+        assert message.typename == 'ActionMessage'
+        assert message.telemetry_payload_type() == 'ActionComplete'
+
+        first_manager.stop_bus_listener()
+        second_manager.stop_bus_listener()
+
+
+async def test_resolve_shared_state_factories(tmp_path):
+    backend = SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3')
+    bus = SQLiteMessageBus(tmp_path / 'state.sqlite3')
+
+    assert resolve_shared_cache_backend(None, None) is None  # type: ignore
+    assert resolve_shared_cache_backend(backend, None) is backend  # type: ignore
+    assert resolve_shared_cache_backend(lambda _config: backend, None) is backend  # type: ignore
+    assert resolve_message_bus(lambda _config: bus, None) is bus  # type: ignore
+    assert resolve_single_flight(None, None) is None  # type: ignore
+
+    with pytest.raises(TypeError):
+        resolve_message_bus(lambda _config: object(), None)  # type: ignore
+
+
+async def test_file_lock_single_flight(tmp_path):
+    first = FileLockSingleFlight(tmp_path, poll_interval=0.01)
+    second = FileLockSingleFlight(tmp_path, poll_interval=0.01, timeout=0.1)
+
+    assert await first.acquire('key')
+    assert first.is_held('key')
+
+    # Held by the other 'process', times out
+    assert not await second.acquire('key')
+    # Unrelated keys are independent
+    assert await second.acquire('other')
+
+    await first.release('key')
+    assert not first.is_held('key')
+    assert await second.acquire('key')
+
+    await second.release('key')
+    await second.release('other')
+    # Releasing a flight which is not held is a no-op
+    await second.release('key')
+
+
+async def test_derived_variable_single_flight_across_processes(tmp_path):
+    """Concurrent cold-cache computations in two 'processes' only run the resolver once"""
+    calls = []
+
+    async def resolver(value: int):
+        calls.append(value)
+        await anyio.sleep(0.2)
+        return value + 1
+
+    var_entry = DerivedVariableRegistryEntry(
+        uid='single-flight-dv',
+        cache=Cache.Policy.KeepAll(),
+        deps=[0],
+        func=resolver,
+        filter_resolver=None,
+        run_as_task=False,
+        variables=[],
+        polling_interval=None,
+        get_value=DerivedVariable.get_value,
+        get_tabular_data=DerivedVariable.get_tabular_data,
+    )
+    stores = [
+        CacheStore(
+            shared_backend=SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3'),
+            single_flight=FileLockSingleFlight(tmp_path / 'locks', poll_interval=0.01),
+        )
+        for _ in range(2)
+    ]
+    results = []
+
+    # The in-process lock would already serialize both calls, separate processes do not share it
+    class _ProcessLocalLock:
+        @asynccontextmanager
+        async def acquire(self, _resource: str):
+            yield
+
+    async def _resolve(store: CacheStore):
+        result = await DerivedVariable.get_value(var_entry, store, None, [1])  # type: ignore
+        results.append(result['value'])
+
+    with patch.object(derived_variable, 'DV_LOCK', _ProcessLocalLock()):
+        async with anyio.create_task_group() as tg:
+            for store in stores:
+                tg.start_soon(_resolve, store)
+
+    assert calls == [1]
+    assert results == [2, 2]
+
+
+async def test_disk_cache_backend_persists_values(tmp_path):
+    backend = DiskCacheBackend(tmp_path)
+    df = pandas.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']}, index=pandas.Index([10, 20, 30], name='idx'))
+    # Not representable in Arrow, stored pickled instead
+    mixed_df = pandas.DataFrame({'mixed': [1, 'a', None]})
+
+    await backend.set('df', df)
+    await backend.set('mixed', mixed_df)
+    await backend.set('value', {'nested': [1, 2]})
+    assert sorted(p.suffix for p in tmp_path.iterdir() if p.suffix in ('.arrow', '.pickle')) == [
+        '.arrow',
+        '.pickle',
+        '.pickle',
+    ]
+    backend.close()
+
+    # A new instance, e.g. after a restart, serves the stored values
+    restarted = DiskCacheBackend(tmp_path)
+    pandas.testing.assert_frame_equal(await restarted.get('df'), df)
+    pandas.testing.assert_frame_equal(await restarted.get('mixed'), mixed_df)
+    assert await restarted.get('value') == {'nested': [1, 2]}
+
+    await restarted.delete('df')
+    with pytest.raises(KeyError):
+        await restarted.get('df')
+
+    await restarted.clear()
+    assert restarted.size() == 0
+    assert [p.name for p in tmp_path.iterdir() if p.suffix in ('.arrow', '.pickle')] == []
+
+
+async def test_disk_cache_backend_evicts_least_recently_used(tmp_path):
+    value = b'x' * 1000
+    backend = DiskCacheBackend(tmp_path, max_size=3500)
+
+    await backend.set('first', value)
+    await backend.set('second', value)
+    await backend.set('third', value)
+    # Access the first entry so the second becomes least recently used
+    await anyio.sleep(0.01)
+    await backend.get('first')
+
+    await backend.set('fourth', value)
+    assert backend.size() <= 3500
+
+    with pytest.raises(KeyError):
+        await backend.get('second')
+    for key in ('first', 'third', 'fourth'):
+        assert await backend.get(key) == value
+
+    # Values larger than the whole cache are not stored
+    await backend.set('huge', b'x' * 5000)
+    with pytest.raises(KeyError):
+        await backend.get('huge')
+
+
+async def test_disk_cache_backend_tracks_total_size(tmp_path):
+    """The running total follows overwrites and deletes, and is shared by all instances using the directory"""
+    backend = DiskCacheBackend(tmp_path)
+    other_process = DiskCacheBackend(tmp_path)
+
+    await backend.set('a', b'x' * 1000)
+    first_size = backend.size()
+    await other_process.set('b', b'x' * 1000)
+    assert backend.size() == other_process.size() == 2 * first_size
+
+    # Overwriting replaces the previous size
+    await backend.set('a', b'x' * 3000)
+    assert backend.size() > 2 * first_size
+    await backend.set('a', b'x' * 1000)
+    assert backend.size() == 2 * first_size
+
+    await other_process.delete('a')
+    assert backend.size() == first_size
+
+
+async def test_disk_cache_backend_ttl(tmp_path):
+    backend = DiskCacheBackend(tmp_path)
+
+    await backend.set('a', 1, ttl=0.1)
+    assert await backend.get('a') == 1
+
+    await anyio.sleep(0.2)
+    with pytest.raises(KeyError):
+        await backend.get('a')
+
+    await backend.clear_expired()
+    assert backend.size() == 0
+
+
+def test_shared_key_includes_code_fingerprint():
+    def first_resolver():
+        return 1
+
+    def second_resolver():
+        return 2
+
+    def _entry(func):
+        return DerivedVariableRegistryEntry(
+            uid='dv',
+            cache=Cache.Policy.KeepAll(),
+            deps=[],
+            func=func,
+            filter_resolver=None,
+            run_as_task=False,
+            variables=[],
+            polling_interval=None,
+            get_value=DerivedVariable.get_value,
+            get_tabular_data=DerivedVariable.get_tabular_data,
+        )
+
+    assert CacheStore.shared_key(_entry(first_resolver), 'key') == CacheStore.shared_key(_entry(first_resolver), 'key')
+    assert CacheStore.shared_key(_entry(first_resolver), 'key') != CacheStore.shared_key(_entry(second_resolver), 'key')
+
+
+def test_generate_uid_is_identical_between_processes(monkeypatch):
+    """Objects created while the app loads get the same uid in every process"""
+    from collections import defaultdict
+
+    from dara.core.internal import cross_process
+
+    monkeypatch.setattr(cross_process, '_started', False)
+
+    def load_app():
+        # Each process starts counting from scratch
+        monkeypatch.setattr(cross_process, '_uid_counters', defaultdict(int))
+        return [cross_process.generate_uid('variable'), cross_process.generate_uid('variable')]
+
+    first_process = load_app()
+    second_process = load_app()
+    assert first_process == second_process
+    assert first_process[0] != first_process[1]
+
+    # Once started, uids are random as they could otherwise collide between processes
+    monkeypatch.setattr(cross_process, '_started', True)
+    assert cross_process.generate_uid('variable') != cross_process.generate_uid('variable')
+
+
+def test_runtime_registrations_refused_with_multiple_workers(monkeypatch):
+    """Entries registered while serving requests would only be known to a single worker"""
+    from dara.core.internal import cross_process
+
+    monkeypatch.setenv('DARA_WORKERS', '2')
+    monkeypatch.setattr(cross_process, '_started', True)
+
+    with pytest.raises(RuntimeError, match='multiple workers'):
+        DerivedVariable(lambda: 1, variables=[])
+
+    # Single worker apps can still register at runtime
+    monkeypatch.setenv('DARA_WORKERS', '1')
+    DerivedVariable(lambda: 1, variables=[])
+
+
+async def test_runtime_static_kwargs_shared_between_workers(monkeypatch, tmp_path):
+    """Static kwargs registered while rendering are found by other workers via the shared backend"""
+    from dara.core.internal import cross_process
+    from dara.core.internal.registries import static_kwargs_registry, utils_registry
+    from dara.core.internal.registry_lookup import RegistryLookup
+
+    monkeypatch.setenv('DARA_WORKERS', '2')
+    monkeypatch.setattr(cross_process, '_started', True)
+    store: CacheStore = utils_registry.get('Store')
+    monkeypatch.setattr(store, 'shared_backend', SQLiteSharedCacheBackend(tmp_path / 'state.sqlite3'))
+
+    async with cross_process.sharing_runtime_entries():
+        static_kwargs_registry.register('instance', {'value': 1})
+
+    # The write completed before leaving the block
+    assert await store.shared_backend.get('registry:Static kwargs:instance') == {'value': 1}
+
+    # Another worker does not have the entry locally
+    static_kwargs_registry.remove('instance')
+    assert await RegistryLookup().get(static_kwargs_registry, 'instance') == {'value': 1}
+
+    monkeypatch.setattr(store, 'shared_backend', None)
+    with pytest.raises(RuntimeError, match='shared_cache_backend'):
+        static_kwargs_registry.register('other_instance', {'value': 2})
@@ -247,8 +247,9 @@ async def test_fetching_global_data_variable_filters():
         assert response.json()['count'] == 4
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
-async def test_update_variable_extras_data_variable(_uid):
+@patch('dara.core.internal.cross_process.uuid.uuid4', return_value='uid')
+@patch('dara.core.internal.cross_process.uuid.uuid5', return_value='uid')
+async def test_update_variable_extras_data_variable(_uid1, _uid2):
     """
     Test that DataVariable can be used within extras in UpdateVariable and that the data does not get the extra __index__ column
     """
@@ -300,8 +301,8 @@ async def test_update_variable_extras_data_variable(_uid):
         assert actions[0]['variable']['uid'] == 'uid'
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
-@patch('dara.core.interactivity.any_variable.uuid.uuid4', return_value='uid')
+@patch('dara.core.internal.cross_process.uuid.uuid4', return_value='uid')
+@patch('dara.core.internal.cross_process.uuid.uuid5', return_value='uid')
 async def test_update_variable_session_data_variable(_uid1, _uid2):
     """
     Test that DataVariable can be used as a target for UpdateVariable with session
@@ -392,8 +393,8 @@ async def test_update_variable_session_data_variable(_uid1, _uid2):
         assert response.json()['count'] == 0
 
 
-@patch('dara.core.interactivity.actions.uuid.uuid4', return_value='uid')
-@patch('dara.core.interactivity.any_variable.uuid.uuid4', return_value='uid')
+@patch('dara.core.internal.cross_process.uuid.uuid4', return_value='uid')
+@patch('dara.core.internal.cross_process.uuid.uuid5', return_value='uid')
 async def test_update_variable_user_data_variable(_uid1, _uid2):
     """
     Test that DataVariable can be used as a target for UpdateVariable with user cache
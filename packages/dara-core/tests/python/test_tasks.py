@@ -5,10 +5,17 @@ import pytest
 from anyio import create_task_group, get_cancelled_exc_class
 from fastapi.encoders import jsonable_encoder
 
-from dara.core.base_definitions import Cache
+from dara.core.base_definitions import Cache, TaskProgressUpdate
 from dara.core.internal.cache_store import CacheStore
 from dara.core.internal.pool import TaskPool
-from dara.core.internal.tasks import CachedRegistryEntry, MetaTask, Task, TaskManager
+from dara.core.internal.tasks import (
+    CachedRegistryEntry,
+    MetaTask,
+    Task,
+    TaskManager,
+    _ProgressCoalescer,
+    _task_notification_message,
+)
 from dara.core.internal.websocket import WebsocketManager
 
 from tests.python.tasks import (
@@ -16,6 +23,7 @@ from tests.python.tasks import (
     failing_task_a,
     task_b,
     task_c,
+    tight_loop_track_task,
     track_task,
     very_slow_task_a,
 )
@@ -138,6 +146,91 @@ async def test_task_manager_run_task_track_progress(_uid):
         assert await task_manager.get_result('uid') == 'result'
 
 
+@patch('dara.core.base_definitions.uuid.uuid4', return_value='uid')
+async def test_task_manager_coalesces_progress(_uid):
+    """
+    Test that progress updates sent in a tight loop are coalesced to at most one per interval,
+    with the latest update delivered before the result
+    """
+    task = Task(tight_loop_track_task, [], cache_key='uid')
+
+    async with create_task_group() as tg:
+        ws_mgr = WebsocketManager()
+        task_manager = TaskManager(tg, ws_mgr, CacheStore())
+        handler = ws_mgr.create_handler('chan')
+
+        pending_task = task_manager.register_task(task)
+        await task_manager.run_task(task, 'chan')
+        assert await pending_task.run() == 'result'
+
+        messages = []
+        while handler.receive_stream.statistics().current_buffer_used > 0:
+            messages.append(jsonable_encoder(handler.receive_stream.receive_nowait().message))
+
+        progress_messages = [msg for msg in messages if msg['status'] == 'PROGRESS']
+        # The task runs for ~0.5s and sends 1000 updates, an update every 0.2s at most is delivered
+        assert 1 < len(progress_messages) < 10
+        assert progress_messages[-1] == {
+            'progress': 100,
+            'message': 'Step 1000',
+            'status': 'PROGRESS',
+            'task_id': 'uid',
+        }
+        assert messages[-1] == {'result': 'result', 'status': 'COMPLETE', 'task_id': 'uid'}
+
+
+async def test_progress_coalescer():
+    delivered = []
+
+    async def _deliver(update: TaskProgressUpdate):
+        delivered.append((update.task_id, update.progress))
+
+    async with create_task_group() as tg:
+        coalescer = _ProgressCoalescer(_deliver, tg, {'slow': 0.2, 'unthrottled': 0})
+
+        for i in range(10):
+            await coalescer.submit(TaskProgressUpdate(task_id='slow', progress=i, message=''))
+            await coalescer.submit(TaskProgressUpdate(task_id='unthrottled', progress=i, message=''))
+
+        # The first update is delivered immediately, the latest is held back until the interval elapses
+        assert [progress for task_id, progress in delivered if task_id == 'slow'] == [0]
+        assert [progress for task_id, progress in delivered if task_id == 'unthrottled'] == list(range(10))
+
+        await anyio.sleep(0.3)
+        assert [progress for task_id, progress in delivered if task_id == 'slow'] == [0, 9]
+
+        # Flushing delivers the pending update immediately
+        await coalescer.submit(TaskProgressUpdate(task_id='slow', progress=10, message=''))
+        await coalescer.flush('slow')
+        assert [progress for task_id, progress in delivered if task_id == 'slow'] == [0, 9, 10]
+
+
+async def test_progress_coalescer_delivers_fake_and_final_progress():
+    """Fake progress and final updates are never dropped, and are delivered after any update held back"""
+    delivered = []
+
+    async def _deliver(update: TaskProgressUpdate):
+        delivered.append((update.progress, update.message))
+
+    async with create_task_group() as tg:
+        coalescer = _ProgressCoalescer(_deliver, tg, {'task': 10})
+
+        await coalescer.submit(TaskProgressUpdate(task_id='task', progress=0, message='start'))
+        await coalescer.submit(TaskProgressUpdate(task_id='task', progress=10, message='step'))
+        await coalescer.submit(TaskProgressUpdate(task_id='task', progress=50, message='FAKE_PROGRESS__100__loading'))
+        await coalescer.submit(TaskProgressUpdate(task_id='task', progress=60, message='step'))
+        await coalescer.submit(TaskProgressUpdate(task_id='task', progress=100, message='done'))
+
+        assert delivered == [
+            (0, 'start'),
+            (10, 'step'),
+            (50, 'FAKE_PROGRESS__100__loading'),
+            (60, 'step'),
+            (100, 'done'),
+        ]
+        tg.cancel_scope.cancel()
+
+
 async def test_completion_does_not_bubble_up():
     """
     Test that task completion notification does not "bubble up" to the parent task.
@@ -505,3 +598,48 @@ async def test_task_chain_cancellation_propagation(_uid):
         assert cancel_msg_c is not None, f'No cancellation message found for C. Messages: {messages_c}'
         assert cancel_msg_b.task_id == 'task_b'
         assert cancel_msg_c.task_id == 'task_c'
+
+
+@patch('dara.core.base_definitions.uuid.uuid4', side_effect=['task_a', 'task_b', 'task_c', 'task_d'])
+async def test_multicast_notification_uses_hierarchy_index(_uid):
+    """
+    Test that notifications for a task only reach the registered tasks containing it in their hierarchy,
+    and that the hierarchy index is cleaned up when tasks are removed.
+    """
+    async with create_task_group() as tg:
+        task_manager = TaskManager(tg, WebsocketManager(), CacheStore())
+
+        # A is nested in B, which is nested in C; D is unrelated
+        task_a = Task(calc_task, [1, 2])
+        meta_task_b = MetaTask(task_b, [task_a])
+        meta_task_c = MetaTask(task_c, [meta_task_b])
+        task_d = Task(calc_task, [3, 4])
+
+        pending_tasks = [task_manager.register_task(task) for task in (task_a, meta_task_b, meta_task_c, task_d)]
+        notified: list[str] = []
+
+        async def _record(task, messages, variable_task_id=True):
+            notified.append(task.task_id)
+
+        with patch.object(task_manager, '_send_notification_for_task', side_effect=_record):
+            message = _task_notification_message(
+                {'status': 'PROGRESS', 'task_id': 'task_a', 'progress': 1, 'message': ''}
+            )
+            await task_manager._multicast_notification(task_id='task_a', messages=[message])
+            assert sorted(notified) == ['task_a', 'task_b', 'task_c']
+
+            notified.clear()
+            await task_manager._multicast_notification(task_id='task_d', messages=[message])
+            assert notified == ['task_d']
+
+            # Removed tasks are no longer notified
+            notified.clear()
+            task_manager._unregister_task('task_c')
+            await task_manager._multicast_notification(task_id='task_a', messages=[message])
+            assert sorted(notified) == ['task_a', 'task_b']
+
+        for pending_task in pending_tasks:
+            task_manager._unregister_task(pending_task.task_id)
+
+        assert task_manager.tasks == {}
+        assert task_manager._ancestors == {}
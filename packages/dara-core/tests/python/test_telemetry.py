@@ -480,6 +480,94 @@ def test_operation_observation_preserves_the_root_error_type():
     assert 'translated failure' not in repr(span)
 
 
+def test_unobserved_operations_share_a_no_op_context():
+    """Disabled telemetry returns one shared context manager instead of allocating one per operation."""
+    first = telemetry.observe_internal_operation('cache', 'get')
+    second = telemetry.observe_derived_variable_phase('resolve', 'resolver')
+    assert first is second
+
+    with first as observation:
+        observation.set_outcome('error')
+        observation.record_exception(ValueError())
+    assert observation.span is None
+    assert observation.outcome == 'success'
+
+
+def test_sample_rates_apply_per_category():
+    provider = TracerProvider()
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    executions = MagicMock()
+
+    with (
+        patch.object(telemetry, '_TRACER', provider.get_tracer('test')),
+        patch.object(telemetry, '_INTERNAL_OPERATIONS', executions),
+        patch.object(telemetry._RUNTIME, 'configured', True),
+        patch.object(telemetry._RUNTIME, 'sample_rates', {'cache': 0, 'registry': 0.5}),
+    ):
+        for _ in range(200):
+            with telemetry.observe_internal_operation('cache', 'get'):
+                pass
+            with telemetry.observe_internal_operation('registry', 'get'):
+                pass
+            with telemetry.observe_internal_operation('server_variable', 'read'):
+                pass
+
+    span_names = [span.name for span in exporter.get_finished_spans()]
+    assert 'dara.cache.get' not in span_names
+    assert 50 < span_names.count('dara.registry.get') < 150
+    assert span_names.count('dara.server_variable.read') == 200
+    # Metrics are not sampled
+    assert executions.add.call_count == 600
+
+
+def test_nested_operations_reuse_the_root_sampling_decision():
+    provider = TracerProvider()
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    with (
+        patch.object(telemetry, '_TRACER', provider.get_tracer('test')),
+        patch.object(telemetry._RUNTIME, 'configured', True),
+        patch.object(telemetry._RUNTIME, 'sample_rates', {'derived_variable': 0.5, 'cache': 0}),
+    ):
+        for _ in range(100):
+            with (
+                telemetry.observe_derived_variable('resolver', 'inline', variable_id='dv', function_name='resolver'),
+                telemetry.observe_derived_variable_phase('cache_lookup', 'resolver'),
+                telemetry.observe_internal_operation('cache', 'get'),
+            ):
+                pass
+
+    spans = exporter.get_finished_spans()
+    roots = [span for span in spans if span.name == 'dara.derived_variable.resolve']
+    assert 0 < len(roots) < 100
+    # Every sampled resolution is traced whole, regardless of the rates of the nested categories
+    assert len(spans) == 3 * len(roots)
+    assert telemetry._SAMPLED.get() is None
+
+
+def test_overhead_benchmark_gate_detects_regressions():
+    from tests.python._telemetry_overhead_benchmark import _find_regressions, _parse_thresholds
+
+    thresholds = _parse_thresholds(['prometheus=10'])
+    scenarios = {
+        'disabled': {'p50_ms': 1.0},
+        'prometheus': {'p50_delta_ms': 0.2, 'p50_delta_percent': 20.0},
+        'combined': {'p50_delta_ms': 0.2, 'p50_delta_percent': 20.0},
+        # Below the noise floor
+        'traces_logs': {'p50_delta_ms': 0.01, 'p50_delta_percent': 500.0},
+    }
+
+    regressions = _find_regressions(scenarios, thresholds)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('prometheus')
+
+    with pytest.raises(ValueError):
+        _parse_thresholds(['unknown=1'])
+
+
 def test_serialized_context_carrier_contains_only_w3c_trace_context():
     """Process carriers exclude baggage that may contain application data."""
     span_context = SpanContext(
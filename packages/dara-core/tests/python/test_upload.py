@@ -1,6 +1,7 @@
 import io
 import os
 import re
+from typing import BinaryIO
 
 import numpy
 import pytest
@@ -248,3 +249,82 @@ async def test_upload_data_variable_default_xlsx():
                 assert list_1_as_date.to_list() == list_2  # Assert that they are equal
             else:
                 assert list_1 == list_2
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.feather'])
+async def test_upload_data_variable_default_arrow_formats(extension: str, tmp_path):
+    builder = ConfigurationBuilder()
+    builder.add_page('Test', content=lambda: MockComponent(text=DataVariable(uid='uid')))
+    builder.add_auth(BasicAuthConfig(username='cl', password='data_ext'))
+    config = builder._to_configuration()
+
+    app = _start_application(config)
+
+    file_content = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    path = tmp_path / f'data{extension}'
+    if extension == '.parquet':
+        file_content.to_parquet(path)
+    else:
+        file_content.to_feather(path)
+
+    async with TestClient(app) as client:
+        AUTH_HEADERS = await login(client)
+
+        with open(path, 'rb') as f:
+            response = await client.post(
+                '/api/core/data/upload?data_uid=uid',
+                files={'data': (path.name, f)},
+                headers=AUTH_HEADERS,
+            )
+            assert response.status_code == 200
+            assert response.json()['status'] == 'SUCCESS'
+
+        response = await client.post('/api/core/tabular-variable/uid', headers=AUTH_HEADERS, json={'ws_channel': 'ws'})
+        assert response.status_code == 200
+        data_response: DataResponse = response.json()
+
+        response_data = DataFrame.from_records(data_response['data'])
+        assert response_data['__col__1__a'].tolist() == [1, 2, 3]
+        assert response_data['__col__2__b'].tolist() == ['x', 'y', 'z']
+
+
+async def test_upload_resolver_receives_file_object():
+    builder = ConfigurationBuilder()
+    builder.add_page('Test', content=lambda: MockComponent(text=DataVariable(uid='uid')))
+    builder.add_auth(BasicAuthConfig(username='cl', password='data_ext'))
+    config = builder._to_configuration()
+
+    app = _start_application(config)
+    received = {}
+
+    async with TestClient(app) as client:
+        AUTH_HEADERS = await login(client)
+
+        from dara.core.internal.registries import upload_resolver_registry
+
+        # Annotating the first argument as a file-like object opts into receiving the spooled upload file
+        def resolver(file: BinaryIO, filename: str):
+            received['is_bytes'] = isinstance(file, bytes)
+            received['filename'] = filename
+            return read_csv(file, index_col=0)
+
+        upload_resolver_registry.register('test_id', UploadResolverDef(resolver=resolver, upload=upload_impl))
+
+        with open(os.path.join('./tests/data/churn_data_clean.csv'), 'rb') as f:
+            form_data, content_type = encode_multipart_formdata(
+                {'resolver_id': 'test_id', 'data': ('churn_data_clean.csv', f)}
+            )
+
+            response = await client.post(
+                '/api/core/data/upload?data_uid=uid',
+                data=form_data,
+                headers={**AUTH_HEADERS, 'Content-Type': content_type},
+            )
+            assert response.status_code == 200
+
+        assert received == {'is_bytes': False, 'filename': 'churn_data_clean.csv'}
+
+        response = await client.post('/api/core/tabular-variable/uid', headers=AUTH_HEADERS, json={'ws_channel': 'ws'})
+        assert response.status_code == 200
+        reference = read_csv(os.path.join('./tests/data/churn_data_clean.csv'), index_col=0)
+        assert len(response.json()['data']) == len(reference)
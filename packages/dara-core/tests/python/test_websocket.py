@@ -110,6 +110,11 @@ async def cleanup_registry():
             {'store_uid': 'store-id', 'sequence_number': 1, 'patches': []},
             'BackendStorePatchMessage',
         ),
+        (
+            'DerivedVariableRefreshMessage',
+            {'uid': 'variable-id'},
+            'DerivedVariableRefreshMessage',
+        ),
         (
             'ServerErrorMessage',
             {'error': 'detail', 'time': 'timestamp'},